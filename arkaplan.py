@@ -0,0 +1,250 @@
+"""
+Veritabanı işlerini Tk ana döngüsünü dondurmadan arka planda çalıştırır.
+
+İşler bir iş parçacığı havuzunda yürür; sonuçlar bir kuyruğa konur ve ana
+iş parçacığında root.after ile yoklanarak geri çağrılara iletilir. Tk
+nesnelerine yalnızca ana iş parçacığından dokunulur.
+
+akis() ile gönderilen işler sonuçlarını parti parti iletir; ana iş parçacığı
+bir partiyi işlemeden en fazla birkaç parti daha üretilir, böylece büyük
+sonuç kümeleri bellekte birikmez.
+"""
+import queue
+import threading
+import time
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+
+import olcum
+
+
+# Kuyrukta işin bittiğini belirten işaret (parti yerine)
+_BITTI = object()
+
+
+class Is:
+    """Arka plana gönderilmiş tek bir iş."""
+    __slots__ = ("future", "basarili", "hata", "gosterge", "sahip", "anahtar", "iptal_edildi",
+                 "parti_geldi", "parti_siniri")
+
+    def __init__(self, basarili, hata, gosterge, sahip, anahtar, parti_geldi=None, parti_siniri=None):
+        self.future = None
+        self.parti_geldi = parti_geldi
+        self.parti_siniri = parti_siniri
+        self.basarili = basarili
+        self.hata = hata
+        self.gosterge = gosterge
+        self.sahip = sahip
+        self.anahtar = anahtar
+        self.iptal_edildi = False
+
+    def iptal(self):
+        """Henüz başlamadıysa işi durdurur; başladıysa sonucunun UI'a iletilmesini engeller."""
+        self.iptal_edildi = True
+        self.future.cancel()
+
+
+class YuklemeGostergesi:
+    """Bekleyen iş olduğu sürece belirsiz bir ilerleme çubuğu gösterir."""
+
+    def __init__(self, parent, **pack_ayarlari):
+        self.cubuk = ttk.Progressbar(parent, mode="indeterminate", length=160)
+        self.pack_ayarlari = pack_ayarlari
+        self.bekleyen = 0
+
+    def basla(self):
+        self.bekleyen += 1
+        if self.bekleyen == 1:
+            self.cubuk.pack(**self.pack_ayarlari)
+            self.cubuk.start(15)
+
+    def bitir(self):
+        self.bekleyen = max(0, self.bekleyen - 1)
+        if self.bekleyen == 0:
+            try:
+                self.cubuk.stop()
+                self.cubuk.pack_forget()
+            except tk.TclError:
+                pass  # Pencere kapanmış
+
+
+class ArkaplanYurutucu:
+    def __init__(self, root, is_parcacigi=4, yoklama_araligi=15, varsayilan_hata=None, dilim_suresi=0.03):
+        """
+        :param root: Sonuçların iletileceği Tk kök penceresi.
+        :param is_parcacigi: Aynı anda çalışabilecek iş sayısı.
+        :param yoklama_araligi: Bekleyen iş varken sonuç kuyruğunun yoklanma aralığı (ms).
+        :param varsayilan_hata: İş kendi hata geri çağrısını vermezse çağrılır (ana iş parçacığında).
+        :param dilim_suresi: Bir yoklamada geri çağrılara harcanacak en uzun süre (sn); kalanlar
+                             sonraki yoklamaya bırakılır ki arayüz yeniden çizilebilsin.
+        """
+        self.root = root
+        self.varsayilan_hata = varsayilan_hata
+        self._havuz = ThreadPoolExecutor(max_workers=is_parcacigi, thread_name_prefix="arkaplan")
+        self._tamamlananlar = queue.SimpleQueue()
+        self._yoklama_araligi = yoklama_araligi
+        self.dilim_suresi = dilim_suresi
+        self._bekleyen = 0
+        self._yoklama_id = None
+        self._sahip_isleri = {}   # Toplevel yolu -> o pencerenin bekleyen işleri
+        self._anahtarli = {}      # anahtar -> en son gönderilen iş
+        self._kapali = False
+
+    def gonder(self, fonksiyon, *args, basarili=None, hata=None, sahip=None, gosterge=None, anahtar=None, **kwargs):
+        """
+        fonksiyon(*args, **kwargs) çağrısını arka planda çalıştırır.
+        :param basarili: Sonuçla birlikte ana iş parçacığında çağrılır.
+        :param hata: İstisna ile birlikte ana iş parçacığında çağrılır.
+        :param sahip: Bu pencere kapanınca iş iptal edilir ve sonucu yok sayılır.
+        :param gosterge: İş sürerken gösterilecek YuklemeGostergesi.
+        :param anahtar: Aynı anahtarla yeni bir iş gönderilirse öncekinin sonucu yok sayılır.
+        :return: İptal için kullanılabilecek Is nesnesi.
+        """
+        is_ = self._is_olustur(basarili, hata, sahip, gosterge, anahtar)
+        return self._baslat(is_, olcum.etiketli(self._cagri_yeri(sahip, fonksiyon), fonksiyon), *args, **kwargs)
+
+    def akis(self, uretec, *args, parti_geldi, bitti=None, hata=None, sahip=None, gosterge=None, anahtar=None,
+             en_fazla_bekleyen=2, **kwargs):
+        """
+        uretec(*args, **kwargs) üretecini arka planda tüketir ve her partiyi ana iş parçacığında
+        parti_geldi'ye iletir. Ana iş parçacığı geride kalırsa üretim en_fazla_bekleyen partide durur.
+        :param bitti: Tüm partiler iletildikten sonra argümansız çağrılır.
+        Diğer parametreler gonder() ile aynıdır.
+        """
+        is_ = self._is_olustur(bitti and (lambda _sonuc: bitti()), hata, sahip, gosterge, anahtar,
+                               parti_geldi=parti_geldi, parti_siniri=threading.Semaphore(en_fazla_bekleyen))
+        return self._baslat(is_, olcum.etiketli(self._cagri_yeri(sahip, uretec), self._akisi_tuket),
+                            is_, uretec, args, kwargs)
+
+    @staticmethod
+    def _cagri_yeri(sahip, fonksiyon):
+        """İşin sorgularının ölçümlerde hangi pencere ve yükleyici adına kaydedileceği."""
+        ad = getattr(fonksiyon, "__qualname__", repr(fonksiyon))
+        if sahip is not None:
+            try:
+                return f"{sahip.winfo_toplevel().title()} / {ad}"
+            except tk.TclError:
+                pass
+        return f"{olcum.cagri_yeri()} / {ad}"
+
+    def _is_olustur(self, basarili, hata, sahip, gosterge, anahtar, **ek):
+        if anahtar is not None and anahtar in self._anahtarli:
+            self._anahtarli.pop(anahtar).iptal()
+
+        is_ = Is(basarili, hata, gosterge, sahip, anahtar, **ek)
+        if sahip is not None:
+            self._sahibe_bagla(sahip, is_)
+        if anahtar is not None:
+            self._anahtarli[anahtar] = is_
+        if gosterge is not None:
+            gosterge.basla()
+        return is_
+
+    def _baslat(self, is_, fonksiyon, *args, **kwargs):
+        self._bekleyen += 1
+        is_.future = self._havuz.submit(fonksiyon, *args, **kwargs)
+        is_.future.add_done_callback(lambda _f: self._tamamlananlar.put((is_, _BITTI)))
+        if self._yoklama_id is None:
+            self._yoklama_id = self.root.after(self._yoklama_araligi, self._yokla)
+        return is_
+
+    def _akisi_tuket(self, is_, uretec, args, kwargs):
+        """Arka plan iş parçacığında çalışır; partileri sınırlı sayıda kuyruğa koyar."""
+        partiler = uretec(*args, **kwargs)
+        try:
+            for parti in partiler:
+                # Ana iş parçacığı yetişemiyorsa bekle; bu sırada iptal edilirse çık
+                while not is_.parti_siniri.acquire(timeout=0.1):
+                    if is_.iptal_edildi or self._kapali:
+                        return
+                if is_.iptal_edildi or self._kapali:
+                    return
+                self._tamamlananlar.put((is_, parti))
+        finally:
+            partiler.close()
+
+    def kapat(self):
+        """Bekleyen işleri iptal eder; çalışan işlerin bitmesini beklemez."""
+        self._kapali = True
+        if self._yoklama_id is not None:
+            self.root.after_cancel(self._yoklama_id)
+            self._yoklama_id = None
+        self._havuz.shutdown(wait=False, cancel_futures=True)
+
+    def sahibin_islerini_iptal_et(self, sahip):
+        """
+        sahip'e bağlı bekleyen işleri pencere yok edilmeden iptal eder (ör. pencere gizlenince);
+        sahip sonradan yeni işler gönderebilir.
+        """
+        bekleyenler = self._sahip_isleri.get(str(sahip))
+        if bekleyenler:
+            for bekleyen in list(bekleyenler):
+                bekleyen.iptal()
+            bekleyenler.clear()
+
+    def _sahibe_bagla(self, sahip, is_):
+        yol = str(sahip)
+        if yol not in self._sahip_isleri:
+            self._sahip_isleri[yol] = set()
+
+            def kapaninca(event):
+                # Toplevel'e bağlanan <Destroy> alt pencereler için de tetiklenir
+                if str(event.widget) == yol:
+                    for bekleyen in self._sahip_isleri.pop(yol, ()):
+                        bekleyen.iptal()
+
+            sahip.bind("<Destroy>", kapaninca, add="+")
+        self._sahip_isleri[yol].add(is_)
+
+    def _yokla(self):
+        self._yoklama_id = None
+        bitis = time.perf_counter() + self.dilim_suresi
+        while time.perf_counter() < bitis:
+            try:
+                is_, parti = self._tamamlananlar.get_nowait()
+            except queue.Empty:
+                break
+            # Hata veren bir geri çağrı yoklamayı durdurmasın; Tk'nin kendi
+            # geri çağrılarında olduğu gibi raporlanıp sıradakine geçilir
+            try:
+                if parti is _BITTI:
+                    self._bekleyen -= 1
+                    self._teslim_et(is_)
+                else:
+                    self._parti_teslim_et(is_, parti)
+            except Exception as hata:
+                self.root.report_callback_exception(type(hata), hata, hata.__traceback__)
+        else:
+            # Süre doldu; kuyrukta kalanlar için arayüzün çizilmesine fırsat verip hemen devam et
+            if not self._kapali:
+                self._yoklama_id = self.root.after(1, self._yokla)
+            return
+        if self._bekleyen > 0 and not self._kapali:
+            self._yoklama_id = self.root.after(self._yoklama_araligi, self._yokla)
+
+    def _parti_teslim_et(self, is_, parti):
+        try:
+            if not is_.iptal_edildi:
+                is_.parti_geldi(parti)
+        finally:
+            is_.parti_siniri.release()
+
+    def _teslim_et(self, is_):
+        if is_.sahip is not None:
+            self._sahip_isleri.get(str(is_.sahip), set()).discard(is_)
+        if is_.anahtar is not None and self._anahtarli.get(is_.anahtar) is is_:
+            del self._anahtarli[is_.anahtar]
+        if is_.gosterge is not None:
+            is_.gosterge.bitir()
+        if is_.iptal_edildi or is_.future.cancelled():
+            return
+
+        hata = is_.future.exception()
+        if hata is not None:
+            geri_cagri = is_.hata or self.varsayilan_hata
+            if geri_cagri is None:
+                raise hata
+            geri_cagri(hata)
+        elif is_.basarili is not None:
+            is_.basarili(is_.future.result())
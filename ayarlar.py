@@ -0,0 +1,81 @@
+"""
+Uygulama ayarları ve ayarlardaki veritabanını açan veritabani_ac.
+
+Arayüz (main.py) ve komut satırı araçları (sunucu.py, servisler.py, sema.py,
+ice_aktarma.py, disa_aktarma.py, veri_uretici.py) ayarları buradan okur;
+modül tkinter'e bağlı olmadığından arayüzsüz sunucularda da içe aktarılabilir.
+"""
+from olcum import Olcumleyici
+from veritabani import veritabani_olustur
+
+# --- Veritabanı Ayarları ---
+VERITABANI_MOTORU = "mysql" # "mysql", tek iş istasyonlu kurulumlar için "sqlite" veya sunucu.py'ye bağlanmak için "istemci"
+
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "levent", # Kendi MySQL kullanıcı adınızı girin
+    "password": "1234", # Kendi MySQL şifrenizi girin
+    "database": "veteriner_klinik"
+}
+
+SQLITE_AYARLARI = {
+    "database": "veteriner_klinik.db", # Çalışma klasörüne göre (icons/ gibi)
+}
+
+ISTEMCI_AYARLARI = {
+    "host": "localhost",        # sunucu.py'nin çalıştığı bilgisayar
+    "port": 8765,
+    "anahtar": None,            # Sunucuda anahtar belirlendiyse aynısı
+    "zaman_asimi": 30,          # Saniye; yanıt gelmezse istek hata verir
+}
+
+VERITABANI_AYARLARI = {"mysql": DB_CONFIG, "sqlite": SQLITE_AYARLARI, "istemci": ISTEMCI_AYARLARI}
+
+# --- API Sunucusu Ayarları (sunucu.py) ---
+SUNUCU_AYARLARI = {
+    "motor": "mysql",           # Sunucunun bağlanacağı veritabanı ("mysql" veya "sqlite")
+    "host": "127.0.0.1",        # Diğer iş istasyonları bağlanacaksa "0.0.0.0"; o zaman anahtar da belirleyin
+    "port": 8765,
+    "anahtar": None,            # İstemcilerin X-Api-Anahtari başlığıyla göndermesi gereken anahtar
+    "onbellek_suresi": 10,      # Saniye; sunucuyu atlayan yazmalar (içe aktarma) en geç bu sürede görünür
+    "onbellek_boyutu_mb": 64,   # Yanıt önbelleğinin en fazla boyutu
+    "bosta_kalma_suresi": 60,   # Saniye; bu kadar istek göndermeyen istemcinin bağlantısı kapatılır
+}
+
+# --- Bağlantı Havuzu Ayarları ---
+HAVUZ_AYARLARI = {
+    "boyut": 5,                 # Aynı anda açık tutulacak en fazla bağlantı
+    "bosta_kalma_suresi": 300,  # Saniye; bu süre kullanılmayan bağlantı kapatılır
+    "kontrol_esigi": 5,         # Saniye; daha uzun boşta kalan bağlantı verilmeden önce ping'lenir
+    "deneme_sayisi": 3,         # Bağlantı açılamazsa toplam deneme sayısı
+    "bekleme_suresi": 0.2,      # Saniye; her yeniden denemede iki katına çıkar
+}
+
+# --- Sorgu Ölçümü Ayarları ---
+OLCUM_AYARLARI = {
+    "acik": True,                   # Sorgu sürelerini, satır sayılarını ve çağrı yerlerini kaydet
+    "yavas_sorgu_esigi_ms": 200,    # Bu süreyi aşan sorgular günlüğe yazılır
+    "yavas_sorgu_gunlugu": "yavas_sorgular.log", # None ise standart hataya yazılır
+    "cikista_ozet": True,           # Uygulama kapanırken sorgu özetini standart hataya bas
+}
+
+# --- Açılış Ayarları ---
+ACILIS_AYARLARI = {
+    "isitilacak_baglanti": 2,       # Açılışta arka planda önceden açılacak bağlantı sayısı
+    "ilk_kare_butcesi_ms": 400,     # --startup-profile: ana menünün çizilmesi için hedef süre
+    "hazir_butcesi_ms": 1500,       # --startup-profile: veritabanı hazır olana kadar hedef süre
+}
+
+# --- Pencere Ayarları ---
+PENCERE_AYARLARI = {
+    "en_fazla_oge": 5000,           # Kapatılıp gizlenen liste pencerelerinde tutulacak en fazla widget + tablo satırı
+}
+
+
+def veritabani_ac(motor=None):
+    """Ayarlardaki (veya verilen) motor için havuzlu bir Veritabani oluşturur."""
+    motor = motor or VERITABANI_MOTORU
+    olcumleyici = None
+    if OLCUM_AYARLARI["acik"]:
+        olcumleyici = Olcumleyici(OLCUM_AYARLARI["yavas_sorgu_esigi_ms"], OLCUM_AYARLARI["yavas_sorgu_gunlugu"])
+    return veritabani_olustur(motor, VERITABANI_AYARLARI[motor], HAVUZ_AYARLARI, olcumleyici=olcumleyici)
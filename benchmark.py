@@ -0,0 +1,438 @@
+"""
+Performans ölçümleri.
+
+Kullanım:
+    python benchmark.py havuz [--sorgu-sayisi 2000] [--mysql]
+    python benchmark.py motorlar [--sahip-sayisi 2000] [--tekrar 50] [--mysql [--doldur]]
+    python benchmark.py hazir [--sorgu-sayisi 5000] [--mysql]
+    python benchmark.py yukleyiciler [--sahip-sayisi 60000] [--tekrar 20] [--sqlite-dosyasi yol | --mysql [--doldur]]
+    python benchmark.py projeksiyonlar [--satir-sayisi 100000] [--tekrar 3] [--sqlite-dosyasi yol | --mysql [--doldur]]
+
+Varsayılan olarak geçici bir SQLite dosyası üzerinde çalışır; --mysql verilirse
+ayarlar.py içindeki DB_CONFIG ile yerel MySQL sunucusuna bağlanır.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+import bicimler
+import sorgular
+from havuz import BaglantiHavuzu
+from randevu_takvimi import TakvimOnbellegi
+from sema import gocleri_uygula
+from veri_uretici import veri_uret
+from veritabani import veritabani_olustur
+
+
+def _sqlite_hazirla():
+    """Örnek sahip kayıtları içeren geçici bir SQLite dosyası oluşturur."""
+    fd, yol = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db = sqlite3.connect(yol)
+    db.execute("CREATE TABLE sahipler (id INTEGER PRIMARY KEY, isim TEXT, telefon TEXT, adres TEXT)")
+    db.executemany("INSERT INTO sahipler (isim, telefon, adres) VALUES (?, ?, ?)",
+                   [(f"Sahip {i}", f"555{i:07d}", None) for i in range(200)])
+    db.commit()
+    db.close()
+    return yol, (lambda: sqlite3.connect(yol)), "SELECT id, isim FROM sahipler WHERE id = ?"
+
+
+def _mysql_hazirla():
+    import mysql.connector
+    from ayarlar import DB_CONFIG
+    return None, (lambda: mysql.connector.connect(autocommit=True, **DB_CONFIG)), "SELECT id, isim FROM sahipler WHERE id = %s"
+
+
+def _olc(etiket, sorgu_sayisi, calistir):
+    baslangic = time.perf_counter()
+    for i in range(sorgu_sayisi):
+        calistir(i % 200 + 1)
+    sure = time.perf_counter() - baslangic
+    print(f"{etiket:<28} {sorgu_sayisi / sure:>10.0f} sorgu/sn   ({sure * 1000 / sorgu_sayisi:.3f} ms/sorgu)")
+    return sure
+
+
+def havuz_benchmark(args):
+    yol, fabrika, sorgu = _mysql_hazirla() if args.mysql else _sqlite_hazirla()
+    try:
+        def her_sorguda_baglan(sahip_id):
+            # Eski sorgu_calistir davranışı: bağlan, çalıştır, kapat
+            db = fabrika()
+            cursor = db.cursor()
+            cursor.execute(sorgu, (sahip_id,))
+            cursor.fetchall()
+            cursor.close()
+            db.close()
+
+        havuz = BaglantiHavuzu(fabrika, boyut=1)
+
+        def havuzdan(sahip_id):
+            with havuz.baglanti() as db:
+                cursor = db.cursor()
+                cursor.execute(sorgu, (sahip_id,))
+                cursor.fetchall()
+                cursor.close()
+
+        once = _olc("Her sorguda bağlan/kapat", args.sorgu_sayisi, her_sorguda_baglan)
+        sonra = _olc("Bağlantı havuzu", args.sorgu_sayisi, havuzdan)
+        havuz.kapat()
+        print(f"Hızlanma: {once / sonra:.1f}x   havuz istatistiği: {havuz.istatistik}")
+    finally:
+        if yol:
+            os.remove(yol)
+
+
+def _sorgulari_olc(db, tekrar):
+    """Uygulamanın sık sorgularının her biri için ortanca süreyi (ms) döndürür."""
+    sureler = {}
+    for ad, sorgu, veri in sorgular.DENETLENECEK_SORGULAR:
+        olcumler = []
+        for _ in range(tekrar):
+            baslangic = time.perf_counter()
+            db.sorgu(sorgular.lehceye_gore(sorgu, db.lehce), veri, fetch_results=True)
+            olcumler.append((time.perf_counter() - baslangic) * 1000)
+        sureler[ad] = statistics.median(olcumler)
+    return sureler
+
+
+def motorlar_benchmark(args):
+    fd, yol = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    sonuclar = {}
+    try:
+        db = veritabani_olustur("sqlite", {"database": yol})
+        gocleri_uygula(db)
+        veri_uret(db, args.sahip_sayisi)
+        sonuclar["SQLite"] = _sorgulari_olc(db, args.tekrar)
+        db.kapat()
+    finally:
+        for ek in ("", "-wal", "-shm"):
+            if os.path.exists(yol + ek):
+                os.remove(yol + ek)
+
+    if args.mysql:
+        from ayarlar import DB_CONFIG
+        db = veritabani_olustur("mysql", DB_CONFIG)
+        gocleri_uygula(db)
+        if args.doldur:
+            veri_uret(db, args.sahip_sayisi)
+        sonuclar["MySQL"] = _sorgulari_olc(db, args.tekrar)
+        db.kapat()
+
+    motorlar = list(sonuclar)
+    print(f"{'Sorgu (ortanca ms)':<34}" + "".join(f"{motor:>10}" for motor in motorlar))
+    for ad, _, _ in sorgular.DENETLENECEK_SORGULAR:
+        print(f"{ad:<34}" + "".join(f"{sonuclar[motor][ad]:>10.3f}" for motor in motorlar))
+
+
+# Form ve geçmiş sekmelerinin her açılışta tekrar tekrar gönderdiği sorgular
+HAZIR_IFADE_SORGULARI = [
+    ("Randevu çakışması (gün)", sorgular.RANDEVU_ARALIGI,
+     lambda i: (datetime(2026, 1, 1) + timedelta(days=i % 60), datetime(2026, 1, 2) + timedelta(days=i % 60))),
+    ("Aşı geçmişi", sorgular.ASI_GECMISI, lambda i: (i + 1,)),
+    ("Randevu geçmişi", sorgular.RANDEVU_GECMISI, lambda i: (i + 1,)),
+    ("Muayene geçmişi", sorgular.MUAYENE_GECMISI, lambda i: (i + 1,)),
+]
+
+
+def hazir_benchmark(args):
+    """Hazırlanmış ifade önbelleği kapalıyken ve açıkken aynı sorguları ölçer."""
+    fd, yol = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        if args.mysql:
+            from ayarlar import DB_CONFIG
+            motor, config = "mysql", DB_CONFIG
+        else:
+            motor, config = "sqlite", {"database": yol}
+            db = veritabani_olustur(motor, config)
+            gocleri_uygula(db)
+            veri_uret(db, 500)
+            db.kapat()
+
+        for etiket, hazir_ifade_sayisi in (("Önbelleksiz (her seferde ayrıştır)", 0), ("Hazırlanmış ifade önbelleği", 32)):
+            db = veritabani_olustur(motor, config, {"boyut": 1}, hazir_ifade_sayisi=hazir_ifade_sayisi)
+            print(etiket)
+            for ad, sorgu, veri in HAZIR_IFADE_SORGULARI:
+                sorgu = sorgular.lehceye_gore(sorgu, db.lehce)
+                _olc(f"  {ad}", args.sorgu_sayisi, lambda i: db.sorgu(sorgu, veri(i), fetch_results=True))
+            if hazir_ifade_sayisi and args.mysql:
+                print(f"  istatistik: {db.hazir_istatistik}")
+            db.kapat()
+    finally:
+        for ek in ("", "-wal", "-shm"):
+            if os.path.exists(yol + ek):
+                os.remove(yol + ek)
+
+
+SAYFA_BOYUTU = 200  # SayfaliListe varsayılanı
+
+
+def _sayfalar(db, sablon, id_sutunu, tumu):
+    """SayfaliListe'nin ileri sayfa yolunu izler; tumu False ise yalnızca ilk sayfa."""
+    sorgu = sorgular._sayfa(sorgular.lehceye_gore(sablon, db.lehce), id_sutunu)
+    satir, sinir = 0, 0
+    while True:
+        kayitlar = db.sorgu(sorgu, (sinir, SAYFA_BOYUTU), fetch_results=True)
+        satir += len(kayitlar)
+        if not tumu or len(kayitlar) < SAYFA_BOYUTU:
+            return satir
+        sinir = kayitlar[-1][0]
+
+
+def _yaklasan_asilar(db, bugun, gun_sayisi):
+    satir = 0
+    for parti in db.sorgu_akisi(sorgular.YAKLASAN_ASILAR[db.lehce], (bugun, bugun + timedelta(days=gun_sayisi))):
+        satir += len(parti)
+    return satir
+
+
+def _hayvan_detayi(db, hayvan_id):
+    """Detay penceresinin bilgi sorgusu ve üç geçmiş sekmesi."""
+    satir = len(db.sorgu(sorgular.HAYVAN_DETAYI, (hayvan_id,), fetch_results=True))
+    for sorgu in (sorgular.ASI_GECMISI, sorgular.RANDEVU_GECMISI, sorgular.MUAYENE_GECMISI):
+        satir += len(db.sorgu(sorgu[db.lehce], (hayvan_id,), fetch_results=True))
+    return satir
+
+
+# veri_uretici.MUAYENE_SABLONLARI'ndaki metinlerden; tek ve çok kelimeli, önekli aramalar
+ARAMA_METINLERI = ["kaşıntı", "ateş mukoza", "antibiyotik", "yabancı cisim", "diyet", "parazit yumurta"]
+
+
+def _randevu_takvimi(onbellek, ilk_gun, gun_sayisi):
+    """Takvimin görünen aralığı okuyan yolu (önbellek her seferinde yeniden doldurulur)."""
+    return sum(len(satirlar) for satirlar in onbellek.yukle(ilk_gun, ilk_gun + timedelta(days=gun_sayisi - 1)).values())
+
+
+def _muayene_aramasi(db, metin):
+    sorgu, veri = sorgular.muayene_aramasi(db.lehce, metin)
+    return len(db.sorgu(sorgu, veri, fetch_results=True))
+
+
+# Hayvan seçicide yazılması olası metinler: tek harf, hayvan adı, sahip adı, "hayvan sahip", id
+SECICI_METINLERI = ["P", "Pam", "Boncuk", "Ayşe", "Zeytin Ay", "ID:1234", "xyz"]
+
+
+def _hayvan_secici(db, metin):
+    sorgu, veri = sorgular.hayvan_secici_aramasi(metin)
+    return len([bicimler.hayvan_etiketi(*kayit) for kayit in db.sorgu(sorgu, veri, fetch_results=True)])
+
+
+def _yukleyiciler(db, bugun, tekrar):
+    """(ad, calistir(i) -> işlenen satır sayısı) listesi; her yükleyici pencerelerdeki sorgu + satır işleme yolu."""
+    en_kucuk, en_buyuk = db.sorgu("SELECT MIN(id), MAX(id) FROM hayvanlar", fetch_results=True)[0]
+    rastgele = random.Random(1)
+    hayvan_idleri = [rastgele.randint(en_kucuk or 1, en_buyuk or 1) for _ in range(tekrar + 1)]
+    takvim = TakvimOnbellegi(db)
+    hafta_basi = bugun - timedelta(days=bugun.weekday())
+    return [
+        ("Hayvan listesi (ilk sayfa)",
+         lambda i: _sayfalar(db, sorgular.HAYVAN_SAYFASI, "h.id", False)),
+        ("Hayvan listesi (tüm sayfalar)",
+         lambda i: _sayfalar(db, sorgular.HAYVAN_SAYFASI, "h.id", True)),
+        ("Randevu listesi (ilk sayfa)",
+         lambda i: _sayfalar(db, sorgular.RANDEVU_SAYFASI, "r.id", False)),
+        ("Muayene listesi (ilk sayfa)",
+         lambda i: _sayfalar(db, sorgular.MUAYENE_SAYFASI, "m.id", False)),
+        ("Yaklaşan aşılar (30 gün)", lambda i: _yaklasan_asilar(db, bugun, 30)),
+        ("Yaklaşan aşılar (365 gün)", lambda i: _yaklasan_asilar(db, bugun, 365)),
+        ("Hayvan detayı", lambda i: _hayvan_detayi(db, hayvan_idleri[i])),
+        ("Randevu takvimi (gün)", lambda i: _randevu_takvimi(takvim, bugun - timedelta(days=i), 1)),
+        ("Randevu takvimi (hafta)", lambda i: _randevu_takvimi(takvim, hafta_basi - timedelta(weeks=i), 7)),
+        ("Muayene araması", lambda i: _muayene_aramasi(db, ARAMA_METINLERI[i % len(ARAMA_METINLERI)])),
+        ("Hayvan seçici araması", lambda i: _hayvan_secici(db, SECICI_METINLERI[i % len(SECICI_METINLERI)])),
+    ]
+
+
+def _yukleyicileri_olc(db, bugun, tekrar):
+    print(f"{'Yükleyici':<32} {'Ortanca ms':>11} {'p95 ms':>9} {'Satır':>9} {'Satır/sn':>11} {'Tepe bellek':>12}")
+    for ad, calistir in _yukleyiciler(db, bugun, tekrar):
+        calistir(tekrar)  # Isınma (önbellekler, hazırlanmış ifadeler)
+        sureler, satir = [], 0
+        for i in range(tekrar):
+            baslangic = time.perf_counter()
+            satir += calistir(i)
+            sureler.append(time.perf_counter() - baslangic)
+        # Bellek ayrı bir çalıştırmada ölçülür; tracemalloc süreleri şişirir
+        tracemalloc.start()
+        calistir(0)
+        _, tepe = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        sureler.sort()
+        p95 = sureler[min(len(sureler) - 1, int(len(sureler) * 0.95))]
+        print(f"{ad:<32} {statistics.median(sureler) * 1000:>11.2f} {p95 * 1000:>9.2f} {satir // tekrar:>9} "
+              f"{satir / sum(sureler):>11.0f} {tepe / 1024 / 1024:>9.2f} MB")
+
+
+def _ornek_veritabani(args):
+    """
+    --mysql verilmişse DB_CONFIG'teki veritabanını, değilse --sqlite-dosyasi'ndaki (yoksa geçici)
+    SQLite dosyasını açar; dosya yeni oluşturulduysa örnek veriyle doldurur.
+    :return: (Veritabani, silinecek geçici dosya yolu veya None)
+    """
+    if args.mysql:
+        from ayarlar import DB_CONFIG
+        db = veritabani_olustur("mysql", DB_CONFIG)
+        gocleri_uygula(db)
+        if args.doldur:
+            veri_uret(db, args.sahip_sayisi)
+        return db, None
+
+    yol = args.sqlite_dosyasi
+    if not yol:
+        fd, yol = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        os.remove(yol)
+    yeni = not os.path.exists(yol)
+    db = veritabani_olustur("sqlite", {"database": yol})
+    gocleri_uygula(db)
+    if yeni:
+        baslangic = time.perf_counter()
+        sayilar = veri_uret(db, args.sahip_sayisi, ilerleme=lambda n, toplam: print(
+            f"\rÖrnek veri: {n}/{toplam} sahip", end="", flush=True))
+        print(f"\n{sayilar} ({time.perf_counter() - baslangic:.1f} sn)")
+    return db, None if args.sqlite_dosyasi else yol
+
+
+def _gecici_dosyayi_sil(yol):
+    if yol:
+        for ek in ("", "-wal", "-shm"):
+            if os.path.exists(yol + ek):
+                os.remove(yol + ek)
+
+
+def yukleyiciler_benchmark(args):
+    """Liste ve detay pencerelerinin yükleme yollarını büyük örnek veri üzerinde ölçer."""
+    db, gecici = _ornek_veritabani(args)
+    try:
+        sayilar = {tablo: db.sorgu(f"SELECT COUNT(*) FROM {tablo}", fetch_results=True)[0][0]
+                   for tablo in ("hayvanlar", "asi_takip", "randevular", "muayeneler")}
+        print("Veri: " + ", ".join(f"{tablo} {sayi}" for tablo, sayi in sayilar.items()))
+        _yukleyicileri_olc(db, date.today(), args.tekrar)
+    finally:
+        db.kapat()
+        _gecici_dosyayi_sil(gecici)
+
+
+def _projeksiyon_listeleri(bugun, satir_sayisi):
+    """
+    (ad, şablon, sütunlar, id sütunu, parametreler, Python biçimleyicisi) listesi. Şablonlar
+    sorgular.py'deki {sutunlar} yer tutuculu hâlleridir; listeler tek sorguda baştan okunur.
+    Ham projeksiyonda türetilmiş alanın yerinde ham sütunu gelir (yaklaşan aşılarda kalan gün için
+    tekrar eden sonraki tarih); Python biçimleyicisi bu fazlalığı atar.
+    """
+    bastan = (0, satir_sayisi)
+    return [
+        ("Hayvan listesi", sorgular._HAYVAN_SAYFASI, sorgular.HAYVAN_SUTUNLARI, "h.id", bastan,
+         lambda kayit: bicimler.hayvan_satiri(kayit, bugun)),
+        ("Randevu listesi", sorgular._RANDEVU_SAYFASI, sorgular.RANDEVU_SUTUNLARI, "r.id", bastan,
+         bicimler.randevu_satiri),
+        ("Muayene listesi", sorgular._MUAYENE_SAYFASI, sorgular.MUAYENE_SUTUNLARI, "m.id", bastan,
+         bicimler.muayene_satiri),
+        ("Yaklaşan aşılar", sorgular._YAKLASAN_ASILAR, sorgular.YAKLASAN_ASI_SUTUNLARI, None,
+         (date(1900, 1, 1), date(2999, 12, 31)), lambda kayit: bicimler.yaklasan_asi_satiri(kayit[:4], bugun)),
+    ]
+
+
+def _projeksiyonla_oku(db, sorgu, veri, satir_bicimle, satir_sayisi):
+    """Pencerelerin yükleme yolu: satırları parti parti okur, biçimleyici verilmişse her satıra uygular."""
+    satirlar = []
+    akis = db.sorgu_akisi(sorgu, veri)
+    try:
+        for parti in akis:
+            satirlar.extend(parti if satir_bicimle is None else map(satir_bicimle, parti))
+            if len(satirlar) >= satir_sayisi:
+                break
+    finally:
+        akis.close()
+    return satirlar[:satir_sayisi]
+
+
+def projeksiyonlar_benchmark(args):
+    """
+    Listeleri ham sütunlar + Python'da biçimleme (bicimler.py) ile sorgu projeksiyonunda biçimleme
+    arasında karşılaştırır; iki yolun Treeview'e gidecek metinleri de satır satır karşılaştırılır.
+    """
+    db, gecici = _ornek_veritabani(args)
+    bugun = db.sorgu("SELECT CURRENT_DATE", fetch_results=True)[0][0]  # Projeksiyonlar veritabanının gününü kullanır
+    bugun = bugun if isinstance(bugun, date) else date.fromisoformat(bugun)
+    try:
+        print(f"{'Liste':<18} {'Satır':>8} {'Python ms':>10} {'SQL ms':>9} {'Python satır/sn':>16} "
+              f"{'SQL satır/sn':>13} {'Farklı':>7}")
+        for ad, sablon, sutunlar, id_sutunu, veri, satir_bicimle in _projeksiyon_listeleri(bugun, args.satir_sayisi):
+            sonuclar = {}
+            for yol, ham in (("python", True), ("sql", False)):
+                sorgu = sablon.replace("{sutunlar}", sorgular.projeksiyon(db.lehce, sutunlar, ham=ham))
+                if id_sutunu:
+                    sorgu = sorgular._sayfa(sorgu, id_sutunu)
+                bicimleyici = satir_bicimle if ham else None
+                _projeksiyonla_oku(db, sorgu, veri, bicimleyici, args.satir_sayisi)  # Isınma
+                sureler = []
+                for _ in range(args.tekrar):
+                    baslangic = time.perf_counter()
+                    satirlar = _projeksiyonla_oku(db, sorgu, veri, bicimleyici, args.satir_sayisi)
+                    sureler.append(time.perf_counter() - baslangic)
+                sonuclar[yol] = (statistics.median(sureler), satirlar)
+
+            (py_sure, py_satirlar), (sql_sure, sql_satirlar) = sonuclar["python"], sonuclar["sql"]
+            # Treeview değerleri metne çevirir; karşılaştırma da metin üzerinden
+            farkli = sum(tuple(map(str, a)) != tuple(map(str, b)) for a, b in zip(py_satirlar, sql_satirlar))
+            farkli += abs(len(py_satirlar) - len(sql_satirlar))
+            satir = len(sql_satirlar)
+            print(f"{ad:<18} {satir:>8} {py_sure * 1000:>10.1f} {sql_sure * 1000:>9.1f} "
+                  f"{satir / py_sure if py_sure else 0:>16.0f} {satir / sql_sure if sql_sure else 0:>13.0f} {farkli:>7}")
+    finally:
+        db.kapat()
+        _gecici_dosyayi_sil(gecici)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Veteriner Klinik performans ölçümleri")
+    alt = parser.add_subparsers(dest="komut", required=True)
+
+    p = alt.add_parser("havuz", help="Bağlantı başına sorgu ile havuzlu sorguyu karşılaştırır")
+    p.add_argument("--sorgu-sayisi", type=int, default=2000)
+    p.add_argument("--mysql", action="store_true", help="SQLite yerine yerel MySQL kullan")
+    p.set_defaults(fonksiyon=havuz_benchmark)
+
+    p = alt.add_parser("motorlar", help="Uygulamanın sorgularını SQLite ve MySQL üzerinde karşılaştırır")
+    p.add_argument("--sahip-sayisi", type=int, default=2000, help="Örnek veri büyüklüğü (sahip başına ~1,7 hayvan)")
+    p.add_argument("--tekrar", type=int, default=50, help="Her sorgunun kaç kez çalıştırılacağı")
+    p.add_argument("--mysql", action="store_true", help="MySQL'i de ölç (DB_CONFIG'teki veritabanı)")
+    p.add_argument("--doldur", action="store_true", help="MySQL veritabanına da örnek veri ekle (kalıcıdır!)")
+    p.set_defaults(fonksiyon=motorlar_benchmark)
+
+    p = alt.add_parser("hazir", help="Hazırlanmış ifade önbelleğinin ayrıştırma maliyetinden kazancını ölçer")
+    p.add_argument("--sorgu-sayisi", type=int, default=5000)
+    p.add_argument("--mysql", action="store_true", help="SQLite yerine yerel MySQL kullan")
+    p.set_defaults(fonksiyon=hazir_benchmark)
+
+    p = alt.add_parser("yukleyiciler", help="Liste ve detay yükleyicilerinin süre, satır/sn ve bellek ölçümü")
+    p.add_argument("--sahip-sayisi", type=int, default=60000, help="60000 sahip ≈ 100 bin hayvan, 1 milyon aşı")
+    p.add_argument("--tekrar", type=int, default=20, help="Her yükleyicinin kaç kez çalıştırılacağı")
+    p.add_argument("--sqlite-dosyasi", help="Örnek veriyi bu dosyada sakla; dosya varsa yeniden üretme")
+    p.add_argument("--mysql", action="store_true", help="SQLite yerine yerel MySQL kullan (DB_CONFIG)")
+    p.add_argument("--doldur", action="store_true", help="MySQL veritabanına örnek veri ekle (kalıcıdır!)")
+    p.set_defaults(fonksiyon=yukleyiciler_benchmark)
+
+    p = alt.add_parser("projeksiyonlar", help="Satır biçimlemeyi Python'da ve SQL projeksiyonunda karşılaştırır")
+    p.add_argument("--satir-sayisi", type=int, default=100000, help="Her listeden okunacak satır")
+    p.add_argument("--sahip-sayisi", type=int, default=60000, help="60000 sahip ≈ 100 bin hayvan, 1 milyon aşı")
+    p.add_argument("--tekrar", type=int, default=3, help="Her yolun kaç kez çalıştırılacağı")
+    p.add_argument("--sqlite-dosyasi", help="Örnek veriyi bu dosyada sakla; dosya varsa yeniden üretme")
+    p.add_argument("--mysql", action="store_true", help="SQLite yerine yerel MySQL kullan (DB_CONFIG)")
+    p.add_argument("--doldur", action="store_true", help="MySQL veritabanına örnek veri ekle (kalıcıdır!)")
+    p.set_defaults(fonksiyon=projeksiyonlar_benchmark)
+
+    args = parser.parse_args()
+    args.fonksiyon(args)
+
+
+if __name__ == "__main__":
+    main()
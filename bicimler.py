@@ -0,0 +1,89 @@
+"""
+Sorgu satırlarını listelerde gösterilecek değerlere çeviren fonksiyonlar.
+
+Tk'ye bağımlı değildir; hem pencereler hem de benchmark.py'deki yükleyici
+ölçümleri aynı satır işleme yolunu kullanır. Liste ve geçmiş satırları artık
+sorgular.py'deki projeksiyonlarla veritabanında biçimlenir; buradaki satır
+fonksiyonları o projeksiyonların Python karşılığıdır ve `benchmark.py
+projeksiyonlar` iki yolu karşılaştırırken kullanır.
+"""
+from datetime import timedelta
+
+
+def yas_metni(dogum_tarihi, bugun):
+    """Doğum tarihinden listelerde gösterilen yaş metnini ("3 yıl", "5 ay", "12 gün") üretir."""
+    if not dogum_tarihi:
+        return "Bilinmiyor"
+    age = bugun.year - dogum_tarihi.year - ((bugun.month, bugun.day) < (dogum_tarihi.month, dogum_tarihi.day))
+    if age > 0:
+        return f"{age} yıl"
+    # 1 yaşından küçükse ayları veya günleri hesapla
+    delta = bugun - dogum_tarihi
+    if delta.days < 30:
+        return f"{delta.days} gün"
+    if delta.days < 365:
+        return f"{delta.days // 30} ay" # Yaklaşık ay hesabı
+    return "1 yaşından küçük" # Nadir durum, ama kapsayıcı olsun
+
+
+def tarih_metni(tarih, bos=""):
+    return tarih.strftime("%Y-%m-%d") if tarih else bos
+
+
+def zaman_metni(zaman, bos=""):
+    return zaman.strftime("%Y-%m-%d %H:%M") if zaman else bos
+
+
+def hayvan_etiketi(hayvan_id, isim, sahip_isim):
+    """Hayvan seçicide gösterilen metin; sondaki (ID:..) seçilen hayvanı belirler."""
+    return f"{isim} - {sahip_isim} (ID:{hayvan_id})"
+
+
+# --- Sayfalı listeler (sorgular.*_SAYFASI satırları) ---
+def hayvan_satiri(kayit, bugun):
+    hayvan_id, isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_isim = kayit
+    return (hayvan_id, isim, tur, cins, yas_metni(dogum_tarihi, bugun), gelis_sebebi, sahip_isim)
+
+
+def randevu_satiri(kayit):
+    return (kayit[0], kayit[1], zaman_metni(kayit[2]), kayit[3], kayit[4])
+
+
+def muayene_satiri(kayit):
+    return (kayit[0], kayit[1], zaman_metni(kayit[2]), kayit[3], kayit[4], kayit[5], kayit[6])
+
+
+def takvim_satiri(kayit):
+    """sorgular.RANDEVU_TAKVIMI satırı; saat sütunu başlangıç-bitiş aralığıdır."""
+    randevu_id, baslangic, sure_dakika, hayvan_adi, veteriner, oda, aciklama, durum = kayit
+    bitis = baslangic + timedelta(minutes=sure_dakika)
+    return (randevu_id, f"{baslangic:%H:%M}-{bitis:%H:%M}", hayvan_adi, veteriner or "", oda or "", aciklama or "", durum)
+
+
+# --- Yaklaşan aşılar ---
+def yaklasan_asi_satiri(kayit, bugun):
+    hayvan_adi, asi_adi, asi_tarihi, sonraki_asi_tarihi = kayit
+    # DATE sütunları datetime.date olarak gelir; kalan gün doğrudan hesaplanır
+    kalan_gun = (sonraki_asi_tarihi - bugun).days
+    return (hayvan_adi, asi_adi, tarih_metni(asi_tarihi), tarih_metni(sonraki_asi_tarihi), kalan_gun)
+
+
+# --- Hayvan detay penceresi sekmeleri ---
+def asi_gecmisi_satiri(kayit):
+    return (kayit[0], tarih_metni(kayit[1]), tarih_metni(kayit[2], "Yok"), kayit[3])
+
+
+def randevu_gecmisi_satiri(kayit):
+    return (zaman_metni(kayit[0]), kayit[1], kayit[2])
+
+
+def muayene_gecmisi_satiri(kayit):
+    return (zaman_metni(kayit[0]), kayit[1], kayit[2], kayit[3])
+
+
+# --- Randevu çakışması ---
+def cakisma_metni(cakisma):
+    """cakisma.Cakisma için "2026-01-05 10:00-10:30 (Dr. Ayşe, Oda 2)" biçiminde metin."""
+    kaynaklar = ", ".join(kaynak for kaynak in (cakisma.veteriner, cakisma.oda) if kaynak)
+    metin = f"{zaman_metni(cakisma.baslangic)}-{cakisma.bitis.strftime('%H:%M')}"
+    return f"{metin} ({kaynaklar})" if kaynaklar else metin
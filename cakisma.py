@@ -0,0 +1,127 @@
+"""
+Randevu çakışma denetimi.
+
+Randevular bir başlangıç ve süreden oluşan aralıklardır; iki randevu aralıkları
+kesişiyorsa ve aynı veterineri veya aynı odayı kullanıyorsa çakışır. Veteriner
+ve odası girilmemiş randevular (eski kayıtlar) tüm kliniği meşgul sayılır; aralığı
+kesişen her randevuyla çakışır.
+
+Her gün için o güne değen randevular tek bir indeksli aralık sorgusuyla
+(sorgular.RANDEVU_ARALIGI) yüklenir ve kaynak (veteriner / oda) başına
+başlangıca göre sıralı tutulur; bir denetim yalnızca yeni randevunun bitişinden
+önce ve en uzun randevu süresi kadar geriden başlayan kayıtlara bakar. Günler
+randevular tablosuna yazılınca, başka iş istasyonlarının yazmaları için de
+`yasam_suresi` dolunca yeniden yüklenir.
+"""
+import bisect
+import threading
+import time
+from datetime import datetime, timedelta
+
+import sorgular
+
+# Bir randevunun en uzun süresi (dakika); aralık sorgusunun ne kadar geriye bakacağını belirler
+RANDEVU_EN_UZUN_SURE = 240
+_EN_UZUN = timedelta(minutes=RANDEVU_EN_UZUN_SURE)
+_KLINIK = ("klinik", None)  # Veteriner ve odası boş randevuların kaynağı
+
+
+class Cakisma:
+    __slots__ = ("randevu_id", "baslangic", "bitis", "veteriner", "oda")
+
+    def __init__(self, randevu_id, baslangic, bitis, veteriner, oda):
+        self.randevu_id = randevu_id
+        self.baslangic = baslangic
+        self.bitis = bitis
+        self.veteriner = veteriner
+        self.oda = oda
+
+
+def _kaynaklar(veteriner, oda):
+    """Randevunun meşgul ettiği kaynaklar; ikisi de boşsa tüm kliniği temsil eden tek kaynak."""
+    kaynaklar = []
+    if veteriner:
+        kaynaklar.append(("veteriner", veteriner))
+    if oda:
+        kaynaklar.append(("oda", oda))
+    return kaynaklar or [_KLINIK]
+
+
+def _bakilacak_kaynaklar(indeks, veteriner, oda):
+    """Yeni randevunun çakışabileceği kaynaklar: kendi kaynakları ve tüm klinik; kaynaksızsa hepsi."""
+    if not veteriner and not oda:
+        return indeks.keys()
+    return _kaynaklar(veteriner, oda) + [_KLINIK]
+
+
+class CakismaDenetcisi:
+    def __init__(self, db, yasam_suresi=30):
+        """
+        :param db: Randevuların okunacağı ve yazma olaylarının dinleneceği Veritabani.
+        :param yasam_suresi: Saniye; yazma olmasa da bu süreden eski gün indeksi yeniden yüklenir.
+        """
+        self.db = db
+        self.yasam_suresi = yasam_suresi
+        self._kilit = threading.Lock()
+        self._gunler = {}  # tarih -> (yükleme zamanı, {kaynak: [(başlangıç, bitiş, Cakisma), ...]})
+        self._surum = 0    # Her geçersiz kılmada artar; yükleme sırasında gelen yazmayı kaçırmamak için
+        db.yazma_dinleyicisi_ekle(self._yazildi)
+
+    def cakismalar(self, baslangic, sure_dakika, veteriner=None, oda=None, haric_id=None, taze=False):
+        """
+        Verilen aralıkla çakışan, iptal edilmemiş randevuları başlangıç sırasıyla döndürür.
+        :param haric_id: Güncellenen randevunun kendisi.
+        :param taze: True ise gün indeksi önbellekten değil veritabanından okunur (kaydetmeden önce).
+        """
+        bitis = baslangic + timedelta(minutes=sure_dakika)
+        bulunanlar = {}
+        gun = baslangic.date()
+        while gun <= (bitis - timedelta(microseconds=1)).date():
+            indeks = self._gun(gun, taze)
+            for kaynak in _bakilacak_kaynaklar(indeks, veteriner, oda):
+                aralik = indeks.get(kaynak, ())
+                # Bu aralıktan önce bitebilecek en geç başlangıçtan geriye doğru bakılır
+                sira = bisect.bisect_left(aralik, (bitis,))
+                while sira > 0:
+                    sira -= 1
+                    diger_baslangic, diger_bitis, cakisma = aralik[sira]
+                    if diger_baslangic <= baslangic - _EN_UZUN:
+                        break
+                    if diger_bitis > baslangic and cakisma.randevu_id != haric_id:
+                        bulunanlar[cakisma.randevu_id] = cakisma
+            gun += timedelta(days=1)
+        return sorted(bulunanlar.values(), key=lambda cakisma: cakisma.baslangic)
+
+    def gecersiz_kil(self):
+        with self._kilit:
+            self._surum += 1
+            self._gunler.clear()
+
+    def _yazildi(self, tablo):
+        if tablo == "randevular":
+            self.gecersiz_kil()
+
+    def _gun(self, gun, taze):
+        with self._kilit:
+            kayit = self._gunler.get(gun)
+            if not taze and kayit is not None and time.monotonic() - kayit[0] < self.yasam_suresi:
+                return kayit[1]
+            surum = self._surum
+
+        # Güne değen randevular: önceki günden sarkanlar dahil; VeritabaniHatasi çağırana iletilir
+        gun_baslangici = datetime.combine(gun, datetime.min.time())
+        satirlar = self.db.sorgu(sorgular.RANDEVU_ARALIGI, (gun_baslangici - _EN_UZUN, gun_baslangici + timedelta(days=1)),
+                                 fetch_results=True)
+        indeks = {}
+        for randevu_id, baslangic, sure_dakika, veteriner, oda in satirlar:
+            cakisma = Cakisma(randevu_id, baslangic, baslangic + timedelta(minutes=sure_dakika), veteriner, oda)
+            for kaynak in _kaynaklar(veteriner, oda):
+                indeks.setdefault(kaynak, []).append((cakisma.baslangic, cakisma.bitis, cakisma))
+        for aralik in indeks.values():
+            aralik.sort(key=lambda eleman: (eleman[0], eleman[2].randevu_id))
+
+        with self._kilit:
+            # Yükleme sırasında tabloya yazıldıysa sonuç bu çağrıda kullanılır ama saklanmaz
+            if surum == self._surum:
+                self._gunler[gun] = (time.monotonic(), indeks)
+        return indeks
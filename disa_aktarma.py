@@ -0,0 +1,311 @@
+"""
+Muayene ve aşı kayıtlarının CSV veya XLSX dosyasına dışa aktarılması.
+
+Kayıtlar tamponsuz imleçle (Veritabani.sorgu_akisi) parti parti okunur ve
+her parti hemen dosyaya yazılır; bellekte hiçbir zaman bir partiden fazlası
+tutulmaz. XLSX dosyası ek bir kütüphane olmadan, çalışma sayfası zip içine
+akış olarak yazılarak üretilir; Excel'in sayfa başına satır sınırı aşılırsa
+yeni sayfaya geçilir. Dosya önce geçici adla yazılır, aktarım tamamlanınca
+yerine taşınır; yarıda kalan aktarım yarım dosya bırakmaz.
+
+Kullanım:
+    python disa_aktarma.py muayeneler muayeneler.xlsx [--baslangic 2020-01-01] [--bitis 2024-12-31]
+    python disa_aktarma.py asi_takip asilar.csv [--hayvan-id 12 | --sahip-id 7] [--ayirici ";"] [--motor sqlite]
+"""
+import argparse
+import csv
+import os
+import re
+import sys
+import time
+import zipfile
+from datetime import datetime
+
+import sorgular
+from veritabani import VeritabaniHatasi
+
+# tablo: [(başlık, tür)]; sütunlar sorgular.disa_aktarma_sorgusu ile aynı sırada
+SUTUNLAR = {
+    "muayeneler": [("ID", "sayi"), ("Muayene Tarihi", "zaman"), ("Hayvan ID", "sayi"), ("Hayvan", "metin"),
+                   ("Sahip", "metin"), ("Şikayet", "metin"), ("Bulgular", "metin"), ("Teşhis", "metin"),
+                   ("Tedavi Planı", "metin")],
+    "asi_takip": [("ID", "sayi"), ("Aşı Tarihi", "tarih"), ("Sonraki Aşı Tarihi", "tarih"), ("Hayvan ID", "sayi"),
+                  ("Hayvan", "metin"), ("Sahip", "metin"), ("Aşı", "metin"), ("Notlar", "metin")],
+}
+
+
+class DisaAktarmaDurumu:
+    """Aktarım sürerken belirli aralıklarla üretilen ilerleme bilgisi; son durumda bitti True'dur."""
+    __slots__ = ("yazilan", "toplam", "sure", "dosya", "bitti")
+
+    def __init__(self, yazilan, toplam, sure, dosya, bitti=False):
+        self.yazilan = yazilan
+        self.toplam = toplam
+        self.sure = sure
+        self.dosya = dosya
+        self.bitti = bitti
+
+    @property
+    def oran(self):
+        return min(1.0, self.yazilan / self.toplam) if self.toplam else float(self.bitti)
+
+    @property
+    def satir_hizi(self):
+        return self.yazilan / self.sure if self.sure > 0 else 0.0
+
+    def ozet(self):
+        return f"{self.yazilan}/{self.toplam} kayıt yazıldı — {self.satir_hizi:,.0f} satır/sn, {self.sure:.1f} sn"
+
+
+# --- CSV ---
+# bicimler.tarih_metni / zaman_metni ile aynı metin; isoformat strftime'dan birkaç kat hızlı
+def _tarih_metni(deger):
+    return deger.isoformat() if deger is not None else ""
+
+
+def _zaman_metni(deger):
+    return deger.isoformat(" ", "minutes") if deger is not None else ""
+
+
+class _CsvYazici:
+    def __init__(self, yol, sutunlar, ayirici=","):
+        self._dosya = open(yol, "w", newline="", encoding="utf-8")
+        # Excel'in Türkçe karakterleri doğru açması için BOM; utf-8-sig her yazmada BOM denetimi yapar
+        self._dosya.write("\ufeff")
+        self._yazici = csv.writer(self._dosya, delimiter=ayirici)
+        self._yazici.writerow([baslik for baslik, _ in sutunlar])
+        donusturuculer = {"tarih": _tarih_metni, "zaman": _zaman_metni}
+        self._donusturuculer = [donusturuculer.get(tur) for _, tur in sutunlar]
+
+    def yaz(self, kayitlar):
+        donusturuculer = self._donusturuculer
+        self._yazici.writerows([donustur(deger) if donustur else deger for donustur, deger in zip(donusturuculer, kayit)]
+                               for kayit in kayitlar)
+
+    def kapat(self):
+        self._dosya.close()
+
+
+# --- XLSX ---
+XLSX_SAYFA_SATIR_SINIRI = 1048576  # Başlık dahil
+_XLSX_HUCRE_SINIRI = 32767
+_EXCEL_BASLANGICI = datetime(1899, 12, 30)
+_GECERSIZ_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_SUTUN_GENISLIKLERI = {"sayi": 9, "tarih": 12, "zaman": 17, "metin": 30}
+
+_XLSX_STILLER = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<numFmts count="2"><numFmt numFmtId="164" formatCode="yyyy\\-mm\\-dd"/><numFmt numFmtId="165" formatCode="yyyy\\-mm\\-dd hh:mm"/></numFmts>
+<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font><font><b/><sz val="11"/><name val="Calibri"/></font></fonts>
+<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>
+<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>
+<cellXfs count="4"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>\
+<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>\
+<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>\
+<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>
+<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>
+</styleSheet>"""
+_XLSX_ILISKILER = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" \
+Target="xl/workbook.xml"/></Relationships>"""
+
+
+def _xml_kacis(metin):
+    return metin.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+# Hücre ve satırlara konum (r="B2") yazılmaz; konum verilmeyen hücreler sırayla yerleşir, boş değer <c/> olur
+def _metin_hucresi(deger):
+    metin = deger if isinstance(deger, str) else str(deger)
+    if len(metin) > _XLSX_HUCRE_SINIRI:
+        metin = metin[:_XLSX_HUCRE_SINIRI]
+    if not metin.isprintable():
+        metin = _GECERSIZ_XML.sub("", metin)
+    metin = _xml_kacis(metin)
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{metin}</t></is></c>'
+
+
+def _tarih_hucresi(deger):
+    return f'<c s="1"><v>{(deger - _EXCEL_BASLANGICI.date()).days}</v></c>'
+
+
+def _zaman_hucresi(deger):
+    return f'<c s="2"><v>{(deger - _EXCEL_BASLANGICI).total_seconds() / 86400:.6f}</v></c>'
+
+
+def _sayi_hucresi(deger):
+    return f"<c><v>{deger}</v></c>"
+
+
+_HUCRELER = {"sayi": _sayi_hucresi, "tarih": _tarih_hucresi, "zaman": _zaman_hucresi, "metin": _metin_hucresi}
+
+
+class _XlsxYazici:
+    def __init__(self, yol, sutunlar):
+        self._zip = zipfile.ZipFile(yol, "w", zipfile.ZIP_DEFLATED, compresslevel=1)
+        self._sutunlar = sutunlar
+        self._hucreler = [_HUCRELER[tur] for _, tur in sutunlar]
+        self._sayfa_sayisi = 0
+        self._sayfa = None
+        self._satir = 0
+        self._yeni_sayfa()
+
+    def _yeni_sayfa(self):
+        if self._sayfa is not None:
+            self._sayfa.write(b"</sheetData></worksheet>")
+            self._sayfa.close()
+        self._sayfa_sayisi += 1
+        self._sayfa = self._zip.open(f"xl/worksheets/sheet{self._sayfa_sayisi}.xml", "w", force_zip64=True)
+        genislikler = "".join(f'<col min="{i}" max="{i}" width="{_SUTUN_GENISLIKLERI[tur]}" customWidth="1"/>'
+                              for i, (_, tur) in enumerate(self._sutunlar, 1))
+        baslik = "".join(f'<c s="3" t="inlineStr"><is><t>{_xml_kacis(ad)}</t></is></c>' for ad, _ in self._sutunlar)
+        self._sayfa.write(
+            ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+             '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             '<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+             f'</sheetView></sheetViews><cols>{genislikler}</cols><sheetData><row>{baslik}</row>').encode())
+        self._satir = 1
+
+    def yaz(self, kayitlar):
+        parcalar = []
+        hucreler = self._hucreler
+        for kayit in kayitlar:
+            if self._satir >= XLSX_SAYFA_SATIR_SINIRI:
+                self._sayfa.write("".join(parcalar).encode())
+                parcalar.clear()
+                self._yeni_sayfa()
+            self._satir += 1
+            parcalar.append("<row>")
+            parcalar += [hucre(deger) if deger is not None else "<c/>" for hucre, deger in zip(hucreler, kayit)]
+            parcalar.append("</row>")
+        self._sayfa.write("".join(parcalar).encode())
+
+    def kapat(self):
+        self._sayfa.write(b"</sheetData></worksheet>")
+        self._sayfa.close()
+        sayfalar = range(1, self._sayfa_sayisi + 1)
+        self._zip.writestr("[Content_Types].xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            + "".join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                      'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                      for i in sayfalar)
+            + "</Types>"))
+        self._zip.writestr("_rels/.rels", _XLSX_ILISKILER)
+        self._zip.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            + "".join(f'<sheet name="Sayfa{i}" sheetId="{i}" r:id="rId{i}"/>' for i in sayfalar)
+            + "</sheets></workbook>"))
+        self._zip.writestr("xl/_rels/workbook.xml.rels", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(f'<Relationship Id="rId{i}" '
+                      'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                      f'Target="worksheets/sheet{i}.xml"/>' for i in sayfalar)
+            + f'<Relationship Id="rId{self._sayfa_sayisi + 1}" '
+              'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+            + "</Relationships>"))
+        self._zip.writestr("xl/styles.xml", _XLSX_STILLER)
+        self._zip.close()
+
+
+def disa_aktar(db, dosya, tablo, baslangic=None, bitis=None, hayvan_id=None, sahip_id=None,
+               parti_boyutu=2000, ayirici=",", ilerleme_araligi=0.1):
+    """
+    Kayıtları dosyaya yazan üreteç; en fazla ilerleme_araligi saniyede bir DisaAktarmaDurumu
+    üretir, sonuncusunun bitti'si True'dur. Biçim dosya uzantısından (.csv / .xlsx) seçilir.
+    Üreteç yarıda kapatılırsa dosya oluşturulmaz.
+    :param baslangic, bitis: Dahil olan ilk ve son gün (datetime.date).
+    :param ayirici: CSV alan ayırıcısı.
+    :raises ValueError: Uzantı desteklenmiyorsa.
+    :raises VeritabaniHatasi: Sorgu başarısız olursa.
+    """
+    uzanti = os.path.splitext(dosya)[1].lower()
+    if uzanti not in (".csv", ".xlsx"):
+        raise ValueError(f"Desteklenmeyen dosya türü: {uzanti or dosya!r} (.csv veya .xlsx olmalı)")
+    filtreler = {"baslangic": baslangic, "bitis": bitis, "hayvan_id": hayvan_id, "sahip_id": sahip_id}
+    baslangic_zamani = time.perf_counter()
+    toplam = db.sorgu(*sorgular.disa_aktarma_sorgusu(tablo, sayim=True, **filtreler), fetch_results=True)[0][0]
+
+    gecici = f"{dosya}.yaziliyor"
+    if uzanti == ".csv":
+        yazici = _CsvYazici(gecici, SUTUNLAR[tablo], ayirici)
+    else:
+        yazici = _XlsxYazici(gecici, SUTUNLAR[tablo])
+    akis = db.sorgu_akisi(*sorgular.disa_aktarma_sorgusu(tablo, **filtreler), parti_boyutu=parti_boyutu)
+    yazilan, son_bildirim, tamam = 0, 0.0, False
+    try:
+        yield DisaAktarmaDurumu(0, toplam, 0.0, dosya)
+        for parti in akis:
+            yazici.yaz(parti)
+            yazilan += len(parti)
+            # Her partide değil aralıklarla bildirilir; arayüz yetişemezse aktarım beklemesin
+            simdi = time.perf_counter()
+            if simdi - son_bildirim >= ilerleme_araligi:
+                son_bildirim = simdi
+                yield DisaAktarmaDurumu(yazilan, toplam, simdi - baslangic_zamani, dosya)
+        yazici.kapat()
+        os.replace(gecici, dosya)
+        tamam = True
+        yield DisaAktarmaDurumu(yazilan, max(toplam, yazilan), time.perf_counter() - baslangic_zamani, dosya, bitti=True)
+    finally:
+        akis.close()
+        if not tamam:
+            try:
+                yazici.kapat()
+            except Exception:
+                pass  # Asıl hata iletilsin
+            if os.path.exists(gecici):
+                os.remove(gecici)
+
+
+def _gun(metin):
+    try:
+        return datetime.strptime(metin, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"tarih YYYY-AA-GG biçiminde olmalı: {metin!r}") from None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Muayene veya aşı kayıtlarını CSV / XLSX dosyasına aktarır")
+    parser.add_argument("tablo", choices=tuple(SUTUNLAR))
+    parser.add_argument("dosya", help="Uzantısı biçimi belirler: .csv veya .xlsx")
+    parser.add_argument("--baslangic", type=_gun, help="İlk gün (YYYY-AA-GG, dahil)")
+    parser.add_argument("--bitis", type=_gun, help="Son gün (YYYY-AA-GG, dahil)")
+    parser.add_argument("--hayvan-id", type=int)
+    parser.add_argument("--sahip-id", type=int)
+    parser.add_argument("--ayirici", default=",", help="CSV alan ayırıcısı")
+    parser.add_argument("--motor", choices=("mysql", "sqlite"), help="Ayarlardaki motor yerine bunu kullan")
+    args = parser.parse_args()
+
+    from ayarlar import veritabani_ac
+    db = veritabani_ac(args.motor)
+    try:
+        durum = None
+        for durum in disa_aktar(db, args.dosya, args.tablo, args.baslangic, args.bitis, args.hayvan_id,
+                                args.sahip_id, ayirici=args.ayirici):
+            print(f"\r{durum.oran:4.0%}  {durum.ozet()}", end="", flush=True)
+        print()
+        return 0
+    except (ValueError, OSError) as err:
+        print(f"\nHata: {err}", file=sys.stderr)
+        return 2
+    except VeritabaniHatasi as err:
+        print(f"\n{err.baslik}: {err.mesaj}", file=sys.stderr)
+        return 2
+    finally:
+        db.kapat()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
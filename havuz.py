@@ -0,0 +1,178 @@
+"""
+Veritabanı bağlantı havuzu.
+
+Her sorguda yeni bir bağlantı açıp kapatmak (TCP el sıkışması + kimlik doğrulama)
+yerine açık bağlantıları yeniden kullanır. Sürücüden bağımsızdır; bağlantıyı
+açan fabrika fonksiyonu ve sağlık kontrolü dışarıdan verilir.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class HavuzHatasi(Exception):
+    """Havuz kapatıldığında veya zaman aşımı içinde bağlantı alınamadığında fırlatılır."""
+
+
+class HavuzBaglantisi:
+    """Havuzdaki tek bir bağlantı, kullanım zamanları ve bağlantıya özgü önbellekler."""
+    __slots__ = ("baglanti", "olusturulma", "son_kullanim", "ek")
+
+    def __init__(self, baglanti):
+        self.baglanti = baglanti
+        self.olusturulma = time.monotonic()
+        self.son_kullanim = self.olusturulma
+        self.ek = {}  # Bağlantıyla birlikte yaşayıp ölen durum (ör. hazırlanmış ifadeler)
+
+
+class BaglantiHavuzu:
+    def __init__(self, fabrika, boyut=5, saglik_kontrolu=None, kapatici=None,
+                 bosta_kalma_suresi=300, kontrol_esigi=5, deneme_sayisi=3,
+                 bekleme_suresi=0.2, alma_zaman_asimi=10, hata_turleri=(Exception,)):
+        """
+        :param fabrika: Yeni bir bağlantı açıp döndüren fonksiyon.
+        :param boyut: Aynı anda açık olabilecek en fazla bağlantı sayısı.
+        :param saglik_kontrolu: Bağlantı sağlamsa True döndüren fonksiyon (ör. ping).
+        :param kapatici: Bağlantıyı kapatan fonksiyon; verilmezse baglanti.close() kullanılır.
+        :param bosta_kalma_suresi: Bu kadar saniye kullanılmayan bağlantılar kapatılır.
+        :param kontrol_esigi: Bu kadar saniyeden uzun boşta kalan bağlantı verilmeden önce kontrol edilir.
+        :param deneme_sayisi: Bağlantı açılamazsa toplam deneme sayısı.
+        :param bekleme_suresi: İlk yeniden denemeden önceki bekleme; her denemede iki katına çıkar.
+        :param alma_zaman_asimi: Havuz doluyken boş bağlantı için en fazla bekleme süresi.
+        :param hata_turleri: Yeniden denemeyi tetikleyen bağlantı hatası türleri.
+        """
+        self.fabrika = fabrika
+        self.boyut = boyut
+        self.saglik_kontrolu = saglik_kontrolu
+        self.kapatici = kapatici
+        self.bosta_kalma_suresi = bosta_kalma_suresi
+        self.kontrol_esigi = kontrol_esigi
+        self.deneme_sayisi = max(1, deneme_sayisi)
+        self.bekleme_suresi = bekleme_suresi
+        self.alma_zaman_asimi = alma_zaman_asimi
+        self.hata_turleri = hata_turleri
+
+        self._bostakiler = deque()  # Sağda en son bırakılan (sıcak) bağlantı durur
+        self._acik = 0              # Boştakiler + kullanımdakiler
+        self._kosul = threading.Condition()
+        self._kapali = False
+        self.istatistik = {"acilan": 0, "yeniden_kullanilan": 0, "bozuk": 0, "tahliye": 0}
+
+    def al(self, zaman_asimi=None):
+        """Sağlıklı bir HavuzBaglantisi döndürür; gerekirse yeni bağlantı açar."""
+        bitis = time.monotonic() + (self.alma_zaman_asimi if zaman_asimi is None else zaman_asimi)
+        while True:
+            hb = None
+            with self._kosul:
+                if self._kapali:
+                    raise HavuzHatasi("Bağlantı havuzu kapatıldı.")
+                eskiler = self._eskileri_ayir()
+                if self._bostakiler:
+                    hb = self._bostakiler.pop()
+                elif self._acik < self.boyut:
+                    self._acik += 1
+                else:
+                    kalan = bitis - time.monotonic()
+                    if kalan <= 0:
+                        raise HavuzHatasi(f"{self.boyut} bağlantının tamamı kullanımda; boş bağlantı beklenirken zaman aşımı.")
+                    self._kosul.wait(kalan)
+                    continue
+            # Ağ işlemleri kilit dışında yapılır
+            for eski in eskiler:
+                self._sessiz_kapat(eski.baglanti)
+
+            if hb is None:
+                try:
+                    return HavuzBaglantisi(self._yeni_baglanti())
+                except BaseException:
+                    self._sayaci_dusur()
+                    raise
+
+            if time.monotonic() - hb.son_kullanim < self.kontrol_esigi or self._saglikli_mi(hb.baglanti):
+                self.istatistik["yeniden_kullanilan"] += 1
+                return hb
+
+            # Sunucu bağlantıyı düşürmüş; kapatıp yenisini dene
+            self.istatistik["bozuk"] += 1
+            self._sessiz_kapat(hb.baglanti)
+            self._sayaci_dusur()
+
+    def birak(self, hb, bozuk=False):
+        """Bağlantıyı havuza geri koyar; bozuksa veya havuz kapalıysa kapatır."""
+        with self._kosul:
+            if not (bozuk or self._kapali):
+                hb.son_kullanim = time.monotonic()
+                self._bostakiler.append(hb)
+                self._kosul.notify()
+                return
+        self._sessiz_kapat(hb.baglanti)
+        self._sayaci_dusur()
+
+    @contextmanager
+    def baglanti(self):
+        """`with havuz.baglanti() as db:` şeklinde kullanım için."""
+        hb = self.al()
+        bozuk = False
+        try:
+            yield hb.baglanti
+        except BaseException:
+            bozuk = not self._saglikli_mi(hb.baglanti)
+            raise
+        finally:
+            self.birak(hb, bozuk)
+
+    def kapat(self):
+        """Boştaki tüm bağlantıları kapatır; kullanımdakiler bırakıldıklarında kapanır."""
+        with self._kosul:
+            self._kapali = True
+            bostakiler = list(self._bostakiler)
+            self._bostakiler.clear()
+            self._acik -= len(bostakiler)
+            self._kosul.notify_all()
+        for hb in bostakiler:
+            self._sessiz_kapat(hb.baglanti)
+
+    def _yeni_baglanti(self):
+        """Fabrikayı çağırır; bağlantı hatalarında üstel bekleme ile yeniden dener."""
+        for deneme in range(self.deneme_sayisi):
+            try:
+                baglanti = self.fabrika()
+                self.istatistik["acilan"] += 1
+                return baglanti
+            except self.hata_turleri:
+                if deneme == self.deneme_sayisi - 1:
+                    raise
+                time.sleep(self.bekleme_suresi * (2 ** deneme))
+
+    def _eskileri_ayir(self):
+        """Boşta kalma süresini aşan bağlantıları havuzdan çıkarır (kilit altında çağrılır)."""
+        eskiler = []
+        sinir = time.monotonic() - self.bosta_kalma_suresi
+        while self._bostakiler and self._bostakiler[0].son_kullanim < sinir:
+            eskiler.append(self._bostakiler.popleft())
+        self._acik -= len(eskiler)
+        self.istatistik["tahliye"] += len(eskiler)
+        return eskiler
+
+    def _sayaci_dusur(self):
+        with self._kosul:
+            self._acik -= 1
+            self._kosul.notify()
+
+    def _saglikli_mi(self, baglanti):
+        if self.saglik_kontrolu is None:
+            return True
+        try:
+            return bool(self.saglik_kontrolu(baglanti))
+        except Exception:
+            return False
+
+    def _sessiz_kapat(self, baglanti):
+        try:
+            if self.kapatici:
+                self.kapatici(baglanti)
+            else:
+                baglanti.close()
+        except Exception:
+            pass
@@ -0,0 +1,76 @@
+"""
+Formlar için yazdıkça arayan hayvan seçici.
+
+Tüm hayvanları bir Combobox'a doldurmak yerine, kullanıcı yazmayı bıraktıktan
+kısa bir süre sonra hayvan adı, sahip adı veya id ile arama yapılır ve en iyi
+eşleşmeler açılır listeye konur. Form açılışında veritabanına gidilmez; her
+arama indeksli ve sınırlı olduğundan hayvan sayısından bağımsız olarak hızlıdır.
+"""
+from tkinter import ttk
+
+import bicimler
+import sorgular
+
+# Arama tetiklemeyen tuşlar (listede gezinme, seçim)
+_GEZINME_TUSLARI = {"Up", "Down", "Return", "KP_Enter", "Tab", "Escape", "Left", "Right", "Home", "End",
+                    "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R"}
+
+
+class HayvanSecici(ttk.Combobox):
+    def __init__(self, parent, db, yurutucu, gecikme=250, **ayarlar):
+        """
+        :param db: Aramaların yapılacağı Veritabani.
+        :param yurutucu: Aramaları arka planda çalıştıran ArkaplanYurutucu.
+        :param gecikme: Son tuştan sonra aramaya başlamadan beklenecek süre (ms).
+        """
+        super().__init__(parent, **ayarlar)
+        self.db = db
+        self.yurutucu = yurutucu
+        self.gecikme = gecikme
+        self._idler = {}          # Gösterilen etiket -> hayvan id
+        self._zamanlayici = None  # Bekleyen aramanın after() kimliği
+        self._aranan = None       # Son aranan metin
+        self.bind("<KeyRelease>", self._tus_birakildi)
+        self.bind("<Destroy>", self._yok_edildi, add="+")
+
+    def secili_id(self):
+        """Alandaki metin bir eşleşme etiketiyse o hayvanın id'si, değilse None."""
+        return self._idler.get(self.get().strip())
+
+    def sec(self, hayvan_id):
+        """Alanı verilen hayvanla doldurur (güncelleme formları); hayvan yoksa alan boş kalır."""
+        kayitlar = self.db.sorgu_calistir(sorgular.HAYVAN_SECICI_ID, (hayvan_id,), fetch_results=True)
+        self._sonuclari_goster(kayitlar or [])
+        self.set(self["values"][0] if kayitlar else "")
+        self._aranan = self.get()
+
+    def _tus_birakildi(self, event):
+        if event.keysym in _GEZINME_TUSLARI:
+            return
+        if self._zamanlayici is not None:
+            self.after_cancel(self._zamanlayici)
+        self._zamanlayici = self.after(self.gecikme, self._ara)
+
+    def _yok_edildi(self, event):
+        # Form yazdıktan hemen sonra kapatılırsa bekleyen arama yok edilmiş alanda çalışmasın
+        if self._zamanlayici is not None:
+            self.after_cancel(self._zamanlayici)
+            self._zamanlayici = None
+
+    def _ara(self):
+        self._zamanlayici = None
+        metin = self.get().strip()
+        if metin == self._aranan or metin in self._idler:
+            return  # Değişmedi ya da listeden seçildi
+        self._aranan = metin
+        arama = sorgular.hayvan_secici_aramasi(metin)
+        if arama is None:
+            self._sonuclari_goster([])
+            return
+        # Aynı anahtar: yeni arama gönderilince öncekinin sonucu yok sayılır
+        self.yurutucu.gonder(self.db.sorgu, *arama, fetch_results=True, basarili=self._sonuclari_goster,
+                             sahip=self.winfo_toplevel(), anahtar=self)
+
+    def _sonuclari_goster(self, kayitlar):
+        self._idler = {bicimler.hayvan_etiketi(*kayit): kayit[0] for kayit in kayitlar}
+        self["values"] = list(self._idler)
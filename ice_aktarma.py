@@ -0,0 +1,363 @@
+"""
+Sahip ve hayvanların CSV dosyasından toplu içe aktarılması.
+
+Dosya satır satır okunur; her satır formlardaki kurallarla doğrulanır ve
+geçerli satırlar parti parti executemany ile, her parti tek işlemde eklenir.
+Bellek kullanımı dosya boyutundan değil parti boyutundan etkilenir. Bir
+partinin yazılması veritabanı hatasıyla başarısız olursa o parti satır satır
+yeniden denenir ve yalnızca hatalı satırlar reddedilir. Reddedilen satırlar
+satır numarası ve sebebiyle birlikte ayrı bir CSV dosyasına yazılır; dosya
+düzeltilip yeniden içe aktarılabilir.
+
+İlk satır başlıktır; ayırıcı (virgül, noktalı virgül veya sekme) başlıktan bulunur.
+
+    sahipler:  isim, telefon, [adres]
+    hayvanlar: isim, tur, cins, dogum_tarihi, gelis_sebebi, [notlar] ve sahip için
+               sahip_id ya da sahip_telefon, [sahip_isim, sahip_adres]
+
+Hayvanın sahibi sahip_id ile ya da kayıtlı sahiplerin telefonuyla bulunur;
+telefonla kayıtlı sahip yoksa ve sahip_isim verilmişse sahip de eklenir.
+Aynı telefonla kayıtlı bir sahip varsa sahip satırı reddedilir; böylece
+yarıda kalan bir aktarım aynı dosyayla yeniden çalıştırılabilir.
+
+Kullanım:
+    python ice_aktarma.py sahipler sahipler.csv [--parti-boyutu 1000] [--reddedilenler yol] [--motor sqlite]
+    python ice_aktarma.py hayvanlar hayvanlar.csv [--kodlama cp1254]
+"""
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+
+import sorgular
+from servisler import GELIS_SEBEPLERI, tarih_dogrula
+from veritabani import VeritabaniHatasi
+
+# Şemadaki (MySQL) VARCHAR uzunlukları; aşan satırlar yazılmadan reddedilir
+_UZUNLUKLAR = {"isim": 100, "telefon": 20, "tur": 50, "cins": 50, "sahip_isim": 100, "sahip_telefon": 20}
+
+# Arayüze iletilen ilk reddedilen satırlar; hepsi reddedilenler dosyasındadır
+GOSTERILEN_RED_SAYISI = 200
+
+
+class IceAktarmaDurumu:
+    """Her partiden sonra üretilen ilerleme bilgisi; son durumda bitti True'dur."""
+    __slots__ = ("tablo", "okunan", "eklenen", "yeni_sahip", "reddedilen", "yeni_redler", "oran", "sure",
+                 "reddedilen_dosyasi", "bitti")
+
+    def __init__(self, tablo, okunan, eklenen, yeni_sahip, reddedilen, yeni_redler, oran, sure,
+                 reddedilen_dosyasi=None, bitti=False):
+        self.tablo = tablo
+        self.okunan = okunan
+        self.eklenen = eklenen
+        self.yeni_sahip = yeni_sahip          # Hayvan satırları için eklenen sahipler
+        self.reddedilen = reddedilen
+        self.yeni_redler = yeni_redler        # Bu partide reddedilen (satır no, sebep) çiftleri
+        self.oran = oran                      # Dosyanın okunan kısmı (0-1)
+        self.sure = sure
+        self.reddedilen_dosyasi = reddedilen_dosyasi
+        self.bitti = bitti
+
+    @property
+    def satir_hizi(self):
+        return self.okunan / self.sure if self.sure > 0 else 0.0
+
+    def ozet(self):
+        metin = f"{self.okunan} satır okundu, {self.eklenen} {self.tablo} kaydı eklendi"
+        if self.yeni_sahip:
+            metin += f" ({self.yeni_sahip} yeni sahip)"
+        return f"{metin}, {self.reddedilen} satır reddedildi — {self.satir_hizi:,.0f} satır/sn, {self.sure:.1f} sn"
+
+
+# --- Doğrulama (formlardaki kurallar) ---
+def _alan(satir, ad, zorunlu=True, etiket=None):
+    deger = (satir.get(ad) or "").strip()
+    if zorunlu and not deger:
+        raise ValueError(f"{etiket or ad} boş bırakılamaz.")
+    if len(deger) > _UZUNLUKLAR.get(ad, len(deger)):
+        raise ValueError(f"{etiket or ad} en fazla {_UZUNLUKLAR[ad]} karakter olabilir.")
+    return deger or None
+
+
+def _sahip_kaydi(satir):
+    # Sahip formu: ad ve telefon zorunlu, adres boşsa NULL
+    return (_alan(satir, "isim", etiket="Adı Soyadı"), _alan(satir, "telefon", etiket="Telefon"),
+            _alan(satir, "adres", zorunlu=False))
+
+
+def _hayvan_kaydi(satir):
+    """(isim, tur, cins, dogum_tarihi, gelis_sebebi, notlar, sahip_id, sahip_telefon, sahip_isim, sahip_adres)"""
+    isim = _alan(satir, "isim", etiket="Hayvan Adı")
+    tur = _alan(satir, "tur", etiket="Tür")
+    cins = _alan(satir, "cins", etiket="Cins")
+    dogum = tarih_dogrula(_alan(satir, "dogum_tarihi", etiket="Doğum Tarihi"), "Doğum tarihi")
+    gelis = _alan(satir, "gelis_sebebi", etiket="Geliş Sebebi")
+    if gelis not in GELIS_SEBEPLERI:
+        raise ValueError(f"Geliş sebebi şunlardan biri olmalı: {', '.join(GELIS_SEBEPLERI)}.")
+
+    sahip_id = _alan(satir, "sahip_id", zorunlu=False)
+    sahip_telefon = _alan(satir, "sahip_telefon", zorunlu=False)
+    if sahip_id is not None:
+        if not sahip_id.isdigit():
+            raise ValueError(f"Sahip id bir sayı olmalı ({sahip_id!r}).")
+        sahip_id = int(sahip_id)
+    elif sahip_telefon is None:
+        raise ValueError("Sahip için sahip_id veya sahip_telefon gerekli.")
+    return (isim, tur, cins, dogum, gelis, _alan(satir, "notlar", zorunlu=False), sahip_id, sahip_telefon,
+            _alan(satir, "sahip_isim", zorunlu=False), _alan(satir, "sahip_adres", zorunlu=False))
+
+
+# --- Partilerin yazılması ---
+def _parcalar(degerler):
+    degerler = list(degerler)
+    for i in range(0, len(degerler), sorgular.IN_LISTESI_SINIRI):
+        yield degerler[i:i + sorgular.IN_LISTESI_SINIRI]
+
+
+def _telefonla_sahipler(oturum, telefonlar):
+    bulunan = {}
+    for parca in _parcalar(telefonlar):
+        bulunan.update(oturum.calistir(*sorgular.sahipler_telefonla(parca), fetch_results=True))
+    return bulunan
+
+
+def _var_olan_sahipler(oturum, idler):
+    var_olan = set()
+    for parca in _parcalar(idler):
+        var_olan.update(sahip_id for sahip_id, in oturum.calistir(*sorgular.sahipler_idyle(parca), fetch_results=True))
+    return var_olan
+
+
+def _sahipleri_yaz(oturum, parti):
+    """parti: [(satır no, kayıt)]; :return: (eklenen, yeni sahip, [(satır no, sebep)])"""
+    gorulen = set(_telefonla_sahipler(oturum, {kayit[1] for _, kayit in parti}))
+    eklenecek, redler = [], []
+    for satir_no, kayit in parti:
+        if kayit[1] in gorulen:
+            redler.append((satir_no, f"{kayit[1]} telefonuyla bir sahip zaten var (kayıtlı veya dosyada daha önce)."))
+            continue
+        gorulen.add(kayit[1])
+        eklenecek.append(kayit)
+    if eklenecek:
+        oturum.coklu_calistir(sorgular.SAHIP_EKLE, eklenecek)
+    return len(eklenecek), 0, redler
+
+
+def _hayvanlari_yaz(oturum, parti):
+    var_olan_idler = _var_olan_sahipler(oturum, {kayit[6] for _, kayit in parti if kayit[6] is not None})
+    telefonlar = _telefonla_sahipler(oturum, {kayit[7] for _, kayit in parti if kayit[6] is None})
+
+    # Kayıtlı olmayan telefonlar için ilk satırdaki bilgilerle yeni sahip
+    yeni_sahipler = {}
+    for _, kayit in parti:
+        if kayit[6] is None and kayit[7] not in telefonlar and kayit[8] is not None:
+            yeni_sahipler.setdefault(kayit[7], (kayit[8], kayit[7], kayit[9]))
+    if yeni_sahipler:
+        oturum.coklu_calistir(sorgular.SAHIP_EKLE, list(yeni_sahipler.values()))
+        telefonlar.update(_telefonla_sahipler(oturum, yeni_sahipler))
+
+    eklenecek, redler = [], []
+    for satir_no, kayit in parti:
+        if kayit[6] is not None:
+            sahip_id = kayit[6] if kayit[6] in var_olan_idler else None
+            if sahip_id is None:
+                redler.append((satir_no, f"{kayit[6]} id'li sahip bulunamadı."))
+                continue
+        else:
+            sahip_id = telefonlar.get(kayit[7])
+            if sahip_id is None:
+                redler.append((satir_no, f"{kayit[7]} telefonuyla kayıtlı sahip yok ve sahip_isim verilmemiş."))
+                continue
+        eklenecek.append(kayit[:5] + (sahip_id, kayit[5]))
+    if eklenecek:
+        oturum.coklu_calistir(sorgular.HAYVAN_EKLE, eklenecek)
+    return len(eklenecek), len(yeni_sahipler), redler
+
+
+# tablo: (satırı doğrulayıp kayda çeviren, partiyi yazan, zorunlu sütunlar)
+_TABLOLAR = {
+    "sahipler": (_sahip_kaydi, _sahipleri_yaz, ("isim", "telefon")),
+    "hayvanlar": (_hayvan_kaydi, _hayvanlari_yaz, ("isim", "tur", "cins", "dogum_tarihi", "gelis_sebebi")),
+}
+
+
+def _islemde_yaz(oturum, yazici, parti):
+    oturum.calistir("BEGIN")
+    try:
+        sonuc = yazici(oturum, parti)
+        oturum.calistir("COMMIT")
+        return sonuc
+    except BaseException:
+        oturum.calistir("ROLLBACK")
+        raise
+
+
+def _partiyi_yaz(oturum, yazici, parti):
+    """Partiyi tek işlemde yazar; veritabanı reddederse satırları tek tek yazıp hatalıları ayıklar."""
+    try:
+        return _islemde_yaz(oturum, yazici, parti)
+    except VeritabaniHatasi:
+        pass
+    eklenen, yeni_sahip, redler = 0, 0, []
+    for eleman in parti:
+        try:
+            sonuc = _islemde_yaz(oturum, yazici, [eleman])
+        except VeritabaniHatasi as err:
+            redler.append((eleman[0], err.mesaj.replace("\n", " ")))
+            continue
+        eklenen += sonuc[0]
+        yeni_sahip += sonuc[1]
+        redler.extend(sonuc[2])
+    return eklenen, yeni_sahip, redler
+
+
+# --- Dosyanın okunması ---
+def _metin_satirlari(ikili, kodlama, konum):
+    """İkili dosyayı satır satır çözer; konum[0] okunan bayt sayısını tutar (ilerleme oranı için)."""
+    for satir_no, satir in enumerate(ikili, 1):
+        konum[0] += len(satir)
+        try:
+            yield satir.decode(kodlama if satir_no == 1 else kodlama.replace("-sig", ""))
+        except UnicodeDecodeError:
+            raise ValueError(f"{satir_no}. satır {kodlama} kodlamasıyla okunamadı; dosyanın kodlamasını belirtin.") from None
+
+
+class _RedDosyasi:
+    """Reddedilen satırları ilk redde açılan bir CSV dosyasına yazar."""
+
+    def __init__(self, yol, baslik):
+        self.yol = yol
+        self.baslik = baslik
+        self._dosya = None
+        self._yazici = None
+
+    def yaz(self, satir_no, sebep, alanlar):
+        if self._dosya is None:
+            self._dosya = open(self.yol, "w", newline="", encoding="utf-8-sig")
+            self._yazici = csv.writer(self._dosya)
+            self._yazici.writerow(["satir", "hata"] + self.baslik)
+        self._yazici.writerow([satir_no, sebep] + alanlar)
+
+    def kapat(self):
+        if self._dosya is not None:
+            self._dosya.close()
+
+
+def ice_aktar(db, dosya, tablo, parti_boyutu=1000, reddedilen_dosyasi=None, kodlama="utf-8-sig"):
+    """
+    CSV dosyasındaki sahip veya hayvanları ekler; bir üreteçtir ve her partiden sonra bir
+    IceAktarmaDurumu üretir, sonuncusunun bitti'si True'dur. Üreteç yarıda kapatılırsa
+    o ana kadar yazılan partiler kalır.
+    :param tablo: "sahipler" veya "hayvanlar".
+    :param parti_boyutu: Bir işlemde eklenecek en fazla satır.
+    :param reddedilen_dosyasi: Reddedilen satırların yazılacağı CSV (varsayılan: dosya.reddedilen.csv).
+    :raises ValueError: Dosya başlığı eksik sütunlar içeriyorsa veya okunamıyorsa.
+    :raises VeritabaniHatasi: Bağlantı koparsa; yazılmış partiler geri alınmaz.
+    """
+    kaydi_olustur, yazici, zorunlu_sutunlar = _TABLOLAR[tablo]
+    reddedilen_dosyasi = reddedilen_dosyasi or os.path.splitext(dosya)[0] + ".reddedilen.csv"
+    boyut = os.path.getsize(dosya) or 1
+    baslangic = time.perf_counter()
+    okunan = eklenen = yeni_sahip = reddedilen = 0
+
+    with open(dosya, "rb") as ikili, db.oturum() as oturum:
+        konum = [0]
+        satirlar = _metin_satirlari(ikili, kodlama, konum)
+        ilk = next(satirlar, "")
+        ayirici = max(",;\t", key=ilk.count)
+        okuyucu = csv.reader(itertools.chain([ilk], satirlar), delimiter=ayirici)
+        baslik = [sutun.strip().lower() for sutun in next(okuyucu, [])]
+        eksik = [sutun for sutun in zorunlu_sutunlar if sutun not in baslik]
+        if tablo == "hayvanlar" and "sahip_id" not in baslik and "sahip_telefon" not in baslik:
+            eksik.append("sahip_id veya sahip_telefon")
+        if eksik:
+            raise ValueError(f"Dosyada eksik sütunlar var: {', '.join(eksik)}")
+
+        red_dosyasi = _RedDosyasi(reddedilen_dosyasi, baslik)
+        try:
+            parti, ham_satirlar, redler = [], {}, []
+
+            def partiyi_bitir():
+                nonlocal eklenen, yeni_sahip, reddedilen
+                if parti:
+                    sonuc = _partiyi_yaz(oturum, yazici, parti)
+                    eklenen += sonuc[0]
+                    yeni_sahip += sonuc[1]
+                    redler.extend(sonuc[2])
+                    # Oturumdaki yazmalar dinleyicilere kendiliğinden bildirilmez
+                    if sonuc[1] or (tablo == "sahipler" and sonuc[0]):
+                        db.yazma_bildir("sahipler")
+                    if tablo == "hayvanlar" and sonuc[0]:
+                        db.yazma_bildir("hayvanlar")
+                redler.sort()
+                for satir_no, sebep in redler:
+                    red_dosyasi.yaz(satir_no, sebep, ham_satirlar.get(satir_no, []))
+                reddedilen += len(redler)
+                durum = IceAktarmaDurumu(tablo, okunan, eklenen, yeni_sahip, reddedilen,
+                                         redler[:max(0, GOSTERILEN_RED_SAYISI - reddedilen + len(redler))],
+                                         min(1.0, konum[0] / boyut), time.perf_counter() - baslangic,
+                                         reddedilen_dosyasi if reddedilen else None)
+                parti.clear()
+                ham_satirlar.clear()
+                redler.clear()
+                return durum
+
+            for alanlar in okuyucu:
+                if not any(alan.strip() for alan in alanlar):
+                    continue  # Boş satır
+                okunan += 1
+                satir_no = okuyucu.line_num
+                ham_satirlar[satir_no] = alanlar
+                try:
+                    if len(alanlar) != len(baslik):
+                        raise ValueError(f"Sütun sayısı ({len(alanlar)}) başlıktakiyle ({len(baslik)}) uyuşmuyor.")
+                    parti.append((satir_no, kaydi_olustur(dict(zip(baslik, alanlar)))))
+                except ValueError as err:
+                    redler.append((satir_no, str(err)))
+                if len(parti) + len(redler) >= parti_boyutu:
+                    yield partiyi_bitir()
+
+            son = partiyi_bitir()
+            son.oran, son.bitti = 1.0, True
+            yield son
+        finally:
+            red_dosyasi.kapat()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sahip veya hayvanları CSV dosyasından toplu olarak ekler")
+    parser.add_argument("tablo", choices=tuple(_TABLOLAR))
+    parser.add_argument("dosya")
+    parser.add_argument("--parti-boyutu", type=int, default=1000, help="Bir işlemde eklenecek en fazla satır")
+    parser.add_argument("--reddedilenler", help="Reddedilen satırların yazılacağı CSV (varsayılan: <dosya>.reddedilen.csv)")
+    parser.add_argument("--kodlama", default="utf-8-sig", help="Dosyanın karakter kodlaması (ör. cp1254)")
+    parser.add_argument("--motor", choices=("mysql", "sqlite"), help="Ayarlardaki motor yerine bunu kullan")
+    args = parser.parse_args()
+
+    from ayarlar import veritabani_ac
+    from sema import gocleri_uygula
+    db = veritabani_ac(args.motor)
+    try:
+        gocleri_uygula(db)
+        durum = None
+        for durum in ice_aktar(db, args.dosya, args.tablo, args.parti_boyutu, args.reddedilenler, args.kodlama):
+            print(f"\r{durum.oran:4.0%}  {durum.okunan} satır, {durum.satir_hizi:,.0f} satır/sn", end="", flush=True)
+        print()
+        print(durum.ozet())
+        if durum.reddedilen_dosyasi:
+            print(f"Reddedilen satırlar: {durum.reddedilen_dosyasi}")
+        return 1 if durum.reddedilen else 0
+    except (ValueError, OSError) as err:
+        print(f"\nHata: {err}", file=sys.stderr)
+        return 2
+    except VeritabaniHatasi as err:
+        print(f"\n{err.baslik}: {err.mesaj}", file=sys.stderr)
+        return 2
+    finally:
+        db.kapat()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Uygulama ikonları.
+
+İkonlar açılışta toplu olarak değil, ilk kullanıldıklarında yüklenir. Her PNG
+gösterileceği boyuta bir kez küçültülüp önbellek klasörüne (ad, boyut, dosya
+değişiklik zamanı) anahtarıyla yazılır; sonraki açılışlarda PIL hiç içe
+aktarılmadan küçük PNG doğrudan Tk ile okunur. Kaynak PNG değişirse anahtarı da
+değiştiği için yeniden küçültülür.
+
+İstenirse tüm ikonlar tek bir atlas dosyasında toplanır; atlas varsa ikonlar
+tek bir dosyadan kopyalanır:
+
+    python ikonlar.py            # Eksik ikonları önbelleğe küçült
+    python ikonlar.py --atlas    # Ayrıca atlas.png / atlas.json üret
+"""
+import argparse
+import json
+import os
+import sys
+import tkinter as tk
+
+IKON_KLASORU = "icons"  # Çalışma klasörüne göre
+ONBELLEK_KLASORU = os.path.join(IKON_KLASORU, ".onbellek")
+ATLAS_DOSYASI = "atlas.png"
+ATLAS_DIZINI = "atlas.json"
+
+# İkon adı -> gösterim boyutu
+IKON_BOYUTLARI = {
+    # Menü ikonları
+    "paw_print": (64, 64),
+    "add_animal": (32, 32),
+    "list_animals": (32, 32),
+    "add_owner": (32, 32),
+    "vaccine": (32, 32),
+    "upcoming_vaccine": (32, 32),
+    "appointment": (32, 32),
+    "examination": (32, 32),
+    "exit": (32, 32),
+    # Düğme ikonları
+    "save": (24, 24),
+    "delete": (24, 24),
+    "update": (24, 24),
+    "details": (24, 24),
+    "refresh": (24, 24),
+    "filter": (24, 24),
+    "add": (24, 24),
+}
+
+
+def _anahtar(ad, boyut, degisim):
+    return f"{ad}_{boyut[0]}x{boyut[1]}_{degisim}"
+
+
+def _kucult(kaynak, boyut):
+    # PIL yalnızca önbellekte olmayan bir ikon küçültülürken gerekir
+    from PIL import Image
+    with Image.open(kaynak) as img:
+        return img.convert("RGBA").resize(boyut, Image.Resampling.LANCZOS)
+
+
+def _png_yaz(img, yol):
+    gecici = yol + ".tmp"
+    img.save(gecici, "PNG")
+    os.replace(gecici, yol)  # Yarım yazılmış dosya başka bir açılışta okunmasın
+
+
+def onbellek_dosyasi(ad, boyut, klasor=IKON_KLASORU, onbellek_klasoru=ONBELLEK_KLASORU):
+    """
+    İkonun küçültülmüş PNG'sinin yolunu döndürür; yoksa üretir ve aynı ikonun eski boyutlarını siler.
+    :raises FileNotFoundError: Kaynak PNG yoksa.
+    :raises OSError: Önbellek klasörüne yazılamazsa.
+    """
+    degisim = os.stat(os.path.join(klasor, f"{ad}.png")).st_mtime_ns
+    dosya = _anahtar(ad, boyut, degisim) + ".png"
+    yol = os.path.join(onbellek_klasoru, dosya)
+    if not os.path.exists(yol):
+        img = _kucult(os.path.join(klasor, f"{ad}.png"), boyut)
+        os.makedirs(onbellek_klasoru, exist_ok=True)
+        _png_yaz(img, yol)
+        onek = f"{ad}_{boyut[0]}x{boyut[1]}_"
+        for eski in os.listdir(onbellek_klasoru):
+            if eski.startswith(onek) and eski != dosya:
+                os.remove(os.path.join(onbellek_klasoru, eski))
+    return yol
+
+
+def atlas_olustur(boyutlar=IKON_BOYUTLARI, klasor=IKON_KLASORU, onbellek_klasoru=ONBELLEK_KLASORU):
+    """Tüm ikonları yan yana tek bir PNG'ye yerleştirir; konumlar atlas.json'a yazılır."""
+    from PIL import Image
+    parcalar = []
+    for ad, boyut in boyutlar.items():
+        try:
+            parcalar.append((ad, boyut, os.stat(os.path.join(klasor, f"{ad}.png")).st_mtime_ns,
+                             _kucult(os.path.join(klasor, f"{ad}.png"), boyut)))
+        except FileNotFoundError:
+            print(f"Uyarı: '{klasor}/{ad}.png' ikonu bulunamadı, atlasa eklenmedi.")
+    atlas = Image.new("RGBA", (sum(boyut[0] for _, boyut, _, _ in parcalar) or 1,
+                               max((boyut[1] for _, boyut, _, _ in parcalar), default=1)))
+    dizin, x = {}, 0
+    for ad, boyut, degisim, img in parcalar:
+        atlas.paste(img, (x, 0))
+        dizin[ad] = {"anahtar": _anahtar(ad, boyut, degisim), "x": x, "y": 0}
+        x += boyut[0]
+    os.makedirs(onbellek_klasoru, exist_ok=True)
+    _png_yaz(atlas, os.path.join(onbellek_klasoru, ATLAS_DOSYASI))
+    with open(os.path.join(onbellek_klasoru, ATLAS_DIZINI), "w", encoding="utf-8") as f:
+        json.dump(dizin, f, ensure_ascii=False, indent=1)
+    return len(dizin)
+
+
+class IkonDeposu:
+    def __init__(self, boyutlar=IKON_BOYUTLARI, klasor=IKON_KLASORU, onbellek_klasoru=ONBELLEK_KLASORU):
+        """
+        Sözlük gibi kullanılır: depo.get("save") / depo["save"] ikonu ilk istekte yükler;
+        ikon yoksa veya yüklenemezse None döner.
+        """
+        self.boyutlar = boyutlar
+        self.klasor = klasor
+        self.onbellek_klasoru = onbellek_klasoru
+        self._ikonlar = {}    # ad -> PhotoImage veya None
+        self._atlas = None    # (atlas PhotoImage, dizin); ilk ikon isteğinde okunur
+        self._atlas_denendi = False
+
+    def __getitem__(self, ad):
+        return self.get(ad)
+
+    def get(self, ad, varsayilan=None):
+        if ad not in self._ikonlar:
+            self._ikonlar[ad] = self._yukle(ad)
+        ikon = self._ikonlar[ad]
+        return ikon if ikon is not None else varsayilan
+
+    def _yukle(self, ad):
+        boyut = self.boyutlar.get(ad, (24, 24))
+        kaynak = os.path.join(self.klasor, f"{ad}.png")
+        try:
+            anahtar = _anahtar(ad, boyut, os.stat(kaynak).st_mtime_ns)
+            ikon = self._atlastan(ad, boyut, anahtar)
+            if ikon is not None:
+                return ikon
+            try:
+                return tk.PhotoImage(file=onbellek_dosyasi(ad, boyut, self.klasor, self.onbellek_klasoru))
+            except OSError:
+                # Önbelleğe yazılamıyor (salt okunur kurulum); bellekte küçültülür
+                from PIL import ImageTk
+                return ImageTk.PhotoImage(_kucult(kaynak, boyut))
+        except FileNotFoundError:
+            print(f"Uyarı: '{kaynak}' ikonu bulunamadı. Lütfen ikon dosyasının var olduğundan emin olun.")
+            return None
+        except Exception as e:
+            print(f"Hata: '{kaynak}' ikonu yüklenirken bir sorun oluştu: {e}")
+            return None
+
+    def _atlastan(self, ad, boyut, anahtar):
+        """Atlas varsa ve ikonun kaynağı atlas üretildikten sonra değişmediyse ikonu atlastan kopyalar."""
+        if not self._atlas_denendi:
+            self._atlas_denendi = True
+            try:
+                with open(os.path.join(self.onbellek_klasoru, ATLAS_DIZINI), encoding="utf-8") as f:
+                    dizin = json.load(f)
+                self._atlas = (tk.PhotoImage(file=os.path.join(self.onbellek_klasoru, ATLAS_DOSYASI)), dizin)
+            except (OSError, ValueError, tk.TclError):
+                self._atlas = None
+        if self._atlas is None:
+            return None
+        atlas, dizin = self._atlas
+        konum = dizin.get(ad)
+        if konum is None or konum["anahtar"] != anahtar:
+            return None
+        ikon = tk.PhotoImage(width=boyut[0], height=boyut[1])
+        ikon.tk.call(ikon, "copy", atlas, "-from", konum["x"], konum["y"], konum["x"] + boyut[0], konum["y"] + boyut[1])
+        return ikon
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İkon önbelleğini hazırla")
+    parser.add_argument("--atlas", action="store_true", help="Tüm ikonları tek bir atlas dosyasında topla")
+    args = parser.parse_args()
+
+    for ad, boyut in IKON_BOYUTLARI.items():
+        try:
+            print(onbellek_dosyasi(ad, boyut))
+        except FileNotFoundError:
+            print(f"Uyarı: '{IKON_KLASORU}/{ad}.png' ikonu bulunamadı.")
+    if args.atlas:
+        print(f"Atlas: {atlas_olustur()} ikon")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,25 @@
+import time
+ACILIS_BASLANGICI = time.perf_counter() # --startup-profile: modül içe aktarma süresi de ölçülsün
+import argparse
 import tkinter as tk
-from tkinter import messagebox, ttk
-import mysql.connector
+from tkinter import filedialog, messagebox, ttk
 from datetime import datetime, timedelta
-from PIL import Image, ImageTk
-
-# --- Veritabanı Ayarları ---
-DB_CONFIG = {
-    "host": "localhost",
-    "user": "levent", # Kendi MySQL kullanıcı adınızı girin
-    "password": "1234", # Kendi MySQL şifrenizi girin
-    "database": "veteriner_klinik"
-}
+import sys
+from arkaplan import ArkaplanYurutucu, YuklemeGostergesi
+from sayfali_liste import SayfaliListe
+from sema import gocleri_uygula, silinme_izlerini_temizle
+import sorgular
+import bicimler
+from veritabani import VeritabaniHatasi
+from ayarlar import ACILIS_AYARLARI, OLCUM_AYARLARI, PENCERE_AYARLARI, veritabani_ac
+from onbellek import SecenekOnbellegi
+from hayvan_secici import HayvanSecici
+from cakisma import CakismaDenetcisi, RANDEVU_EN_UZUN_SURE
+from randevu_takvimi import RandevuTakvimi, TakvimOnbellegi
+from olcum import AcilisProfili
+from ikonlar import IkonDeposu
+from pencereler import PencereYoneticisi
+from servisler import GELIS_SEBEPLERI, RANDEVU_DURUMLARI, Servisler
 
 # --- Renk Paleti (Yeşil Tonları) ---
 COLORS = {
@@ -26,84 +35,103 @@ COLORS = {
     "error": "#DC143C"       # Crimson Kırmızısı (hata mesajları)
 }
 
-# --- Veritabanı Sınıfı ---
-class Veritabani:
-    def __init__(self, config):
-        self.config = config
-        self.baglanti = None
-
-    def baglan(self):
-        """MySQL veritabanına bağlantı kurar ve bağlantı nesnesini döndürür."""
-        try:
-            if self.baglanti is None or not self.baglanti.is_connected():
-                self.baglanti = mysql.connector.connect(**self.config)
-            return self.baglanti
-        except mysql.connector.Error as err:
-            messagebox.showerror(
-                "Veritabanı Bağlantı Hatası",
-                f"Veritabanına bağlanılamadı:\n{err}\\n\\n"
-                "Lütfen MySQL sunucunuzun çalıştığından, kullanıcı adı ve şifrenin doğru olduğundan "
-                "ve 'veteriner_klinik' veritabanının mevcut olduğundan emin olun.",
-                icon="error" 
-            )
-            self.baglanti = None
-            return None
-
-    def kapat(self):
-        """Veritabanı bağlantısını kapatır."""
-        if self.baglanti and self.baglanti.is_connected():
-            self.baglanti.close()
-            self.baglanti = None
-
-    def sorgu_calistir(self, sorgu, veri=None, commit=False, fetch_results=False):
-        """
-        Veritabanı sorgusunu çalıştırır.
-        :param sorgu: Çalıştırılacak SQL sorgusu.
-        :param veri: Sorguya geçirilecek veriler (tuple).
-        :param commit: True ise değişiklikleri commit eder.
-        :param fetch_results: True ise tüm sonuçları (SELECT için) fetch eder ve döndürür.
-        :return: Sorgu sonuçları (list of tuples) SELECT için, aksi halde True/False başarılı/başarısız.
-        """
-        db = self.baglan()
-        if db is None:
-            return None 
-
-        cursor = db.cursor()
-        try:
-            cursor.execute(sorgu, veri)
-            
-            if commit:
-                db.commit()
-                return True 
-            
-            if fetch_results:
-                results = cursor.fetchall() 
-                return results 
-            else:
-                return True 
-
-        except mysql.connector.Error as err:
-            messagebox.showerror("Veritabanı Hatası", f"Sorgu çalıştırılırken bir hata oluştu:\n{err}\nSorgu: {sorgu}", icon="error") 
-            if commit: 
-                db.rollback() 
-            return None 
-        finally:
-            if cursor:
-                cursor.close()
-            self.kapat() 
+# --- Yardımcı Fonksiyonlar ---
+def veritabani_hatasini_goster(err):
+    """Veritabani.hata_bildirici: VeritabaniHatasi'nı mesaj kutusuyla gösterir."""
+    messagebox.showerror(err.baslik, err.mesaj, icon="error")
 
 
 # --- Ana Uygulama Sınıfı ---
 class VeterinerUygulamasi:
-    def __init__(self, root):
+    def __init__(self, root, profil=None):
+        """
+        Ana menü önce çizilir; veritabanı sürücüsü, göçler ve bağlantılar arka planda,
+        ikonlar ve pencerelerin stilleri ilk kareden sonra hazırlanır.
+        :param profil: Verilirse açılış aşamalarının süreleri bu olcum.AcilisProfili'ne kaydedilir.
+        """
         self.root = root
         self.root.title("Vefa Veteriner Klinik Sistemi")
-        self.db = Veritabani(DB_CONFIG) 
+        self.profil = profil or AcilisProfili()
+        self.db = None # Arka planda açılır; hazır olana kadar menü düğmeleri devre dışıdır
+        self.yurutucu = ArkaplanYurutucu(root, varsayilan_hata=self._arkaplan_hatasi)
+        self.yurutucu.gonder(self._veritabanini_hazirla, basarili=self._veritabani_hazir, hata=self._veritabani_acilamadi)
+        # Liste pencereleri kapatılınca gizlenir, yeniden açılınca yalnızca değişenlerle tazelenir
+        self.pencereler = PencereYoneticisi(root, PENCERE_AYARLARI["en_fazla_oge"], self.yurutucu,
+                                            bg=COLORS["background"])
 
         # --- İkonları Yükle ---
         self.icons = self._load_icons()
+        self._ertelenen_ikonlar = [] # İlk kareden sonra ikon atanacak (widget, ikon adı) çiftleri
 
-        # --- Stil Ayarları ---
+        self._temel_stilleri_ayarla()
+        self.profil.isaretle("stiller (menü)")
+        self._ana_menu_olustur()
+        self.profil.isaretle("ana menü")
+        self.root.update_idletasks()
+        self.profil.isaretle("ilk çizim")
+        self.profil.kilometre_tasi("ilk kare")
+        self.root.after_idle(self._ilk_kareden_sonra)
+
+    def _veritabanini_hazirla(self):
+        """Arka planda: sürücü içe aktarılır, göçler uygulanır ve havuz ısıtılır."""
+        with self.profil.olc("veritabanı sürücüsü"):
+            db = veritabani_ac()
+        try:
+            if not db.uzak: # İstemci modunda göçleri ve bakımı sunucu yapar
+                with self.profil.olc("göçler"):
+                    gocleri_uygula(db)
+                    silinme_izlerini_temizle(db)
+            with self.profil.olc("bağlantı ısıtma"):
+                db.isit(ACILIS_AYARLARI["isitilacak_baglanti"])
+        except VeritabaniHatasi as err:
+            return db, err # Uygulama yine açılır; hata ana iş parçacığında gösterilir
+        return db, None
+
+    def _veritabani_hazir(self, sonuc):
+        self.db, hata = sonuc
+        self.db.hata_bildirici = veritabani_hatasini_goster
+        # Kayıtlar pencerelerden değil servisler üzerinden okunur ve yazılır
+        self.servis = Servisler(self.db)
+        # Formlardaki sahip listesi; tabloya yazılınca kendiliğinden geçersiz olur
+        # (hayvanlar HayvanSecici ile yazdıkça aranır)
+        self.sahip_secenekleri = SecenekOnbellegi(self.db, "sahipler", sorgular.SAHIP_SECENEKLERI,
+                                                  lambda id, isim: f"{isim} (ID: {id})")
+        # Randevu formlarındaki çakışma denetimi için gün gün randevu aralıkları
+        self.randevu_cakismalari = CakismaDenetcisi(self.db)
+        # Randevu takvimindeki günler; pencere kapanıp açılınca da yeniden okunmaz
+        self.randevu_takvimi_onbellegi = TakvimOnbellegi(self.db)
+
+        for btn in self._veritabani_dugmeleri:
+            btn.state(["!disabled"])
+        self.profil.kilometre_tasi("veritabanı hazır")
+        self._acilis_raporu()
+        if hata is not None:
+            self.db.hata_goster(hata)
+
+    def _veritabani_acilamadi(self, err):
+        # Ör. MySQL sürücüsü kurulu değil; menü devre dışı kalır
+        messagebox.showerror("Veritabanı Hatası", f"Veritabanı açılamadı:\n{err}", icon="error")
+
+    def _ilk_kareden_sonra(self):
+        """Menü çizildikten sonra: ikonlar ve pencerelerde kullanılan stiller."""
+        for widget, ikon_adi in self._ertelenen_ikonlar:
+            if self.icons.get(ikon_adi) and widget.winfo_exists():
+                widget.config(image=self.icons[ikon_adi])
+        self._ertelenen_ikonlar = None
+        self.profil.isaretle("menü ikonları")
+        self._pencere_stillerini_ayarla()
+        self.profil.isaretle("stiller (pencereler)")
+        self._acilis_raporu()
+
+    def _acilis_raporu(self):
+        """--startup-profile: hem veritabanı hem ertelenen işler bitince profili basar."""
+        if self.profil.raporla and self.db is not None and self._ertelenen_ikonlar is None:
+            self.profil.raporla = False
+            print(self.profil.rapor({"ilk kare": ACILIS_AYARLARI["ilk_kare_butcesi_ms"],
+                                     "veritabanı hazır": ACILIS_AYARLARI["hazir_butcesi_ms"]}), file=sys.stderr)
+
+    def _temel_stilleri_ayarla(self):
+        """Ana menünün ihtiyaç duyduğu stiller (ilk kareden önce)."""
         self.style = ttk.Style()
         self.style.theme_use("clam") 
 
@@ -117,13 +145,8 @@ class VeterinerUygulamasi:
         # Genel fontlar
         self.style.configure(".", font=("Segoe UI", 10), background=COLORS["background"], foreground=COLORS["text_dark"]) 
         self.style.configure("TLabel", font=("Segoe UI", 10), background=COLORS["background"], foreground=COLORS["text_dark"])
-        self.style.configure("TEntry", font=("Segoe UI", 10), fieldbackground=COLORS["text_light"], foreground=COLORS["text_dark"])
-        self.style.configure("TCombobox", font=("Segoe UI", 10), fieldbackground=COLORS["text_light"], foreground=COLORS["text_dark"])
-        self.style.configure("TNotebook.Tab", font=("Segoe UI", 10, "bold"), background=COLORS["secondary"], foreground=COLORS["text_light"])
-        self.style.map("TNotebook.Tab", background=[("selected", COLORS["primary"])], foreground=[("selected", COLORS["text_light"])])
 
-
-        # Buton stilleri
+        # Buton stilleri (menü düğmeleri TButton'dan türer)
         self.style.configure("TButton", 
                             font=("Segoe UI", 11, "bold"), 
                             padding=10, 
@@ -133,7 +156,7 @@ class VeterinerUygulamasi:
         self.style.map("TButton", 
                        background=[("active", COLORS["primary"]), ("!disabled", COLORS["button_bg"])],
                        foreground=[("active", COLORS["text_light"]), ("!disabled", COLORS["text_dark"])])
-        
+
         self.style.configure("MainMenu.TButton", 
                             font=("Segoe UI", 13, "bold"), 
                             padding=[15, 12], # Yatay, Dikey
@@ -143,6 +166,13 @@ class VeterinerUygulamasi:
                        background=[("active", COLORS["secondary"])],
                        foreground=[("active", COLORS["text_dark"])])
 
+    def _pencere_stillerini_ayarla(self):
+        """Formlarda ve listelerde kullanılan stiller; ana menüde gerekmediği için ilk kareden sonra ayarlanır."""
+        self.style.configure("TEntry", font=("Segoe UI", 10), fieldbackground=COLORS["text_light"], foreground=COLORS["text_dark"])
+        self.style.configure("TCombobox", font=("Segoe UI", 10), fieldbackground=COLORS["text_light"], foreground=COLORS["text_dark"])
+        self.style.configure("TNotebook.Tab", font=("Segoe UI", 10, "bold"), background=COLORS["secondary"], foreground=COLORS["text_light"])
+        self.style.map("TNotebook.Tab", background=[("selected", COLORS["primary"])], foreground=[("selected", COLORS["text_light"])])
+
 
         # Treeview için özel stil
         self.style.configure("Treeview.Heading", 
@@ -157,47 +187,11 @@ class VeterinerUygulamasi:
                              fieldbackground=COLORS["text_light"]) 
         self.style.map("Treeview", 
                        background=[("selected", COLORS["treeview_selected"])],
-                       foreground=[("selected", COLORS["text_light"])]) 
-
-        self._ana_menu_olustur()
+                       foreground=[("selected", COLORS["text_light"])])
 
     def _load_icons(self):
-        icons = {}
-        icon_path = "icons/"
-        
-        # Hata yönetimi için try-except bloğu
-        def get_icon(name, size=(24, 24)):
-            try:
-                img = Image.open(f"{icon_path}{name}.png")
-                img = img.resize(size, Image.Resampling.LANCZOS)
-                return ImageTk.PhotoImage(img)
-            except FileNotFoundError:
-                print(f"Uyarı: '{icon_path}{name}.png' ikonu bulunamadı. Lütfen ikon dosyasının var olduğundan emin olun.")
-                return None
-            except Exception as e:
-                print(f"Hata: '{icon_path}{name}.png' ikonu yüklenirken bir sorun oluştu: {e}")
-                return None
-
-        # Menü ikonları
-        icons["paw_print"] = get_icon("paw_print", size=(64, 64)) 
-        icons["add_animal"] = get_icon("add_animal", size=(32, 32))
-        icons["list_animals"] = get_icon("list_animals", size=(32, 32))
-        icons["add_owner"] = get_icon("add_owner", size=(32, 32))
-        icons["vaccine"] = get_icon("vaccine", size=(32, 32))
-        icons["upcoming_vaccine"] = get_icon("upcoming_vaccine", size=(32, 32))
-        icons["appointment"] = get_icon("appointment", size=(32, 32))
-        icons["examination"] = get_icon("examination", size=(32, 32))
-        icons["exit"] = get_icon("exit", size=(32, 32))
-
-        icons["save"] = get_icon("save", size=(24, 24))
-        icons["delete"] = get_icon("delete", size=(24, 24))
-        icons["update"] = get_icon("update", size=(24, 24))
-        icons["details"] = get_icon("details", size=(24, 24))
-        icons["refresh"] = get_icon("refresh", size=(24, 24))
-        icons["filter"] = get_icon("filter", size=(24, 24))
-        icons["add"] = get_icon("add", size=(24, 24)) 
-
-        return icons
+        # İkonlar ilk kullanıldıklarında, önceden küçültülmüş önbellekten yüklenir
+        return IkonDeposu()
 
     def _ana_menu_olustur(self):
         # Eğer mevcut bir frame varsa temizle
@@ -211,8 +205,9 @@ class VeterinerUygulamasi:
         header_frame = ttk.Frame(main_frame, style="TFrame")
         header_frame.pack(pady=20, anchor="w", fill="x") # Sola hizala ve yatayda doldur
         
-        if self.icons["paw_print"]:
-            ttk.Label(header_frame, image=self.icons["paw_print"], background=COLORS["background"]).pack(side="left", padx=10)
+        logo = ttk.Label(header_frame, background=COLORS["background"])
+        logo.pack(side="left", padx=10)
+        self._ikon_ata(logo, "paw_print")
         ttk.Label(header_frame, text="Veteriner Klinik Yönetim Sistemi", font=("Segoe UI", 20, "bold"), 
                   foreground=COLORS["primary"], background=COLORS["background"]).pack(side="left")
 
@@ -224,7 +219,8 @@ class VeterinerUygulamasi:
         button_width = 30
         button_pady = 10
 
-        # Menü düğmeleri
+        # Menü düğmeleri; Çıkış dışındakiler veritabanı hazır olunca etkinleşir
+        self._veritabani_dugmeleri = []
         self._create_main_menu_button(button_container, "Hayvan Ekle", self._hayvan_ekle_penceresi, "add_animal", button_width, button_pady)
         self._create_main_menu_button(button_container, "Hayvanları Listele/Yönet", self._hayvanlari_listele_penceresi, "list_animals", button_width, button_pady)
         self._create_main_menu_button(button_container, "Sahipleri Listele/Yönet", self._sahipleri_listele_penceresi, "add_owner", button_width, button_pady) 
@@ -232,14 +228,25 @@ class VeterinerUygulamasi:
         self._create_main_menu_button(button_container, "Yaklaşan Aşılar", self._yaklasan_asilar_penceresi, "upcoming_vaccine", button_width, button_pady)
         self._create_main_menu_button(button_container, "Randevu Yönetimi", self._randevulari_listele_penceresi, "appointment", button_width, button_pady)
         self._create_main_menu_button(button_container, "Muayene ve Tedavi Kayıtları", self._muayene_listele_penceresi, "examination", button_width, button_pady)
-        self._create_main_menu_button(button_container, "Çıkış", self.root.quit, "exit", button_width, button_pady)
+        self._create_main_menu_button(button_container, "Toplu İçe Aktar (CSV)", self._ice_aktarma_penceresi, "add_owner", button_width, button_pady)
+        self._create_main_menu_button(button_container, "Çıkış", self.root.quit, "exit", button_width, button_pady,
+                                      veritabani_gerekir=False)
    
-    def _create_main_menu_button(self, parent, text, command, icon_name, width, pady):
+    def _create_main_menu_button(self, parent, text, command, icon_name, width, pady, veritabani_gerekir=True):
         """Ana menü düğmelerini ikonlarla oluşturur."""
-        btn = ttk.Button(parent, text=text, command=command, style="MainMenu.TButton")
-        if self.icons.get(icon_name):
-            btn.config(image=self.icons[icon_name], compound="left") 
+        btn = ttk.Button(parent, text=text, command=command, style="MainMenu.TButton", compound="left")
+        self._ikon_ata(btn, icon_name)
         btn.pack(pady=pady, fill="x", ipadx=width) 
+        if veritabani_gerekir and self.db is None:
+            btn.state(["disabled"])
+            self._veritabani_dugmeleri.append(btn)
+
+    def _ikon_ata(self, widget, ikon_adi):
+        """İlk kare çizilmeden önce ikon çözülmez; atama _ilk_kareden_sonra'ya bırakılır."""
+        if self._ertelenen_ikonlar is not None:
+            self._ertelenen_ikonlar.append((widget, ikon_adi))
+        elif self.icons.get(ikon_adi):
+            widget.config(image=self.icons[ikon_adi])
 
     def _create_button_with_icon(self, parent, text, command, icon_name):
         """Küçük düğmeleri ikonlarla oluşturur."""
@@ -248,11 +255,38 @@ class VeterinerUygulamasi:
             btn.config(image=self.icons[icon_name], compound="left")
         return btn
 
+    def _arkaplan_hatasi(self, err):
+        """Arka plan işlerinden gelen hataları ana iş parçacığında gösterir."""
+        if isinstance(err, VeritabaniHatasi):
+            self.db.hata_goster(err)
+        else:
+            messagebox.showerror("Hata", f"Beklenmeyen bir hata oluştu:\n{err}", icon="error")
+
+    def _servisle(self, islem, *args):
+        """
+        Servis çağrısını yapar ve sonucunu döndürür; kural ihlali (ValueError) veya veritabanı
+        hatası kullanıcıya gösterilir ve None döner.
+        """
+        try:
+            return islem(*args)
+        except ValueError as err:
+            messagebox.showerror("Hata", str(err), icon="warning")
+        except VeritabaniHatasi as err:
+            self.db.hata_goster(err)
+        return None
+
+    def _arkaplanda_sorgula(self, top, gosterge, sorgu, veri=None, basarili=None, anahtar=None):
+        """
+        SELECT sorgusunu arka planda çalıştırır; satırlar ana iş parçacığında basarili'ye iletilir.
+        Pencere (top) sorgu bitmeden kapanırsa sonuç yok sayılır.
+        """
+        return self.yurutucu.gonder(self.db.sorgu, sorgu, veri, fetch_results=True, basarili=basarili,
+                                    sahip=top, gosterge=gosterge, anahtar=anahtar)
+
     def _yaklasan_asilar_penceresi(self):
-        top = tk.Toplevel(self.root, bg=COLORS["background"])
-        top.title("Yaklaşan Aşılar")
-        top.grab_set()
-        top.geometry("800x500") # Pencere boyutu
+        top = self.pencereler.ac("yaklasan_asilar", "Yaklaşan Aşılar", "800x500")
+        if top is None:
+            return # Saklanan pencere öne getirildi ve yeniden yüklendi
 
         # Başlık sola hizalandı
         ttk.Label(top, text="Yaklaşan Aşı Kayıtları", font=("Segoe UI", 14, "bold"), 
@@ -268,11 +302,13 @@ class VeterinerUygulamasi:
         gun_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         
         self._create_button_with_icon(filter_frame, "Filtrele", lambda: yukle_yaklasan_asilar(int(self.gun_sayisi_var.get())), "filter").grid(row=0, column=2, padx=5, pady=5)
+        self._create_button_with_icon(filter_frame, "Aşı Kayıtlarını Dışa Aktar", lambda: self._disa_aktarma_penceresi("asi_takip"), "save").grid(row=0, column=3, padx=5, pady=5)
         
         filter_frame.columnconfigure(1, weight=1) 
 
         tree_frame = ttk.Frame(top, style="TFrame")
         tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        gosterge = YuklemeGostergesi(top, before=tree_frame, anchor="e", padx=10)
 
         tree = ttk.Treeview(tree_frame, columns=("Hayvan", "Aşı Adı", "Aşı Tarihi", "Sonraki Aşı Tarihi", "Kalan Gün"), show="headings")
         tree.pack(side="left", fill="both", expand=True)
@@ -294,54 +330,38 @@ class VeterinerUygulamasi:
         tree.column("Kalan Gün", width=80, anchor="center")
 
         def yukle_yaklasan_asilar(gun_sayisi=30):
-            for item in tree.get_children():
-                tree.delete(item)
-            
             bugun = datetime.now().date()
             gecerli_tarih = bugun + timedelta(days=gun_sayisi)
 
-            sorgu = """
-                SELECT h.isim, at.asi_adi, at.asi_tarihi, at.sonraki_asi_tarihi
-                FROM asi_takip at
-                JOIN hayvanlar h ON at.hayvan_id = h.id
-                WHERE at.sonraki_asi_tarihi IS NOT NULL
-                AND at.sonraki_asi_tarihi BETWEEN %s AND %s
-                ORDER BY at.id ASC  -- ID'ye göre küçükten büyüğe sırala
-            """
-            kayitlar = self.db.sorgu_calistir(sorgu, (bugun.strftime("%Y-%m-%d"), gecerli_tarih.strftime("%Y-%m-%d")), fetch_results=True)
-
-            if kayitlar:
+            kayit_geldi = False
+
+            def parti_ekle(kayitlar):
+                nonlocal kayit_geldi
+                if not kayit_geldi:
+                    # İlk parti gelince eski liste temizlenir; satırlar parti parti eklenir
+                    tree.delete(*tree.get_children())
+                    kayit_geldi = True
                 for kayit in kayitlar:
-                    hayvan_adi, asi_adi, asi_tarihi, sonraki_asi_tarihi = kayit
-                    
-                    asi_tarihi_str = asi_tarihi.strftime("%Y-%m-%d") if asi_tarihi else ""
-                    sonraki_asi_str = sonraki_asi_tarihi.strftime("%Y-%m-%d") if sonraki_asi_tarihi else ""
-                    
-                    # Düzeltme: sonraki_asi_tarihi zaten bir datetime.date objesi olduğu için .date() metodunu çağırmaya gerek yok.
-                    # Eğer sonraki_asi_tarihi bir datetime.datetime objesi olsaydı, .date() kullanmak doğru olurdu.
-                    # MySQL'den gelen 'DATE' tipi sütunlar genellikle Python'da datetime.date objesi olarak eşlenir.
-                    kalan_gun = (sonraki_asi_tarihi - bugun).days
-                    
-                    tree.insert("", "end", values=(hayvan_adi, asi_adi, asi_tarihi_str, sonraki_asi_str, kalan_gun))
-            else:
-                messagebox.showinfo("Bilgi", "Yaklaşan aşı kaydı bulunamadı.", icon="info")
-        
-        yukle_yaklasan_asilar(int(self.gun_sayisi_var.get())) # Load on open
+                    tree.insert("", "end", values=kayit)
 
-    def _get_hayvanlar_ve_sahipler(self):
-        """Hayvan ve sahip bilgilerini veritabanından çeker."""
-        hayvanlar = {}
-        sahipler = {}
+            def bitti():
+                if not kayit_geldi:
+                    tree.delete(*tree.get_children())
+                    messagebox.showinfo("Bilgi", "Yaklaşan aşı kaydı bulunamadı.", icon="info")
+
+            self.yurutucu.akis(self.servis.asilar.yaklasanlar, bugun, gecerli_tarih,
+                               parti_geldi=parti_ekle, bitti=bitti, sahip=top, gosterge=gosterge, anahtar=yukle_yaklasan_asilar)
         
-        hayvan_data = self.db.sorgu_calistir("SELECT id, isim FROM hayvanlar", fetch_results=True)
-        if hayvan_data:
-            hayvanlar = {f"{isim} (ID:{id})": id for id, isim in hayvan_data}
+        yukle_yaklasan_asilar(int(self.gun_sayisi_var.get())) # Load on open
+        self.pencereler.sakla("yaklasan_asilar", top, lambda: yukle_yaklasan_asilar(int(self.gun_sayisi_var.get())))
 
-        sahip_data = self.db.sorgu_calistir("SELECT id, isim FROM sahipler", fetch_results=True)
-        if sahip_data:
-            sahipler = {f"{isim} (ID: {id})": id for id, isim in sahip_data}
-            
-        return hayvanlar, sahipler
+    def _get_sahipler(self):
+        """Sahip seçim listesini (etiket -> id) önbellekten, gerekirse veritabanından alır."""
+        try:
+            return self.sahip_secenekleri.secenekler()
+        except VeritabaniHatasi as err:
+            self.db.hata_goster(err)
+            return {}
 
     # --- Hayvan Ekleme Penceresi ---
     def _hayvan_ekle_penceresi(self):
@@ -354,7 +374,7 @@ class VeterinerUygulamasi:
         form_frame = ttk.LabelFrame(top, text="Yeni Hayvan Bilgileri", padding="20", style="TLabelframe")
         form_frame.pack(padx=20, pady=20, fill="both", expand=True)
 
-        hayvan_dict, sahip_dict = self._get_hayvanlar_ve_sahipler()
+        sahip_dict = self._get_sahipler()
 
 
         fields = [
@@ -371,8 +391,7 @@ class VeterinerUygulamasi:
             ttk.Label(form_frame, text=label_text).grid(row=i, column=0, padx=10, pady=8, sticky="w")
             if key_name == "gelis_sebebi":
                 gelis_var = tk.StringVar(form_frame)
-                gelis_options = ["Aşı", "Yaralanma", "Parazit", "Kontrol", "Diğer"]
-                entries[key_name] = ttk.Combobox(form_frame, textvariable=gelis_var, values=gelis_options, state="readonly")
+                entries[key_name] = ttk.Combobox(form_frame, textvariable=gelis_var, values=GELIS_SEBEPLERI, state="readonly")
                 entries[key_name].set("Kontrol")
                 entries[key_name].grid(row=i, column=1, padx=10, pady=8, sticky="ew")
             elif key_name == "sahip":
@@ -397,38 +416,10 @@ class VeterinerUygulamasi:
             cins = entries['cins'].get().strip()
             dogum = entries['dogum_tarihi'].get().strip()
             gelis = entries['gelis_sebebi'].get().strip()
-            secilen_sahip_str = entries['sahip'].get()
-            sahip_id = sahip_dict.get(secilen_sahip_str)
-
-            # Boş alan kontrolü güçlendirildi
-            if not isim:
-                messagebox.showerror("Hata", "Hayvan Adı boş bırakılamaz.", icon="warning")
-                return
-            if not tur:
-                messagebox.showerror("Hata", "Tür boş bırakılamaz.", icon="warning")
-                return
-            if not cins:
-                messagebox.showerror("Hata", "Cins boş bırakılamaz.", icon="warning")
-                return
-            if not dogum:
-                messagebox.showerror("Hata", "Doğum Tarihi boş bırakılamaz.", icon="warning")
-                return
-            if not gelis:
-                messagebox.showerror("Hata", "Geliş Sebebi boş bırakılamaz.", icon="warning")
-                return
-            if not secilen_sahip_str or sahip_id is None: 
-                messagebox.showerror("Hata", "Lütfen geçerli bir Sahip seçin.", icon="warning")
-                return
-
-            try:
-                datetime.strptime(dogum, "%Y-%m-%d")
-            except ValueError:
-                messagebox.showerror("Hata", "Doğum tarihi formatı yanlış. Lütfen YYYY-AA-GG formatını kullanın.", icon="warning")
-                return
+            sahip_id = sahip_dict.get(entries['sahip'].get())
 
-            sorgu = "INSERT INTO hayvanlar (isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id) VALUES (%s, %s, %s, %s, %s, %s)"
-            veri = (isim, tur, cins, dogum, gelis, sahip_id)
-            if self.db.sorgu_calistir(sorgu, veri, commit=True):
+            # Boş alanlar, tarih biçimi ve sahip servis tarafından denetlenir
+            if self._servisle(self.servis.hayvanlar.ekle, isim, tur, cins, dogum, gelis, sahip_id):
                 messagebox.showinfo("Başarılı", "Hayvan kaydı eklendi.", icon="info")
                 top.destroy()
 
@@ -445,12 +436,8 @@ class VeterinerUygulamasi:
         form_frame = ttk.LabelFrame(top, text="Yeni Aşı Kaydı", padding="20", style="TLabelframe")
         form_frame.pack(padx=20, pady=20, fill="both", expand=True)
 
-        hayvan_dict, _ = self._get_hayvanlar_ve_sahipler()
-
         ttk.Label(form_frame, text="Hayvan:").grid(row=0, column=0, padx=10, pady=8, sticky="w")
-        hayvan_combo = ttk.Combobox(form_frame, width=30, values=list(hayvan_dict.keys()), state="readonly")
-        if hayvan_dict:
-            hayvan_combo.set(next(iter(hayvan_dict)))
+        hayvan_combo = HayvanSecici(form_frame, self.db, self.yurutucu, width=30) # Ad, sahip adı veya ID yazın
         hayvan_combo.grid(row=0, column=1, padx=10, pady=8, sticky="ew")
 
         ttk.Label(form_frame, text="Aşı Adı:").grid(row=1, column=0, padx=10, pady=8, sticky="w")
@@ -483,26 +470,10 @@ class VeterinerUygulamasi:
             if not (secilen_hayvan_str and asi_adi and asi_tarihi_str):
                 messagebox.showerror("Hata", "Lütfen Hayvan, Aşı Adı ve Aşı Tarihini doldurun.", icon="warning")
                 return
-            
-            hayvan_id = hayvan_dict.get(secilen_hayvan_str)
-            if not hayvan_id:
-                messagebox.showerror("Hata", "Lütfen geçerli bir hayvan seçin.", icon="warning")
-                return
-            
-            try:
-                datetime.strptime(asi_tarihi_str, "%Y-%m-%d")
-                if sonraki_asi_str:
-                    datetime.strptime(sonraki_asi_str, "%Y-%m-%d")
-            except ValueError:
-                messagebox.showerror("Hata", "Tarih formatları yanlış. Lütfen YYYY-AA-GG formatını kullanın.", icon="warning")
-                return
 
-            sql = """
-                INSERT INTO asi_takip (hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi, notlar)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            veri = (hayvan_id, asi_adi, asi_tarihi_str, sonraki_asi_str if sonraki_asi_str else None, notlar if notlar else None)
-            if self.db.sorgu_calistir(sql, veri, commit=True):
+            # Tarih biçimleri servis tarafından denetlenir; boş sonraki aşı tarihi ve notlar NULL yazılır
+            if self._servisle(self.servis.asilar.ekle, hayvan_combo.secili_id(), asi_adi, asi_tarihi_str,
+                              sonraki_asi_str, notlar):
                 messagebox.showinfo("Başarılı", "Aşı kaydı eklendi.", icon="info")
                 top.destroy()
 
@@ -542,22 +513,114 @@ class VeterinerUygulamasi:
                 messagebox.showerror("Hata", "Lütfen Adı Soyadı ve Telefon alanlarını doldurun.", icon="warning")
                 return
 
-            sorgu = "INSERT INTO sahipler (isim, telefon, adres) VALUES (%s, %s, %s)"
-            veri = (isim, telefon, adres if adres else None)
-            if self.db.sorgu_calistir(sorgu, veri, commit=True):
+            if self._servisle(self.servis.sahipler.ekle, isim, telefon, adres):
                 messagebox.showinfo("Başarılı", "Sahip kaydı eklendi.", icon="info")
                 top.destroy()
         
         # Butonu doğrudan form_frame'in içine grid ile yerleştir
         # En son satır (adres) 2. satırda, bu yüzden buton 3. satıra gelecek
         self._create_button_with_icon(form_frame, "Kaydet", kaydet, "save").grid(row=3, column=0, columnspan=2, pady=15, padx=20, sticky="e")
-        
-    # --- Sahip Listeleme ve Yönetimi Penceresi ---
-    def _sahipleri_listele_penceresi(self):
+
+    # --- Toplu İçe Aktarma Penceresi ---
+    def _ice_aktarma_penceresi(self):
+        from ice_aktarma import ice_aktar  # Açılışı yavaşlatmasın; pencere açılınca yüklenir
         top = tk.Toplevel(self.root, bg=COLORS["background"])
-        top.title("Sahipleri Listele")
+        top.title("Toplu İçe Aktar")
         top.grab_set()
-        top.geometry("800x500") 
+        top.geometry("700x520")
+
+        form_frame = ttk.LabelFrame(top, text="CSV Dosyası", padding="15", style="TLabelframe")
+        form_frame.pack(padx=20, pady=(20, 10), fill="x")
+
+        ttk.Label(form_frame, text="Kayıtlar:").grid(row=0, column=0, padx=10, pady=6, sticky="w")
+        tablo_var = tk.StringVar(form_frame, "sahipler")
+        tablo_frame = ttk.Frame(form_frame, style="TFrame")
+        tablo_frame.grid(row=0, column=1, columnspan=2, padx=10, pady=6, sticky="w")
+        ttk.Radiobutton(tablo_frame, text="Sahipler", value="sahipler", variable=tablo_var).pack(side="left")
+        ttk.Radiobutton(tablo_frame, text="Hayvanlar", value="hayvanlar", variable=tablo_var).pack(side="left", padx=10)
+
+        ttk.Label(form_frame, text="Dosya:").grid(row=1, column=0, padx=10, pady=6, sticky="w")
+        dosya_entry = ttk.Entry(form_frame)
+        dosya_entry.grid(row=1, column=1, padx=10, pady=6, sticky="ew")
+
+        def dosya_sec():
+            dosya = filedialog.askopenfilename(parent=top, filetypes=[("CSV dosyaları", "*.csv"), ("Tüm dosyalar", "*.*")])
+            if dosya:
+                dosya_entry.delete(0, "end")
+                dosya_entry.insert(0, dosya)
+
+        ttk.Button(form_frame, text="Seç...", command=dosya_sec).grid(row=1, column=2, padx=10, pady=6)
+
+        ttk.Label(form_frame, text="Parti Boyutu:").grid(row=2, column=0, padx=10, pady=6, sticky="w")
+        parti_spin = ttk.Spinbox(form_frame, from_=100, to=20000, increment=100, width=8)
+        parti_spin.set(1000)
+        parti_spin.grid(row=2, column=1, padx=10, pady=6, sticky="w")
+        form_frame.columnconfigure(1, weight=1)
+
+        ilerleme = ttk.Progressbar(top, mode="determinate", maximum=1.0)
+        ilerleme.pack(padx=20, pady=5, fill="x")
+        durum_label = ttk.Label(top, text="", background=COLORS["background"])
+        durum_label.pack(padx=20, anchor="w")
+
+        tree_frame = ttk.Frame(top, style="TFrame")
+        tree_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        tree = ttk.Treeview(tree_frame, columns=("Satır", "Sebep"), show="headings")
+        tree.pack(side="left", fill="both", expand=True)
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
+        vsb.pack(side="right", fill="y")
+        tree.configure(yscrollcommand=vsb.set)
+        tree.heading("Satır", text="Reddedilen Satır")
+        tree.column("Satır", width=110, anchor="center")
+        tree.heading("Sebep", text="Sebep")
+        tree.column("Sebep", width=520, anchor="w")
+
+        def durum_geldi(durum):
+            ilerleme["value"] = durum.oran
+            durum_label.config(text=durum.ozet())
+            for satir_no, sebep in durum.yeni_redler:
+                tree.insert("", "end", values=(satir_no, sebep))
+            if durum.bitti:
+                baslat_btn.state(["!disabled"])
+                mesaj = durum.ozet()
+                if durum.reddedilen_dosyasi:
+                    mesaj += f"\n\nReddedilen satırlar şu dosyaya yazıldı:\n{durum.reddedilen_dosyasi}"
+                messagebox.showinfo("İçe Aktarma Tamamlandı", mesaj, icon="info", parent=top)
+
+        def hata(err):
+            baslat_btn.state(["!disabled"])
+            if isinstance(err, VeritabaniHatasi):
+                self.db.hata_goster(err)
+            else:
+                messagebox.showerror("Hata", str(err), icon="warning", parent=top)
+
+        def baslat():
+            dosya = dosya_entry.get().strip()
+            if not dosya:
+                messagebox.showerror("Hata", "Lütfen içe aktarılacak CSV dosyasını seçin.", icon="warning", parent=top)
+                return
+            try:
+                parti_boyutu = int(parti_spin.get())
+                if parti_boyutu < 1:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Hata", "Parti boyutu pozitif bir sayı olmalı.", icon="warning", parent=top)
+                return
+            tree.delete(*tree.get_children())
+            ilerleme["value"] = 0
+            durum_label.config(text="Okunuyor...")
+            baslat_btn.state(["disabled"])
+            # Pencere kapanırsa aktarım o partide durur; yazılmış partiler kalır
+            self.yurutucu.akis(ice_aktar, self.db, dosya, tablo_var.get(), parti_boyutu,
+                               parti_geldi=durum_geldi, hata=hata, sahip=top)
+
+        baslat_btn = self._create_button_with_icon(top, "İçe Aktar", baslat, "save")
+        baslat_btn.pack(pady=(0, 15), padx=20, fill="x")
+
+    # --- Sahip Listeleme ve Yönetimi Penceresi ---
+    def _sahipleri_listele_penceresi(self):
+        top = self.pencereler.ac("sahipler", "Sahipleri Listele", "800x500")
+        if top is None:
+            return # Saklanan pencere öne getirildi; liste yalnızca değişenlerle tazelendi
 
         # Başlık sola hizalandı
         ttk.Label(top, text="Kayıtlı Sahipler", font=("Segoe UI", 14, "bold"), 
@@ -566,6 +629,8 @@ class VeterinerUygulamasi:
         tree_frame = ttk.Frame(top, style="TFrame")
         tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
+        gosterge = YuklemeGostergesi(top, before=tree_frame, anchor="e", padx=10)
+
         tree = ttk.Treeview(tree_frame, columns=("ID", "Adı Soyadı", "Telefon", "Adres"), show="headings")
         tree.pack(side="left", fill="both", expand=True)
 
@@ -583,16 +648,11 @@ class VeterinerUygulamasi:
         tree.column("Telefon", width=120, anchor="w")
         tree.column("Adres", width=250, anchor="w")
 
-        def verileri_yukle():
-            for item in tree.get_children():
-                tree.delete(item)
-            # Sorguyu ID'ye göre sıralayacak şekilde güncellendi
-            kayitlar = self.db.sorgu_calistir("SELECT id, isim, telefon, adres FROM sahipler ORDER BY id ASC", fetch_results=True)
-            if kayitlar:
-                for kayit in kayitlar:
-                    tree.insert("", "end", values=kayit)
-            else:
-                messagebox.showinfo("Bilgi", "Kayıtlı sahip bulunamadı.", icon="info")
+        # Sorgu ID'ye göre sıralı, sayfa sayfa yüklenir
+        liste = SayfaliListe(tree, vsb, self.yurutucu, self.db, sorgular.SAHIP_SAYFASI, "id", None,
+                             sahip=top, gosterge=gosterge, bos_mesaji="Kayıtlı sahip bulunamadı.",
+                             degisim_kosulu=sorgular.SAHIP_DEGISIMI, silinme_tablosu="sahipler")
+        verileri_yukle = liste.tazele # Açılışta tam, sonrasında yalnızca değişenleri yükler
         
         def sahip_sil():
             secilen_item = tree.selection()
@@ -603,22 +663,19 @@ class VeterinerUygulamasi:
             sahip_id = tree.item(secilen_item, "values")[0]
             sahip_adi = tree.item(secilen_item, "values")[1]
 
-            # Sahibe bağlı hayvan var mı kontrol et
-            hayvan_sayisi_sorgu = "SELECT COUNT(*) FROM hayvanlar WHERE sahip_id = %s"
-            hayvan_sayisi_result = self.db.sorgu_calistir(hayvan_sayisi_sorgu, (sahip_id,), fetch_results=True)
-            
-            if hayvan_sayisi_result and hayvan_sayisi_result[0][0] > 0:
+            # Sahibe bağlı hayvan var mı kontrol et (silme sırasında servis yeniden denetler)
+            hayvan_sayisi = self._servisle(self.servis.sahipler.hayvan_sayisi, sahip_id)
+            if hayvan_sayisi is None:
+                return
+            if hayvan_sayisi > 0:
                 messagebox.showerror("Hata", f"'{sahip_adi}' adlı sahibe bağlı hayvanlar bulunmaktadır. "
                                               "Sahibi silmek için önce bu hayvanları başka bir sahibe atamalı veya silmelisiniz.", icon="error")
                 return
 
             if messagebox.askyesno("Onay", f"'{sahip_adi}' adlı sahibi silmek istediğinize emin misiniz? Bu işlem geri alınamaz.", icon="question"):
-                sorgu = "DELETE FROM sahipler WHERE id=%s"
-                if self.db.sorgu_calistir(sorgu, (sahip_id,), commit=True):
+                if self._servisle(self.servis.sahipler.sil, sahip_id) is not None:
                     messagebox.showinfo("Silindi", "Sahip başarıyla silindi.", icon="info")
                     verileri_yukle()
-                else:
-                    messagebox.showerror("Hata", "Sahip silinirken bir hata oluştu.", icon="error")
 
         def sahip_guncelle():
             secilen_item = tree.selection()
@@ -637,6 +694,7 @@ class VeterinerUygulamasi:
         self._create_button_with_icon(button_frame, "Sahip Sil", sahip_sil, "delete").pack(side="left", padx=7)
         self._create_button_with_icon(button_frame, "Sahip Güncelle", sahip_guncelle, "update").pack(side="left", padx=7)
         self._create_button_with_icon(button_frame, "Listeyi Yenile", verileri_yukle, "refresh").pack(side="left", padx=7)
+        self.pencereler.sakla("sahipler", top, verileri_yukle)
 
 
     # --- Sahip Güncelleme Penceresi ---
@@ -650,26 +708,25 @@ class VeterinerUygulamasi:
         form_frame = ttk.LabelFrame(top, text=f"Sahip Bilgilerini Güncelle (ID: {kayit_id})", padding="20", style="TLabelframe")
         form_frame.pack(padx=20, pady=20, fill="both", expand=True)
 
-        sahip_data_list = self.db.sorgu_calistir("SELECT isim, telefon, adres FROM sahipler WHERE id=%s", (kayit_id,), fetch_results=True)
-        if not sahip_data_list:
+        kayit = self._servisle(self.servis.sahipler.getir, kayit_id)
+        if kayit is None:
             messagebox.showerror("Hata", "Sahip kaydı bulunamadı veya veritabanı hatası.", icon="error")
             top.destroy()
             return
-        kayit = sahip_data_list[0]
 
         ttk.Label(form_frame, text="Adı Soyadı:").grid(row=0, column=0, padx=10, pady=8, sticky="w")
         isim_entry = ttk.Entry(form_frame)
-        isim_entry.insert(0, kayit[0])
+        isim_entry.insert(0, kayit.isim)
         isim_entry.grid(row=0, column=1, padx=10, pady=8, sticky="ew")
 
         ttk.Label(form_frame, text="Telefon:").grid(row=1, column=0, padx=10, pady=8, sticky="w")
         telefon_entry = ttk.Entry(form_frame)
-        telefon_entry.insert(0, kayit[1])
+        telefon_entry.insert(0, kayit.telefon)
         telefon_entry.grid(row=1, column=1, padx=10, pady=8, sticky="ew")
 
         ttk.Label(form_frame, text="Adres:").grid(row=2, column=0, padx=10, pady=8, sticky="nw")
         adres_text = tk.Text(form_frame, height=4, width=40, font=("Segoe UI", 10))
-        adres_text.insert("1.0", kayit[2] if kayit[2] else "")
+        adres_text.insert("1.0", kayit.adres or "")
         adres_text.grid(row=2, column=1, padx=10, pady=8, sticky="ew")
 
         form_frame.columnconfigure(1, weight=1)
@@ -683,9 +740,7 @@ class VeterinerUygulamasi:
                 messagebox.showerror("Hata", "Lütfen Adı Soyadı ve Telefon alanlarını doldurun.", icon="warning")
                 return
 
-            sorgu = "UPDATE sahipler SET isim=%s, telefon=%s, adres=%s WHERE id=%s"
-            veri = (yeni_isim, yeni_telefon, yeni_adres if yeni_adres else None, kayit_id)
-            if self.db.sorgu_calistir(sorgu, veri, commit=True):
+            if self._servisle(self.servis.sahipler.guncelle, kayit_id, yeni_isim, yeni_telefon, yeni_adres):
                 messagebox.showinfo("Başarılı", "Sahip kaydı güncellendi.", icon="info")
                 top.destroy()
                 if callback:
@@ -705,22 +760,22 @@ class VeterinerUygulamasi:
         form_frame = ttk.LabelFrame(top, text=f"Hayvan Bilgilerini Güncelle (ID: {kayit_id})", padding="20", style="TLabelframe")
         form_frame.pack(padx=20, pady=20, fill="both", expand=True)
 
-        hayvan_data_list = self.db.sorgu_calistir("SELECT isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id, notlar FROM hayvanlar WHERE id=%s", (kayit_id,), fetch_results=True)
-        if not hayvan_data_list:
+        kayit = self._servisle(self.servis.hayvanlar.getir, kayit_id)
+        if kayit is None:
             messagebox.showerror("Hata", "Hayvan kaydı bulunamadı veya veritabanı hatası.", icon="error")
             top.destroy()
             return
-        kayit = hayvan_data_list[0]
 
-        sahip_liste = self.db.sorgu_calistir("SELECT id, isim FROM sahipler", fetch_results=True)
-        if not sahip_liste:
+        try:
+            sahip_dict = self.sahip_secenekleri.secenekler()
+            ters_sahip_dict = self.sahip_secenekleri.etiketler()
+        except VeritabaniHatasi:
+            sahip_dict = None
+        if not sahip_dict:
             messagebox.showerror("Hata", "Sahip bilgileri yüklenemedi.", icon="error")
             top.destroy()
             return
 
-        sahip_dict = {f"{isim} (ID: {id})": id for id, isim in sahip_liste}
-        ters_sahip_dict = {id: f"{isim} (ID: {id})" for id, isim in sahip_liste}
-
         # Define fields and their corresponding keys for consistency
         fields = [
             ("İsim:", "isim"),
@@ -736,17 +791,17 @@ class VeterinerUygulamasi:
         for i, (label_text, key_name) in enumerate(fields):
             ttk.Label(form_frame, text=label_text).grid(row=i, column=0, padx=10, pady=8, sticky="w")
             if key_name == "gelis_sebebi":
-                entries[key_name] = ttk.Combobox(form_frame, values=["Aşı", "Yaralanma", "Parazit", "Kontrol", "Diğer"], state="readonly")
-                entries[key_name].set(kayit[4])
+                entries[key_name] = ttk.Combobox(form_frame, values=GELIS_SEBEPLERI, state="readonly")
+                entries[key_name].set(kayit.gelis_sebebi)
                 entries[key_name].grid(row=i, column=1, padx=10, pady=8, sticky="ew")
             elif key_name == "sahip":
                 sahip_var = tk.StringVar(form_frame)
                 entries[key_name] = ttk.Combobox(form_frame, textvariable=sahip_var, values=list(sahip_dict.keys()), state="readonly")
-                entries[key_name].set(ters_sahip_dict.get(kayit[5], ""))
+                entries[key_name].set(ters_sahip_dict.get(kayit.sahip_id, ""))
                 entries[key_name].grid(row=i, column=1, padx=10, pady=8, sticky="ew")
             elif key_name == "notlar":
                 notlar_text = tk.Text(form_frame, height=5, width=40, font=("Segoe UI", 10))
-                notlar_text.insert("1.0", kayit[6] if kayit[6] else "")
+                notlar_text.insert("1.0", kayit.notlar or "")
                 entries[key_name] = notlar_text
                 notlar_text.grid(row=i, column=1, padx=10, pady=8, sticky="ew")
             else:
@@ -755,10 +810,10 @@ class VeterinerUygulamasi:
                 entry.grid(row=i, column=1, padx=10, pady=8, sticky="ew")
                 
                 # Populate entry fields with existing data based on their key_name
-                if key_name == "isim": entry.insert(0, kayit[0])
-                elif key_name == "tur": entry.insert(0, kayit[1])
-                elif key_name == "cins": entry.insert(0, kayit[2])
-                elif key_name == "dogum_tarihi": entry.insert(0, kayit[3].strftime("%Y-%m-%d") if kayit[3] else "")
+                if key_name == "isim": entry.insert(0, kayit.isim)
+                elif key_name == "tur": entry.insert(0, kayit.tur)
+                elif key_name == "cins": entry.insert(0, kayit.cins)
+                elif key_name == "dogum_tarihi": entry.insert(0, bicimler.tarih_metni(kayit.dogum_tarihi))
 
 
         form_frame.columnconfigure(1, weight=1)
@@ -773,21 +828,9 @@ class VeterinerUygulamasi:
             yeni_sahip_id = sahip_dict.get(entries['sahip'].get())
             yeni_notlar = entries['notlar'].get("1.0", "end-1c").strip()
 
-            if not all([yeni_isim, yeni_tur, yeni_cins, yeni_dogum, yeni_gelis, yeni_sahip_id]):
-                messagebox.showerror("Hata", "Tüm gerekli alanları doldurun.", icon="warning")
-                return
-
-            try:
-                datetime.strptime(yeni_dogum, "%Y-%m-%d")
-            except ValueError:
-                messagebox.showerror("Hata", "Doğum tarihi formatı yanlış. Lütfen YYYY-AA-GG formatını kullanın.", icon="warning")
-                return
-
-            sorgu = """
-                UPDATE hayvanlar SET isim=%s, tur=%s, cins=%s, dogum_tarihi=%s, gelis_sebebi=%s, sahip_id=%s, notlar=%s WHERE id=%s
-            """
-            veri = (yeni_isim, yeni_tur, yeni_cins, yeni_dogum, yeni_gelis, yeni_sahip_id, yeni_notlar if yeni_notlar else None, kayit_id)
-            if self.db.sorgu_calistir(sorgu, veri, commit=True):
+            # Boş alanlar ve tarih biçimi servis tarafından denetlenir
+            if self._servisle(self.servis.hayvanlar.guncelle, kayit_id, yeni_isim, yeni_tur, yeni_cins, yeni_dogum,
+                              yeni_gelis, yeni_sahip_id, yeni_notlar):
                 messagebox.showinfo("Başarılı", "Kayıt güncellendi.", icon="info")
                 top.destroy()
                 if callback:
@@ -797,10 +840,9 @@ class VeterinerUygulamasi:
 
     # --- Hayvan Listeleme Penceresi ---
     def _hayvanlari_listele_penceresi(self):
-        top = tk.Toplevel(self.root, bg=COLORS["background"])
-        top.title("Hayvanları Listele")
-        top.grab_set()
-        top.geometry("1000x600") # Daha büyük pencere
+        top = self.pencereler.ac("hayvanlar", "Hayvanları Listele", "1000x600") # Daha büyük pencere
+        if top is None:
+            return # Saklanan pencere öne getirildi; liste yalnızca değişenlerle tazelendi
 
         # Başlık sola hizalandı
         ttk.Label(top, text="Kayıtlı Hayvanlar", font=("Segoe UI", 14, "bold"), 
@@ -810,6 +852,8 @@ class VeterinerUygulamasi:
         tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Sütunları güncelle: "Doğum Tarihi" yerine "Yaş"
+        gosterge = YuklemeGostergesi(top, before=tree_frame, anchor="e", padx=10)
+
         tree = ttk.Treeview(tree_frame, columns=("ID", "İsim", "Tür", "Cins", "Yaş", "Geliş Sebebi", "Sahip"), show="headings")
         tree.pack(side="left", fill="both", expand=True)
 
@@ -833,40 +877,11 @@ class VeterinerUygulamasi:
         tree.column("Geliş Sebebi", width=120, anchor="w")
         tree.column("Sahip", width=150, anchor="w")
 
-        def verileri_yukle():
-            for item in tree.get_children():
-                tree.delete(item)
-            # Sorguyu ID'ye göre sıralayacak şekilde güncellendi
-            kayitlar = self.db.sorgu_calistir("""
-                SELECT h.id, h.isim, h.tur, h.cins, h.dogum_tarihi, h.gelis_sebebi, s.isim
-                FROM hayvanlar h JOIN sahipler s ON h.sahip_id = s.id
-                ORDER BY h.id ASC 
-            """, fetch_results=True)
-            if kayitlar:
-                bugun = datetime.now().date()
-                for kayit in kayitlar:
-                    hayvan_id, isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_isim = kayit
-                    
-                    yas_str = "Bilinmiyor"
-                    if dogum_tarihi:
-                        # Yaş hesaplama
-                        age = bugun.year - dogum_tarihi.year - ((bugun.month, bugun.day) < (dogum_tarihi.month, dogum_tarihi.day))
-                        if age > 0:
-                            yas_str = f"{age} yıl"
-                        else:
-                            # 1 yaşından küçükse ayları veya günleri hesapla
-                            delta = bugun - dogum_tarihi
-                            if delta.days < 30:
-                                yas_str = f"{delta.days} gün"
-                            elif delta.days < 365:
-                                months = delta.days // 30 # Yaklaşık ay hesabı
-                                yas_str = f"{months} ay"
-                            else:
-                                yas_str = "1 yaşından küçük" # Nadir durum, ama kapsayıcı olsun
-
-                    tree.insert("", "end", values=(hayvan_id, isim, tur, cins, yas_str, gelis_sebebi, sahip_isim))
-            else:
-                messagebox.showinfo("Bilgi", "Kayıtlı hayvan bulunamadı.", icon="info")
+        # Tüm tablo yerine id'ye göre sayfa sayfa yüklenir
+        liste = SayfaliListe(tree, vsb, self.yurutucu, self.db, sorgular.HAYVAN_SAYFASI[self.db.lehce], "h.id", None,
+                             sahip=top, gosterge=gosterge, bos_mesaji="Kayıtlı hayvan bulunamadı.",
+                             degisim_kosulu=sorgular.HAYVAN_DEGISIMI, silinme_tablosu="hayvanlar")
+        verileri_yukle = liste.tazele # Açılışta tam, sonrasında yalnızca değişenleri yükler
         
         def kayit_sil():
             secilen_item = tree.selection()
@@ -877,8 +892,7 @@ class VeterinerUygulamasi:
             kayit_id = tree.item(secilen_item, "values")[0]
 
             if messagebox.askyesno("Onay", f"ID {kayit_id} olan kaydı silmek istediğinize emin misiniz? Bu işlem bağlantılı tüm kayıtları da silebilir!", icon="question"):
-                sorgu = "DELETE FROM hayvanlar WHERE id=%s"
-                if self.db.sorgu_calistir(sorgu, (kayit_id,), commit=True):
+                if self._servisle(self.servis.hayvanlar.sil, kayit_id) is not None:
                     messagebox.showinfo("Silindi", "Kayıt başarıyla silindi.", icon="info")
                     verileri_yukle()
 
@@ -907,6 +921,7 @@ class VeterinerUygulamasi:
         self._create_button_with_icon(button_frame, "Güncelle", kayit_guncelle, "update").pack(side="left", padx=7)
         self._create_button_with_icon(button_frame, "Detay Gör", hayvan_detay_goster, "details").pack(side="left", padx=7)
         self._create_button_with_icon(button_frame, "Yenile", verileri_yukle, "refresh").pack(side="left", padx=7)
+        self.pencereler.sakla("hayvanlar", top, verileri_yukle)
 
     def _hayvan_detay_penceresi(self, hayvan_id):
         top = tk.Toplevel(self.root, bg=COLORS["background"])
@@ -922,54 +937,42 @@ class VeterinerUygulamasi:
         info_frame.columnconfigure(1, weight=1) # İkinci sütun genişlesin
         info_frame.columnconfigure(3, weight=1) # Dördüncü sütun genişlesin
 
-        hayvan_bilgi = self.db.sorgu_calistir(
-            """
-            SELECT h.isim, h.tur, h.cins, h.dogum_tarihi, h.gelis_sebebi, s.isim, h.notlar
-            FROM hayvanlar h JOIN sahipler s ON h.sahip_id = s.id
-            WHERE h.id = %s
-            """, (hayvan_id,), fetch_results=True
-        )
-        if not hayvan_bilgi:
+        hayvan = self._servisle(self.servis.hayvanlar.getir, hayvan_id)
+        if hayvan is None:
             messagebox.showerror("Hata", "Hayvan bilgileri bulunamadı veya veritabanı hatası.", icon="error")
             top.destroy()
             return
-        
-        hayvan_bilgi = hayvan_bilgi[0] 
 
         ttk.Label(info_frame, text="Adı:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(info_frame, text=hayvan_bilgi[0], font=("Segoe UI", 10, "bold"), 
+        ttk.Label(info_frame, text=hayvan.isim, font=("Segoe UI", 10, "bold"), 
                   foreground=COLORS["primary"]).grid(row=0, column=1, sticky="w", padx=5, pady=2)
         
         ttk.Label(info_frame, text="Tür:").grid(row=0, column=2, sticky="w", padx=15, pady=2)
-        ttk.Label(info_frame, text=hayvan_bilgi[1]).grid(row=0, column=3, sticky="w", padx=5, pady=2)
+        ttk.Label(info_frame, text=hayvan.tur).grid(row=0, column=3, sticky="w", padx=5, pady=2)
 
         ttk.Label(info_frame, text="Cins:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(info_frame, text=hayvan_bilgi[2]).grid(row=1, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(info_frame, text=hayvan.cins).grid(row=1, column=1, sticky="w", padx=5, pady=2)
         
-        dogum_tarihi_str = hayvan_bilgi[3].strftime("%Y-%m-%d") if hayvan_bilgi[3] else "Belirtilmemiş"
+        dogum_tarihi_str = bicimler.tarih_metni(hayvan.dogum_tarihi, "Belirtilmemiş")
         ttk.Label(info_frame, text="Doğum Tarihi:").grid(row=1, column=2, sticky="w", padx=15, pady=2)
         ttk.Label(info_frame, text=dogum_tarihi_str).grid(row=1, column=3, sticky="w", padx=5, pady=2)
 
         ttk.Label(info_frame, text="Geliş Sebebi:").grid(row=2, column=0, sticky="w", padx=5, pady=2)
-        ttk.Label(info_frame, text=hayvan_bilgi[4]).grid(row=2, column=1, sticky="w", padx=5, pady=2)
+        ttk.Label(info_frame, text=hayvan.gelis_sebebi).grid(row=2, column=1, sticky="w", padx=5, pady=2)
         
         ttk.Label(info_frame, text="Sahibi:").grid(row=2, column=2, sticky="w", padx=15, pady=2)
-        ttk.Label(info_frame, text=hayvan_bilgi[5], font=("Segoe UI", 10, "bold"),
+        ttk.Label(info_frame, text=hayvan.sahip_isim, font=("Segoe UI", 10, "bold"),
                   foreground=COLORS["primary"]).grid(row=2, column=3, sticky="w", padx=5, pady=2)
 
         ttk.Label(info_frame, text="Notlar/Uyarılar:").grid(row=3, column=0, sticky="nw", padx=5, pady=5)
         notlar_text = tk.Text(info_frame, height=4, width=60, font=("Segoe UI", 9), wrap="word", 
                               bg=COLORS["text_light"], fg=COLORS["text_dark"])
-        notlar_text.insert("1.0", hayvan_bilgi[6] if hayvan_bilgi[6] else "")
+        notlar_text.insert("1.0", hayvan.notlar or "")
         notlar_text.grid(row=3, column=1, columnspan=3, sticky="ew", padx=5, pady=5)
         
         def notlari_kaydet():
-            yeni_notlar = notlar_text.get("1.0", "end-1c").strip()
-            sorgu = "UPDATE hayvanlar SET notlar = %s WHERE id = %s"
-            if self.db.sorgu_calistir(sorgu, (yeni_notlar if yeni_notlar else None, hayvan_id), commit=True):
+            if self._servisle(self.servis.hayvanlar.notlari_guncelle, hayvan_id, notlar_text.get("1.0", "end-1c")):
                 messagebox.showinfo("Başarılı", "Notlar güncellendi.", icon="info")
-            else:
-                messagebox.showerror("Hata", "Notlar güncellenirken bir hata oluştu.", icon="error")
 
         self._create_button_with_icon(info_frame, "Notları Kaydet", notlari_kaydet, "save").grid(row=4, column=3, sticky="e", padx=5, pady=5)
 
@@ -977,24 +980,47 @@ class VeterinerUygulamasi:
         # Sekmeli Görünüm (Notebook)
         notebook = ttk.Notebook(top)
         notebook.pack(fill="both", expand=True, padx=15, pady=10)
+        gosterge = YuklemeGostergesi(top, before=notebook, anchor="e", padx=15)
 
         # --- Aşı Geçmişi Tabı ---
         asi_frame = ttk.Frame(notebook, style="TFrame")
         notebook.add(asi_frame, text="Aşı Geçmişi")
-        self._asi_gecmisi_tab_olustur(asi_frame, hayvan_id) # Fonksiyonu ayrı çağıralım
 
         # --- Randevu Geçmişi Tabı ---
         randevu_frame = ttk.Frame(notebook, style="TFrame")
         notebook.add(randevu_frame, text="Randevu Geçmişi")
-        self._randevu_gecmisi_tab_olustur(randevu_frame, hayvan_id)
 
         # --- Muayene ve Tedavi Geçmişi Tabı ---
         muayene_frame = ttk.Frame(notebook, style="TFrame")
         notebook.add(muayene_frame, text="Muayene/Tedavi")
-        self._muayene_gecmisi_tab_olustur(muayene_frame, hayvan_id)
+
+        # Sekmeler ilk açıldıklarında arka planda doldurulur
+        self._sekmeleri_tembel_yukle(notebook, {
+            asi_frame: lambda: self._asi_gecmisi_tab_olustur(asi_frame, hayvan_id, gosterge),
+            randevu_frame: lambda: self._randevu_gecmisi_tab_olustur(randevu_frame, hayvan_id, gosterge),
+            muayene_frame: lambda: self._muayene_gecmisi_tab_olustur(muayene_frame, hayvan_id, gosterge),
+        })
+
+    def _sekmeleri_tembel_yukle(self, notebook, yukleyiciler):
+        """
+        Sekmeleri ilk seçildiklerinde yükler; yüklenen sekme pencere açık kaldıkça yeniden yüklenmez.
+        :param yukleyiciler: Sekme çerçevesi -> argümansız yükleme fonksiyonu.
+        """
+        bekleyenler = {str(cerceve): yukle for cerceve, yukle in yukleyiciler.items()}
+
+        def sekme_degisti(event=None):
+            yukle = bekleyenler.pop(notebook.select(), None)
+            if yukle is not None:
+                yukle()
+
+        notebook.bind("<<NotebookTabChanged>>", sekme_degisti, add="+")
+        sekme_degisti() # Açık gelen sekme
+
+    def _bos_sekme_mesaji(self, parent_frame, metin):
+        ttk.Label(parent_frame, text=metin, background=COLORS["frame_bg"]).pack(pady=20, anchor="center")
 
     # Aşı Geçmişi Tabı için yardımcı fonksiyon
-    def _asi_gecmisi_tab_olustur(self, parent_frame, hayvan_id):
+    def _asi_gecmisi_tab_olustur(self, parent_frame, hayvan_id, gosterge=None):
         tree = ttk.Treeview(parent_frame, columns=("Aşı Adı", "Aşı Tarihi", "Sonraki Aşı", "Notlar"), show="headings")
         tree.pack(fill="both", expand=True, padx=5, pady=5)
 
@@ -1012,22 +1038,20 @@ class VeterinerUygulamasi:
         tree.column("Sonraki Aşı", width=120, anchor="center")
         tree.column("Notlar", width=200, anchor="w")
 
-        asi_kayitlar = self.db.sorgu_calistir(
-            "SELECT asi_adi, asi_tarihi, sonraki_asi_tarihi, notlar FROM asi_takip WHERE hayvan_id = %s ORDER BY id ASC", # ID'ye göre sırala
-            (hayvan_id,), fetch_results=True
-        )
-        if asi_kayitlar:
-            for kayit in asi_kayitlar:
-                asi_tarihi_str = kayit[1].strftime("%Y-%m-%d") if kayit[1] else ""
-                sonraki_asi_str = kayit[2].strftime("%Y-%m-%d") if kayit[2] else "Yok"
-                tree.insert("", "end", values=(kayit[0], asi_tarihi_str, sonraki_asi_str, kayit[3]))
-        else:
-            # Başlık sola hizalandı
-            ttk.Label(parent_frame, text="Bu hayvana ait aşı kaydı bulunmamaktadır.", background=COLORS["frame_bg"]).pack(pady=20, anchor="center")
+        def doldur(asi_kayitlar):
+            if asi_kayitlar:
+                for kayit in asi_kayitlar:
+                    tree.insert("", "end", values=kayit)
+            else:
+                self._bos_sekme_mesaji(parent_frame, "Bu hayvana ait aşı kaydı bulunmamaktadır.")
+
+        # ID'ye göre sıralı
+        self.yurutucu.gonder(self.servis.asilar.gecmis, hayvan_id, basarili=doldur, sahip=parent_frame.winfo_toplevel(),
+                             gosterge=gosterge)
 
 
     # Randevu Geçmişi Tabı için yardımcı fonksiyon
-    def _randevu_gecmisi_tab_olustur(self, parent_frame, hayvan_id):
+    def _randevu_gecmisi_tab_olustur(self, parent_frame, hayvan_id, gosterge=None):
         tree = ttk.Treeview(parent_frame, columns=("Tarih", "Açıklama", "Durum"), show="headings")
         tree.pack(fill="both", expand=True, padx=5, pady=5)
         
@@ -1043,20 +1067,19 @@ class VeterinerUygulamasi:
         tree.column("Açıklama", width=300, anchor="w")
         tree.column("Durum", width=100, anchor="center")
 
-        randevu_kayitlar = self.db.sorgu_calistir(
-            "SELECT randevu_tarihi, aciklama, durum FROM randevular WHERE hayvan_id = %s ORDER BY id ASC", # ID'ye göre sırala
-            (hayvan_id,), fetch_results=True
-        )
-        if randevu_kayitlar:
-            for kayit in randevu_kayitlar:
-                randevu_tarihi_str = kayit[0].strftime("%Y-%m-%d %H:%M") if kayit[0] else ""
-                tree.insert("", "end", values=(randevu_tarihi_str, kayit[1], kayit[2]))
-        else:
-            # Başlık sola hizalandı
-            ttk.Label(parent_frame, text="Bu hayvana ait randevu kaydı bulunmamaktadır.", background=COLORS["frame_bg"]).pack(pady=20, anchor="center")
+        def doldur(randevu_kayitlar):
+            if randevu_kayitlar:
+                for kayit in randevu_kayitlar:
+                    tree.insert("", "end", values=kayit)
+            else:
+                self._bos_sekme_mesaji(parent_frame, "Bu hayvana ait randevu kaydı bulunmamaktadır.")
+
+        # ID'ye göre sıralı
+        self.yurutucu.gonder(self.servis.randevular.gecmis, hayvan_id, basarili=doldur, sahip=parent_frame.winfo_toplevel(),
+                             gosterge=gosterge)
 
     # Muayene Geçmişi Tabı için yardımcı fonksiyon
-    def _muayene_gecmisi_tab_olustur(self, parent_frame, hayvan_id):
+    def _muayene_gecmisi_tab_olustur(self, parent_frame, hayvan_id, gosterge=None):
         tree = ttk.Treeview(parent_frame, columns=("Tarih", "Şikayet", "Teşhis", "Tedavi Planı"), show="headings")
         tree.pack(fill="both", expand=True, padx=5, pady=5)
 
@@ -1074,36 +1097,130 @@ class VeterinerUygulamasi:
         tree.column("Teşhis", width=150, anchor="w")
         tree.column("Tedavi Planı", width=180, anchor="w")
 
-        muayene_kayitlar = self.db.sorgu_calistir(
-            "SELECT muayene_tarihi, sikayet, teshis, tedavi_plani FROM muayeneler WHERE hayvan_id = %s ORDER BY id ASC", # ID'ye göre sırala
-            (hayvan_id,), fetch_results=True
-        )
-        if muayene_kayitlar:
-            for kayit in muayene_kayitlar:
-                muayene_tarihi_str = kayit[0].strftime("%Y-%m-%d %H:%M") if kayit[0] else ""
-                tree.insert("", "end", values=(kayit[0], kayit[1], kayit[2], kayit[3]))
-        else:
-            # Başlık sola hizalandı
-            ttk.Label(parent_frame, text="Bu hayvana ait muayene kaydı bulunmamaktadır.", background=COLORS["frame_bg"]).pack(pady=20, anchor="center")
+        top = parent_frame.winfo_toplevel()
+        arama_var = tk.StringVar()
+
+        def listele(kayitlar):
+            tree.delete(*tree.get_children())
+            for kayit in kayitlar:
+                tree.insert("", "end", values=kayit)
+
+        def ara():
+            try:
+                arama = self.servis.muayeneler.arama_sorgusu(arama_var.get(), hayvan_id)
+            except ValueError as err:
+                messagebox.showwarning("Uyarı", str(err), icon="warning")
+                return
+            self._arkaplanda_sorgula(top, gosterge, *arama, basarili=listele, anahtar=listele) # Alakaya göre sıralı
+
+        def tumunu_goster():
+            arama_var.set("")
+            self.yurutucu.gonder(self.servis.muayeneler.gecmis, hayvan_id, basarili=listele, sahip=top, gosterge=gosterge,
+                                 anahtar=listele)
+
+        def doldur(muayene_kayitlar):
+            if not muayene_kayitlar:
+                self._bos_sekme_mesaji(parent_frame, "Bu hayvana ait muayene kaydı bulunmamaktadır.")
+                return
+            listele(muayene_kayitlar)
+
+            # Bu hayvanın kayıtlarında tam metin araması
+            arama_frame = ttk.Frame(parent_frame, style="TFrame")
+            arama_frame.pack(fill="x", padx=5, pady=(5, 0), before=tree)
+            arama_entry = ttk.Entry(arama_frame, textvariable=arama_var)
+            arama_entry.pack(side="left", fill="x", expand=True, padx=5)
+            arama_entry.bind("<Return>", lambda e: ara())
+            self._create_button_with_icon(arama_frame, "Ara", ara, "filter").pack(side="left", padx=5)
+            self._create_button_with_icon(arama_frame, "Tümü", tumunu_goster, "refresh").pack(side="left", padx=5)
+
+        # ID'ye göre sıralı
+        self.yurutucu.gonder(self.servis.muayeneler.gecmis, hayvan_id, basarili=doldur, sahip=top, gosterge=gosterge,
+                             anahtar=listele)
 
 
     # --- Randevu Yönetimi ---
+    def _randevu_cakismalari(self, tarih_str, sure_str, veteriner, oda, haric_id=None, taze=False):
+        """
+        Randevu formundaki alanlarla çakışan randevuları bulur.
+        :return: (randevu_tarihi, sure_dakika, çakışmalar)
+        :raises ValueError: Tarih veya süre geçersizse; mesajı kullanıcıya gösterilebilir.
+        """
+        try:
+            randevu_tarihi = datetime.strptime(tarih_str.strip(), "%Y-%m-%d %H:%M")
+        except ValueError:
+            raise ValueError("Randevu tarihi formatı yanlış. Lütfen YYYY-AA-GG HH:MM formatını kullanın.") from None
+        try:
+            sure_dakika = int(sure_str)
+        except ValueError:
+            sure_dakika = 0
+        if not 0 < sure_dakika <= RANDEVU_EN_UZUN_SURE:
+            raise ValueError(f"Süre 1 ile {RANDEVU_EN_UZUN_SURE} dakika arasında olmalıdır.")
+        cakismalar = self.randevu_cakismalari.cakismalar(randevu_tarihi, sure_dakika, veteriner.strip() or None,
+                                                         oda.strip() or None, haric_id, taze)
+        return randevu_tarihi, sure_dakika, cakismalar
+
+    def _randevu_kaynak_alanlari(self, form_frame, ilk_satir, sure=15, veteriner=None, oda=None):
+        """Süre, veteriner ve oda alanlarını ve çakışma durum etiketini ekler; (süre, veteriner, oda, etiket) döndürür."""
+        ttk.Label(form_frame, text="Süre (dk):").grid(row=ilk_satir, column=0, padx=10, pady=8, sticky="w")
+        sure_combo = ttk.Combobox(form_frame, values=["15", "30", "45", "60", "90", "120"])
+        sure_combo.set(str(sure))
+        sure_combo.grid(row=ilk_satir, column=1, padx=10, pady=8, sticky="ew")
+
+        ttk.Label(form_frame, text="Veteriner:").grid(row=ilk_satir + 1, column=0, padx=10, pady=8, sticky="w")
+        veteriner_entry = ttk.Entry(form_frame)
+        veteriner_entry.insert(0, veteriner or "")
+        veteriner_entry.grid(row=ilk_satir + 1, column=1, padx=10, pady=8, sticky="ew")
+
+        ttk.Label(form_frame, text="Oda:").grid(row=ilk_satir + 2, column=0, padx=10, pady=8, sticky="w")
+        oda_entry = ttk.Entry(form_frame)
+        oda_entry.insert(0, oda or "")
+        oda_entry.grid(row=ilk_satir + 2, column=1, padx=10, pady=8, sticky="ew")
+
+        cakisma_label = ttk.Label(form_frame, text="", wraplength=300)
+        cakisma_label.grid(row=ilk_satir + 3, column=0, columnspan=2, padx=10, pady=4, sticky="w")
+        return sure_combo, veteriner_entry, oda_entry, cakisma_label
+
+    def _cakisma_durumunu_izle(self, tarih_entry, sure_combo, veteriner_entry, oda_entry, cakisma_label, haric_id=None):
+        """Alanlar değiştikçe çakışmayı önbellekteki gün indeksinden denetleyip etikette gösterir."""
+        def goster(event=None):
+            try:
+                _, _, cakismalar = self._randevu_cakismalari(tarih_entry.get(), sure_combo.get(), veteriner_entry.get(),
+                                                             oda_entry.get(), haric_id)
+            except (ValueError, VeritabaniHatasi):
+                cakisma_label.config(text="")
+                return
+            if cakismalar:
+                cakisma_label.config(text="Çakışıyor: " + "; ".join(bicimler.cakisma_metni(c) for c in cakismalar[:3]),
+                                     foreground=COLORS["error"])
+            else:
+                cakisma_label.config(text="Bu saat uygun.", foreground=COLORS["primary"])
+
+        for alan in (tarih_entry, sure_combo, veteriner_entry, oda_entry):
+            alan.bind("<KeyRelease>", goster, add="+")
+        sure_combo.bind("<<ComboboxSelected>>", goster, add="+")
+        goster()
+
+    def _cakisma_onayi(self, cakismalar, tarih_str):
+        """Çakışma yoksa ya da kullanıcı yine de kaydetmeyi seçerse True."""
+        if not cakismalar:
+            return True
+        liste = "\n".join(bicimler.cakisma_metni(c) for c in cakismalar[:5])
+        return messagebox.askyesno("Randevu Çakışması",
+                                   f"Bu aralıkta ({tarih_str}) çakışan randevu var:\n{liste}\n\nYine de kaydetmek istiyor musunuz?",
+                                   icon="question")
+
     def _randevu_ekle_penceresi(self):
         top = tk.Toplevel(self.root, bg=COLORS["background"])
         top.title("Randevu Ekle")
         top.grab_set()
-        top.geometry("500x480")
+        top.geometry("500x640")
         top.resizable(False, False)
 
         form_frame = ttk.LabelFrame(top, text="Yeni Randevu Bilgileri", padding="20", style="TLabelframe")
         form_frame.pack(padx=20, pady=20, fill="both", expand=True)
 
-        hayvan_dict, _ = self._get_hayvanlar_ve_sahipler()
-
         ttk.Label(form_frame, text="Hayvan:").grid(row=0, column=0, padx=10, pady=8, sticky="w")
-        hayvan_combo = ttk.Combobox(form_frame, width=30, values=list(hayvan_dict.keys()), state="readonly")
-        if hayvan_dict:
-            hayvan_combo.set(next(iter(hayvan_dict)))
+        hayvan_combo = HayvanSecici(form_frame, self.db, self.yurutucu, width=30) # Ad, sahip adı veya ID yazın
         hayvan_combo.grid(row=0, column=1, padx=10, pady=8, sticky="ew")
 
         ttk.Label(form_frame, text="Randevu Tarihi (YYYY-AA-GG HH:MM):").grid(row=1, column=0, padx=10, pady=8, sticky="w")
@@ -1117,11 +1234,14 @@ class VeterinerUygulamasi:
         
         ttk.Label(form_frame, text="Durum:").grid(row=3, column=0, padx=10, pady=8, sticky="w")
         durum_var = tk.StringVar(form_frame)
-        durum_options = ["Planlandı", "Tamamlandı", "İptal Edildi", "Gelmedi"]
+        durum_options = RANDEVU_DURUMLARI
         durum_combo = ttk.Combobox(form_frame, textvariable=durum_var, values=durum_options, state="readonly")
         durum_combo.set("Planlandı")
         durum_combo.grid(row=3, column=1, padx=10, pady=8, sticky="ew")
 
+        sure_combo, veteriner_entry, oda_entry, cakisma_label = self._randevu_kaynak_alanlari(form_frame, 4)
+        self._cakisma_durumunu_izle(randevu_tarihi_entry, sure_combo, veteriner_entry, oda_entry, cakisma_label)
+
         form_frame.columnconfigure(1, weight=1)
 
         def kaydet():
@@ -1134,29 +1254,28 @@ class VeterinerUygulamasi:
                 messagebox.showerror("Hata", "Lütfen hayvan ve randevu tarihini doldurun.", icon="warning")
                 return
 
-            hayvan_id = hayvan_dict.get(secilen_hayvan)
+            hayvan_id = hayvan_combo.secili_id()
             if not hayvan_id:
                 messagebox.showerror("Hata", "Lütfen geçerli bir hayvan seçin.", icon="warning")
                 return
             
+            veteriner = veteriner_entry.get().strip()
+            oda = oda_entry.get().strip()
+            # Çakışma kontrolü; başka bir masanın az önce aldığı randevuyu kaçırmamak için gün tazelenir
             try:
-                randevu_tarihi = datetime.strptime(randevu_tarihi_str, "%Y-%m-%d %H:%M")
-            except ValueError:
-                messagebox.showerror("Hata", "Randevu tarihi formatı yanlış. Lütfen YYYY-AA-GG HH:MM formatını kullanın.", icon="warning")
+                randevu_tarihi, sure_dakika, cakismalar = self._randevu_cakismalari(
+                    randevu_tarihi_str, sure_combo.get(), veteriner, oda, taze=True)
+            except ValueError as err:
+                messagebox.showerror("Hata", str(err), icon="warning")
+                return
+            except VeritabaniHatasi as err:
+                self.db.hata_goster(err)
+                return
+            if durum != "İptal Edildi" and not self._cakisma_onayi(cakismalar, randevu_tarihi_str):
                 return
-
-            # Çakışma kontrolü
-            collision_check_sql = "SELECT COUNT(*) FROM randevular WHERE randevu_tarihi = %s AND durum != 'İptal Edildi'"
-            existing_appointments_data = self.db.sorgu_calistir(collision_check_sql, (randevu_tarihi,), fetch_results=True)
-            
-            if existing_appointments_data and existing_appointments_data[0][0] > 0:
-                if not messagebox.askyesno("Randevu Çakışması", 
-                                          f"Bu tarihte ({randevu_tarihi_str}) zaten bir randevu var. Yine de eklemek istiyor musunuz?", icon="question"):
-                    return
             
-            sql = "INSERT INTO randevular (hayvan_id, randevu_tarihi, aciklama, durum) VALUES (%s, %s, %s, %s)"
-            veri = (hayvan_id, randevu_tarihi, aciklama if aciklama else None, durum)
-            if self.db.sorgu_calistir(sql, veri, commit=True):
+            if self._servisle(self.servis.randevular.ekle, hayvan_id, randevu_tarihi, aciklama, durum, sure_dakika,
+                              veteriner, oda):
                 messagebox.showinfo("Başarılı", "Randevu başarıyla eklendi.", icon="info")
                 top.destroy()
 
@@ -1164,17 +1283,26 @@ class VeterinerUygulamasi:
 
     # --- Randevu Listeleme ve Takvim Görünümü ---
     def _randevulari_listele_penceresi(self):
-        top = tk.Toplevel(self.root, bg=COLORS["background"])
-        top.title("Randevular")
-        top.grab_set()
-        top.geometry("1000x600")
+        top = self.pencereler.ac("randevular", "Randevular", "1000x600")
+        if top is None:
+            return # Saklanan pencere öne getirildi; takvim ve liste tazelendi
 
         # Başlık sola hizalandı
         ttk.Label(top, text="Randevu Kayıtları", font=("Segoe UI", 14, "bold"), 
                   background=COLORS["background"], foreground=COLORS["primary"]).pack(pady=10, anchor="w", padx=10)
 
-        tree_frame = ttk.Frame(top, style="TFrame")
-        tree_frame.pack(pady=10, padx=10, fill="both", expand=True)
+        notebook = ttk.Notebook(top)
+        notebook.pack(pady=10, padx=10, fill="both", expand=True)
+
+        gosterge = YuklemeGostergesi(top, before=notebook, anchor="e", padx=10)
+
+        # Açılışta yalnızca bugünün randevuları okunur
+        takvim = RandevuTakvimi(notebook, self.yurutucu, self.randevu_takvimi_onbellegi, gosterge=gosterge,
+                                style="TFrame", padding=10)
+        notebook.add(takvim, text="Takvim")
+
+        tree_frame = ttk.Frame(notebook, style="TFrame")
+        notebook.add(tree_frame, text="Tüm Randevular")
 
         tree = ttk.Treeview(tree_frame, columns=("ID", "Hayvan", "Randevu Tarihi", "Açıklama", "Durum"), show="headings")
         tree.pack(side="left", fill="both", expand=True)
@@ -1195,86 +1323,90 @@ class VeterinerUygulamasi:
         tree.column("Açıklama", width=250, anchor="w")
         tree.column("Durum", width=100, anchor="center")
 
+        # Tüm tablo yerine id'ye göre sayfa sayfa yüklenir
+        liste = SayfaliListe(tree, vsb, self.yurutucu, self.db, sorgular.RANDEVU_SAYFASI[self.db.lehce], "r.id", None,
+                             sahip=top, gosterge=gosterge, bos_mesaji="Kayıtlı randevu bulunamadı.",
+                             degisim_kosulu=sorgular.RANDEVU_DEGISIMI, silinme_tablosu="randevular")
+        liste_yuklendi = False
+
+        def listeyi_yukle():
+            nonlocal liste_yuklendi
+            liste_yuklendi = True
+            liste.tazele()
+
+        # Tüm geçmiş yalnızca bu sekme açılınca yüklenir
+        self._sekmeleri_tembel_yukle(notebook, {tree_frame: listeyi_yukle})
+
         def randevulari_yukle():
-            for item in tree.get_children():
-                tree.delete(item)
-            # Sorguyu ID'ye göre sıralayacak şekilde güncellendi
-            randevular = self.db.sorgu_calistir("""
-                SELECT r.id, h.isim, r.randevu_tarihi, r.aciklama, r.durum
-                FROM randevular r
-                JOIN hayvanlar h ON r.hayvan_id = h.id
-                ORDER BY r.id ASC 
-            """, fetch_results=True)
-            if randevular:
-                for randevu in randevular:
-                    randevu_tarihi_str = randevu[2].strftime("%Y-%m-%d %H:%M")
-                    tree.insert("", "end", values=(randevu[0], randevu[1], randevu_tarihi_str, randevu[3], randevu[4]))
-            else:
-                messagebox.showinfo("Bilgi", "Kayıtlı randevu bulunamadı.", icon="info")
+            takvim.yenile()
+            if liste_yuklendi:
+                liste.tazele() # Yalnızca değişenleri yükler
 
-        def randevu_sil():
+        def secili_randevu_id():
+            if notebook.select() == str(takvim):
+                return takvim.secili_id()
             secilen_item = tree.selection()
-            if not secilen_item:
+            return tree.item(secilen_item, "values")[0] if secilen_item else None
+
+        def randevu_sil():
+            randevu_id = secili_randevu_id()
+            if not randevu_id:
                 messagebox.showwarning("Uyarı", "Lütfen silmek istediğiniz randevuyu seçin.", icon="warning")
                 return
 
-            randevu_id = tree.item(secilen_item, "values")[0]
-
             if messagebox.askyesno("Onay", f"ID {randevu_id} olan randevuyu silmek istediğinize emin misiniz?", icon="question"):
-                sorgu = "DELETE FROM randevular WHERE id=%s"
-                if self.db.sorgu_calistir(sorgu, (randevu_id,), commit=True):
+                if self._servisle(self.servis.randevular.sil, randevu_id) is not None:
                     messagebox.showinfo("Başarılı", "Randevu başarıyla silindi.", icon="info")
                     randevulari_yukle()
 
         def randevu_guncelle():
-            secilen_item = tree.selection()
-            if not secilen_item:
+            randevu_id = secili_randevu_id()
+            if not randevu_id:
                 messagebox.showwarning("Uyarı", "Lütfen güncellemek istediğiniz randevuyu seçin.", icon="warning")
                 return
             
-            randevu_id = tree.item(secilen_item, "values")[0]
-            
             top_guncelle = tk.Toplevel(self.root, bg=COLORS["background"])
             top_guncelle.title("Randevu Güncelle")
             top_guncelle.grab_set()
-            top_guncelle.geometry("500x480")
+            top_guncelle.geometry("500x640")
             top_guncelle.resizable(False, False)
 
             form_frame = ttk.LabelFrame(top_guncelle, text=f"Randevu Bilgilerini Güncelle (ID: {randevu_id})", padding="20", style="TLabelframe")
             form_frame.pack(padx=20, pady=20, fill="both", expand=True)
 
-            randevu_data_list = self.db.sorgu_calistir("SELECT hayvan_id, randevu_tarihi, aciklama, durum FROM randevular WHERE id=%s", (randevu_id,), fetch_results=True)
-            if not randevu_data_list:
+            randevu = self._servisle(self.servis.randevular.getir, randevu_id)
+            if randevu is None:
                 messagebox.showerror("Hata", "Randevu kaydı bulunamadı veya veritabanı hatası.", icon="error")
                 top_guncelle.destroy()
                 return
-            randevu_data = randevu_data_list[0]
             
-            hayvan_dict, _ = self._get_hayvanlar_ve_sahipler()
-            ters_hayvan_dict = {v: k for k, v in hayvan_dict.items()} 
-
             ttk.Label(form_frame, text="Hayvan:").grid(row=0, column=0, padx=10, pady=8, sticky="w")
-            hayvan_combo_guncelle = ttk.Combobox(form_frame, width=30, values=list(hayvan_dict.keys()), state="readonly")
-            hayvan_combo_guncelle.set(ters_hayvan_dict.get(randevu_data[0], ""))
+            hayvan_combo_guncelle = HayvanSecici(form_frame, self.db, self.yurutucu, width=30)
+            hayvan_combo_guncelle.sec(randevu.hayvan_id)
             hayvan_combo_guncelle.grid(row=0, column=1, padx=10, pady=8, sticky="ew")
 
             ttk.Label(form_frame, text="Randevu Tarihi (YYYY-AA-GG HH:MM):").grid(row=1, column=0, padx=10, pady=8, sticky="w")
             randevu_tarihi_entry_guncelle = ttk.Entry(form_frame)
-            randevu_tarihi_entry_guncelle.insert(0, randevu_data[1].strftime("%Y-%m-%d %H:%M"))
+            randevu_tarihi_entry_guncelle.insert(0, bicimler.zaman_metni(randevu.randevu_tarihi))
             randevu_tarihi_entry_guncelle.grid(row=1, column=1, padx=10, pady=8, sticky="ew")
 
             ttk.Label(form_frame, text="Açıklama:").grid(row=2, column=0, padx=10, pady=8, sticky="nw")
             aciklama_text_guncelle = tk.Text(form_frame, height=5, width=40, font=("Segoe UI", 10))
-            aciklama_text_guncelle.insert("1.0", randevu_data[2] if randevu_data[2] else "")
+            aciklama_text_guncelle.insert("1.0", randevu.aciklama or "")
             aciklama_text_guncelle.grid(row=2, column=1, padx=10, pady=8, sticky="ew")
 
             ttk.Label(form_frame, text="Durum:").grid(row=3, column=0, padx=10, pady=8, sticky="w")
             durum_var_guncelle = tk.StringVar(form_frame)
-            durum_options_guncelle = ["Planlandı", "Tamamlandı", "İptal Edildi", "Gelmedi"]
+            durum_options_guncelle = RANDEVU_DURUMLARI
             durum_combo_guncelle = ttk.Combobox(form_frame, textvariable=durum_var_guncelle, values=durum_options_guncelle, state="readonly")
-            durum_combo_guncelle.set(randevu_data[3])
+            durum_combo_guncelle.set(randevu.durum)
             durum_combo_guncelle.grid(row=3, column=1, padx=10, pady=8, sticky="ew")
 
+            sure_combo_guncelle, veteriner_entry_guncelle, oda_entry_guncelle, cakisma_label = self._randevu_kaynak_alanlari(
+                form_frame, 4, randevu.sure_dakika, randevu.veteriner, randevu.oda)
+            self._cakisma_durumunu_izle(randevu_tarihi_entry_guncelle, sure_combo_guncelle, veteriner_entry_guncelle,
+                                        oda_entry_guncelle, cakisma_label, haric_id=int(randevu_id))
+
             form_frame.columnconfigure(1, weight=1)
 
             def guncelle_kaydet():
@@ -1287,38 +1419,36 @@ class VeterinerUygulamasi:
                     messagebox.showerror("Hata", "Lütfen hayvan ve randevu tarihini doldurun.", icon="warning")
                     return
                 
-                yeni_hayvan_id = hayvan_dict.get(yeni_secilen_hayvan)
+                yeni_hayvan_id = hayvan_combo_guncelle.secili_id()
                 if not yeni_hayvan_id:
                     messagebox.showerror("Hata", "Lütfen geçerli bir hayvan seçin.", icon="warning")
                     return
 
+                yeni_veteriner = veteriner_entry_guncelle.get().strip()
+                yeni_oda = oda_entry_guncelle.get().strip()
+                # Çakışma kontrolü (randevunun kendisi hariç)
                 try:
-                    yeni_randevu_tarihi = datetime.strptime(yeni_randevu_tarihi_str, "%Y-%m-%d %H:%M")
-                except ValueError:
-                    messagebox.showerror("Hata", "Randevu tarihi formatı yanlış. Lütfen YYYY-AA-GG HH:MM formatını kullanın.", icon="warning")
+                    yeni_randevu_tarihi, yeni_sure, cakismalar = self._randevu_cakismalari(
+                        yeni_randevu_tarihi_str, sure_combo_guncelle.get(), yeni_veteriner, yeni_oda,
+                        haric_id=int(randevu_id), taze=True)
+                except ValueError as err:
+                    messagebox.showerror("Hata", str(err), icon="warning")
+                    return
+                except VeritabaniHatasi as err:
+                    self.db.hata_goster(err)
+                    return
+                if yeni_durum != "İptal Edildi" and not self._cakisma_onayi(cakismalar, yeni_randevu_tarihi_str):
                     return
 
-                # Çakışma kontrolü
-                collision_check_sql = "SELECT COUNT(*) FROM randevular WHERE randevu_tarihi = %s AND id != %s AND durum != 'İptal Edildi'"
-                existing_appointments_data = self.db.sorgu_calistir(collision_check_sql, (yeni_randevu_tarihi, randevu_id), fetch_results=True)
-                
-                if existing_appointments_data and existing_appointments_data[0][0] > 0:
-                    if not messagebox.askyesno("Randevu Çakışması", 
-                                              f"Bu tarihte ({yeni_randevu_tarihi_str}) zaten başka bir randevu var. Yine de güncellemek istiyor musunuz?", icon="question"):
-                        return
-
-                sql = """
-                    UPDATE randevular SET hayvan_id=%s, randevu_tarihi=%s, aciklama=%s, durum=%s WHERE id=%s
-                """
-                veri = (yeni_hayvan_id, yeni_randevu_tarihi, yeni_aciklama if yeni_aciklama else None, yeni_durum, randevu_id)
-                if self.db.sorgu_calistir(sql, veri, commit=True):
+                if self._servisle(self.servis.randevular.guncelle, randevu_id, yeni_hayvan_id, yeni_randevu_tarihi,
+                                  yeni_aciklama, yeni_durum, yeni_sure, yeni_veteriner, yeni_oda):
                     messagebox.showinfo("Başarılı", "Randevu başarıyla güncellendi.", icon="info")
                     top_guncelle.destroy()
                     randevulari_yukle()
 
             self._create_button_with_icon(top_guncelle, "Güncelle", guncelle_kaydet, "update").pack(pady=15, padx=20, fill="x")
 
-        randevulari_yukle()
+        takvim.goster()
 
         button_frame = ttk.Frame(top, style="TFrame")
         button_frame.pack(pady=10)
@@ -1328,6 +1458,13 @@ class VeterinerUygulamasi:
         self._create_button_with_icon(button_frame, "Randevu Güncelle", randevu_guncelle, "update").pack(side="left", padx=7)
         self._create_button_with_icon(button_frame, "Listeyi Yenile", randevulari_yukle, "refresh").pack(side="left", padx=7)
 
+        def yeniden_acildi():
+            takvim.goster() # Takvim önbelleği yazmalarla zaten geçersiz olur; günler çoğunlukla beklemeden çizilir
+            if liste_yuklendi:
+                liste.tazele()
+
+        self.pencereler.sakla("randevular", top, yeniden_acildi)
+
     # --- Muayene ve Tedavi Kayıtları ---
     def _muayene_ekle_penceresi(self):
         top = tk.Toplevel(self.root, bg=COLORS["background"])
@@ -1339,12 +1476,8 @@ class VeterinerUygulamasi:
         form_frame = ttk.LabelFrame(top, text="Yeni Muayene Kaydı", padding="20", style="TLabelframe")
         form_frame.pack(padx=20, pady=20, fill="both", expand=True)
 
-        hayvan_dict, _ = self._get_hayvanlar_ve_sahipler()
-
         ttk.Label(form_frame, text="Hayvan:").grid(row=0, column=0, padx=10, pady=8, sticky="w")
-        hayvan_combo = ttk.Combobox(form_frame, width=30, values=list(hayvan_dict.keys()), state="readonly")
-        if hayvan_dict:
-            hayvan_combo.set(next(iter(hayvan_dict)))
+        hayvan_combo = HayvanSecici(form_frame, self.db, self.yurutucu, width=30) # Ad, sahip adı veya ID yazın
         hayvan_combo.grid(row=0, column=1, padx=10, pady=8, sticky="ew")
 
         ttk.Label(form_frame, text="Muayene Tarihi (YYYY-AA-GG HH:MM):").grid(row=1, column=0, padx=10, pady=8, sticky="w")
@@ -1382,41 +1515,43 @@ class VeterinerUygulamasi:
                 messagebox.showerror("Hata", "Lütfen hayvan ve muayene tarihini doldurun.", icon="warning")
                 return
 
-            hayvan_id = hayvan_dict.get(secilen_hayvan)
-            if not hayvan_id:
-                messagebox.showerror("Hata", "Lütfen geçerli bir hayvan seçin.", icon="warning")
-                return
-            
-            try:
-                muayene_tarihi = datetime.strptime(muayene_tarihi_str, "%Y-%m-%d %H:%M")
-            except ValueError:
-                messagebox.showerror("Hata", "Muayene tarihi formatı yanlış. Lütfen YYYY-AA-GG HH:MM formatını kullanın.", icon="warning")
-                return
-
-            sql = """
-                INSERT INTO muayeneler (hayvan_id, muayene_tarihi, sikayet, bulgular, teshis, tedavi_plani)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            veri = (hayvan_id, muayene_tarihi, sikayet if sikayet else None, bulgular if bulgular else None, teshis if teshis else None, tedavi_plani if tedavi_plani else None)
-            if self.db.sorgu_calistir(sql, veri, commit=True):
+            # Hayvan ve tarih biçimi servis tarafından denetlenir; boş metinler NULL yazılır
+            if self._servisle(self.servis.muayeneler.ekle, hayvan_combo.secili_id(), muayene_tarihi_str, sikayet, bulgular,
+                              teshis, tedavi_plani):
                 messagebox.showinfo("Başarılı", "Muayene kaydı eklendi.", icon="info")
                 top.destroy()
 
         self._create_button_with_icon(top, "Kaydet", kaydet, "save").pack(pady=15, padx=20, fill="x")
 
     def _muayene_listele_penceresi(self):
-        top = tk.Toplevel(self.root, bg=COLORS["background"])
-        top.title("Muayene ve Tedavi Kayıtları")
-        top.grab_set()
-        top.geometry("1100x600")
+        top = self.pencereler.ac("muayeneler", "Muayene ve Tedavi Kayıtları", "1100x600")
+        if top is None:
+            return # Saklanan pencere öne getirildi; liste (veya gösterilen arama) tazelendi
 
         # Başlık sola hizalandı
         ttk.Label(top, text="Muayene ve Tedavi Kayıtları", font=("Segoe UI", 14, "bold"), 
                   background=COLORS["background"], foreground=COLORS["primary"]).pack(pady=10, anchor="w", padx=10)
 
+        # Şikayet, bulgu, teşhis ve tedavi metinlerinde tam metin araması
+        arama_frame = ttk.LabelFrame(top, text="Benzer Vaka Ara", padding="10", style="TLabelframe")
+        arama_frame.pack(padx=10, pady=5, fill="x")
+
+        ttk.Label(arama_frame, text="Kelimeler:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        arama_var = tk.StringVar()
+        arama_entry = ttk.Entry(arama_frame, textvariable=arama_var)
+        arama_entry.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        arama_entry.bind("<Return>", lambda e: muayene_ara())
+
+        self._create_button_with_icon(arama_frame, "Ara", lambda: muayene_ara(), "filter").grid(row=0, column=2, padx=5, pady=5)
+        self._create_button_with_icon(arama_frame, "Tümünü Göster", lambda: tumunu_goster(), "refresh").grid(row=0, column=3, padx=5, pady=5)
+
+        arama_frame.columnconfigure(1, weight=1)
+
         tree_frame = ttk.Frame(top, style="TFrame")
         tree_frame.pack(pady=10, padx=10, fill="both", expand=True)
 
+        gosterge = YuklemeGostergesi(top, before=tree_frame, anchor="e", padx=10)
+
         tree = ttk.Treeview(tree_frame, columns=("ID", "Hayvan", "Tarih", "Şikayet", "Bulgular", "Teşhis", "Tedavi Planı"), show="headings")
         tree.pack(side="left", fill="both", expand=True)
 
@@ -1440,22 +1575,23 @@ class VeterinerUygulamasi:
         tree.column("Teşhis", width=150, anchor="w")
         tree.column("Tedavi Planı", width=180, anchor="w")
 
-        def muayeneleri_yukle():
-            for item in tree.get_children():
-                tree.delete(item)
-            # Sorguyu ID'ye göre sıralayacak şekilde güncellendi
-            kayitlar = self.db.sorgu_calistir("""
-                SELECT m.id, h.isim, m.muayene_tarihi, m.sikayet, m.bulgular, m.teshis, m.tedavi_plani
-                FROM muayeneler m
-                JOIN hayvanlar h ON m.hayvan_id = h.id
-                ORDER BY m.id ASC
-            """, fetch_results=True)
-            if kayitlar:
-                for kayit in kayitlar:
-                    muayene_tarihi_str = kayit[2].strftime("%Y-%m-%d %H:%M") if kayit[2] else ""
-                    tree.insert("", "end", values=(kayit[0], kayit[1], muayene_tarihi_str, kayit[3], kayit[4], kayit[5], kayit[6]))
-            else:
-                messagebox.showinfo("Bilgi", "Kayıtlı muayene bulunamadı.", icon="info")
+        # Tüm tablo yerine id'ye göre sayfa sayfa yüklenir
+        liste = SayfaliListe(tree, vsb, self.yurutucu, self.db, sorgular.MUAYENE_SAYFASI[self.db.lehce], "m.id", None,
+                             sahip=top, gosterge=gosterge, bos_mesaji="Kayıtlı muayene bulunamadı.",
+                             degisim_kosulu=sorgular.MUAYENE_DEGISIMI, silinme_tablosu="muayeneler")
+        muayeneleri_yukle = liste.tazele # Açılışta tam, sonrasında yalnızca değişenleri yükler (arama açıksa aramayı yeniler)
+
+        def muayene_ara():
+            try:
+                arama = self.servis.muayeneler.arama_sorgusu(arama_var.get())
+            except ValueError as err:
+                messagebox.showwarning("Uyarı", str(err), icon="warning")
+                return
+            liste.ara(*arama, bos_mesaji="Aranan kelimelerle eşleşen muayene bulunamadı.")
+
+        def tumunu_goster():
+            arama_var.set("")
+            liste.yenile()
 
         def muayene_sil():
             secilen_item = tree.selection()
@@ -1466,8 +1602,7 @@ class VeterinerUygulamasi:
             kayit_id = tree.item(secilen_item, "values")[0]
 
             if messagebox.askyesno("Onay", f"ID {kayit_id} olan muayene kaydını silmek istediğinize emin misiniz?", icon="question"):
-                sorgu = "DELETE FROM muayeneler WHERE id=%s"
-                if self.db.sorgu_calistir(sorgu, (kayit_id,), commit=True):
+                if self._servisle(self.servis.muayeneler.sil, kayit_id) is not None:
                     messagebox.showinfo("Silindi", "Muayene kaydı başarıyla silindi.", icon="info")
                     muayeneleri_yukle()
 
@@ -1487,45 +1622,40 @@ class VeterinerUygulamasi:
             form_frame = ttk.LabelFrame(top_guncelle, text=f"Muayene Kaydını Güncelle (ID: {kayit_id})", padding="20", style="TLabelframe")
             form_frame.pack(padx=20, pady=20, fill="both", expand=True)
 
-            muayene_data_list = self.db.sorgu_calistir(
-                "SELECT hayvan_id, muayene_tarihi, sikayet, bulgular, teshis, tedavi_plani FROM muayeneler WHERE id=%s", (kayit_id,), fetch_results=True)
-            if not muayene_data_list:
+            muayene = self._servisle(self.servis.muayeneler.getir, kayit_id)
+            if muayene is None:
                 messagebox.showerror("Hata", "Muayene kaydı bulunamadı veya veritabanı hatası.", icon="error")
                 top_guncelle.destroy()
                 return
-            muayene_data = muayene_data_list[0]
             
-            hayvan_dict, _ = self._get_hayvanlar_ve_sahipler()
-            ters_hayvan_dict = {v: k for k, v in hayvan_dict.items()}
-
             ttk.Label(form_frame, text="Hayvan:").grid(row=0, column=0, padx=10, pady=8, sticky="w")
-            hayvan_combo_guncelle = ttk.Combobox(form_frame, width=30, values=list(hayvan_dict.keys()), state="readonly")
-            hayvan_combo_guncelle.set(ters_hayvan_dict.get(muayene_data[0], ""))
+            hayvan_combo_guncelle = HayvanSecici(form_frame, self.db, self.yurutucu, width=30)
+            hayvan_combo_guncelle.sec(muayene.hayvan_id)
             hayvan_combo_guncelle.grid(row=0, column=1, padx=10, pady=8, sticky="ew")
 
             ttk.Label(form_frame, text="Muayene Tarihi (YYYY-AA-GG HH:MM):").grid(row=1, column=0, padx=10, pady=8, sticky="w")
             muayene_tarihi_entry_guncelle = ttk.Entry(form_frame)
-            muayene_tarihi_entry_guncelle.insert(0, muayene_data[1].strftime("%Y-%m-%d %H:%M"))
+            muayene_tarihi_entry_guncelle.insert(0, bicimler.zaman_metni(muayene.muayene_tarihi))
             muayene_tarihi_entry_guncelle.grid(row=1, column=1, padx=10, pady=8, sticky="ew")
 
             ttk.Label(form_frame, text="Şikayet:").grid(row=2, column=0, padx=10, pady=8, sticky="nw")
             sikayet_text_guncelle = tk.Text(form_frame, height=4, width=40, font=("Segoe UI", 10))
-            sikayet_text_guncelle.insert("1.0", muayene_data[2] if muayene_data[2] else "")
+            sikayet_text_guncelle.insert("1.0", muayene.sikayet or "")
             sikayet_text_guncelle.grid(row=2, column=1, padx=10, pady=8, sticky="ew")
 
             ttk.Label(form_frame, text="Bulgular:").grid(row=3, column=0, padx=10, pady=8, sticky="nw")
             bulgular_text_guncelle = tk.Text(form_frame, height=4, width=40, font=("Segoe UI", 10))
-            bulgular_text_guncelle.insert("1.0", muayene_data[3] if muayene_data[3] else "")
+            bulgular_text_guncelle.insert("1.0", muayene.bulgular or "")
             bulgular_text_guncelle.grid(row=3, column=1, padx=10, pady=8, sticky="ew")
 
             ttk.Label(form_frame, text="Teşhis:").grid(row=4, column=0, padx=10, pady=8, sticky="nw")
             teshis_text_guncelle = tk.Text(form_frame, height=4, width=40, font=("Segoe UI", 10))
-            teshis_text_guncelle.insert("1.0", muayene_data[4] if muayene_data[4] else "")
+            teshis_text_guncelle.insert("1.0", muayene.teshis or "")
             teshis_text_guncelle.grid(row=4, column=1, padx=10, pady=8, sticky="ew")
 
             ttk.Label(form_frame, text="Tedavi Planı:").grid(row=5, column=0, padx=10, pady=8, sticky="nw")
             tedavi_text_guncelle = tk.Text(form_frame, height=4, width=40, font=("Segoe UI", 10))
-            tedavi_text_guncelle.insert("1.0", muayene_data[5] if muayene_data[5] else "")
+            tedavi_text_guncelle.insert("1.0", muayene.tedavi_plani or "")
             tedavi_text_guncelle.grid(row=5, column=1, padx=10, pady=8, sticky="ew")
 
             form_frame.columnconfigure(1, weight=1)
@@ -1542,22 +1672,8 @@ class VeterinerUygulamasi:
                     messagebox.showerror("Hata", "Lütfen hayvan ve muayene tarihini doldurun.", icon="warning")
                     return
                 
-                yeni_hayvan_id = hayvan_dict.get(yeni_secilen_hayvan)
-                if not yeni_hayvan_id:
-                    messagebox.showerror("Hata", "Lütfen geçerli bir hayvan seçin.", icon="warning")
-                    return
-
-                try:
-                    yeni_muayene_tarihi = datetime.strptime(yeni_muayene_tarihi_str, "%Y-%m-%d %H:%M")
-                except ValueError:
-                    messagebox.showerror("Hata", "Muayene tarihi formatı yanlış. Lütfen YYYY-AA-GG HH:MM formatını kullanın.", icon="warning")
-                    return
-
-                sql = """
-                    UPDATE muayeneler SET hayvan_id=%s, muayene_tarihi=%s, sikayet=%s, bulgular=%s, teshis=%s, tedavi_plani=%s WHERE id=%s
-                """
-                veri = (yeni_hayvan_id, yeni_muayene_tarihi, yeni_sikayet if yeni_sikayet else None, yeni_bulgular if yeni_bulgular else None, yeni_teshis if yeni_teshis else None, yeni_tedavi_plani if yeni_tedavi_plani else None, kayit_id)
-                if self.db.sorgu_calistir(sql, veri, commit=True):
+                if self._servisle(self.servis.muayeneler.guncelle, kayit_id, hayvan_combo_guncelle.secili_id(),
+                                  yeni_muayene_tarihi_str, yeni_sikayet, yeni_bulgular, yeni_teshis, yeni_tedavi_plani):
                     messagebox.showinfo("Başarılı", "Muayene kaydı başarıyla güncellendi.", icon="info")
                     top_guncelle.destroy()
                     muayeneleri_yukle()
@@ -1573,10 +1689,125 @@ class VeterinerUygulamasi:
         self._create_button_with_icon(button_frame, "Muayene Sil", muayene_sil, "delete").pack(side="left", padx=7)
         self._create_button_with_icon(button_frame, "Muayene Güncelle", muayene_guncelle, "update").pack(side="left", padx=7)
         self._create_button_with_icon(button_frame, "Listeyi Yenile", muayeneleri_yukle, "refresh").pack(side="left", padx=7)
+        self._create_button_with_icon(button_frame, "Dışa Aktar", lambda: self._disa_aktarma_penceresi("muayeneler"), "save").pack(side="left", padx=7)
+        self.pencereler.sakla("muayeneler", top, muayeneleri_yukle)
+
+    # --- Dışa Aktarma Penceresi ---
+    def _disa_aktarma_penceresi(self, tablo="muayeneler"):
+        from disa_aktarma import disa_aktar  # Açılışı yavaşlatmasın; pencere açılınca yüklenir
+        top = tk.Toplevel(self.root, bg=COLORS["background"])
+        top.title("Dışa Aktar")
+        top.grab_set()
+        top.geometry("520x480")
+        top.resizable(False, False)
+
+        form_frame = ttk.LabelFrame(top, text="Dışa Aktarılacak Kayıtlar", padding="20", style="TLabelframe")
+        form_frame.pack(padx=20, pady=20, fill="both", expand=True)
+
+        ttk.Label(form_frame, text="Kayıtlar:").grid(row=0, column=0, padx=10, pady=8, sticky="w")
+        tablo_var = tk.StringVar(form_frame, tablo)
+        tablo_frame = ttk.Frame(form_frame, style="TFrame")
+        tablo_frame.grid(row=0, column=1, padx=10, pady=8, sticky="w")
+        ttk.Radiobutton(tablo_frame, text="Muayeneler", value="muayeneler", variable=tablo_var).pack(side="left")
+        ttk.Radiobutton(tablo_frame, text="Aşılar", value="asi_takip", variable=tablo_var).pack(side="left", padx=10)
+
+        ttk.Label(form_frame, text="Başlangıç (YYYY-AA-GG):").grid(row=1, column=0, padx=10, pady=8, sticky="w")
+        baslangic_entry = ttk.Entry(form_frame)
+        baslangic_entry.grid(row=1, column=1, padx=10, pady=8, sticky="ew")
+
+        ttk.Label(form_frame, text="Bitiş (YYYY-AA-GG):").grid(row=2, column=0, padx=10, pady=8, sticky="w")
+        bitis_entry = ttk.Entry(form_frame)
+        bitis_entry.grid(row=2, column=1, padx=10, pady=8, sticky="ew")
+
+        ttk.Label(form_frame, text="Hayvan:").grid(row=3, column=0, padx=10, pady=8, sticky="w")
+        hayvan_combo = HayvanSecici(form_frame, self.db, self.yurutucu, width=30) # Boş: tüm hayvanlar
+        hayvan_combo.grid(row=3, column=1, padx=10, pady=8, sticky="ew")
+
+        sahip_dict = self._get_sahipler()
+        ttk.Label(form_frame, text="Sahip:").grid(row=4, column=0, padx=10, pady=8, sticky="w")
+        sahip_combo = ttk.Combobox(form_frame, values=[""] + list(sahip_dict.keys()), state="readonly")
+        sahip_combo.grid(row=4, column=1, padx=10, pady=8, sticky="ew")
+
+        ttk.Label(form_frame, text="Biçim:").grid(row=5, column=0, padx=10, pady=8, sticky="w")
+        bicim_var = tk.StringVar(form_frame, ".xlsx")
+        bicim_frame = ttk.Frame(form_frame, style="TFrame")
+        bicim_frame.grid(row=5, column=1, padx=10, pady=8, sticky="w")
+        ttk.Radiobutton(bicim_frame, text="Excel (XLSX)", value=".xlsx", variable=bicim_var).pack(side="left")
+        ttk.Radiobutton(bicim_frame, text="CSV", value=".csv", variable=bicim_var).pack(side="left", padx=10)
+
+        form_frame.columnconfigure(1, weight=1)
+
+        ilerleme = ttk.Progressbar(top, mode="determinate", maximum=1.0)
+        ilerleme.pack(padx=20, fill="x")
+        durum_label = ttk.Label(top, text="", background=COLORS["background"])
+        durum_label.pack(padx=20, pady=5, anchor="w")
+
+        def durum_geldi(durum):
+            ilerleme["value"] = durum.oran
+            durum_label.config(text=durum.ozet())
+            if durum.bitti:
+                aktar_btn.state(["!disabled"])
+                messagebox.showinfo("Dışa Aktarma Tamamlandı", f"{durum.ozet()}\n\n{durum.dosya}", icon="info", parent=top)
+
+        def hata(err):
+            aktar_btn.state(["!disabled"])
+            durum_label.config(text="")
+            if isinstance(err, VeritabaniHatasi):
+                self.db.hata_goster(err)
+            else:
+                messagebox.showerror("Hata", str(err), icon="warning", parent=top)
+
+        def aktar():
+            tarihler = []
+            for entry in (baslangic_entry, bitis_entry):
+                metin = entry.get().strip()
+                try:
+                    tarihler.append(datetime.strptime(metin, "%Y-%m-%d").date() if metin else None)
+                except ValueError:
+                    messagebox.showerror("Hata", "Tarih formatı yanlış. Lütfen YYYY-AA-GG formatını kullanın.", icon="warning", parent=top)
+                    return
+            hayvan_id = None
+            if hayvan_combo.get().strip():
+                hayvan_id = hayvan_combo.secili_id()
+                if hayvan_id is None:
+                    messagebox.showerror("Hata", "Lütfen listeden geçerli bir hayvan seçin veya alanı boş bırakın.", icon="warning", parent=top)
+                    return
+            sahip_id = sahip_dict.get(sahip_combo.get())
+
+            uzanti = bicim_var.get()
+            dosya = filedialog.asksaveasfilename(parent=top, defaultextension=uzanti,
+                                                 initialfile=f"{tablo_var.get()}_{datetime.now():%Y%m%d}{uzanti}",
+                                                 filetypes=[("Excel", "*.xlsx")] if uzanti == ".xlsx" else [("CSV", "*.csv")])
+            if not dosya:
+                return
+            ilerleme["value"] = 0
+            durum_label.config(text="Kayıtlar sayılıyor...")
+            aktar_btn.state(["disabled"])
+            # Pencere kapanırsa aktarım durur ve yarım dosya silinir
+            self.yurutucu.akis(disa_aktar, self.db, dosya, tablo_var.get(), tarihler[0], tarihler[1], hayvan_id, sahip_id,
+                               parti_geldi=durum_geldi, hata=hata, sahip=top)
+
+        aktar_btn = self._create_button_with_icon(top, "Dışa Aktar", aktar, "save")
+        aktar_btn.pack(pady=15, padx=20, fill="x")
 
 
 # --- Ana Program Başlatma ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vefa Veteriner Klinik Sistemi")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Açılış aşamalarının sürelerini ve bütçeyi standart hataya bas")
+    args = parser.parse_args()
+
+    profil = AcilisProfili(ACILIS_BASLANGICI, raporla=args.startup_profile)
+    profil.isaretle("modüller")
     root = tk.Tk()
-    app = VeterinerUygulamasi(root)
-    root.mainloop()
\ No newline at end of file
+    profil.isaretle("tk")
+    app = VeterinerUygulamasi(root, profil)
+    try:
+        root.mainloop()
+    finally:
+        app.yurutucu.kapat()
+        if app.db is not None:
+            app.db.kapat()
+            if app.db.olcumleyici is not None and OLCUM_AYARLARI["cikista_ozet"]:
+                print(app.db.olcumleyici.ozet(), file=sys.stderr)
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+Sorgu süresi ölçümü ve yavaş sorgu günlüğü.
+
+Veritabani'na bir Olcumleyici verilirse her ifade için süre, satır sayısı ve
+sorguyu başlatan yer (çağrı yeri) kaydedilir; bağlantı alma ve açma süreleri
+ayrıca tutulur. Eşiği aşan sorgular yavaş sorgu günlüğüne yazılır, ozet()
+ise çıkışta basılabilecek bir tablo üretir.
+
+Çağrı yeri, çağrı yığınındaki ilk uygulama fonksiyonudur (ör.
+"VeterinerUygulamasi._hayvan_detay_penceresi"). Arka planda çalışan işlerde
+yığın işi gönderen pencereyi içermediğinden ArkaplanYurutucu, işi etiketli()
+ile sarıp pencere başlığını ve yükleyiciyi çağrı yeri olarak bırakır.
+
+AcilisProfili uygulamanın açılış aşamalarını (main.py --startup-profile)
+ölçer ve ilk kare / veritabanı hazır anlarını bütçeyle karşılaştırır.
+"""
+import bisect
+import contextvars
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Histogram kova üst sınırları (ms); sonuncusundan büyükler son kovaya düşer
+KOVA_SINIRLARI = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Çağrı yeri aranırken atlanan altyapı modülleri (uygulama klasöründeki)
+_ALTYAPI = {"veritabani.py", "havuz.py", "olcum.py", "arkaplan.py", "sayfali_liste.py", "onbellek.py", "hayvan_secici.py"}
+_UYGULAMA_KLASORU = os.path.dirname(os.path.abspath(__file__))
+
+_BAGLANTI_OLCUMLERI = {"bekleme": "havuzdan alma", "acma": "açma"}
+
+_etiket = contextvars.ContextVar("cagri_yeri", default=None)
+
+
+def cagri_yeri():
+    """Geçerli sorguyu başlatan uygulama fonksiyonunun adını döndürür."""
+    etiket = _etiket.get()
+    if etiket is not None:
+        return etiket
+    cerceve = sys._getframe(1)
+    while cerceve is not None:
+        dosya = cerceve.f_code.co_filename
+        if os.path.dirname(os.path.abspath(dosya)) == _UYGULAMA_KLASORU and os.path.basename(dosya) not in _ALTYAPI:
+            return cerceve.f_code.co_qualname
+        cerceve = cerceve.f_back
+    return "?"
+
+
+def etiketli(etiket, fonksiyon):
+    """fonksiyon'u, içinde çalışan sorguların çağrı yeri `etiket` olacak şekilde sarar."""
+    def calistir(*args, **kwargs):
+        belirtec = _etiket.set(etiket)
+        try:
+            return fonksiyon(*args, **kwargs)
+        finally:
+            _etiket.reset(belirtec)
+    return calistir
+
+
+class Histogram:
+    """Logaritmik kovalı süre histogramı (ms)."""
+    __slots__ = ("kovalar", "sayi", "toplam", "en_buyuk")
+
+    def __init__(self):
+        self.kovalar = [0] * (len(KOVA_SINIRLARI) + 1)
+        self.sayi = 0
+        self.toplam = 0.0
+        self.en_buyuk = 0.0
+
+    def ekle(self, ms):
+        self.kovalar[bisect.bisect_left(KOVA_SINIRLARI, ms)] += 1
+        self.sayi += 1
+        self.toplam += ms
+        self.en_buyuk = max(self.en_buyuk, ms)
+
+    def yuzdelik(self, oran):
+        """Ölçümlerin `oran`ının altında kaldığı kova üst sınırı (yaklaşık)."""
+        hedef = oran * self.sayi
+        birikim = 0
+        for sinir, adet in zip(KOVA_SINIRLARI + (self.en_buyuk,), self.kovalar):
+            birikim += adet
+            if birikim >= hedef:
+                return min(sinir, self.en_buyuk)
+        return self.en_buyuk
+
+
+class SorguIstatistigi:
+    __slots__ = ("sure", "satir", "hata", "cagri_yerleri")
+
+    def __init__(self):
+        self.sure = Histogram()
+        self.satir = 0
+        self.hata = 0
+        self.cagri_yerleri = Counter()
+
+
+class Olcumleyici:
+    def __init__(self, yavas_sorgu_esigi_ms=200, yavas_sorgu_gunlugu=None):
+        """
+        :param yavas_sorgu_esigi_ms: Bu süreyi aşan sorgular yavaş sorgu günlüğüne yazılır.
+        :param yavas_sorgu_gunlugu: Günlük dosyasının yolu; None ise standart hataya yazılır.
+        """
+        self.yavas_sorgu_esigi_ms = yavas_sorgu_esigi_ms
+        self._kilit = threading.Lock()
+        self.sorgular = {}  # Boşlukları sadeleştirilmiş SQL -> SorguIstatistigi
+        self.baglanti = {"bekleme": Histogram(), "acma": Histogram()}
+
+        self.gunluk = logging.getLogger("veteriner.yavas_sorgu")
+        if not self.gunluk.handlers:
+            isleyici = logging.FileHandler(yavas_sorgu_gunlugu, encoding="utf-8") if yavas_sorgu_gunlugu \
+                else logging.StreamHandler()
+            isleyici.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self.gunluk.addHandler(isleyici)
+            self.gunluk.setLevel(logging.INFO)
+            self.gunluk.propagate = False
+
+    @staticmethod
+    def _sadelestir(sorgu):
+        return re.sub(r"\s+", " ", sorgu).strip()
+
+    def sorgu_kaydet(self, sorgu, sure, satir=0, hata=False):
+        """
+        :param sure: Saniye (time.perf_counter farkı).
+        :param satir: Döndürülen veya etkilenen satır sayısı.
+        """
+        ms = sure * 1000
+        satir = max(satir, 0)  # DDL ve bazı sürücüler rowcount için -1 döndürür
+        metin = self._sadelestir(sorgu)
+        yer = cagri_yeri()
+        with self._kilit:
+            istatistik = self.sorgular.get(metin)
+            if istatistik is None:
+                istatistik = self.sorgular[metin] = SorguIstatistigi()
+            istatistik.sure.ekle(ms)
+            istatistik.satir += satir
+            istatistik.hata += hata
+            istatistik.cagri_yerleri[yer] += 1
+        if ms >= self.yavas_sorgu_esigi_ms:
+            # Parametreler kişisel veri içerebileceği için günlüğe yazılmaz
+            self.gunluk.info("%.1f ms  %d satır  %s  %s%s", ms, satir, yer, metin, "  [HATA]" if hata else "")
+
+    def baglanti_kaydet(self, tur, sure):
+        """:param tur: "bekleme" (havuzdan alma, ping dahil) veya "acma" (yeni bağlantı kurma)."""
+        with self._kilit:
+            self.baglanti[tur].ekle(sure * 1000)
+
+    def sifirla(self):
+        with self._kilit:
+            self.sorgular.clear()
+            self.baglanti = {"bekleme": Histogram(), "acma": Histogram()}
+
+    def ozet(self, en_fazla=25):
+        """Toplam süreye göre sıralı, metin biçiminde sorgu özeti."""
+        with self._kilit:
+            kayitlar = sorted(self.sorgular.items(), key=lambda kayit: kayit[1].sure.toplam, reverse=True)
+            satirlar = [f"{'Toplam ms':>10} {'Sayı':>6} {'Hata':>5} {'Ort':>8} {'p50':>7} {'p95':>7} {'En çok':>8} "
+                        f"{'Satır/ç':>8}  Çağrı yeri / Sorgu"]
+            for metin, ist in kayitlar[:en_fazla]:
+                h = ist.sure
+                yer, _ = ist.cagri_yerleri.most_common(1)[0]
+                satirlar.append(f"{h.toplam:>10.1f} {h.sayi:>6} {ist.hata:>5} {h.toplam / h.sayi:>8.2f} "
+                                f"{h.yuzdelik(0.5):>7.1f} {h.yuzdelik(0.95):>7.1f} {h.en_buyuk:>8.1f} "
+                                f"{ist.satir / h.sayi:>8.1f}  {yer}\n{'':>66}{metin[:120]}")
+            for tur, h in self.baglanti.items():
+                if h.sayi:
+                    satirlar.append(f"Bağlantı {_BAGLANTI_OLCUMLERI[tur]}: {h.sayi} kez, ort {h.toplam / h.sayi:.2f} ms, "
+                                    f"p95 {h.yuzdelik(0.95):.1f} ms, en çok {h.en_buyuk:.1f} ms")
+        return "\n".join(satirlar)
+
+
+class AcilisProfili:
+    def __init__(self, baslangic=None, raporla=False):
+        """
+        :param baslangic: Açılışın başladığı time.perf_counter() değeri (ör. main.py'nin ilk satırı).
+        :param raporla: True ise uygulama açılış bitince rapor()'u basar.
+        """
+        self.baslangic = time.perf_counter() if baslangic is None else baslangic
+        self.raporla = raporla
+        self.asamalar = []        # (ad, süre ms, arka planda mı)
+        self.kilometre_taslari = []  # (ad, başlangıçtan bu yana ms)
+        self._son = self.baslangic
+        self._kilit = threading.Lock()
+
+    def isaretle(self, ad):
+        """Ana iş parçacığında bir önceki işaretten bu yana geçen süreyi `ad` aşaması olarak kaydeder."""
+        simdi = time.perf_counter()
+        with self._kilit:
+            self.asamalar.append((ad, (simdi - self._son) * 1000, False))
+        self._son = simdi
+
+    def kilometre_tasi(self, ad):
+        """Açılışın başından bu yana geçen süreyi kaydeder (ör. "ilk kare")."""
+        with self._kilit:
+            self.kilometre_taslari.append((ad, (time.perf_counter() - self.baslangic) * 1000))
+
+    @contextmanager
+    def olc(self, ad):
+        """Arka plan iş parçacığında süren bir aşamayı ölçer."""
+        baslangic = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._kilit:
+                self.asamalar.append((ad, (time.perf_counter() - baslangic) * 1000, True))
+
+    def rapor(self, butceler=None):
+        """
+        Aşama süreleri ve kilometre taşları; butceler verilirse (ad -> ms) aşılanlar işaretlenir.
+        """
+        butceler = butceler or {}
+        with self._kilit:
+            satirlar = ["Açılış profili (ms)"]
+            for ad, ms, arka_plan in self.asamalar:
+                satirlar.append(f"  {('[arka plan] ' if arka_plan else '') + ad:<34} {ms:>8.1f}")
+            for ad, ms in self.kilometre_taslari:
+                satir = f"  {ad + ' (toplam)':<34} {ms:>8.1f}"
+                if ad in butceler:
+                    satir += f"   bütçe {butceler[ad]:>5} {'tamam' if ms <= butceler[ad] else 'AŞILDI'}"
+                satirlar.append(satir)
+        return "\n".join(satirlar)
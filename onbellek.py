@@ -0,0 +1,68 @@
+"""
+Formlardaki seçim listeleri (ör. sahipler) için bellek içi önbellek.
+
+Her form açılışında tüm tabloyu yeniden okumak yerine id -> isim eşlemesi bir
+kez yüklenir ve tabloya Veritabani üzerinden yazıldığında (INSERT/UPDATE/DELETE)
+geçersiz kılınır; bir sonraki kullanımda tek sorguyla yeniden yüklenir. Başka
+iş istasyonlarının yaptığı değişiklikler yazma olayı üretmediğinden önbellek
+ayrıca `yasam_suresi` dolunca da yenilenir.
+"""
+import threading
+import time
+
+
+class SecenekOnbellegi:
+    def __init__(self, db, tablo, sorgu, etiketle, yasam_suresi=300):
+        """
+        :param db: Yazma olaylarının dinleneceği Veritabani.
+        :param tablo: Önbelleği geçersiz kılan yazmaların hedef tablosu.
+        :param sorgu: (id, isim) satırları döndüren SELECT.
+        :param etiketle: (id, isim) -> listede gösterilecek metin.
+        :param yasam_suresi: Saniye; yazma olmasa da bu süreden eski önbellek yeniden yüklenir.
+        """
+        self.db = db
+        self.tablo = tablo
+        self.sorgu = sorgu
+        self.etiketle = etiketle
+        self.yasam_suresi = yasam_suresi
+        self._kilit = threading.Lock()
+        self._secenekler = None  # etiket -> id
+        self._etiketler = None   # id -> etiket
+        self._yukleme_zamani = 0.0
+        self._surum = 0          # Her geçersiz kılmada artar; yükleme sırasında gelen yazmayı kaçırmamak için
+        db.yazma_dinleyicisi_ekle(self._yazildi)
+
+    def secenekler(self):
+        """Etiket -> id sözlüğü (Combobox değerleri); döndürülen sözlük değiştirilmemelidir."""
+        return self._yukle()[0]
+
+    def etiketler(self):
+        """id -> etiket sözlüğü (kayıttaki id'den Combobox metnine); değiştirilmemelidir."""
+        return self._yukle()[1]
+
+    def gecersiz_kil(self):
+        with self._kilit:
+            self._surum += 1
+            self._secenekler = self._etiketler = None
+
+    def _yazildi(self, tablo):
+        if tablo == self.tablo:
+            self.gecersiz_kil()
+
+    def _yukle(self):
+        with self._kilit:
+            if self._secenekler is not None and time.monotonic() - self._yukleme_zamani < self.yasam_suresi:
+                return self._secenekler, self._etiketler
+            surum = self._surum
+
+        # Sorgu kilit dışında çalışır; VeritabaniHatasi çağırana iletilir
+        satirlar = self.db.sorgu(self.sorgu, fetch_results=True)
+        etiketler = {kayit_id: self.etiketle(kayit_id, isim) for kayit_id, isim in satirlar}
+        secenekler = {etiket: kayit_id for kayit_id, etiket in etiketler.items()}
+
+        with self._kilit:
+            # Yükleme sırasında tabloya yazıldıysa sonuç bu çağrıda kullanılır ama saklanmaz
+            if surum == self._surum:
+                self._secenekler, self._etiketler = secenekler, etiketler
+                self._yukleme_zamani = time.monotonic()
+        return secenekler, etiketler
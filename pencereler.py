@@ -0,0 +1,106 @@
+"""
+Liste pencerelerinin yeniden kullanımı.
+
+Menüden açılan liste pencereleri kapatılınca yok edilmez, gizlenir (withdraw).
+Yeniden açılınca aynı Toplevel, Treeview ve düğmeler gösterilir (deiconify) ve
+pencerenin tazeleme fonksiyonu çağrılır; SayfaliListe.tazele() yalnızca
+değişen satırları getirdiği için pencere beklemeden açılır. Gizlenen pencerenin
+arka plandaki işleri (sayfa yüklemeleri, akışlar) iptal edilir; tazeleme
+yüklemeyi yeniden başlatır.
+
+Gizli pencerelerin tuttuğu öğe sayısı (widget'lar ve Treeview satırları) bir
+sınırı aşarsa en uzun süredir kullanılmayan gizli pencereler yok edilir; açık
+pencereler hiçbir zaman atılmaz. Böylece uzun bir mesai boyunca pencere açıp
+kapamak belleği büyütmez.
+"""
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+
+
+def tutulan_oge_sayisi(widget):
+    """Widget'ın kendisi, tüm alt widget'ları ve Treeview'lerindeki satırlar."""
+    sayi = 1
+    if isinstance(widget, ttk.Treeview):
+        sayi += len(widget.get_children())
+    return sayi + sum(tutulan_oge_sayisi(alt) for alt in widget.winfo_children())
+
+
+class PencereYoneticisi:
+    def __init__(self, root, en_fazla_oge=5000, yurutucu=None, **toplevel_ayarlari):
+        """
+        :param root: Pencerelerin bağlı olduğu ana pencere.
+        :param en_fazla_oge: Gizli pencerelerde tutulacak en fazla öğe (widget + Treeview satırı).
+        :param yurutucu: Verilirse gizlenen pencereye bağlı (sahip=top) işler bu ArkaplanYurutucu'da iptal edilir.
+        :param toplevel_ayarlari: Her yeni Toplevel'e verilecek ayarlar (ör. bg).
+        """
+        self.root = root
+        self.en_fazla_oge = en_fazla_oge
+        self.yurutucu = yurutucu
+        self.toplevel_ayarlari = toplevel_ayarlari
+        self._pencereler = {}           # anahtar -> (Toplevel, tazele)
+        self._gizliler = OrderedDict()  # anahtar -> (öğe sayısı, modal mı); en uzun süredir kullanılmayan başta
+
+    def ac(self, anahtar, baslik, boyut=None, modal=True):
+        """
+        anahtar için saklanan pencere varsa öne getirip tazeler ve None döndürür. Yoksa yeni bir
+        Toplevel döndürür; içeriği çağıran kurar ve yeniden kullanılacaksa sakla() ile kaydeder.
+        """
+        kayit = self._pencereler.get(anahtar)
+        if kayit is not None:
+            self._goster(anahtar, *kayit)
+            return None
+        top = tk.Toplevel(self.root, **self.toplevel_ayarlari)
+        top.title(baslik)
+        if modal:
+            top.grab_set()
+        if boyut:
+            top.geometry(boyut)
+        return top
+
+    def sakla(self, anahtar, top, tazele=None):
+        """
+        Pencere kapatılınca yok edilmek yerine gizlenir; yeniden açılınca tazele() çağrılır.
+        Pencere başka bir yoldan yok edilirse (ör. sınır aşıldı) bir sonraki ac() yenisini kurar.
+        """
+        self._pencereler[anahtar] = (top, tazele)
+        top.protocol("WM_DELETE_WINDOW", lambda: self.gizle(anahtar))
+        top.bind("<Destroy>", lambda event: self._unut(anahtar, top) if event.widget is top else None, add="+")
+
+    def gizle(self, anahtar):
+        kayit = self._pencereler.get(anahtar)
+        if kayit is None:
+            return
+        top = kayit[0]
+        if self.yurutucu is not None:
+            # Gizli pencere bağlantı tutmasın ve görünmeyen Treeview'e satır eklenmesin
+            self.yurutucu.sahibin_islerini_iptal_et(top)
+        modal = top.grab_status() is not None
+        top.grab_release()
+        top.withdraw()
+        self._gizliler[anahtar] = (tutulan_oge_sayisi(top), modal)
+        self._gizliler.move_to_end(anahtar)
+        self._sinirla()
+
+    def _goster(self, anahtar, top, tazele):
+        _, modal = self._gizliler.pop(anahtar, (0, False))
+        top.deiconify()
+        top.lift()
+        top.focus_set()
+        if modal:
+            top.grab_set()
+        if tazele is not None:
+            tazele()
+
+    def _sinirla(self):
+        """Gizli pencerelerin toplam öğe sayısı sınırı aşıyorsa en uzun süredir kullanılmayanları yok eder."""
+        toplam = sum(sayi for sayi, _ in self._gizliler.values())
+        while toplam > self.en_fazla_oge and self._gizliler:
+            anahtar, (sayi, _) = self._gizliler.popitem(last=False)
+            toplam -= sayi
+            self._pencereler[anahtar][0].destroy()  # <Destroy> kaydı da siler
+
+    def _unut(self, anahtar, top):
+        if self._pencereler.get(anahtar, (None,))[0] is top:
+            del self._pencereler[anahtar]
+            self._gizliler.pop(anahtar, None)
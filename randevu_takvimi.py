@@ -0,0 +1,220 @@
+"""
+Randevular için gün / hafta takvim görünümü.
+
+Tüm randevu geçmişini yüklemek yerine yalnızca görünen tarih aralığı
+randevu_tarihi indeksi üzerinden tek bir aralık sorgusuyla
+(sorgular.RANDEVU_TAKVIMI) okunur. Okunan günler biçimlenmiş satırlarıyla
+TakvimOnbellegi'nde tutulur; bir aralık gösterildikten sonra önceki ve sonraki
+aralık arka planda önceden yüklenir, böylece günler / haftalar arasında
+geçiş geçmişin uzunluğundan bağımsız olarak beklemeden yapılır.
+"""
+import threading
+import time
+import tkinter as tk
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from tkinter import ttk
+
+import bicimler
+import sorgular
+
+GUN_ADLARI = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi", "Pazar"]
+
+
+def _gun_listesi(baslangic, gun_sayisi):
+    return [baslangic + timedelta(days=i) for i in range(gun_sayisi)]
+
+
+class TakvimOnbellegi:
+    def __init__(self, db, en_fazla_gun=120, yasam_suresi=60):
+        """
+        :param db: Randevuların okunacağı ve yazma olaylarının dinleneceği Veritabani.
+        :param en_fazla_gun: Bellekte tutulacak en fazla gün; en uzun süre kullanılmayanlar atılır.
+        :param yasam_suresi: Saniye; başka iş istasyonlarının yazmaları için günler bu süreden sonra yeniden okunur.
+        """
+        self.db = db
+        self.en_fazla_gun = en_fazla_gun
+        self.yasam_suresi = yasam_suresi
+        self._kilit = threading.Lock()
+        self._gunler = OrderedDict()  # tarih -> (yükleme zamanı, biçimlenmiş satırlar)
+        self._surum = 0               # Her geçersiz kılmada artar; yükleme sırasında gelen yazmayı kaçırmamak için
+        db.yazma_dinleyicisi_ekle(self._yazildi)
+
+    def al(self, gunler):
+        """Günlerin hepsi önbellekte ve tazeyse {gün: satırlar}, değilse None."""
+        simdi = time.monotonic()
+        sonuc = {}
+        with self._kilit:
+            for gun in gunler:
+                kayit = self._gunler.get(gun)
+                if kayit is None or simdi - kayit[0] >= self.yasam_suresi:
+                    return None
+                self._gunler.move_to_end(gun)
+                sonuc[gun] = kayit[1]
+        return sonuc
+
+    def eksikler(self, gunler):
+        """Önbellekte olmayan veya bayatlamış günler."""
+        simdi = time.monotonic()
+        with self._kilit:
+            return [gun for gun in gunler
+                    if gun not in self._gunler or simdi - self._gunler[gun][0] >= self.yasam_suresi]
+
+    def yukle(self, ilk_gun, son_gun):
+        """
+        [ilk_gun, son_gun] aralığını tek sorguyla okur, önbelleğe koyar ve {gün: satırlar} döndürür.
+        Arka plan iş parçacığında çağrılabilir; VeritabaniHatasi çağırana iletilir.
+        """
+        with self._kilit:
+            surum = self._surum
+        satirlar = self.db.sorgu(sorgular.RANDEVU_TAKVIMI,
+                                 (datetime.combine(ilk_gun, datetime.min.time()),
+                                  datetime.combine(son_gun + timedelta(days=1), datetime.min.time())),
+                                 fetch_results=True)
+        sonuc = {gun: [] for gun in _gun_listesi(ilk_gun, (son_gun - ilk_gun).days + 1)}
+        for kayit in satirlar:
+            sonuc[kayit[1].date()].append(bicimler.takvim_satiri(kayit))
+
+        with self._kilit:
+            # Yükleme sırasında tabloya yazıldıysa sonuç bu çağrıda kullanılır ama saklanmaz
+            if surum == self._surum:
+                simdi = time.monotonic()
+                for gun, gun_satirlari in sonuc.items():
+                    self._gunler[gun] = (simdi, gun_satirlari)
+                    self._gunler.move_to_end(gun)
+                while len(self._gunler) > self.en_fazla_gun:
+                    self._gunler.popitem(last=False)
+        return sonuc
+
+    def gecersiz_kil(self):
+        with self._kilit:
+            self._surum += 1
+            self._gunler.clear()
+
+    def _yazildi(self, tablo):
+        # Hayvan adı da satırlarda gösterildiği için hayvanlar tablosu da izlenir
+        if tablo in ("randevular", "hayvanlar"):
+            self.gecersiz_kil()
+
+
+class RandevuTakvimi(ttk.Frame):
+    def __init__(self, parent, yurutucu, onbellek, gosterge=None, **ayarlar):
+        """
+        :param yurutucu: Günleri arka planda okuyan ArkaplanYurutucu.
+        :param onbellek: Pencereler arasında paylaşılan TakvimOnbellegi.
+        :param gosterge: Görünen aralık okunurken gösterilecek YuklemeGostergesi (önceden yükleme göstermez).
+        """
+        super().__init__(parent, **ayarlar)
+        self.yurutucu = yurutucu
+        self.onbellek = onbellek
+        self.gosterge = gosterge
+        self._gun = date.today()
+        self._gorunum = tk.StringVar(self, "gun")
+        self._bekleyen = None  # Görünen aralık için süren okuma işi
+
+        arac_cubugu = ttk.Frame(self, style="TFrame")
+        arac_cubugu.pack(fill="x", pady=(0, 8))
+        ttk.Button(arac_cubugu, text="◀", width=3, command=lambda: self._kaydir(-1)).pack(side="left")
+        ttk.Button(arac_cubugu, text="Bugün", command=lambda: self.goster(date.today())).pack(side="left", padx=5)
+        ttk.Button(arac_cubugu, text="▶", width=3, command=lambda: self._kaydir(1)).pack(side="left")
+        self._baslik = ttk.Label(arac_cubugu, font=("Segoe UI", 11, "bold"))
+        self._baslik.pack(side="left", padx=15)
+        ttk.Radiobutton(arac_cubugu, text="Hafta", value="hafta", variable=self._gorunum,
+                        command=self.goster).pack(side="right")
+        ttk.Radiobutton(arac_cubugu, text="Gün", value="gun", variable=self._gorunum,
+                        command=self.goster).pack(side="right", padx=5)
+
+        tree_frame = ttk.Frame(self, style="TFrame")
+        tree_frame.pack(fill="both", expand=True)
+        sutunlar = ("ID", "Saat", "Hayvan", "Veteriner", "Oda", "Açıklama", "Durum")
+        self.tree = ttk.Treeview(tree_frame, columns=sutunlar, show="headings")
+        self.tree.pack(side="left", fill="both", expand=True)
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        vsb.pack(side="right", fill="y")
+        self.tree.configure(yscrollcommand=vsb.set)
+        for sutun, genislik, hiza in zip(sutunlar, (40, 160, 120, 130, 100, 230, 100),
+                                         ("center", "w", "w", "w", "w", "w", "center")):
+            self.tree.heading(sutun, text=sutun)
+            self.tree.column(sutun, width=genislik, anchor=hiza)
+        self.tree.tag_configure("gun", font=("Segoe UI", 10, "bold"))
+        self.tree.bind("<Double-1>", self._gune_git)
+
+    def secili_id(self):
+        """Seçili randevunun id'si; seçim yoksa veya bir gün başlığıysa None."""
+        secim = self.tree.selection()
+        if not secim or "gun" in self.tree.item(secim[0], "tags"):
+            return None
+        return self.tree.item(secim[0], "values")[0]
+
+    def goster(self, gun=None):
+        """Verilen günü (veya o günün haftasını) gösterir; günler önbellekteyse beklemeden çizilir."""
+        if gun is not None:
+            self._gun = gun
+        gunler = self._gorunen_gunler()
+        self._baslik.config(text=self._baslik_metni(gunler))
+        if self._bekleyen is not None:
+            self._bekleyen.iptal()  # Önceki aralığın geç gelen sonucu bu aralığın üzerine çizilmesin
+            self._bekleyen = None
+        hazir = self.onbellek.al(gunler)
+        if hazir is not None:
+            self._ciz(hazir)
+            self._onceden_yukle(gunler)
+            return
+        self._bekleyen = self.yurutucu.gonder(self.onbellek.yukle, gunler[0], gunler[-1],
+                                              basarili=lambda sonuc: self._yuklendi(sonuc, gunler),
+                                              sahip=self.winfo_toplevel(), gosterge=self.gosterge)
+
+    def yenile(self):
+        """Önbelleği boşaltıp görünen aralığı veritabanından yeniden okur."""
+        self.onbellek.gecersiz_kil()
+        self.goster()
+
+    def _gorunen_gunler(self):
+        if self._gorunum.get() == "hafta":
+            return _gun_listesi(self._gun - timedelta(days=self._gun.weekday()), 7)
+        return [self._gun]
+
+    @staticmethod
+    def _baslik_metni(gunler):
+        if len(gunler) == 1:
+            return f"{gunler[0]:%d.%m.%Y} {GUN_ADLARI[gunler[0].weekday()]}"
+        return f"{gunler[0]:%d.%m.%Y} - {gunler[-1]:%d.%m.%Y}"
+
+    def _kaydir(self, yon):
+        self.goster(self._gun + timedelta(days=yon * len(self._gorunen_gunler())))
+
+    def _ciz(self, gun_satirlari):
+        tree = self.tree
+        tree.delete(*tree.get_children())
+        hafta = len(gun_satirlari) > 1
+        for gun in sorted(gun_satirlari):
+            if hafta:
+                tree.insert("", "end", iid=f"gun-{gun.isoformat()}", tags=("gun",),
+                            values=("", f"{GUN_ADLARI[gun.weekday()]} {gun:%d.%m}",
+                                    f"{len(gun_satirlari[gun])} randevu", "", "", "", ""))
+            for satir in gun_satirlari[gun]:
+                tree.insert("", "end", iid=str(satir[0]), values=satir)
+        if not hafta and not gun_satirlari.get(self._gun):
+            tree.insert("", "end", iid="bos", tags=("gun",), values=("", "Bu gün için randevu yok.", "", "", "", "", ""))
+
+    def _yuklendi(self, sonuc, gunler):
+        self._bekleyen = None
+        self._ciz(sonuc)
+        self._onceden_yukle(gunler)
+
+    def _onceden_yukle(self, gunler):
+        """Önceki ve sonraki aralığın eksik günlerini tek sorguyla arka planda okur."""
+        adet = len(gunler)
+        komsular = _gun_listesi(gunler[0] - timedelta(days=adet), adet) + _gun_listesi(gunler[-1] + timedelta(days=1), adet)
+        eksikler = self.onbellek.eksikler(komsular)
+        if eksikler:
+            # Hata sessizce geçilir; gün gösterilmek istendiğinde yeniden denenir ve hata orada görünür
+            self.yurutucu.gonder(self.onbellek.yukle, eksikler[0], eksikler[-1], hata=lambda _err: None,
+                                 sahip=self.winfo_toplevel(), anahtar=(self, "onceden"))
+
+    def _gune_git(self, event):
+        """Haftalık görünümde gün başlığına çift tıklanınca o günün günlük görünümüne geçer."""
+        satir = self.tree.identify_row(event.y)
+        if satir.startswith("gun-"):
+            self._gorunum.set("gun")
+            self.goster(date.fromisoformat(satir[4:]))
@@ -0,0 +1,265 @@
+"""
+Büyük tablolar için sayfalı (sanal) Treeview listesi.
+
+Satırlar `id` üzerinden anahtar kümesi (keyset) sayfalamasıyla çekilir; OFFSET
+kullanılmadığı için tablo ne kadar büyük olursa olsun her sayfa aynı maliyettedir.
+Kullanıcı listenin sonuna yaklaştıkça sonraki sayfa, başına yaklaştıkça önceki
+sayfa yüklenir; bellekte en fazla `en_fazla_satir` satır tutulur.
+
+Değişiklik takibi tanımlanmışsa (`degisim_kosulu`, `silinme_tablosu`) tazele()
+yalnızca son eşitlemeden bu yana değişen veya silinen satırları çeker ve
+Treeview'i yerinde günceller.
+
+ara() listeyi geçici olarak sayfalama yerine sıralı ve sınırlı bir sorgu
+sonucuyla (ör. tam metin araması) doldurur; yenile() normal listeye döner.
+"""
+import bisect
+from datetime import timedelta
+from tkinter import messagebox
+
+import sorgular
+
+# Aynı anda işlenen işlemlerin zaman damgası sırası ile commit sırası farklı olabilir;
+# değişiklikler bu kadar geriden itibaren tekrar istenir (güncelleme idempotenttir).
+ESITLEME_PAYI = timedelta(seconds=2)
+
+
+class SayfaliListe:
+    def __init__(self, tree, kaydirma_cubugu, yurutucu, db, sorgu_sablonu, id_sutunu, satir_bicimle,
+                 sahip, gosterge=None, veri=(), sayfa_boyutu=200, en_fazla_satir=1000, esik=0.1, bos_mesaji=None,
+                 degisim_kosulu=None, silinme_tablosu=None):
+        """
+        :param tree: Doldurulacak ttk.Treeview; satır iid'leri kayıt id'si olur.
+        :param kaydirma_cubugu: Treeview'e bağlı dikey kaydırma çubuğu.
+        :param yurutucu: Sayfaları arka planda çeken ArkaplanYurutucu.
+        :param db: Veritabani nesnesi.
+        :param sorgu_sablonu: {kosul} ve {yon} yer tutucuları ile LIMIT %s içeren SELECT; ilk sütun id olmalı.
+        :param id_sutunu: Sayfalamada kullanılan sütun (ör. "h.id").
+        :param satir_bicimle: Sorgu satırını Treeview değerlerine çeviren fonksiyon; None ise satırlar
+                              olduğu gibi eklenir (türetilmiş alanlar sorgunun projeksiyonundaysa).
+        :param sahip: Kapanınca bekleyen sayfa isteklerinin iptal edileceği pencere.
+        :param veri: Şablondaki {kosul}'dan önce gelen parametreler.
+        :param esik: Listenin başına/sonuna bu oranda yaklaşılınca yeni sayfa istenir.
+        :param degisim_kosulu: Satırın verilen zamandan beri değiştiğini seçen koşul; her %s aynı zamanı alır
+                               (ör. "(h.guncellenme >= %s OR s.guncellenme >= %s)").
+        :param silinme_tablosu: silinen_kayitlar içinde bu listenin izlediği tablo adı.
+        """
+        self.tree = tree
+        self.kaydirma_cubugu = kaydirma_cubugu
+        self.yurutucu = yurutucu
+        self.db = db
+        self.sorgu_sablonu = sorgu_sablonu
+        self.id_sutunu = id_sutunu
+        self.satir_bicimle = satir_bicimle
+        self.sahip = sahip
+        self.gosterge = gosterge
+        self.veri = tuple(veri)
+        self.sayfa_boyutu = sayfa_boyutu
+        self.en_fazla_satir = max(en_fazla_satir, 2 * sayfa_boyutu)
+        self.esik = esik
+        self.bos_mesaji = bos_mesaji
+        self.degisim_kosulu = degisim_kosulu
+        self.silinme_tablosu = silinme_tablosu
+
+        self._senkron = None  # Listenin en son eşitlendiği sunucu zamanı
+        self._oncesi_var = False
+        self._sonrasi_var = False
+        self._yukleniyor = False
+        self._arama = None  # Gösterilen arama: (sorgu, veri, bos_mesaji)
+        tree.configure(yscrollcommand=self._kaydirildi)
+
+    def yenile(self):
+        """Aramayı bırakıp listeyi baştan (en küçük id'den) yeniden yükler."""
+        self._arama = None
+        self._sayfa_iste(ileri=True, sinir=0, bastan=True)
+
+    def ara(self, sorgu, veri, bos_mesaji=None):
+        """
+        Listeyi sorgunun döndürdüğü satırlarla, sorgudaki sırayla doldurur; sayfalama yapılmaz.
+        Sorgu satırları sayfa sorgusuyla aynı sütunları döndürmeli ve sonucu kendisi sınırlamalıdır.
+        Arama gösterilirken tazele() aramayı yeniden çalıştırır.
+        """
+        self._arama = (sorgu, tuple(veri), bos_mesaji)
+        self._yukleniyor = True
+        self.yurutucu.gonder(
+            self.db.sorgu, sorgu, tuple(veri), fetch_results=True,
+            basarili=self._arama_geldi, hata=self._sayfa_hatasi,
+            sahip=self.sahip, gosterge=self.gosterge, anahtar=self,
+        )
+
+    def tazele(self):
+        """
+        Yalnızca son eşitlemeden bu yana değişen satırları çekip yüklü bölgeyi yerinde günceller;
+        seçim ve kaydırma konumu korunur. Değişiklik takibi tanımlı değilse listeyi baştan yükler.
+        """
+        if self._arama is not None:
+            self.ara(*self._arama)
+            return
+        if self.degisim_kosulu is None or self._senkron is None:
+            self.yenile()
+            return
+
+        satirlar = self.tree.get_children()
+        alt = int(satirlar[0]) if satirlar and self._oncesi_var else 0
+        kosul, veri = f"{self.id_sutunu} >= %s", (alt,)
+        if satirlar and self._sonrasi_var:
+            # Yüklü bölgenin ötesindeki satırlar zaten kaydırınca güncel hâliyle gelecek
+            kosul, veri = kosul + f" AND {self.id_sutunu} <= %s", veri + (int(satirlar[-1]),)
+        zaman = self._senkron - ESITLEME_PAYI
+        kosul += f" AND {self.degisim_kosulu}"
+        veri += (zaman,) * self.degisim_kosulu.count("%s")
+
+        sorgu = self.sorgu_sablonu.format(kosul=kosul, yon="ASC")
+        self._yukleniyor = True
+        self.yurutucu.gonder(
+            self._degisiklikleri_getir, sorgu, self.veri + veri + (self.en_fazla_satir,), zaman,
+            basarili=self._degisiklikler_geldi, hata=self._sayfa_hatasi,
+            sahip=self.sahip, gosterge=self.gosterge, anahtar=self,
+        )
+
+    def _sayfa_iste(self, ileri, sinir, bastan=False):
+        self._yukleniyor = True
+        sorgu = self.sorgu_sablonu.format(
+            kosul=f"{self.id_sutunu} {'>' if ileri else '<'} %s",
+            yon="ASC" if ileri else "DESC",
+        )
+        self.yurutucu.gonder(
+            self._sayfa_getir, sorgu, self.veri + (sinir, self.sayfa_boyutu), bastan,
+            basarili=lambda sonuc: self._sayfa_geldi(*sonuc, ileri, bastan),
+            hata=self._sayfa_hatasi, sahip=self.sahip, gosterge=self.gosterge, anahtar=self,
+        )
+
+    # --- Arka plan iş parçacığında çalışanlar ---
+    def _sayfa_getir(self, sorgu, veri, zaman_al):
+        # Eşitleme zamanı sorgudan önce alınır ki sorgu sırasında yapılan değişiklikler kaçmasın
+        zaman = self.db.sunucu_zamani() if zaman_al and self.degisim_kosulu else None
+        return zaman, self.db.sorgu(sorgu, veri, fetch_results=True)
+
+    def _degisiklikleri_getir(self, sorgu, veri, zaman):
+        yeni_senkron = self.db.sunucu_zamani()
+        kayitlar = self.db.sorgu(sorgu, veri, fetch_results=True)
+        silinenler = []
+        if self.silinme_tablosu:
+            silinenler = [kayit_id for (kayit_id,) in self.db.sorgu(
+                sorgular.SILINEN_KAYITLAR, (self.silinme_tablosu, zaman), fetch_results=True)]
+        return yeni_senkron, kayitlar, silinenler
+
+    # --- Ana iş parçacığında çalışanlar ---
+    def _degisiklikler_geldi(self, sonuc):
+        yeni_senkron, kayitlar, silinenler = sonuc
+        self._yukleniyor = False
+        if len(kayitlar) >= self.en_fazla_satir:
+            # Bu kadar çok değişiklik varsa baştan yüklemek daha ucuz
+            self.yenile()
+            return
+
+        tree = self.tree
+        capa = self._gorunen_ilk_satir()
+        for kayit_id in silinenler:
+            if tree.exists(str(kayit_id)):
+                tree.delete(str(kayit_id))
+
+        idler = [int(iid) for iid in tree.get_children()]
+        for kayit in self._degerler(kayitlar):
+            iid = str(kayit[0])
+            if tree.exists(iid):
+                tree.item(iid, values=kayit)
+            else:
+                sira = bisect.bisect_left(idler, kayit[0])
+                idler.insert(sira, kayit[0])
+                tree.insert("", sira, iid=iid, values=kayit)
+
+        fazla = len(idler) - self.en_fazla_satir
+        if fazla > 0:
+            tree.delete(*tree.get_children()[-fazla:])
+            self._sonrasi_var = True
+        self._senkron = yeni_senkron
+        self._capaya_don(capa)
+        tree.after_idle(self._kontrol_et)
+
+    def _sayfa_geldi(self, zaman, kayitlar, ileri, bastan):
+        tree = self.tree
+        if bastan:
+            self._senkron = zaman
+            tree.delete(*tree.get_children())
+            self._oncesi_var = False
+            if not kayitlar and self.bos_mesaji:
+                messagebox.showinfo("Bilgi", self.bos_mesaji, icon="info")
+        capa = self._gorunen_ilk_satir()
+
+        if ileri:
+            for kayit in self._degerler(kayitlar):
+                tree.insert("", "end", iid=str(kayit[0]), values=kayit)
+            self._sonrasi_var = len(kayitlar) == self.sayfa_boyutu
+            satirlar = tree.get_children()
+            fazla = len(satirlar) - self.en_fazla_satir
+            if fazla > 0:
+                tree.delete(*satirlar[:fazla])
+                self._oncesi_var = True
+        else:
+            # Önceki sayfa büyükten küçüğe gelir; başa sırayla eklenir
+            for sira, kayit in enumerate(reversed(self._degerler(kayitlar))):
+                tree.insert("", sira, iid=str(kayit[0]), values=kayit)
+            self._oncesi_var = len(kayitlar) == self.sayfa_boyutu
+            satirlar = tree.get_children()
+            fazla = len(satirlar) - self.en_fazla_satir
+            if fazla > 0:
+                tree.delete(*satirlar[-fazla:])
+                self._sonrasi_var = True
+
+        self._capaya_don(capa)
+        self._yukleniyor = False
+        tree.after_idle(self._kontrol_et)
+
+    def _arama_geldi(self, kayitlar):
+        tree = self.tree
+        tree.delete(*tree.get_children())
+        for kayit in self._degerler(kayitlar):
+            tree.insert("", "end", iid=str(kayit[0]), values=kayit)
+        self._oncesi_var = self._sonrasi_var = False
+        self._senkron = None  # Aramadan dönülünce liste baştan yüklenir
+        self._yukleniyor = False
+        if not kayitlar and self._arama[2]:
+            messagebox.showinfo("Bilgi", self._arama[2], icon="info")
+
+    def _degerler(self, kayitlar):
+        """Treeview'e eklenecek satırlar; biçimleyici yoksa sorgu satırlarının kendisi."""
+        if self.satir_bicimle is None:
+            return kayitlar
+        return [self.satir_bicimle(kayit) for kayit in kayitlar]
+
+    def _sayfa_hatasi(self, err):
+        self._yukleniyor = False
+        self._sonrasi_var = self._oncesi_var = False  # Hata döngüsüne girmemek için otomatik yüklemeyi durdur
+        if self.yurutucu.varsayilan_hata:
+            self.yurutucu.varsayilan_hata(err)
+
+    def _capaya_don(self, capa):
+        """Eklenen/silinen satırlar görünümü kaydırmasın diye önceki ilk görünen satıra döner."""
+        if capa is not None and self.tree.exists(capa):
+            self.tree.yview_moveto(self.tree.index(capa) / len(self.tree.get_children()))
+
+    def _gorunen_ilk_satir(self):
+        satirlar = self.tree.get_children()
+        if not satirlar:
+            return None
+        ust = self.tree.yview()[0]
+        return satirlar[min(int(ust * len(satirlar)), len(satirlar) - 1)]
+
+    def _kaydirildi(self, ilk, son):
+        self.kaydirma_cubugu.set(ilk, son)
+        if not self._yukleniyor:
+            self._kontrol_et()
+
+    def _kontrol_et(self):
+        """Görünüm listenin başına veya sonuna yaklaştıysa komşu sayfayı ister."""
+        if self._yukleniyor or not self.tree.winfo_exists():
+            return
+        satirlar = self.tree.get_children()
+        if not satirlar:
+            return
+        ilk, son = self.tree.yview()
+        if son >= 1 - self.esik and self._sonrasi_var:
+            self._sayfa_iste(ileri=True, sinir=int(satirlar[-1]))
+        elif ilk <= self.esik and self._oncesi_var:
+            self._sayfa_iste(ileri=False, sinir=int(satirlar[0]))
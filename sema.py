@@ -0,0 +1,585 @@
+"""
+Veritabanı şeması ve sürümlü göçler.
+
+Her göç bir (sürüm, açıklama, ifadeler) üçlüsüdür; uygulanan sürümler
+`sema_surumu` tablosunda tutulur. Bekleyen göçler uygulama açılırken
+otomatik olarak ya da komut satırından uygulanır:
+
+    python sema.py                   # Bekleyen göçleri uygula
+    python sema.py --durum           # Uygulanmış ve bekleyen sürümleri listele
+    python sema.py --plan-denetimi   # Sık sorguların EXPLAIN planlarında tam tablo taraması ara
+"""
+import argparse
+import re
+import sys
+from datetime import timedelta
+
+import sorgular
+from veritabani import SQLITE_SIMDI, VeritabaniHatasi
+
+# Değişiklik takibi yapılan tablolar ve bir hayvan silinince onunla birlikte silinen alt tablolar
+TAKIP_EDILEN_TABLOLAR = ("sahipler", "hayvanlar", "asi_takip", "randevular", "muayeneler")
+HAYVAN_ALT_TABLOLARI = ("asi_takip", "randevular", "muayeneler")
+
+# Bu süreden eski silme izleri temizlenir
+SILINME_IZI_SAKLAMA_GUNU = 7
+
+# Şeması elle kurulmuş veritabanlarında göçler hata vermeden devralınsın diye
+# "zaten var" hataları yok sayılır: tablo (1050), sütun (1060), indeks (1061),
+# tetikleyici (1359), yabancı anahtar (1826).
+ZATEN_VAR_HATALARI = {1050, 1060, 1061, 1359, 1826}
+
+SEMA_KILIDI = "veteriner_klinik_sema"
+
+# Her göç ve tablo tanımı motora göre ("mysql" / "sqlite") ayrı yazılır
+SURUM_TABLOSU = {
+    "mysql": """
+        CREATE TABLE IF NOT EXISTS sema_surumu (
+            surum INT PRIMARY KEY,
+            aciklama VARCHAR(200) NOT NULL,
+            uygulanma TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """,
+    "sqlite": """
+        CREATE TABLE IF NOT EXISTS sema_surumu (
+            surum INTEGER PRIMARY KEY,
+            aciklama TEXT NOT NULL,
+            uygulanma TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+}
+
+# Sık çalışan sorguların (sorgular.py) kullandığı indeksler: (ad, tablo, sütunlar)
+SIK_SORGU_INDEKSLERI = [
+    # Sahip silmeden önceki COUNT(*) ve geçmiş sekmeleri (hayvan_id = ? ORDER BY id);
+    # elle kurulmuş şemalarda eksik olabilirler, yeni kurulumda 1. göçle zaten gelirler.
+    ("idx_hayvanlar_sahip", "hayvanlar", "sahip_id"),
+    ("idx_asi_takip_hayvan", "asi_takip", "hayvan_id"),
+    ("idx_randevular_hayvan", "randevular", "hayvan_id"),
+    ("idx_muayeneler_hayvan", "muayeneler", "hayvan_id"),
+    # Yaklaşan aşılar: sonraki_asi_tarihi BETWEEN ? AND ?
+    ("idx_asi_takip_sonraki", "asi_takip", "sonraki_asi_tarihi"),
+    # Çakışma kontrolü: randevu_tarihi = ? AND durum != 'İptal Edildi'
+    ("idx_randevular_tarih_durum", "randevular", "randevu_tarihi, durum"),
+]
+
+
+def _metin_sutunlari(onek=""):
+    return ", ".join(onek + sutun for sutun in sorgular.MUAYENE_METIN_SUTUNLARI)
+
+
+def _indeksler(indeksler):
+    return {
+        "mysql": [f"CREATE INDEX {ad} ON {tablo} ({sutunlar})" for ad, tablo, sutunlar in indeksler],
+        "sqlite": [f"CREATE INDEX IF NOT EXISTS {ad} ON {tablo} ({sutunlar})" for ad, tablo, sutunlar in indeksler],
+    }
+
+
+def _silinme_tetikleyicisi(tablo, ek="", alt_kayitlar=True):
+    govde = f"INSERT INTO silinen_kayitlar (tablo, kayit_id) VALUES ('{tablo}', OLD.id);"
+    if tablo == "hayvanlar" and alt_kayitlar:
+        # MySQL'de ON DELETE CASCADE ile silinen alt kayıtlar kendi tetikleyicilerini çalıştırmaz
+        for alt in HAYVAN_ALT_TABLOLARI:
+            govde += f"\n            INSERT INTO silinen_kayitlar (tablo, kayit_id) SELECT '{alt}', id FROM {alt} WHERE hayvan_id = OLD.id;"
+    return f"""
+        CREATE TRIGGER {ek}trg_{tablo}_silinme BEFORE DELETE ON {tablo} FOR EACH ROW
+        BEGIN
+            {govde}
+        END
+    """
+
+
+def _asi_durumunu_yenile(kaynak):
+    """(hayvan_id, asi_adi) için asi_durumu satırını o aşının en son dozundan yeniden kurar."""
+    return f"""
+            DELETE FROM asi_durumu WHERE hayvan_id = {kaynak}.hayvan_id AND asi_adi = {kaynak}.asi_adi;
+            INSERT INTO asi_durumu (hayvan_id, asi_adi, asi_id, asi_tarihi, sonraki_asi_tarihi)
+            SELECT hayvan_id, asi_adi, id, asi_tarihi, sonraki_asi_tarihi FROM asi_takip
+            WHERE hayvan_id = {kaynak}.hayvan_id AND asi_adi = {kaynak}.asi_adi
+            ORDER BY asi_tarihi DESC, id DESC LIMIT 1;"""
+
+
+def _asi_durumu_tetikleyicileri(ek="", guncellenen_sutunlar=""):
+    return [
+        f"""
+        CREATE TRIGGER {ek}trg_asi_durumu_ekleme AFTER INSERT ON asi_takip FOR EACH ROW
+        BEGIN{_asi_durumunu_yenile("NEW")}
+        END
+        """,
+        f"""
+        CREATE TRIGGER {ek}trg_asi_durumu_silme AFTER DELETE ON asi_takip FOR EACH ROW
+        BEGIN{_asi_durumunu_yenile("OLD")}
+        END
+        """,
+        # Hayvan veya aşı adı değiştiyse eski anahtarın durumu da yeniden kurulur
+        f"""
+        CREATE TRIGGER {ek}trg_asi_durumu_guncelleme AFTER UPDATE {guncellenen_sutunlar}ON asi_takip FOR EACH ROW
+        BEGIN{_asi_durumunu_yenile("OLD")}{_asi_durumunu_yenile("NEW")}
+        END
+        """,
+    ]
+
+
+# Mevcut aşı kayıtlarından başlangıç durumu: her (hayvan, aşı) için en son doz
+ASI_DURUMU_DOLDUR = """
+    INSERT INTO asi_durumu (hayvan_id, asi_adi, asi_id, asi_tarihi, sonraki_asi_tarihi)
+    SELECT at.hayvan_id, at.asi_adi, at.id, at.asi_tarihi, at.sonraki_asi_tarihi
+    FROM asi_takip at
+    WHERE at.id = (
+        SELECT son.id FROM asi_takip son
+        WHERE son.hayvan_id = at.hayvan_id AND son.asi_adi = at.asi_adi
+        ORDER BY son.asi_tarihi DESC, son.id DESC LIMIT 1
+    )
+"""
+
+
+def _mysql_degisiklik_takibi(tablo):
+    return [
+        f"""
+        ALTER TABLE {tablo}
+        ADD COLUMN guncellenme TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+        ADD INDEX idx_{tablo}_guncellenme (guncellenme)
+        """,
+        _silinme_tetikleyicisi(tablo),
+    ]
+
+
+def _sqlite_degisiklik_takibi(tablo):
+    # SQLite'ta ON UPDATE yok ve ALTER TABLE sabit olmayan varsayılan kabul etmiyor;
+    # zaman damgasını tetikleyiciler yazar (recursive_triggers kapalı olduğundan döngü olmaz).
+    return [
+        f"ALTER TABLE {tablo} ADD COLUMN guncellenme TIMESTAMP NOT NULL DEFAULT '1970-01-01 00:00:00.000'",
+        f"UPDATE {tablo} SET guncellenme = {SQLITE_SIMDI}",
+        f"CREATE INDEX IF NOT EXISTS idx_{tablo}_guncellenme ON {tablo} (guncellenme)",
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{tablo}_ekleme AFTER INSERT ON {tablo} FOR EACH ROW
+        BEGIN
+            UPDATE {tablo} SET guncellenme = {SQLITE_SIMDI} WHERE id = NEW.id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{tablo}_guncelleme AFTER UPDATE ON {tablo} FOR EACH ROW
+        BEGIN
+            UPDATE {tablo} SET guncellenme = {SQLITE_SIMDI} WHERE id = NEW.id;
+        END
+        """,
+        # SQLite'ta CASCADE ile silinen alt kayıtların tetikleyicileri de çalışır
+        _silinme_tetikleyicisi(tablo, ek="IF NOT EXISTS ", alt_kayitlar=False),
+    ]
+
+
+GOCLER = [
+    (1, "Temel tablolar", {
+        "mysql": [
+            """
+            CREATE TABLE IF NOT EXISTS sahipler (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                isim VARCHAR(100) NOT NULL,
+                telefon VARCHAR(20) NOT NULL,
+                adres TEXT
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS hayvanlar (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                isim VARCHAR(100) NOT NULL,
+                tur VARCHAR(50) NOT NULL,
+                cins VARCHAR(50) NOT NULL,
+                dogum_tarihi DATE,
+                gelis_sebebi VARCHAR(50),
+                sahip_id INT NOT NULL,
+                notlar TEXT,
+                INDEX idx_hayvanlar_sahip (sahip_id),
+                CONSTRAINT fk_hayvanlar_sahip FOREIGN KEY (sahip_id) REFERENCES sahipler (id) ON DELETE RESTRICT
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS asi_takip (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                hayvan_id INT NOT NULL,
+                asi_adi VARCHAR(100) NOT NULL,
+                asi_tarihi DATE NOT NULL,
+                sonraki_asi_tarihi DATE,
+                notlar TEXT,
+                INDEX idx_asi_takip_hayvan (hayvan_id),
+                CONSTRAINT fk_asi_takip_hayvan FOREIGN KEY (hayvan_id) REFERENCES hayvanlar (id) ON DELETE CASCADE
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS randevular (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                hayvan_id INT NOT NULL,
+                randevu_tarihi DATETIME NOT NULL,
+                aciklama TEXT,
+                durum VARCHAR(20) NOT NULL DEFAULT 'Planlandı',
+                INDEX idx_randevular_hayvan (hayvan_id),
+                CONSTRAINT fk_randevular_hayvan FOREIGN KEY (hayvan_id) REFERENCES hayvanlar (id) ON DELETE CASCADE
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS muayeneler (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                hayvan_id INT NOT NULL,
+                muayene_tarihi DATETIME NOT NULL,
+                sikayet TEXT,
+                bulgular TEXT,
+                teshis TEXT,
+                tedavi_plani TEXT,
+                INDEX idx_muayeneler_hayvan (hayvan_id),
+                CONSTRAINT fk_muayeneler_hayvan FOREIGN KEY (hayvan_id) REFERENCES hayvanlar (id) ON DELETE CASCADE
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+        ],
+        # AUTOINCREMENT: silinen id'ler yeniden kullanılmasın (sayfalama yeni kayıtları sonda bekler)
+        "sqlite": [
+            """
+            CREATE TABLE IF NOT EXISTS sahipler (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                isim TEXT NOT NULL,
+                telefon TEXT NOT NULL,
+                adres TEXT
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS hayvanlar (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                isim TEXT NOT NULL,
+                tur TEXT NOT NULL,
+                cins TEXT NOT NULL,
+                dogum_tarihi DATE,
+                gelis_sebebi TEXT,
+                sahip_id INTEGER NOT NULL REFERENCES sahipler (id) ON DELETE RESTRICT,
+                notlar TEXT
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS asi_takip (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                hayvan_id INTEGER NOT NULL REFERENCES hayvanlar (id) ON DELETE CASCADE,
+                asi_adi TEXT NOT NULL,
+                asi_tarihi DATE NOT NULL,
+                sonraki_asi_tarihi DATE,
+                notlar TEXT
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS randevular (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                hayvan_id INTEGER NOT NULL REFERENCES hayvanlar (id) ON DELETE CASCADE,
+                randevu_tarihi DATETIME NOT NULL,
+                aciklama TEXT,
+                durum TEXT NOT NULL DEFAULT 'Planlandı'
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS muayeneler (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                hayvan_id INTEGER NOT NULL REFERENCES hayvanlar (id) ON DELETE CASCADE,
+                muayene_tarihi DATETIME NOT NULL,
+                sikayet TEXT,
+                bulgular TEXT,
+                teshis TEXT,
+                tedavi_plani TEXT
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_hayvanlar_sahip ON hayvanlar (sahip_id)",
+            "CREATE INDEX IF NOT EXISTS idx_asi_takip_hayvan ON asi_takip (hayvan_id)",
+            "CREATE INDEX IF NOT EXISTS idx_randevular_hayvan ON randevular (hayvan_id)",
+            "CREATE INDEX IF NOT EXISTS idx_muayeneler_hayvan ON muayeneler (hayvan_id)",
+        ],
+    }),
+    (2, "Sık sorgular için indeksler", _indeksler(SIK_SORGU_INDEKSLERI)),
+    (3, "Artımlı liste yenileme için değişiklik takibi", {
+        "mysql": [
+            """
+            CREATE TABLE IF NOT EXISTS silinen_kayitlar (
+                id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                tablo VARCHAR(32) NOT NULL,
+                kayit_id INT NOT NULL,
+                silinme TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+                INDEX idx_silinen_kayitlar_tablo_silinme (tablo, silinme)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+            *[ifade for tablo in TAKIP_EDILEN_TABLOLAR for ifade in _mysql_degisiklik_takibi(tablo)],
+        ],
+        "sqlite": [
+            f"""
+            CREATE TABLE IF NOT EXISTS silinen_kayitlar (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tablo TEXT NOT NULL,
+                kayit_id INTEGER NOT NULL,
+                silinme TIMESTAMP NOT NULL DEFAULT ({SQLITE_SIMDI})
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_silinen_kayitlar_tablo_silinme ON silinen_kayitlar (tablo, silinme)",
+            *[ifade for tablo in TAKIP_EDILEN_TABLOLAR for ifade in _sqlite_degisiklik_takibi(tablo)],
+        ],
+    }),
+    (4, "Muayene kayıtlarında tam metin araması", {
+        "mysql": [
+            f"CREATE FULLTEXT INDEX ftx_muayeneler_metin ON muayeneler ({_metin_sutunlari()})",
+        ],
+        # Dış içerikli FTS5 tablosu: metin muayeneler'de kalır, yalnızca indeks tutulur;
+        # tetikleyiciler indeksi eşitler (SQLite CASCADE silmelerinde de tetikleyici çalıştırır)
+        "sqlite": [
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS muayene_arama USING fts5 (
+                {_metin_sutunlari()},
+                content='muayeneler', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+            )
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_muayene_arama_ekleme AFTER INSERT ON muayeneler FOR EACH ROW
+            BEGIN
+                INSERT INTO muayene_arama (rowid, {_metin_sutunlari()})
+                VALUES (NEW.id, {_metin_sutunlari("NEW.")});
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_muayene_arama_silme AFTER DELETE ON muayeneler FOR EACH ROW
+            BEGIN
+                INSERT INTO muayene_arama (muayene_arama, rowid, {_metin_sutunlari()})
+                VALUES ('delete', OLD.id, {_metin_sutunlari("OLD.")});
+            END
+            """,
+            # guncellenme tetikleyicisinin UPDATE'i indeksi boşuna yeniden yazmasın diye yalnızca metin sütunları
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_muayene_arama_guncelleme
+            AFTER UPDATE OF {_metin_sutunlari()} ON muayeneler FOR EACH ROW
+            BEGIN
+                INSERT INTO muayene_arama (muayene_arama, rowid, {_metin_sutunlari()})
+                VALUES ('delete', OLD.id, {_metin_sutunlari("OLD.")});
+                INSERT INTO muayene_arama (rowid, {_metin_sutunlari()})
+                VALUES (NEW.id, {_metin_sutunlari("NEW.")});
+            END
+            """,
+            "INSERT INTO muayene_arama (muayene_arama) VALUES ('rebuild')",
+        ],
+    }),
+    # Hayvan seçicideki isim başı aramaları (LIKE 'metin%'); SQLite LIKE büyük/küçük harf duyarsız
+    # olduğundan indeksi yalnızca NOCASE indeksle kullanabilir
+    (5, "Hayvan seçici için isim indeksleri", {
+        "mysql": [
+            "CREATE INDEX idx_hayvanlar_isim ON hayvanlar (isim)",
+            "CREATE INDEX idx_sahipler_isim ON sahipler (isim)",
+        ],
+        "sqlite": [
+            "CREATE INDEX IF NOT EXISTS idx_hayvanlar_isim ON hayvanlar (isim COLLATE NOCASE)",
+            "CREATE INDEX IF NOT EXISTS idx_sahipler_isim ON sahipler (isim COLLATE NOCASE)",
+        ],
+    }),
+    # Çakışma denetimi aralıkları randevu_tarihi + sure_dakika ile kurar; veteriner ve oda
+    # boş olan (eski) randevular tüm kliniği meşgul sayılır
+    (6, "Randevu süresi, veteriner ve oda", {
+        "mysql": [
+            """
+            ALTER TABLE randevular
+            ADD COLUMN sure_dakika SMALLINT NOT NULL DEFAULT 15,
+            ADD COLUMN veteriner VARCHAR(100) NULL,
+            ADD COLUMN oda VARCHAR(50) NULL
+            """,
+        ],
+        "sqlite": [
+            "ALTER TABLE randevular ADD COLUMN sure_dakika INTEGER NOT NULL DEFAULT 15",
+            "ALTER TABLE randevular ADD COLUMN veteriner TEXT",
+            "ALTER TABLE randevular ADD COLUMN oda TEXT",
+        ],
+    }),
+    # Yaklaşan aşılar ekranı her (hayvan, aşı) için yalnızca en son dozun sonraki tarihini okur;
+    # yerine yenisi yapılmış eski dozlar listelenmez. Tablo asi_takip tetikleyicileriyle güncel tutulur.
+    (7, "Güncel aşı durumu tablosu", {
+        "mysql": [
+            """
+            CREATE TABLE IF NOT EXISTS asi_durumu (
+                hayvan_id INT NOT NULL,
+                asi_adi VARCHAR(100) NOT NULL,
+                asi_id INT NOT NULL,
+                asi_tarihi DATE NOT NULL,
+                sonraki_asi_tarihi DATE,
+                PRIMARY KEY (hayvan_id, asi_adi),
+                INDEX idx_asi_durumu_sonraki (sonraki_asi_tarihi, hayvan_id, asi_adi, asi_tarihi),
+                CONSTRAINT fk_asi_durumu_hayvan FOREIGN KEY (hayvan_id) REFERENCES hayvanlar (id) ON DELETE CASCADE
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """,
+            # Tetikleyicilerin en son dozu bulduğu indeks
+            "CREATE INDEX idx_asi_takip_hayvan_asi ON asi_takip (hayvan_id, asi_adi, asi_tarihi, id)",
+            ASI_DURUMU_DOLDUR,
+            # MySQL'de CASCADE ile silinen aşılar tetikleyici çalıştırmaz; o satırları asi_durumu'nun
+            # kendi yabancı anahtarı siler
+            *_asi_durumu_tetikleyicileri(),
+        ],
+        "sqlite": [
+            """
+            CREATE TABLE IF NOT EXISTS asi_durumu (
+                hayvan_id INTEGER NOT NULL REFERENCES hayvanlar (id) ON DELETE CASCADE,
+                asi_adi TEXT NOT NULL,
+                asi_id INTEGER NOT NULL,
+                asi_tarihi DATE NOT NULL,
+                sonraki_asi_tarihi DATE,
+                PRIMARY KEY (hayvan_id, asi_adi)
+            ) WITHOUT ROWID
+            """,
+            # Kapsayan indeks: liste asi_durumu satırlarına hiç gitmeden okunur
+            "CREATE INDEX IF NOT EXISTS idx_asi_durumu_sonraki ON asi_durumu (sonraki_asi_tarihi, hayvan_id, asi_adi, asi_tarihi)",
+            "CREATE INDEX IF NOT EXISTS idx_asi_takip_hayvan_asi ON asi_takip (hayvan_id, asi_adi, asi_tarihi, id)",
+            ASI_DURUMU_DOLDUR,
+            # guncellenme tetikleyicisinin UPDATE'i durumu boşuna yeniden kurmasın diye yalnızca ilgili sütunlar
+            *_asi_durumu_tetikleyicileri("IF NOT EXISTS ", "OF hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi "),
+        ],
+    }),
+    # Toplu içe aktarmada (ice_aktarma.py) hayvanların sahipleri telefonla eşleştirilir
+    (8, "Sahip telefon indeksi", _indeksler([("idx_sahipler_telefon", "sahipler", "telefon")])),
+    # Dışa aktarmada (disa_aktarma.py) tarih aralıkları ve tarih sırası bu indekslerden okunur
+    (9, "Muayene ve aşı tarihi indeksleri", _indeksler([("idx_muayeneler_tarih", "muayeneler", "muayene_tarihi"),
+                                                        ("idx_asi_takip_tarih", "asi_takip", "asi_tarihi")])),
+]
+
+
+_SUTUN_EKLEME = re.compile(r"^\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)", re.IGNORECASE)
+
+
+def _sutun_var_mi(oturum, tablo, sutun):
+    return any(satir[1] == sutun for satir in oturum.calistir(f"PRAGMA table_info({tablo})", fetch_results=True))
+
+
+def _ifade_uygula(oturum, ifade):
+    if oturum.db.lehce == "sqlite":
+        # SQLite'ın "duplicate column name" hatasının numarası yok; sütun önceden denetlenir
+        eslesme = _SUTUN_EKLEME.match(ifade)
+        if eslesme and _sutun_var_mi(oturum, *eslesme.groups()):
+            return
+    try:
+        oturum.calistir(ifade)
+    except VeritabaniHatasi as err:
+        if err.kod not in ZATEN_VAR_HATALARI:
+            raise
+
+
+def _kilitle(oturum, lehce):
+    """Aynı anda açılan iki masa göçleri iki kez uygulamaya çalışmasın."""
+    if lehce == "sqlite":
+        # SQLite'ta DDL işlem içinde çalışır; yazma kilidi hemen alınır, hata olursa göç geri alınır
+        oturum.calistir("BEGIN IMMEDIATE")
+    else:
+        (alindi,), = oturum.calistir("SELECT GET_LOCK(%s, 30)", (SEMA_KILIDI,), fetch_results=True)
+        if alindi != 1:  # 0: zaman aşımı, NULL: hata
+            raise VeritabaniHatasi("Göç Hatası", "Şema kilidi 30 saniyede alınamadı; göçler başka bir bilgisayarda "
+                                                 "uygulanıyor olabilir. Lütfen biraz sonra yeniden deneyin.")
+
+
+def _kilidi_birak(oturum, lehce, basarili):
+    if lehce == "sqlite":
+        oturum.calistir("COMMIT" if basarili else "ROLLBACK")
+    else:
+        oturum.calistir("SELECT RELEASE_LOCK(%s)", (SEMA_KILIDI,), fetch_results=True)
+
+
+def uygulanmis_surumler(oturum):
+    oturum.calistir(SURUM_TABLOSU[oturum.db.lehce])
+    return {surum for (surum,) in oturum.calistir("SELECT surum FROM sema_surumu", fetch_results=True)}
+
+
+def gocleri_uygula(db, hedef=None):
+    """
+    Bekleyen göçleri sürüm sırasıyla uygular ve uygulanan sürümlerin listesini döndürür.
+    :param hedef: Verilirse bu sürümden sonraki göçler uygulanmaz.
+    """
+    uygulananlar = []
+    with db.oturum() as oturum:
+        _kilitle(oturum, db.lehce)
+        basarili = False
+        try:
+            mevcut = uygulanmis_surumler(oturum)
+            for surum, aciklama, ifadeler in GOCLER:
+                if surum in mevcut or (hedef is not None and surum > hedef):
+                    continue
+                for ifade in ifadeler[db.lehce]:
+                    _ifade_uygula(oturum, ifade)
+                oturum.calistir("INSERT INTO sema_surumu (surum, aciklama) VALUES (%s, %s)", (surum, aciklama))
+                uygulananlar.append(surum)
+            basarili = True
+        finally:
+            _kilidi_birak(oturum, db.lehce, basarili)
+    return uygulananlar
+
+
+def silinme_izlerini_temizle(db):
+    """Artık hiçbir açık listenin ihtiyaç duymayacağı eski silme izlerini siler."""
+    sinir = db.sunucu_zamani() - timedelta(days=SILINME_IZI_SAKLAMA_GUNU)
+    db.sorgu("DELETE FROM silinen_kayitlar WHERE silinme < %s", (sinir,), commit=True)
+
+
+def _fts_eslesmesi(detay):
+    # FTS5 sanal tablosu: "VIRTUAL TABLE INDEX 0:M4" MATCH ile tam metin indeksinden okur; M yoksa tarar
+    return "VIRTUAL TABLE INDEX" in detay and ":M" in detay
+
+
+def _tam_taramalar(oturum, sorgu, veri):
+    """Sorgunun planında tam tablo taraması yapılan tabloları döndürür."""
+    if oturum.db.lehce == "sqlite":
+        # EXPLAIN QUERY PLAN: "SCAN h" tam tarama; "SEARCH ..." ve "SCAN h USING INDEX ..." değil
+        plan = oturum.calistir("EXPLAIN QUERY PLAN " + sorgu, veri, fetch_results=True)
+        # Alt sorgu sonuçlarının (CO-ROUTINE / MATERIALIZE) taranması tablo taraması değildir
+        ara_sonuclar = {detay.split()[1] for *_, detay in plan if detay.startswith(("CO-ROUTINE ", "MATERIALIZE "))}
+        return [detay.split()[1] for *_, detay in plan
+                if detay.startswith("SCAN ") and "USING" not in detay and "CONSTANT ROW" not in detay
+                and not _fts_eslesmesi(detay) and detay.split()[1] not in ara_sonuclar]
+
+    plan = oturum.calistir("EXPLAIN " + sorgu, veri, fetch_results=True)
+    sutun = {isim: i for i, isim in enumerate(oturum.sutunlar)}
+    # <derivedN> / <unionM,N>: alt sorgu ve UNION ara sonuçları
+    return [satir[sutun["table"]] for satir in plan
+            if satir[sutun["type"]] == "ALL" and not str(satir[sutun["table"]]).startswith("<")]
+
+
+def plan_denetimi(db):
+    """
+    sorgular.DENETLENECEK_SORGULAR'daki her sorgunun planını inceler.
+    :return: Tam tablo taraması yapılan (sorgu adı, tablo) çiftleri; sorgular.BILEREK_TARANANLAR hariç.
+    Not: MySQL çok küçük tablolarda indeks yerine taramayı seçebilir; MySQL'de denetim
+    gerçekçi büyüklükte veriyle yapılmalıdır.
+    """
+    taramalar = []
+    with db.oturum() as oturum:
+        for ad, sorgu, veri in sorgular.DENETLENECEK_SORGULAR:
+            sorgu = sorgular.lehceye_gore(sorgu, db.lehce)
+            veri = veri[db.lehce] if isinstance(veri, dict) else veri
+            taramalar.extend((ad, tablo) for tablo in _tam_taramalar(oturum, sorgu, veri)
+                             if (ad, tablo) not in sorgular.BILEREK_TARANANLAR)
+    return taramalar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Veteriner Klinik veritabanı göçleri")
+    parser.add_argument("--motor", choices=("mysql", "sqlite"), help="Ayarlardaki motor yerine bunu kullan")
+    parser.add_argument("--hedef", type=int, help="Bu sürüme kadar uygula")
+    parser.add_argument("--durum", action="store_true", help="Uygulanmış ve bekleyen sürümleri listele")
+    parser.add_argument("--plan-denetimi", action="store_true", help="Sık sorgularda tam tablo taraması ara")
+    args = parser.parse_args()
+
+    from ayarlar import veritabani_ac
+    db = veritabani_ac(args.motor)
+    try:
+        if args.durum:
+            with db.oturum() as oturum:
+                mevcut = uygulanmis_surumler(oturum)
+            for surum, aciklama, _ in GOCLER:
+                print(f"{surum:>3}  {'uygulandı' if surum in mevcut else 'bekliyor ':<9}  {aciklama}")
+            return 0
+
+        if args.plan_denetimi:
+            taramalar = plan_denetimi(db)
+            for ad, tablo in taramalar:
+                print(f"TAM TARAMA: {ad} -> {tablo}")
+            print("Tüm sorgular indeks kullanıyor." if not taramalar else f"{len(taramalar)} tam tablo taraması bulundu.")
+            return 1 if taramalar else 0
+
+        uygulananlar = gocleri_uygula(db, args.hedef)
+        print(f"Uygulanan göçler: {uygulananlar}" if uygulananlar else "Şema güncel.")
+        return 0
+    finally:
+        db.kapat()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,426 @@
+"""
+Arayüzden bağımsız kayıt servisleri.
+
+Sahip, hayvan, aşı, randevu ve muayene kayıtlarının okunması, eklenmesi,
+güncellenmesi ve silinmesi buradadır; Tk'ye dokunmadıkları için pencereler,
+toplu işler, komut satırı ve ölçümler aynı sorgu yolunu kullanır. Tekil
+kayıtlar __slots__'lı kayıt sınıfları (Sahip, Hayvan, ...) olarak, listeler ve
+geçmişler sorgular.py projeksiyonlarının gösterime hazır satırları olarak döner.
+
+Servisler alanları formlardaki kurallarla doğrular ve boş metinleri NULL
+yazar. Kural ihlalleri ValueError, veritabanı hataları VeritabaniHatasi olarak
+yükselir; mesajlar kullanıcıya gösterilmeye hazırdır. Servisin sunmadığı
+listeler (ör. aşıların sayfası) KaynakYok yükseltir. ekle() yeni kaydın id'sini,
+sil() kaydın bulunup bulunmadığını, guncelle() True döndürür (MySQL değeri
+değişmeyen satırları etkilenmiş saymadığı için UPDATE'in satır sayısına bakılmaz).
+
+    servis = Servisler(db)
+    hayvan = servis.hayvanlar.getir(12)
+    for parti in servis.asilar.yaklasanlar(date.today(), date.today() + timedelta(days=30)):
+        ...
+
+Kullanım:
+    python servisler.py sahip 3
+    python servisler.py hayvan 12 [--gecmis]
+    python servisler.py yaklasan-asilar [--gun 30]
+    python servisler.py muayene-ara "kulak akıntı" [--hayvan-id 12]
+"""
+import argparse
+import sys
+from datetime import date, datetime, timedelta
+
+import sorgular
+from cakisma import RANDEVU_EN_UZUN_SURE
+from veritabani import VeritabaniHatasi
+
+RANDEVU_DURUMLARI = ["Planlandı", "Tamamlandı", "İptal Edildi", "Gelmedi"]
+# Hayvan formundaki geliş sebebi seçenekleri
+GELIS_SEBEPLERI = ["Aşı", "Yaralanma", "Parazit", "Kontrol", "Diğer"]
+SAYFA_BOYUTU = 200
+
+
+class KaynakYok(LookupError):
+    """Servisin sayfa() veya gecmis() listesi yoksa fırlatılır (sunucu.py 404 döndürür)."""
+
+
+# --- Kayıtlar ---
+class _Kayit:
+    """Alanları __slots__ sırasıyla sorgu satırından kurulan kayıt."""
+    __slots__ = ()
+
+    def __init__(self, *degerler):
+        if len(degerler) != len(self.__slots__):
+            raise TypeError(f"{type(self).__name__} {len(self.__slots__)} alan bekler, {len(degerler)} verildi")
+        for alan, deger in zip(self.__slots__, degerler):
+            setattr(self, alan, deger)
+
+    def sozluk(self):
+        return {alan: getattr(self, alan) for alan in self.__slots__}
+
+    def __eq__(self, diger):
+        return type(diger) is type(self) and diger.sozluk() == self.sozluk()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{alan}={getattr(self, alan)!r}' for alan in self.__slots__)})"
+
+
+class Sahip(_Kayit):
+    __slots__ = ("id", "isim", "telefon", "adres")
+
+
+class Hayvan(_Kayit):
+    __slots__ = ("id", "isim", "tur", "cins", "dogum_tarihi", "gelis_sebebi", "sahip_id", "notlar", "sahip_isim")
+
+
+class AsiKaydi(_Kayit):
+    __slots__ = ("id", "hayvan_id", "asi_adi", "asi_tarihi", "sonraki_asi_tarihi", "notlar")
+
+
+class Randevu(_Kayit):
+    __slots__ = ("id", "hayvan_id", "randevu_tarihi", "aciklama", "durum", "sure_dakika", "veteriner", "oda")
+
+
+class Muayene(_Kayit):
+    __slots__ = ("id", "hayvan_id", "muayene_tarihi", "sikayet", "bulgular", "teshis", "tedavi_plani")
+
+
+# --- Doğrulama (formlardaki kurallar) ---
+def tarih_dogrula(metin, etiket="Tarih"):
+    """Formlardaki gibi YYYY-AA-GG tarihini doğrular ve aynı biçimde normalleştirilmiş olarak döndürür."""
+    try:
+        return datetime.strptime(metin, "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        raise ValueError(f"{etiket} formatı yanlış ({metin!r}); YYYY-AA-GG formatını kullanın.") from None
+
+
+def _metin(deger):
+    """Baştaki/sondaki boşluklar atılır; boş metin NULL yazılır."""
+    if deger is None:
+        return None
+    return str(deger).strip() or None
+
+
+def _zorunlu(deger, etiket):
+    deger = _metin(deger)
+    if deger is None:
+        raise ValueError(f"{etiket} boş bırakılamaz.")
+    return deger
+
+
+def _kimlik(deger, etiket):
+    try:
+        kimlik = int(deger)
+    except (TypeError, ValueError):
+        kimlik = 0
+    if kimlik <= 0:
+        raise ValueError(f"Lütfen geçerli bir {etiket} seçin.")
+    return kimlik
+
+
+def _tarih(deger, etiket, zorunlu=True):
+    if isinstance(deger, date):
+        return deger.date() if isinstance(deger, datetime) else deger
+    metin = _zorunlu(deger, etiket) if zorunlu else _metin(deger)
+    return None if metin is None else date.fromisoformat(tarih_dogrula(metin, etiket))
+
+
+def _zaman(deger, etiket):
+    if isinstance(deger, datetime):
+        return deger
+    metin = _zorunlu(deger, etiket)
+    try:
+        return datetime.strptime(metin, "%Y-%m-%d %H:%M")
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(metin)  # API'den gelen ISO zaman damgaları ("2026-01-05T10:00:00")
+    except ValueError:
+        raise ValueError(f"{etiket} formatı yanlış. Lütfen YYYY-AA-GG HH:MM formatını kullanın.") from None
+
+
+# --- Servisler ---
+class _Servis:
+    tablo = None
+    kayit = None            # Kayıt sınıfı
+    getir_sorgusu = None
+    sil_sorgusu = None
+    sayfa_sablonu = None    # SayfaliListe şablonu (sorgu veya {lehce: sorgu}); yoksa sayfa() yok
+    id_sutunu = None
+    liste_sutunlari = ()    # Sayfa satırlarının sütun adları
+    gecmis_sorgusu = None   # {lehce: sorgu}; hayvanın kayıtları, yoksa gecmis() yok
+    gecmis_sutunlari = ()
+
+    def __init__(self, db):
+        self.db = db
+
+    def getir(self, kayit_id):
+        """Kaydı döndürür; yoksa None."""
+        satirlar = self.db.sorgu(self.getir_sorgusu, (kayit_id,), fetch_results=True)
+        return self.kayit(*satirlar[0]) if satirlar else None
+
+    def sil(self, kayit_id):
+        """:return: Kayıt vardı ve silindiyse True."""
+        etkilenen, _ = self.db.yaz(self.sil_sorgusu, (kayit_id,))
+        return etkilenen > 0
+
+    def sayfa(self, son_id=0, adet=SAYFA_BOYUTU):
+        """
+        id'si son_id'den büyük ilk adet satırı liste penceresindeki gibi (liste_sutunlari) döndürür.
+        :return: (satırlar, sonraki sayfa için son_id veya son sayfaysa None)
+        """
+        if self.sayfa_sablonu is None:
+            raise KaynakYok(f"{self.tablo} sayfa sayfa listelenmez")
+        sablon = sorgular.lehceye_gore(self.sayfa_sablonu, self.db.lehce)
+        sorgu = sablon.format(kosul=f"{self.id_sutunu} > %s", yon="ASC")
+        satirlar = self.db.sorgu(sorgu, (son_id, adet), fetch_results=True)
+        return satirlar, (satirlar[-1][0] if len(satirlar) == adet else None)
+
+    def gecmis(self, hayvan_id):
+        """Hayvanın kayıtları; detay penceresindeki sekmenin satırları (gecmis_sutunlari)."""
+        if self.gecmis_sorgusu is None:
+            raise KaynakYok(f"{self.tablo} için hayvan geçmişi yok")
+        return self.db.sorgu(self.gecmis_sorgusu[self.db.lehce], (hayvan_id,), fetch_results=True)
+
+
+class SahipServisi(_Servis):
+    tablo = "sahipler"
+    kayit = Sahip
+    getir_sorgusu = sorgular.SAHIP_GETIR
+    sil_sorgusu = sorgular.SAHIP_SIL
+    sayfa_sablonu = sorgular.SAHIP_SAYFASI
+    id_sutunu = "id"
+    liste_sutunlari = ("id", "isim", "telefon", "adres")
+
+    @staticmethod
+    def _alanlar(isim, telefon, adres):
+        return _zorunlu(isim, "Adı Soyadı"), _zorunlu(telefon, "Telefon"), _metin(adres)
+
+    def ekle(self, isim, telefon, adres=None):
+        """:return: Yeni sahibin id'si."""
+        return self.db.yaz(sorgular.SAHIP_EKLE, self._alanlar(isim, telefon, adres))[1]
+
+    def guncelle(self, sahip_id, isim, telefon, adres=None):
+        self.db.yaz(sorgular.SAHIP_GUNCELLE, self._alanlar(isim, telefon, adres) + (sahip_id,))
+        return True
+
+    def hayvan_sayisi(self, sahip_id):
+        return self.db.sorgu(sorgular.SAHIBIN_HAYVAN_SAYISI, (sahip_id,), fetch_results=True)[0][0]
+
+    def sil(self, sahip_id):
+        """:raises ValueError: Sahibe bağlı hayvan varsa (yabancı anahtar da silmeye izin vermez)."""
+        if self.hayvan_sayisi(sahip_id) > 0:
+            raise ValueError("Sahibe bağlı hayvanlar bulunmaktadır. Sahibi silmek için önce bu hayvanları "
+                             "başka bir sahibe atamalı veya silmelisiniz.")
+        return super().sil(sahip_id)
+
+
+class HayvanServisi(_Servis):
+    tablo = "hayvanlar"
+    kayit = Hayvan
+    getir_sorgusu = sorgular.HAYVAN_DETAYI
+    sil_sorgusu = sorgular.HAYVAN_SIL
+    sayfa_sablonu = sorgular.HAYVAN_SAYFASI
+    id_sutunu = "h.id"
+    liste_sutunlari = ("id", "isim", "tur", "cins", "yas", "gelis_sebebi", "sahip")
+
+    @staticmethod
+    def _alanlar(isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id, notlar):
+        gelis_sebebi = _zorunlu(gelis_sebebi, "Geliş Sebebi")
+        if gelis_sebebi not in GELIS_SEBEPLERI:
+            raise ValueError(f"Geliş sebebi şunlardan biri olmalı: {', '.join(GELIS_SEBEPLERI)}.")
+        return (_zorunlu(isim, "Hayvan Adı"), _zorunlu(tur, "Tür"), _zorunlu(cins, "Cins"),
+                _tarih(dogum_tarihi, "Doğum Tarihi"), gelis_sebebi, _kimlik(sahip_id, "sahip"), _metin(notlar))
+
+    def ekle(self, isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id, notlar=None):
+        """:return: Yeni hayvanın id'si."""
+        return self.db.yaz(sorgular.HAYVAN_EKLE,
+                           self._alanlar(isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id, notlar))[1]
+
+    def guncelle(self, hayvan_id, isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id, notlar=None):
+        self.db.yaz(sorgular.HAYVAN_GUNCELLE,
+                    self._alanlar(isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id, notlar) + (hayvan_id,))
+        return True
+
+    def notlari_guncelle(self, hayvan_id, notlar):
+        self.db.yaz(sorgular.HAYVAN_NOTLARI, (_metin(notlar), hayvan_id))
+        return True
+
+
+class AsiServisi(_Servis):
+    tablo = "asi_takip"
+    kayit = AsiKaydi
+    getir_sorgusu = sorgular.ASI_GETIR
+    sil_sorgusu = sorgular.ASI_SIL
+    gecmis_sorgusu = sorgular.ASI_GECMISI
+    gecmis_sutunlari = ("asi_adi", "asi_tarihi", "sonraki_asi_tarihi", "notlar")
+    yaklasan_sutunlari = ("hayvan", "asi_adi", "asi_tarihi", "sonraki_asi_tarihi", "kalan_gun")
+
+    @staticmethod
+    def _alanlar(hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi, notlar):
+        return (_kimlik(hayvan_id, "hayvan"), _zorunlu(asi_adi, "Aşı Adı"), _tarih(asi_tarihi, "Aşı Tarihi"),
+                _tarih(sonraki_asi_tarihi, "Sonraki Aşı Tarihi", zorunlu=False), _metin(notlar))
+
+    def ekle(self, hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi=None, notlar=None):
+        """:return: Yeni aşı kaydının id'si."""
+        return self.db.yaz(sorgular.ASI_EKLE,
+                           self._alanlar(hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi, notlar))[1]
+
+    def guncelle(self, asi_id, hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi=None, notlar=None):
+        self.db.yaz(sorgular.ASI_GUNCELLE,
+                    self._alanlar(hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi, notlar) + (asi_id,))
+        return True
+
+    def yaklasanlar(self, baslangic, bitis, parti_boyutu=500):
+        """Sonraki dozu [baslangic, bitis] aralığında olan aşıların (yaklasan_sutunlari) partilerini üretir."""
+        return self.db.sorgu_akisi(sorgular.YAKLASAN_ASILAR[self.db.lehce],
+                                   (baslangic.strftime("%Y-%m-%d"), bitis.strftime("%Y-%m-%d")), parti_boyutu)
+
+
+class RandevuServisi(_Servis):
+    tablo = "randevular"
+    kayit = Randevu
+    getir_sorgusu = sorgular.RANDEVU_GETIR
+    sil_sorgusu = sorgular.RANDEVU_SIL
+    sayfa_sablonu = sorgular.RANDEVU_SAYFASI
+    id_sutunu = "r.id"
+    liste_sutunlari = ("id", "hayvan", "randevu_tarihi", "aciklama", "durum")
+    gecmis_sorgusu = sorgular.RANDEVU_GECMISI
+    gecmis_sutunlari = ("randevu_tarihi", "aciklama", "durum")
+
+    @staticmethod
+    def _alanlar(hayvan_id, randevu_tarihi, aciklama, durum, sure_dakika, veteriner, oda):
+        if durum not in RANDEVU_DURUMLARI:
+            raise ValueError(f"Durum şunlardan biri olmalı: {', '.join(RANDEVU_DURUMLARI)}.")
+        try:
+            sure_dakika = int(sure_dakika)
+        except (TypeError, ValueError):
+            sure_dakika = 0
+        if not 0 < sure_dakika <= RANDEVU_EN_UZUN_SURE:
+            raise ValueError(f"Süre 1 ile {RANDEVU_EN_UZUN_SURE} dakika arasında olmalıdır.")
+        return (_kimlik(hayvan_id, "hayvan"), _zaman(randevu_tarihi, "Randevu tarihi"), _metin(aciklama), durum,
+                sure_dakika, _metin(veteriner), _metin(oda))
+
+    def ekle(self, hayvan_id, randevu_tarihi, aciklama=None, durum="Planlandı", sure_dakika=15, veteriner=None, oda=None):
+        """Çakışma denetimi yapmaz (cakisma.CakismaDenetcisi); :return: Yeni randevunun id'si."""
+        return self.db.yaz(sorgular.RANDEVU_EKLE, self._alanlar(hayvan_id, randevu_tarihi, aciklama, durum,
+                                                                 sure_dakika, veteriner, oda))[1]
+
+    def guncelle(self, randevu_id, hayvan_id, randevu_tarihi, aciklama=None, durum="Planlandı", sure_dakika=15,
+                 veteriner=None, oda=None):
+        self.db.yaz(sorgular.RANDEVU_GUNCELLE, self._alanlar(hayvan_id, randevu_tarihi, aciklama, durum,
+                                                              sure_dakika, veteriner, oda) + (randevu_id,))
+        return True
+
+
+class MuayeneServisi(_Servis):
+    tablo = "muayeneler"
+    kayit = Muayene
+    getir_sorgusu = sorgular.MUAYENE_GETIR
+    sil_sorgusu = sorgular.MUAYENE_SIL
+    sayfa_sablonu = sorgular.MUAYENE_SAYFASI
+    id_sutunu = "m.id"
+    liste_sutunlari = ("id", "hayvan", "muayene_tarihi", "sikayet", "bulgular", "teshis", "tedavi_plani")
+    gecmis_sorgusu = sorgular.MUAYENE_GECMISI
+    gecmis_sutunlari = ("muayene_tarihi", "sikayet", "teshis", "tedavi_plani")
+
+    @staticmethod
+    def _alanlar(hayvan_id, muayene_tarihi, sikayet, bulgular, teshis, tedavi_plani):
+        return (_kimlik(hayvan_id, "hayvan"), _zaman(muayene_tarihi, "Muayene tarihi"), _metin(sikayet),
+                _metin(bulgular), _metin(teshis), _metin(tedavi_plani))
+
+    def ekle(self, hayvan_id, muayene_tarihi, sikayet=None, bulgular=None, teshis=None, tedavi_plani=None):
+        """:return: Yeni muayene kaydının id'si."""
+        return self.db.yaz(sorgular.MUAYENE_EKLE,
+                           self._alanlar(hayvan_id, muayene_tarihi, sikayet, bulgular, teshis, tedavi_plani))[1]
+
+    def guncelle(self, muayene_id, hayvan_id, muayene_tarihi, sikayet=None, bulgular=None, teshis=None,
+                 tedavi_plani=None):
+        self.db.yaz(sorgular.MUAYENE_GUNCELLE, self._alanlar(hayvan_id, muayene_tarihi, sikayet, bulgular, teshis,
+                                                              tedavi_plani) + (muayene_id,))
+        return True
+
+    def arama_sorgusu(self, metin, hayvan_id=None):
+        """
+        Tam metin araması için (sorgu, parametreler); satırlar hayvan_id yoksa liste_sutunlari,
+        varsa gecmis_sutunlari ile döner.
+        :raises ValueError: Aranacak kadar uzun kelime yoksa.
+        """
+        arama = sorgular.muayene_aramasi(self.db.lehce, metin, hayvan_id)
+        if arama is None:
+            raise ValueError(f"Lütfen en az {sorgular.ARAMA_EN_KISA_KELIME} harfli bir kelime girin.")
+        return arama
+
+    def ara(self, metin, hayvan_id=None):
+        """Şikayet, bulgu, teşhis ve tedavi metinlerinde arar; alakaya göre sıralı en fazla ARAMA_SONUC_SINIRI satır."""
+        return self.db.sorgu(*self.arama_sorgusu(metin, hayvan_id), fetch_results=True)
+
+
+class Servisler:
+    """Bir Veritabani üzerindeki tüm servisler."""
+    def __init__(self, db):
+        self.db = db
+        self.sahipler = SahipServisi(db)
+        self.hayvanlar = HayvanServisi(db)
+        self.asilar = AsiServisi(db)
+        self.randevular = RandevuServisi(db)
+        self.muayeneler = MuayeneServisi(db)
+
+
+# --- Komut satırı ---
+def _yazdir(sutunlar, satirlar):
+    for satir in satirlar:
+        print("  ".join(f"{sutun}={deger}" for sutun, deger in zip(sutunlar, satir)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kayıtları arayüz olmadan sorgula")
+    parser.add_argument("--motor", choices=("mysql", "sqlite"), help="Ayarlardaki motor yerine bunu kullan")
+    komutlar = parser.add_subparsers(dest="komut", required=True)
+    komut = komutlar.add_parser("sahip", help="Sahip kaydı")
+    komut.add_argument("id", type=int)
+    komut = komutlar.add_parser("hayvan", help="Hayvan kaydı")
+    komut.add_argument("id", type=int)
+    komut.add_argument("--gecmis", action="store_true", help="Aşı, randevu ve muayene geçmişini de yazdır")
+    komut = komutlar.add_parser("yaklasan-asilar", help="Sonraki dozu yaklaşan aşılar")
+    komut.add_argument("--gun", type=int, default=30)
+    komut = komutlar.add_parser("muayene-ara", help="Muayene metinlerinde tam metin araması")
+    komut.add_argument("metin")
+    komut.add_argument("--hayvan-id", type=int)
+    args = parser.parse_args()
+
+    from ayarlar import veritabani_ac
+    db = veritabani_ac(args.motor)
+    servis = Servisler(db)
+    try:
+        if args.komut in ("sahip", "hayvan"):
+            kayit = (servis.sahipler if args.komut == "sahip" else servis.hayvanlar).getir(args.id)
+            if kayit is None:
+                print(f"{args.id} id'li {args.komut} bulunamadı.", file=sys.stderr)
+                return 1
+            print(kayit)
+            if args.komut == "hayvan" and args.gecmis:
+                for ad, alt in (("Aşılar", servis.asilar), ("Randevular", servis.randevular),
+                                ("Muayeneler", servis.muayeneler)):
+                    print(f"{ad}:")
+                    _yazdir(alt.gecmis_sutunlari, alt.gecmis(args.id))
+        elif args.komut == "yaklasan-asilar":
+            bugun = date.today()
+            for parti in servis.asilar.yaklasanlar(bugun, bugun + timedelta(days=args.gun)):
+                _yazdir(AsiServisi.yaklasan_sutunlari, parti)
+        else:
+            sutunlar = (MuayeneServisi.liste_sutunlari if args.hayvan_id is None
+                        else MuayeneServisi.gecmis_sutunlari)
+            _yazdir(sutunlar, servis.muayeneler.ara(args.metin, args.hayvan_id))
+        return 0
+    except ValueError as err:
+        print(f"Hata: {err}", file=sys.stderr)
+        return 2
+    except VeritabaniHatasi as err:
+        print(f"{err.baslik}: {err.mesaj}", file=sys.stderr)
+        return 2
+    finally:
+        db.kapat()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
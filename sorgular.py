@@ -0,0 +1,471 @@
+"""
+Uygulamanın sık çalışan (liste, geçmiş, çakışma kontrolü) SQL sorguları.
+
+Sorgular burada toplanır ki şema göçlerindeki indekslerle birlikte gözden
+geçirilebilsin ve `python sema.py --plan-denetimi` ile hepsinin indeks
+kullandığı doğrulanabilsin. Sayfalı liste şablonlarındaki {kosul} ve {yon}
+yer tutucularını SayfaliListe doldurur. Listelerde gösterilen yaş, tarih ve
+kısaltılmış metin gibi alanlar Python'da değil, sorgunun projeksiyonunda
+hesaplanır; bu sorgular motora göre {lehce: sorgu} sözlükleridir.
+"""
+import re
+from datetime import date, timedelta
+
+# --- Liste projeksiyonları ---
+# Listelerde gösterilen türetilmiş alanlar (yaş, biçimli tarih, kalan gün, kısaltılmış metin)
+# veritabanında hesaplanır; pencereler sorgu satırlarını Treeview'e olduğu gibi ekler. Her liste
+# sütunlarını bir ifade veya (alan türü, ifade) ikilisi olarak tanımlar. İfadeler '%' içermez,
+# böylece sürücülerin %s parametre biçimiyle karışmaz. "Bugün" veritabanının saatine göredir.
+LISTE_METIN_SINIRI = 120  # Liste hücrelerindeki uzun metinler bu kadar karaktere kısaltılır
+
+_SQLITE_BUGUN = "date('now', 'localtime')"
+# Tam yıl: YYYYMMDD tamsayılarının farkı / 10000 (ay ve gün karşılaştırmasından belirgin biçimde hızlı)
+_SQLITE_YIL = (f"((CAST(replace({_SQLITE_BUGUN}, '-', '') AS INTEGER)"
+               f" - CAST(replace({{0}}, '-', '') AS INTEGER)) / 10000)")
+_SQLITE_GUN = f"CAST(julianday({_SQLITE_BUGUN}) - julianday(date({{0}})) AS INTEGER)"
+
+# Alan türü -> motora özgü ifade; {0} sütun ifadesidir (bicimler.py'deki Python karşılıklarıyla aynı metni üretir)
+_ALANLAR = {
+    "mysql": {
+        "tarih": "COALESCE(CAST({0} AS CHAR), '')",
+        "tarih_yoksa": "COALESCE(CAST({0} AS CHAR), 'Yok')",
+        "zaman": "COALESCE(LEFT(CAST({0} AS CHAR), 16), '')",
+        "kalan_gun": "DATEDIFF({0}, CURDATE())",
+        "kisa": f"IF(CHAR_LENGTH({{0}}) > {LISTE_METIN_SINIRI}, CONCAT(LEFT({{0}}, {LISTE_METIN_SINIRI - 1}), '…'), {{0}})",
+        "yas": """CASE WHEN {0} IS NULL THEN 'Bilinmiyor'
+            WHEN TIMESTAMPDIFF(YEAR, {0}, CURDATE()) > 0 THEN CONCAT(TIMESTAMPDIFF(YEAR, {0}, CURDATE()), ' yıl')
+            WHEN DATEDIFF(CURDATE(), {0}) < 30 THEN CONCAT(DATEDIFF(CURDATE(), {0}), ' gün')
+            WHEN DATEDIFF(CURDATE(), {0}) < 365 THEN CONCAT(DATEDIFF(CURDATE(), {0}) DIV 30, ' ay')
+            ELSE '1 yaşından küçük' END""",
+    },
+    "sqlite": {
+        "tarih": "COALESCE(date({0}), '')",
+        "tarih_yoksa": "COALESCE(date({0}), 'Yok')",
+        "zaman": "COALESCE(substr(datetime({0}), 1, 16), '')",
+        "kalan_gun": f"CAST(julianday(date({{0}})) - julianday({_SQLITE_BUGUN}) AS INTEGER)",
+        "kisa": f"CASE WHEN length({{0}}) > {LISTE_METIN_SINIRI} THEN substr({{0}}, 1, {LISTE_METIN_SINIRI - 1}) || '…' ELSE {{0}} END",
+        "yas": f"""CASE WHEN {{0}} IS NULL OR {{0}} = '' THEN 'Bilinmiyor'
+            WHEN {_SQLITE_YIL} > 0 THEN {_SQLITE_YIL} || ' yıl'
+            WHEN {_SQLITE_GUN} < 30 THEN {_SQLITE_GUN} || ' gün'
+            WHEN {_SQLITE_GUN} < 365 THEN ({_SQLITE_GUN} / 30) || ' ay'
+            ELSE '1 yaşından küçük' END""",
+    },
+}
+
+
+def projeksiyon(lehce, sutunlar, ham=False):
+    """
+    Liste sütun tanımından motora özgü SELECT listesini üretir.
+    :param ham: Türetilmiş alanlar yerine ham sütunlar (Python tarafında biçimlemeyle karşılaştırmak için).
+    """
+    ifadeler = []
+    for sutun in sutunlar:
+        if isinstance(sutun, tuple):
+            tur, sutun = sutun
+            if not ham:
+                sutun = _ALANLAR[lehce][tur].format(sutun)
+        ifadeler.append(sutun)
+    return ", ".join(ifadeler)
+
+
+def _lehcelere(sablon, sutunlar):
+    """Şablondaki {sutunlar} yer tutucusunu her motor için doldurur; {kosul} / {yon} SayfaliListe'ye kalır."""
+    return {lehce: sablon.replace("{sutunlar}", projeksiyon(lehce, sutunlar)) for lehce in _ALANLAR}
+
+
+def lehceye_gore(sorgu, lehce):
+    """Motora göre farklı yazılan sorgular {lehce: sorgu} sözlüğüdür; düz sorguyu olduğu gibi döndürür."""
+    return sorgu[lehce] if isinstance(sorgu, dict) else sorgu
+
+
+# --- Sayfalı listeler (SayfaliListe şablonları) ---
+SAHIP_SAYFASI = """
+    SELECT id, isim, telefon, adres FROM sahipler
+    WHERE {kosul}
+    ORDER BY id {yon} LIMIT %s
+"""
+SAHIP_DEGISIMI = "guncellenme >= %s"
+
+HAYVAN_SUTUNLARI = ("h.id", "h.isim", "h.tur", "h.cins", ("yas", "h.dogum_tarihi"), "h.gelis_sebebi", "s.isim")
+_HAYVAN_SAYFASI = """
+    SELECT {sutunlar}
+    FROM hayvanlar h JOIN sahipler s ON h.sahip_id = s.id
+    WHERE {kosul}
+    ORDER BY h.id {yon} LIMIT %s
+"""
+HAYVAN_SAYFASI = _lehcelere(_HAYVAN_SAYFASI, HAYVAN_SUTUNLARI)
+HAYVAN_DEGISIMI = "(h.guncellenme >= %s OR s.guncellenme >= %s)"
+
+RANDEVU_SUTUNLARI = ("r.id", "h.isim", ("zaman", "r.randevu_tarihi"), "r.aciklama", "r.durum")
+_RANDEVU_SAYFASI = """
+    SELECT {sutunlar}
+    FROM randevular r
+    JOIN hayvanlar h ON r.hayvan_id = h.id
+    WHERE {kosul}
+    ORDER BY r.id {yon} LIMIT %s
+"""
+RANDEVU_SAYFASI = _lehcelere(_RANDEVU_SAYFASI, RANDEVU_SUTUNLARI)
+RANDEVU_DEGISIMI = "(r.guncellenme >= %s OR h.guncellenme >= %s)"
+
+# Muayene listesi ve tam metin araması (muayene_aramasi) aynı sütunları döndürür
+MUAYENE_SUTUNLARI = ("m.id", "h.isim", ("zaman", "m.muayene_tarihi"), ("kisa", "m.sikayet"), ("kisa", "m.bulgular"),
+                     ("kisa", "m.teshis"), ("kisa", "m.tedavi_plani"))
+_MUAYENE_SAYFASI = """
+    SELECT {sutunlar}
+    FROM muayeneler m
+    JOIN hayvanlar h ON m.hayvan_id = h.id
+    WHERE {kosul}
+    ORDER BY m.id {yon} LIMIT %s
+"""
+MUAYENE_SAYFASI = _lehcelere(_MUAYENE_SAYFASI, MUAYENE_SUTUNLARI)
+MUAYENE_DEGISIMI = "(m.guncellenme >= %s OR h.guncellenme >= %s)"
+
+SILINEN_KAYITLAR = "SELECT kayit_id FROM silinen_kayitlar WHERE tablo = %s AND silinme >= %s"
+
+# --- Yaklaşan aşılar ---
+# asi_durumu her (hayvan, aşı) için en son dozu tutar; eski dozların sonraki tarihleri gelmez
+YAKLASAN_ASI_SUTUNLARI = ("h.isim", "d.asi_adi", ("tarih", "d.asi_tarihi"), ("tarih", "d.sonraki_asi_tarihi"),
+                          ("kalan_gun", "d.sonraki_asi_tarihi"))
+_YAKLASAN_ASILAR = """
+    SELECT {sutunlar}
+    FROM asi_durumu d
+    JOIN hayvanlar h ON d.hayvan_id = h.id
+    WHERE d.sonraki_asi_tarihi BETWEEN %s AND %s
+    ORDER BY d.sonraki_asi_tarihi, d.hayvan_id
+"""
+YAKLASAN_ASILAR = _lehcelere(_YAKLASAN_ASILAR, YAKLASAN_ASI_SUTUNLARI)
+
+# --- Hayvan detay penceresi ---
+# servisler.Hayvan alanlarının sırasıyla; güncelleme formu da aynı satırı kullanır
+HAYVAN_DETAYI = """
+    SELECT h.id, h.isim, h.tur, h.cins, h.dogum_tarihi, h.gelis_sebebi, h.sahip_id, h.notlar, s.isim
+    FROM hayvanlar h JOIN sahipler s ON h.sahip_id = s.id
+    WHERE h.id = %s
+"""
+ASI_GECMISI_SUTUNLARI = ("asi_adi", ("tarih", "asi_tarihi"), ("tarih_yoksa", "sonraki_asi_tarihi"), "notlar")
+_ASI_GECMISI = "SELECT {sutunlar} FROM asi_takip WHERE hayvan_id = %s ORDER BY id ASC"
+ASI_GECMISI = _lehcelere(_ASI_GECMISI, ASI_GECMISI_SUTUNLARI)
+RANDEVU_GECMISI_SUTUNLARI = (("zaman", "randevu_tarihi"), "aciklama", "durum")
+_RANDEVU_GECMISI = "SELECT {sutunlar} FROM randevular WHERE hayvan_id = %s ORDER BY id ASC"
+RANDEVU_GECMISI = _lehcelere(_RANDEVU_GECMISI, RANDEVU_GECMISI_SUTUNLARI)
+# Sekme ve hayvana özel tam metin araması (muayene_aramasi) aynı sütunları döndürür
+MUAYENE_GECMISI_SUTUNLARI = (("zaman", "m.muayene_tarihi"), ("kisa", "m.sikayet"), ("kisa", "m.teshis"),
+                             ("kisa", "m.tedavi_plani"))
+_MUAYENE_GECMISI = "SELECT {sutunlar} FROM muayeneler m WHERE m.hayvan_id = %s ORDER BY m.id ASC"
+MUAYENE_GECMISI = _lehcelere(_MUAYENE_GECMISI, MUAYENE_GECMISI_SUTUNLARI)
+
+# --- Muayene tam metin araması (sema.py 4. göç) ---
+ARAMA_SONUC_SINIRI = 200
+ARAMA_EN_KISA_KELIME = 3  # InnoDB FULLTEXT varsayılanı (innodb_ft_min_token_size); iki motorda aynı davranış için
+# SQLite'ta bm25 her eşleşen satır için hesaplanır; çok yaygın kelimelerde tüm listede yalnızca
+# en yeni bu kadar eşleşme sıralanır. MySQL alaka sıralamasını FULLTEXT indeksi içinde yapar.
+ARAMA_ADAY_SINIRI = 2000
+# İndekslenen sütunlar; MySQL'de MATCH sütunları FULLTEXT indeksiyle birebir aynı olmalı
+MUAYENE_METIN_SUTUNLARI = ("sikayet", "bulgular", "teshis", "tedavi_plani")
+
+# Motora özgü: MySQL MATCH ... AGAINST (boolean mod), SQLite FTS5 MATCH; ikisi de alaka sırasıyla döner
+_MUAYENE_ARAMASI = {
+    "mysql": """
+        SELECT {sutunlar}
+        FROM muayeneler m
+        JOIN hayvanlar h ON m.hayvan_id = h.id
+        WHERE MATCH ({metin}) AGAINST (%s IN BOOLEAN MODE) {kosul}
+        ORDER BY MATCH ({metin}) AGAINST (%s IN BOOLEAN MODE) DESC, m.id DESC
+        LIMIT %s
+    """,
+    "sqlite": """
+        SELECT {sutunlar}
+        FROM muayene_arama
+        JOIN muayeneler m ON m.id = muayene_arama.rowid
+        JOIN hayvanlar h ON m.hayvan_id = h.id
+        WHERE muayene_arama MATCH %s {kosul}
+        ORDER BY muayene_arama.rank, m.id DESC
+        LIMIT %s
+    """,
+}
+_SQLITE_ADAY_KOSULU = """AND muayene_arama.rowid >= (
+            SELECT MIN(rowid) FROM (
+                SELECT rowid FROM muayene_arama WHERE muayene_arama MATCH %s ORDER BY rowid DESC LIMIT %s
+            )
+        )"""
+
+
+def muayene_aramasi(lehce, metin, hayvan_id=None):
+    """
+    Aranan metinden (sorgu, parametreler) üretir; kelimeler önek olarak ve hepsi birlikte aranır.
+    hayvan_id verilirse yalnızca o hayvanın kayıtları, MUAYENE_GECMISI sütunlarıyla döner.
+    :return: Aranacak (en az ARAMA_EN_KISA_KELIME harfli) kelime yoksa None.
+    """
+    kelimeler = [kelime for kelime in re.findall(r"\w+", metin) if len(kelime) >= ARAMA_EN_KISA_KELIME]
+    if not kelimeler:
+        return None
+    if hayvan_id is None:
+        sutunlar = MUAYENE_SUTUNLARI
+        kosul, veri = "", ()
+    else:
+        sutunlar = MUAYENE_GECMISI_SUTUNLARI
+        kosul, veri = "AND m.hayvan_id = %s", (hayvan_id,)
+
+    # Parametreler sorgudaki sırayla: WHERE'deki eşleşme, koşullar, (MySQL) ORDER BY'daki eşleşme, LIMIT
+    if lehce == "mysql":
+        ifade = " ".join(f"+{kelime}*" for kelime in kelimeler)
+        veri = (ifade,) + veri + (ifade,)
+    else:
+        ifade = " ".join(f'"{kelime}"*' for kelime in kelimeler)
+        if hayvan_id is None:
+            kosul, veri = _SQLITE_ADAY_KOSULU, (ifade, ARAMA_ADAY_SINIRI)
+        veri = (ifade,) + veri
+    metin_sutunlari = ", ".join("m." + sutun for sutun in MUAYENE_METIN_SUTUNLARI)
+    sorgu = _MUAYENE_ARAMASI[lehce].format(sutunlar=projeksiyon(lehce, sutunlar), kosul=kosul, metin=metin_sutunlari)
+    return sorgu, veri + (ARAMA_SONUC_SINIRI,)
+
+
+# --- Form seçim listeleri (SecenekOnbellegi) ---
+SAHIP_SECENEKLERI = "SELECT id, isim FROM sahipler"
+
+# --- Hayvan seçici (HayvanSecici); isim aramaları sema.py 5. göçteki indeksleri kullanır ---
+HAYVAN_SECICI_SONUC_SAYISI = 20
+_HAYVAN_SECICI = "SELECT h.id, h.isim AS hayvan, s.isim AS sahip FROM hayvanlar h JOIN sahipler s ON h.sahip_id = s.id"
+HAYVAN_SECICI_ID = _HAYVAN_SECICI + " WHERE h.id = %s"
+
+
+def hayvan_secici_aramasi(metin):
+    """
+    Yazılan metinden (sorgu, parametreler) üretir: "123" / "ID:123" id ile, diğerleri hayvan veya
+    sahip adının başıyla; birden çok kelimede ilk kelime hayvan, kalanı sahip adının başı olarak da aranır.
+    :return: Metin boşsa None.
+    """
+    metin = " ".join(metin.replace("%", "").replace("_", "").split())
+    # Seçilmiş bir etiketin sonundaki "(ID:123)" de id araması sayılır
+    kimlik = re.fullmatch(r"(?:ID:?\s*)?(\d+)", metin, re.IGNORECASE) or re.search(r"\(ID:\s*(\d+)\)$", metin)
+    if kimlik:
+        return HAYVAN_SECICI_ID, (int(kimlik.group(1)),)
+    if not metin:
+        return None
+
+    # Her dal indeks aralığından en fazla sınır kadar satır alır; sıralama birleşimde yapılır
+    dallar = [(f"{_HAYVAN_SECICI} WHERE h.isim LIKE %s LIMIT %s", (metin + "%",)),
+              (f"{_HAYVAN_SECICI} WHERE s.isim LIKE %s LIMIT %s", (metin + "%",))]
+    hayvan, _, sahip = metin.partition(" ")
+    if sahip:
+        dallar.append((f"{_HAYVAN_SECICI} WHERE h.isim LIKE %s AND s.isim LIKE %s LIMIT %s",
+                       (hayvan + "%", sahip + "%")))
+    sorgu = "\n    UNION\n    ".join(f"SELECT * FROM ({dal}) AS dal{i}" for i, (dal, _) in enumerate(dallar))
+    veri = tuple(deger for _, desen in dallar for deger in desen + (HAYVAN_SECICI_SONUC_SAYISI,))
+    return sorgu + "\n    ORDER BY 2, 3, 1 LIMIT %s", veri + (HAYVAN_SECICI_SONUC_SAYISI,)
+
+# --- Toplu içe aktarma (ice_aktarma.py); telefon eşleştirmesi sema.py 8. göçteki indeksi kullanır ---
+IN_LISTESI_SINIRI = 500  # Eski SQLite sürümlerinin 999 parametre sınırının altında
+
+
+def sahipler_telefonla(telefonlar):
+    """Verilen telefonlardan kayıtlı olanlar için (telefon, en küçük sahip id) satırları."""
+    yer_tutucular = ", ".join(["%s"] * len(telefonlar))
+    return f"SELECT telefon, MIN(id) FROM sahipler WHERE telefon IN ({yer_tutucular}) GROUP BY telefon", tuple(telefonlar)
+
+
+def sahipler_idyle(idler):
+    """Verilen id'lerden var olan sahiplerin id'leri."""
+    return f"SELECT id FROM sahipler WHERE id IN ({', '.join(['%s'] * len(idler))})", tuple(idler)
+
+
+# --- Dışa aktarma (disa_aktarma.py); tarih aralıkları sema.py 9. göçteki indeksleri kullanır ---
+# tablo: (sütunlar, tablo ve takma adı, tarih sütunu); ikinci sütun her zaman kaydın tarihidir
+_DISA_AKTARMA = {
+    "muayeneler": ("m.id, m.muayene_tarihi, h.id, h.isim, s.isim, m.sikayet, m.bulgular, m.teshis, m.tedavi_plani",
+                   "muayeneler m", "m.muayene_tarihi"),
+    "asi_takip": ("a.id, a.asi_tarihi, a.sonraki_asi_tarihi, h.id, h.isim, s.isim, a.asi_adi, a.notlar",
+                  "asi_takip a", "a.asi_tarihi"),
+}
+
+
+def disa_aktarma_sorgusu(tablo, baslangic=None, bitis=None, hayvan_id=None, sahip_id=None, sayim=False):
+    """
+    Dışa aktarılacak kayıtlar için tarih ve id sırasıyla (sorgu, parametreler) üretir.
+    :param baslangic, bitis: Dahil olan ilk ve son gün (datetime.date).
+    :param sayim: True ise kayıtlar yerine yalnızca sayılarını döndüren sorgu.
+    """
+    sutunlar, kaynak, tarih_sutunu = _DISA_AKTARMA[tablo]
+    takma_ad = kaynak.split()[1]
+    kosullar, veri = [], []
+    if baslangic is not None:
+        kosullar.append(f"{tarih_sutunu} >= %s")
+        veri.append(baslangic.isoformat())
+    if bitis is not None:
+        # Gün sonuna kadar: DATETIME sütunlarda o günün saatleri de dahil
+        kosullar.append(f"{tarih_sutunu} < %s")
+        veri.append((bitis + timedelta(days=1)).isoformat())
+    if hayvan_id is not None:
+        kosullar.append(f"{takma_ad}.hayvan_id = %s")
+        veri.append(hayvan_id)
+    if sahip_id is not None:
+        kosullar.append("h.sahip_id = %s")
+        veri.append(sahip_id)
+    nerede = f" WHERE {' AND '.join(kosullar)}" if kosullar else ""
+    if sayim:
+        katilim = f" JOIN hayvanlar h ON {takma_ad}.hayvan_id = h.id" if sahip_id is not None else ""
+        return f"SELECT COUNT(*) FROM {kaynak}{katilim}{nerede}", tuple(veri)
+    # Tarih aralığı yoksa tablo baştan sona okunup sıralanır: tüm satırları tarih indeksi sırasıyla
+    # tek tek ziyaret etmek (+ ile indeks sıralaması kapatılmazsa) iki kat yavaş
+    sira = tarih_sutunu if baslangic is not None or bitis is not None else "+" + tarih_sutunu
+    return (f"SELECT {sutunlar} FROM {kaynak}"
+            f" JOIN hayvanlar h ON {takma_ad}.hayvan_id = h.id JOIN sahipler s ON h.sahip_id = s.id"
+            f"{nerede} ORDER BY {sira}, {takma_ad}.id"), tuple(veri)
+
+
+# --- Tekil kayıt işlemleri (servisler.py) ---
+# SELECT'ler servisler.py'deki kayıt sınıflarının alan sırasıyla döner
+SAHIP_GETIR = "SELECT id, isim, telefon, adres FROM sahipler WHERE id = %s"
+SAHIP_EKLE = "INSERT INTO sahipler (isim, telefon, adres) VALUES (%s, %s, %s)"
+SAHIP_GUNCELLE = "UPDATE sahipler SET isim = %s, telefon = %s, adres = %s WHERE id = %s"
+SAHIP_SIL = "DELETE FROM sahipler WHERE id = %s"
+
+HAYVAN_EKLE = """
+    INSERT INTO hayvanlar (isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id, notlar)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+HAYVAN_GUNCELLE = """
+    UPDATE hayvanlar SET isim = %s, tur = %s, cins = %s, dogum_tarihi = %s, gelis_sebebi = %s, sahip_id = %s, notlar = %s
+    WHERE id = %s
+"""
+HAYVAN_NOTLARI = "UPDATE hayvanlar SET notlar = %s WHERE id = %s"
+HAYVAN_SIL = "DELETE FROM hayvanlar WHERE id = %s"
+
+ASI_GETIR = "SELECT id, hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi, notlar FROM asi_takip WHERE id = %s"
+ASI_EKLE = """
+    INSERT INTO asi_takip (hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi, notlar)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+ASI_GUNCELLE = """
+    UPDATE asi_takip SET hayvan_id = %s, asi_adi = %s, asi_tarihi = %s, sonraki_asi_tarihi = %s, notlar = %s
+    WHERE id = %s
+"""
+ASI_SIL = "DELETE FROM asi_takip WHERE id = %s"
+
+RANDEVU_GETIR = """
+    SELECT id, hayvan_id, randevu_tarihi, aciklama, durum, sure_dakika, veteriner, oda
+    FROM randevular WHERE id = %s
+"""
+RANDEVU_EKLE = """
+    INSERT INTO randevular (hayvan_id, randevu_tarihi, aciklama, durum, sure_dakika, veteriner, oda)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+RANDEVU_GUNCELLE = """
+    UPDATE randevular SET hayvan_id = %s, randevu_tarihi = %s, aciklama = %s, durum = %s,
+    sure_dakika = %s, veteriner = %s, oda = %s WHERE id = %s
+"""
+RANDEVU_SIL = "DELETE FROM randevular WHERE id = %s"
+
+MUAYENE_GETIR = """
+    SELECT id, hayvan_id, muayene_tarihi, sikayet, bulgular, teshis, tedavi_plani
+    FROM muayeneler WHERE id = %s
+"""
+MUAYENE_EKLE = """
+    INSERT INTO muayeneler (hayvan_id, muayene_tarihi, sikayet, bulgular, teshis, tedavi_plani)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+MUAYENE_GUNCELLE = """
+    UPDATE muayeneler SET hayvan_id = %s, muayene_tarihi = %s, sikayet = %s, bulgular = %s, teshis = %s,
+    tedavi_plani = %s WHERE id = %s
+"""
+MUAYENE_SIL = "DELETE FROM muayeneler WHERE id = %s"
+
+
+# --- Kontroller ---
+# Çakışma denetimi için bir güne değen randevular (cakisma.CakismaDenetcisi)
+RANDEVU_ARALIGI = """
+    SELECT id, randevu_tarihi, sure_dakika, veteriner, oda FROM randevular
+    WHERE randevu_tarihi > %s AND randevu_tarihi < %s AND durum != 'İptal Edildi'
+"""
+# Takvim görünümü: görünen günlerin randevuları (randevu_tarihi indeksi üzerinden aralık taraması)
+RANDEVU_TAKVIMI = """
+    SELECT r.id, r.randevu_tarihi, r.sure_dakika, h.isim, r.veteriner, r.oda, r.aciklama, r.durum
+    FROM randevular r
+    JOIN hayvanlar h ON r.hayvan_id = h.id
+    WHERE r.randevu_tarihi >= %s AND r.randevu_tarihi < %s
+    ORDER BY r.randevu_tarihi, r.id
+"""
+SAHIBIN_HAYVAN_SAYISI = "SELECT COUNT(*) FROM hayvanlar WHERE sahip_id = %s"
+
+
+def _sayfa(sablon, id_sutunu):
+    """Şablondan SayfaliListe'nin ürettiği ileri sayfa sorgusunu üretir."""
+    if isinstance(sablon, dict):
+        return {lehce: _sayfa(motor_sablonu, id_sutunu) for lehce, motor_sablonu in sablon.items()}
+    return sablon.format(kosul=f"{id_sutunu} > %s", yon="ASC")
+
+
+def _degisim(sablon, id_sutunu, degisim):
+    """Şablondan SayfaliListe.tazele()'nin ürettiği değişiklik sorgusunu üretir."""
+    if isinstance(sablon, dict):
+        return {lehce: _degisim(motor_sablonu, id_sutunu, degisim) for lehce, motor_sablonu in sablon.items()}
+    return sablon.format(kosul=f"{id_sutunu} >= %s AND {id_sutunu} <= %s AND {degisim}", yon="ASC")
+
+
+def _lehce_basina(uretec, *args):
+    """uretec(lehce, *args) -> (sorgu, veri) için ({lehce: sorgu}, {lehce: veri})."""
+    sonuclar = {lehce: uretec(lehce, *args) for lehce in ("mysql", "sqlite")}
+    return ({lehce: sorgu for lehce, (sorgu, _) in sonuclar.items()},
+            {lehce: veri for lehce, (_, veri) in sonuclar.items()})
+
+
+_ZAMAN = "2000-01-01 00:00:00"
+
+# Plan denetiminde EXPLAIN edilen sorgular: (ad, sorgu veya {lehce: sorgu}, örnek parametreler veya
+# {lehce: parametreler}). Buradaki sabitler ve fonksiyonlar dışında sorgu eklenirse buraya da eklenmeli;
+# INSERT ... VALUES tablo okumadığı için denetlenmez.
+DENETLENECEK_SORGULAR = [
+    ("Sahip listesi sayfası", _sayfa(SAHIP_SAYFASI, "id"), (0, 200)),
+    ("Hayvan listesi sayfası", _sayfa(HAYVAN_SAYFASI, "h.id"), (0, 200)),
+    ("Randevu listesi sayfası", _sayfa(RANDEVU_SAYFASI, "r.id"), (0, 200)),
+    ("Muayene listesi sayfası", _sayfa(MUAYENE_SAYFASI, "m.id"), (0, 200)),
+    ("Sahip listesi değişiklikleri", _degisim(SAHIP_SAYFASI, "id", SAHIP_DEGISIMI), (0, 1000, _ZAMAN, 1000)),
+    ("Hayvan listesi değişiklikleri", _degisim(HAYVAN_SAYFASI, "h.id", HAYVAN_DEGISIMI), (0, 1000, _ZAMAN, _ZAMAN, 1000)),
+    ("Randevu listesi değişiklikleri", _degisim(RANDEVU_SAYFASI, "r.id", RANDEVU_DEGISIMI), (0, 1000, _ZAMAN, _ZAMAN, 1000)),
+    ("Muayene listesi değişiklikleri", _degisim(MUAYENE_SAYFASI, "m.id", MUAYENE_DEGISIMI), (0, 1000, _ZAMAN, _ZAMAN, 1000)),
+    ("Silinen kayıtlar", SILINEN_KAYITLAR, ("hayvanlar", _ZAMAN)),
+    ("Yaklaşan aşılar", YAKLASAN_ASILAR, ("2000-01-01", "2000-01-31")),
+    ("Hayvan detayı", HAYVAN_DETAYI, (1,)),
+    ("Aşı geçmişi", ASI_GECMISI, (1,)),
+    ("Randevu geçmişi", RANDEVU_GECMISI, (1,)),
+    ("Muayene geçmişi", MUAYENE_GECMISI, (1,)),
+    ("Randevu çakışması (gün)", RANDEVU_ARALIGI, (_ZAMAN, "2000-01-02 00:00:00")),
+    ("Randevu takvimi (hafta)", RANDEVU_TAKVIMI, (_ZAMAN, "2000-01-08 00:00:00")),
+    ("Sahibin hayvan sayısı", SAHIBIN_HAYVAN_SAYISI, (1,)),
+    ("Hayvan seçici (isim)", *hayvan_secici_aramasi("Pamuk Ali")),
+    ("Hayvan seçici (id)", *hayvan_secici_aramasi("ID:1")),
+    ("İçe aktarma sahip eşleştirme", *sahipler_telefonla(["05550000000", "05551111111"])),
+    ("Muayene dışa aktarma (tarih)", *disa_aktarma_sorgusu("muayeneler", date(2000, 1, 1), date(2000, 12, 31))),
+    ("Aşı dışa aktarma (tarih)", *disa_aktarma_sorgusu("asi_takip", date(2000, 1, 1), date(2000, 12, 31))),
+    ("Muayene dışa aktarma (hayvan)", *disa_aktarma_sorgusu("muayeneler", hayvan_id=1)),
+    ("Aşı dışa aktarma (sahip)", *disa_aktarma_sorgusu("asi_takip", sahip_id=1)),
+    ("Muayene dışa aktarma (tümü)", *disa_aktarma_sorgusu("muayeneler")),
+    ("Muayene dışa aktarma sayımı (tarih)", *disa_aktarma_sorgusu("muayeneler", date(2000, 1, 1), date(2000, 12, 31),
+                                                                  sayim=True)),
+    ("Aşı dışa aktarma sayımı (sahip)", *disa_aktarma_sorgusu("asi_takip", sahip_id=1, sayim=True)),
+    ("Muayene araması", *_lehce_basina(muayene_aramasi, "kulak ağrı")),
+    ("Hayvanın muayene araması", *_lehce_basina(muayene_aramasi, "kulak", 1)),
+    ("Sahip seçenekleri", SAHIP_SECENEKLERI, ()),
+    ("İçe aktarma sahip id kontrolü", *sahipler_idyle([1, 2])),
+    ("Sahip getir", SAHIP_GETIR, (1,)),
+    ("Sahip güncelle", SAHIP_GUNCELLE, ("a", "b", None, 1)),
+    ("Sahip sil", SAHIP_SIL, (1,)),
+    ("Hayvan güncelle", HAYVAN_GUNCELLE, ("a", "b", "c", "2000-01-01", "Aşı", 1, None, 1)),
+    ("Hayvan notları", HAYVAN_NOTLARI, (None, 1)),
+    ("Hayvan sil", HAYVAN_SIL, (1,)),
+    ("Aşı getir", ASI_GETIR, (1,)),
+    ("Aşı güncelle", ASI_GUNCELLE, (1, "a", "2000-01-01", None, None, 1)),
+    ("Aşı sil", ASI_SIL, (1,)),
+    ("Randevu getir", RANDEVU_GETIR, (1,)),
+    ("Randevu güncelle", RANDEVU_GUNCELLE, (1, _ZAMAN, None, "Planlandı", 15, None, None, 1)),
+    ("Randevu sil", RANDEVU_SIL, (1,)),
+    ("Muayene getir", MUAYENE_GETIR, (1,)),
+    ("Muayene güncelle", MUAYENE_GUNCELLE, (1, _ZAMAN, None, None, None, None, 1)),
+    ("Muayene sil", MUAYENE_SIL, (1,)),
+]
+
+# Bilerek tüm tabloyu okuyan sorgular: (denetim adı, plandaki tablo veya takma ad); plan_denetimi bildirmez
+BILEREK_TARANANLAR = {
+    ("Sahip seçenekleri", "sahipler"),      # Form seçim listesi tüm sahipleri bir kez yükler (SecenekOnbellegi)
+    ("Muayene dışa aktarma (tümü)", "m"),   # Filtresiz dışa aktarma tablonun tamamını okur
+}
@@ -0,0 +1,557 @@
+"""
+Çok iş istasyonlu kurulumlar için yerel API sunucusu.
+
+Her iş istasyonu kendi veritabanı bağlantılarını açıp aynı listeleri ayrı ayrı
+okumak yerine bu sunucuya bağlanabilir (ayarlar.py'de VERITABANI_MOTORU =
+"istemci"). Veritabanına yalnızca sunucunun havuzu açılır; aynı okumalar iş
+istasyonu sayısından bağımsız olarak bir kez yapılır ve yanıt önbelleğinden
+karşılanır. Sunucu tek bir asyncio döngüsüdür; sorgular havuz boyutu kadar iş
+parçacığı olan bir yürütücüde çalışır.
+
+Uç noktalar:
+
+    veritabani.IstemciVeritabani için (gövdeler veritabani.json_kodla biçiminde):
+        GET  /saglik     -> {"lehce"}
+        GET  /zaman      -> {"zaman"}
+        POST /sorgu      {"sorgu", "veri"} -> {"satirlar"}; yalnızca tek bir SELECT, salt okunur bağlantıda
+        POST /yaz        {"sorgu", "veri"} -> {"etkilenen", "son_id"}; yalnızca kayıt tablolarına
+        POST /akis       {"sorgu", "veri", "parti_boyutu"} -> her satırda {"parti": [...]} (chunked)
+
+    Diğer araçlar için (tarihler ISO metni; kaynak: sahipler, hayvanlar, asilar,
+    randevular, muayeneler):
+        GET    /{kaynak}?son_id=0&adet=200   -> {"sutunlar", "satirlar", "sonraki"}
+        GET    /{kaynak}/{id}                -> kayıt
+        POST   /{kaynak}                     -> {"id"}
+        PUT    /{kaynak}/{id}                -> {"guncellendi"}
+        DELETE /{kaynak}/{id}                -> {"silindi"}
+        GET    /hayvanlar/{id}/{asilar|randevular|muayeneler}
+        GET    /asilar/yaklasan?gun=30
+        GET    /muayeneler/ara?metin=...&hayvan_id=...
+        GET    /durum                        -> havuz ve önbellek istatistikleri
+
+Okuma yanıtları okudukları tablolarla etiketlenip bayt olarak saklanır; bir
+tabloya yazılınca (tetikleyicilerin ve ON DELETE CASCADE'in değiştirdikleri
+dahil) o tabloları okuyan yanıtlar atılır. Sunucuyu atlayarak yazan araçlar
+(ice_aktarma.py, veri_uretici.py) için yanıtlar ayrıca onbellek_suresi sonunda
+eskir. Aynı anda gelen aynı okuma veritabanına bir kez gider.
+
+Sunucu varsayılan olarak yalnızca bu bilgisayardan bağlantı kabul eder. /sorgu
+herhangi bir SELECT'i çalıştırdığından diğer iş istasyonları için host
+"0.0.0.0" yapılırken bir anahtar da belirlenmelidir; istemciler onu
+X-Api-Anahtari başlığıyla gönderir.
+
+Kullanım:
+    python sunucu.py [--host 0.0.0.0] [--port 8765] [--motor mysql] [--anahtar GIZLI]
+"""
+import argparse
+import asyncio
+import hmac
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from decimal import Decimal
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from sema import HAYVAN_ALT_TABLOLARI, TAKIP_EDILEN_TABLOLAR, gocleri_uygula, silinme_izlerini_temizle
+from servisler import SAYFA_BOYUTU, KaynakYok, Servisler
+from veritabani import VeritabaniHatasi, json_coz, json_kodla, yazilan_tablo
+
+EN_FAZLA_ADET = 1000            # Bir sayfada istenebilecek en fazla satır
+EN_UZUN_YAKLASAN_SURESI = 366   # Gün
+EN_FAZLA_BASLIK = 100
+PARTI_KUYRUGU = 4               # /akis: istemciye yazılmayı bekleyen en fazla parti
+
+# Bir tabloya yazmak tetikleyiciler ve ON DELETE CASCADE ile bu tabloları da değiştirir (sema.py)
+YAN_ETKILER = {tablo: {tablo, "silinen_kayitlar"} for tablo in TAKIP_EDILEN_TABLOLAR}
+YAN_ETKILER["hayvanlar"].update(HAYVAN_ALT_TABLOLARI, ("asi_durumu", "muayene_arama"))
+YAN_ETKILER["asi_takip"].add("asi_durumu")
+YAN_ETKILER["muayeneler"].add("muayene_arama")
+BILINEN_TABLOLAR = frozenset().union(*YAN_ETKILER.values())
+
+# REST kaynaklarının okuduğu tablolar (sorgular.py'deki birleştirmeler)
+KAYNAK_TABLOLARI = {
+    "sahipler": frozenset(("sahipler",)),
+    "hayvanlar": frozenset(("hayvanlar", "sahipler")),
+    "asilar": frozenset(("asi_takip", "asi_durumu", "hayvanlar")),
+    "randevular": frozenset(("randevular", "hayvanlar")),
+    "muayeneler": frozenset(("muayeneler", "muayene_arama", "hayvanlar")),
+}
+SALT_OKUNUR_ALANLAR = ("id", "sahip_isim")  # GET ile gelen kayıt olduğu gibi PUT edilebilsin
+
+# WITH kabul edilmez: "WITH ... DELETE" de bir yazmadır. Sorgular ayrıca salt okunur bağlantıda çalışır.
+_OKUMA_KALIBI = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+_YAN_ETKILI_OKUMA = re.compile(r"\b(?:INTO|FOR\s+UPDATE|LOCK\s+IN\s+SHARE\s+MODE)\b", re.IGNORECASE)
+_KELIME = re.compile(r"\w+")
+
+
+class IstekHatasi(Exception):
+    """İstemciye verilen HTTP durum koduyla dönecek hata."""
+    def __init__(self, durum, mesaj, baslik="Geçersiz İstek"):
+        super().__init__(mesaj)
+        self.durum = durum
+        self.mesaj = mesaj
+        self.baslik = baslik
+
+
+def okunan_tablolar(sorgu):
+    """Sorgunun adını geçirdiği bilinen tablolar; fazladan tablo yalnızca gereksiz yere geçersiz kılar."""
+    return frozenset(kelime.lower() for kelime in _KELIME.findall(sorgu)) & BILINEN_TABLOLAR
+
+
+def _tek_ifade(sorgu):
+    # Sürücü birden çok ifadeyi çalıştırabilir; /sorgu ile /yaz yalnızca tek ifade kabul eder
+    if not isinstance(sorgu, str) or ";" in sorgu.rstrip().rstrip(";"):
+        raise IstekHatasi(400, "Tek bir SQL ifadesi gönderilmelidir.")
+    return sorgu
+
+
+def _rest_degeri(nesne):
+    if isinstance(nesne, date):
+        return nesne.isoformat()
+    if isinstance(nesne, Decimal):
+        return str(nesne)
+    raise TypeError(f"JSON'a çevrilemeyen değer: {type(nesne).__name__}")
+
+
+def rest_kodla(nesne):
+    return json.dumps(nesne, default=_rest_degeri, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _hata_govdesi(baslik, mesaj, kod=None):
+    return json_kodla({"hata": {"baslik": baslik, "mesaj": mesaj, "kod": kod}})
+
+
+def _sayi(parametreler, ad, varsayilan=None):
+    deger = parametreler.get(ad, [None])[0]
+    if deger is None:
+        return varsayilan
+    try:
+        return int(deger)
+    except ValueError:
+        raise IstekHatasi(400, f"{ad} bir tam sayı olmalıdır.") from None
+
+
+class YanitOnbellegi:
+    """Okunan tablolarla etiketli, boyutu ve ömrü sınırlı yanıt önbelleği (iş parçacığı güvenli)."""
+    def __init__(self, en_fazla_bayt=64 << 20, yasam_suresi=10):
+        self.en_fazla_bayt = en_fazla_bayt
+        self.yasam_suresi = yasam_suresi
+        self._kilit = threading.Lock()
+        self._kayitlar = OrderedDict()  # anahtar -> (zaman, tablolar, baytlar); en uzun süredir kullanılmayan başta
+        self._toplam = 0
+        self.surum = 0                  # Her yazmada artar; okuma sırasında yazılırsa sonuç saklanmaz
+        self.istatistik = {"isabet": 0, "iska": 0, "birlesen": 0, "gecersiz_kilinan": 0}
+
+    def al(self, anahtar):
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is not None and time.monotonic() - kayit[0] >= self.yasam_suresi:
+                self._at(anahtar)
+                kayit = None
+            if kayit is None:
+                self.istatistik["iska"] += 1
+                return None
+            self._kayitlar.move_to_end(anahtar)
+            self.istatistik["isabet"] += 1
+            return kayit[2]
+
+    def koy(self, anahtar, tablolar, govde, surum):
+        with self._kilit:
+            if surum != self.surum or len(govde) > self.en_fazla_bayt // 8:
+                return
+            self._at(anahtar)
+            self._kayitlar[anahtar] = (time.monotonic(), tablolar, govde)
+            self._toplam += len(govde)
+            while self._toplam > self.en_fazla_bayt:
+                self._at(next(iter(self._kayitlar)))
+
+    def gecersiz_kil(self, tablolar=None):
+        """tablolar'dan birini okuyan yanıtları atar; tablolar None ise hepsini."""
+        with self._kilit:
+            self.surum += 1
+            atilacaklar = [anahtar for anahtar, (_, okunan, _) in self._kayitlar.items()
+                           if tablolar is None or okunan & tablolar]
+            for anahtar in atilacaklar:
+                self._at(anahtar)
+            self.istatistik["gecersiz_kilinan"] += len(atilacaklar)
+
+    def durum(self):
+        with self._kilit:
+            return dict(self.istatistik, kayit=len(self._kayitlar), bayt=self._toplam)
+
+    def _at(self, anahtar):
+        kayit = self._kayitlar.pop(anahtar, None)
+        if kayit is not None:
+            self._toplam -= len(kayit[2])
+
+
+class Sunucu:
+    def __init__(self, db, anahtar=None, onbellek=None, en_buyuk_govde=1 << 20, bosta_kalma_suresi=60):
+        """
+        :param db: Tüm istemcilerin paylaştığı (havuzlu) Veritabani.
+        :param anahtar: Verilirse her istekte X-Api-Anahtari başlığıyla gönderilmelidir.
+        :param onbellek: YanitOnbellegi; verilmezse varsayılan ayarlarla oluşturulur.
+        :param en_buyuk_govde: Kabul edilecek en büyük istek gövdesi (bayt).
+        :param bosta_kalma_suresi: Saniye; bu kadar istek göndermeyen istemcinin bağlantısı kapatılır.
+        """
+        self.db = db
+        self.servis = Servisler(db)
+        self.anahtar = anahtar
+        self.onbellek = onbellek or YanitOnbellegi()
+        self.en_buyuk_govde = en_buyuk_govde
+        self.bosta_kalma_suresi = bosta_kalma_suresi
+        # Havuzdan fazla iş parçacığı bağlantı beklemekten başka bir şey yapamaz
+        self.yurutucu = ThreadPoolExecutor(max_workers=db.havuz.boyut, thread_name_prefix="sunucu")
+        self._bekleyenler = {}  # anahtar -> asyncio.Future; aynı okumayı bekleyen istekler
+        self.istek_sayisi = 0
+        db.yazma_dinleyicisi_ekle(self._yazildi)
+
+    def _yazildi(self, tablo):
+        self.onbellek.gecersiz_kil(YAN_ETKILER.get(tablo))
+
+    async def calistir(self, host, port):
+        sunucu = await asyncio.start_server(self._istemci, host, port)
+        adresler = ", ".join(f"{soket.getsockname()[0]}:{soket.getsockname()[1]}" for soket in sunucu.sockets)
+        print(f"API sunucusu {adresler} adresinde dinliyor ({self.db.lehce}).", file=sys.stderr)
+        try:
+            async with sunucu:
+                await sunucu.serve_forever()
+        finally:
+            self.yurutucu.shutdown(wait=True, cancel_futures=True)
+
+    # --- HTTP ---
+    async def _istemci(self, okuyucu, yazici):
+        """Bir istemci bağlantısındaki istekleri sırayla (keep-alive) yanıtlar."""
+        try:
+            while True:
+                try:
+                    istek = await asyncio.wait_for(self._istek_oku(okuyucu), self.bosta_kalma_suresi)
+                except IstekHatasi as err:
+                    await self._yanit_yaz(yazici, err.durum, _hata_govdesi(err.baslik, err.mesaj), kapat=True)
+                    break
+                if istek is None:
+                    break
+                yontem, hedef, surum, basliklar, govde = istek
+                kapat = basliklar.get("connection", "").lower() == "close" or surum != "HTTP/1.1"
+                self.istek_sayisi += 1
+                if yontem == "POST" and urlsplit(hedef).path == "/akis":
+                    await self._akis(yazici, basliklar, govde, kapat)
+                else:
+                    durum, cevap = await self._yanitla(yontem, hedef, basliklar, govde)
+                    await self._yanit_yaz(yazici, durum, cevap, kapat)
+                if kapat:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            yazici.close()
+
+    async def _istek_oku(self, okuyucu):
+        """:return: (yöntem, hedef, HTTP sürümü, başlıklar, gövde) veya istemci bağlantıyı kapattıysa None."""
+        try:
+            satir = await okuyucu.readline()
+            if not satir:
+                return None
+            try:
+                yontem, hedef, surum = satir.decode("latin-1").split()
+            except ValueError:
+                raise IstekHatasi(400, "Geçersiz istek satırı.") from None
+            basliklar = {}
+            while True:
+                satir = await okuyucu.readline()
+                if satir in (b"\r\n", b"\n", b""):
+                    break
+                if len(basliklar) >= EN_FAZLA_BASLIK:
+                    raise IstekHatasi(431, "Çok fazla başlık.")
+                ad, _, deger = satir.decode("latin-1").partition(":")
+                basliklar[ad.strip().lower()] = deger.strip()
+        except (ValueError, asyncio.LimitOverrunError):
+            raise IstekHatasi(400, "İstek satırı veya başlık çok uzun.") from None
+
+        if "transfer-encoding" in basliklar:
+            raise IstekHatasi(411, "İstek gövdesi Content-Length ile gönderilmelidir.")
+        try:
+            uzunluk = int(basliklar.get("content-length") or 0)
+        except ValueError:
+            raise IstekHatasi(400, "Geçersiz Content-Length.") from None
+        if not 0 <= uzunluk <= self.en_buyuk_govde:
+            raise IstekHatasi(413, f"İstek gövdesi en fazla {self.en_buyuk_govde} bayt olabilir.")
+        govde = await okuyucu.readexactly(uzunluk) if uzunluk else b""
+        return yontem.upper(), hedef, surum.upper(), basliklar, govde
+
+    @staticmethod
+    def _baslik_satirlari(durum, kapat, *ekler):
+        satirlar = [f"HTTP/1.1 {durum} {HTTPStatus(durum).phrase}", "Content-Type: application/json; charset=utf-8",
+                    *ekler]
+        if kapat:
+            satirlar.append("Connection: close")
+        return ("\r\n".join(satirlar) + "\r\n\r\n").encode("latin-1")
+
+    async def _yanit_yaz(self, yazici, durum, govde, kapat):
+        yazici.write(self._baslik_satirlari(durum, kapat, f"Content-Length: {len(govde)}") + govde)
+        await yazici.drain()
+
+    def _yetkili_mi(self, basliklar):
+        if not self.anahtar:
+            return True
+        return hmac.compare_digest(basliklar.get("x-api-anahtari", "").encode(), self.anahtar.encode())
+
+    async def _yanitla(self, yontem, hedef, basliklar, govde):
+        """:return: (HTTP durum kodu, yanıt gövdesi)"""
+        try:
+            if not self._yetkili_mi(basliklar):
+                raise IstekHatasi(401, "API anahtarı eksik veya yanlış.", "Yetkisiz")
+            return 200, await self._yonlendir(yontem, hedef, govde)
+        except IstekHatasi as err:
+            return err.durum, _hata_govdesi(err.baslik, err.mesaj)
+        except (ValueError, TypeError) as err:
+            # Servis doğrulamaları, çözülemeyen JSON ve yanlış alan adları
+            return 400, _hata_govdesi("Geçersiz Veri", str(err))
+        except KaynakYok as err:
+            return 404, _hata_govdesi("Bulunamadı", str(err))
+        except VeritabaniHatasi as err:
+            return 500, _hata_govdesi(err.baslik, err.mesaj, err.kod)
+
+    async def _calistir(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.yurutucu, fn, *args)
+
+    async def _onbellekli(self, anahtar, tablolar, hesapla):
+        """hesapla()'nın yanıt baytlarını önbellekten verir; aynı anahtar zaten hesaplanıyorsa onu bekler."""
+        govde = self.onbellek.al(anahtar)
+        if govde is not None:
+            return govde
+        bekleyen = self._bekleyenler.get(anahtar)
+        if bekleyen is not None:
+            self.onbellek.istatistik["birlesen"] += 1
+            return await asyncio.shield(bekleyen)
+
+        bekleyen = self._bekleyenler[anahtar] = asyncio.get_running_loop().create_future()
+        surum = self.onbellek.surum
+        try:
+            govde = await self._calistir(hesapla)
+        except BaseException as err:
+            bekleyen.set_exception(err)
+            bekleyen.exception()  # Bekleyen yoksa "exception was never retrieved" uyarısı çıkmasın
+            raise
+        finally:
+            del self._bekleyenler[anahtar]
+        self.onbellek.koy(anahtar, tablolar, govde, surum)
+        bekleyen.set_result(govde)
+        return govde
+
+    # --- Yönlendirme ---
+    async def _yonlendir(self, yontem, hedef, govde):
+        adres = urlsplit(hedef)
+        yol = [parca for parca in adres.path.split("/") if parca]
+        parametreler = parse_qs(adres.query)
+
+        if yontem == "GET" and yol == ["saglik"]:
+            return json_kodla({"lehce": self.db.lehce})
+        if yontem == "GET" and yol == ["zaman"]:
+            # Yanıtlar önbellekte yasam_suresi kadar eski olabilir; SayfaliListe'nin değişiklik
+            # sorguları o kadar geriden başlasın ki önbellekten verilen sayfadan sonraki yazmalar kaçmasın
+            zaman = await self._calistir(self.db.sunucu_zamani)
+            return json_kodla({"zaman": zaman - timedelta(seconds=self.onbellek.yasam_suresi)})
+        if yontem == "GET" and yol == ["durum"]:
+            return rest_kodla({"istek": self.istek_sayisi, "havuz": self.db.havuz.istatistik,
+                               "onbellek": self.onbellek.durum()})
+        if yontem == "POST" and yol == ["sorgu"]:
+            sorgu, veri = self._okuma_istegi(govde)
+            return await self._onbellekli(("sorgu", govde), okunan_tablolar(sorgu),
+                                          lambda: json_kodla({"satirlar": self.db.sorgu(sorgu, veri, fetch_results=True,
+                                                                                      salt_okunur=True)}))
+        if yontem == "POST" and yol == ["yaz"]:
+            return await self._yaz(govde)
+        if yol and yol[0] in KAYNAK_TABLOLARI:
+            return await self._kaynak(yontem, hedef, yol, parametreler, govde)
+        raise IstekHatasi(404, f"Bilinmeyen adres: {yontem} {adres.path}", "Bulunamadı")
+
+    @staticmethod
+    def _okuma_istegi(govde):
+        istek = json_coz(govde)
+        sorgu = _tek_ifade(istek.get("sorgu"))
+        if not _OKUMA_KALIBI.match(sorgu) or _YAN_ETKILI_OKUMA.search(sorgu):
+            raise IstekHatasi(403, "Bu adresten yalnızca okuma sorguları çalıştırılabilir.", "İzin Verilmedi")
+        return sorgu, tuple(istek.get("veri") or ())
+
+    async def _yaz(self, govde):
+        istek = json_coz(govde)
+        sorgu = _tek_ifade(istek.get("sorgu"))
+        if yazilan_tablo(sorgu) not in TAKIP_EDILEN_TABLOLAR:
+            raise IstekHatasi(403, f"Yalnızca şu tablolara yazılabilir: {', '.join(TAKIP_EDILEN_TABLOLAR)}.",
+                              "İzin Verilmedi")
+        etkilenen, son_id = await self._calistir(self.db.yaz, sorgu, tuple(istek.get("veri") or ()))
+        return json_kodla({"etkilenen": etkilenen, "son_id": son_id})
+
+    async def _kaynak(self, yontem, hedef, yol, parametreler, govde):
+        kaynak = yol[0]
+        servis = getattr(self.servis, kaynak)
+        tablolar = KAYNAK_TABLOLARI[kaynak]
+
+        def okuma(hesapla):
+            return self._onbellekli(("rest", hedef), tablolar, lambda: rest_kodla(hesapla()))
+
+        if len(yol) == 1 and yontem == "GET":
+            adet = min(max(_sayi(parametreler, "adet", SAYFA_BOYUTU), 1), EN_FAZLA_ADET)
+            son_id = _sayi(parametreler, "son_id", 0)
+
+            def sayfa():
+                satirlar, sonraki = servis.sayfa(son_id, adet)
+                return {"sutunlar": servis.liste_sutunlari, "satirlar": satirlar, "sonraki": sonraki}
+            return await okuma(sayfa)
+        if len(yol) == 1 and yontem == "POST":
+            alanlar = self._alanlar(govde)
+            return rest_kodla({"id": await self._calistir(lambda: servis.ekle(**alanlar))})
+
+        if len(yol) == 2 and kaynak == "asilar" and yol[1] == "yaklasan" and yontem == "GET":
+            gun = min(max(_sayi(parametreler, "gun", 30), 0), EN_UZUN_YAKLASAN_SURESI)
+
+            def yaklasanlar():
+                bugun = date.today()
+                return {"sutunlar": servis.yaklasan_sutunlari,
+                        "satirlar": [satir for parti in servis.yaklasanlar(bugun, bugun + timedelta(days=gun))
+                                     for satir in parti]}
+            return await okuma(yaklasanlar)
+        if len(yol) == 2 and kaynak == "muayeneler" and yol[1] == "ara" and yontem == "GET":
+            metin = parametreler.get("metin", [""])[0]
+            hayvan_id = _sayi(parametreler, "hayvan_id")
+            sutunlar = servis.liste_sutunlari if hayvan_id is None else servis.gecmis_sutunlari
+            return await okuma(lambda: {"sutunlar": sutunlar, "satirlar": servis.ara(metin, hayvan_id)})
+
+        try:
+            kayit_id = int(yol[1]) if len(yol) >= 2 else None
+        except ValueError:
+            kayit_id = None
+        if kayit_id is None:
+            raise IstekHatasi(404, f"Bilinmeyen adres: {yontem} /{'/'.join(yol)}", "Bulunamadı")
+
+        if len(yol) == 2 and yontem == "GET":
+            def getir():
+                kayit = servis.getir(kayit_id)
+                if kayit is None:
+                    raise IstekHatasi(404, f"{kayit_id} id'li kayıt bulunamadı.", "Bulunamadı")
+                return kayit.sozluk()
+            return await okuma(getir)
+        if len(yol) == 2 and yontem == "PUT":
+            alanlar = self._alanlar(govde)
+            return rest_kodla({"guncellendi": await self._calistir(lambda: servis.guncelle(kayit_id, **alanlar))})
+        if len(yol) == 2 and yontem == "DELETE":
+            return rest_kodla({"silindi": await self._calistir(servis.sil, kayit_id)})
+        if len(yol) == 3 and kaynak == "hayvanlar" and yol[2] in ("asilar", "randevular", "muayeneler") \
+                and yontem == "GET":
+            alt = getattr(self.servis, yol[2])
+            tablolar = tablolar | KAYNAK_TABLOLARI[yol[2]]
+            return await okuma(lambda: {"sutunlar": alt.gecmis_sutunlari, "satirlar": alt.gecmis(kayit_id)})
+        raise IstekHatasi(404, f"Bilinmeyen adres: {yontem} /{'/'.join(yol)}", "Bulunamadı")
+
+    @staticmethod
+    def _alanlar(govde):
+        alanlar = json.loads(govde or b"{}")
+        if not isinstance(alanlar, dict):
+            raise IstekHatasi(400, "İstek gövdesi bir JSON nesnesi olmalıdır.")
+        for alan in SALT_OKUNUR_ALANLAR:
+            alanlar.pop(alan, None)
+        return alanlar
+
+    # --- Akış ---
+    async def _akis(self, yazici, basliklar, govde, kapat):
+        """
+        sorgu_akisi partilerini üretildikçe satır başına bir JSON olarak (chunked) gönderir.
+        Kuyruk dolunca veritabanı iş parçacığı bekler; yavaş istemci için sonuç bellekte birikmez.
+        """
+        try:
+            if not self._yetkili_mi(basliklar):
+                raise IstekHatasi(401, "API anahtarı eksik veya yanlış.", "Yetkisiz")
+            sorgu, veri = self._okuma_istegi(govde)
+            parti_boyutu = min(max(int(json_coz(govde).get("parti_boyutu") or 500), 1), EN_FAZLA_ADET)
+        except IstekHatasi as err:
+            await self._yanit_yaz(yazici, err.durum, _hata_govdesi(err.baslik, err.mesaj), kapat)
+            return
+        except (ValueError, TypeError) as err:
+            await self._yanit_yaz(yazici, 400, _hata_govdesi("Geçersiz Veri", str(err)), kapat)
+            return
+
+        dongu = asyncio.get_running_loop()
+        kuyruk = asyncio.Queue(PARTI_KUYRUGU)
+        iptal = threading.Event()
+
+        def koy(parca):
+            asyncio.run_coroutine_threadsafe(kuyruk.put(parca), dongu).result()
+
+        def uret():
+            akis = self.db.sorgu_akisi(sorgu, veri, parti_boyutu, salt_okunur=True)
+            try:
+                for parti in akis:
+                    if iptal.is_set():
+                        break
+                    koy(json_kodla({"parti": parti}) + b"\n")
+            except VeritabaniHatasi as err:
+                koy(json_kodla({"hata": {"baslik": err.baslik, "mesaj": err.mesaj, "kod": err.kod}}) + b"\n")
+            finally:
+                akis.close()
+                koy(None)
+
+        gorev = dongu.run_in_executor(self.yurutucu, uret)
+        bitti = False
+        try:
+            yazici.write(self._baslik_satirlari(200, kapat, "Transfer-Encoding: chunked"))
+            while True:
+                parca = await kuyruk.get()
+                if parca is None:
+                    bitti = True
+                    break
+                yazici.write(b"%x\r\n%s\r\n" % (len(parca), parca))
+                await yazici.drain()
+            yazici.write(b"0\r\n\r\n")
+            await yazici.drain()
+        finally:
+            if not bitti:
+                # İstemci gitti; üretici kuyruğa koyabilsin ve bağlantıyı havuza geri versin
+                iptal.set()
+                while await kuyruk.get() is not None:
+                    pass
+            await gorev
+
+
+def main():
+    from ayarlar import SUNUCU_AYARLARI, veritabani_ac
+
+    parser = argparse.ArgumentParser(description="İş istasyonlarının paylaştığı yerel API sunucusu")
+    parser.add_argument("--host", default=SUNUCU_AYARLARI["host"])
+    parser.add_argument("--port", type=int, default=SUNUCU_AYARLARI["port"])
+    parser.add_argument("--motor", choices=("mysql", "sqlite"), default=SUNUCU_AYARLARI["motor"],
+                        help="Sunucunun bağlanacağı veritabanı motoru")
+    parser.add_argument("--anahtar", default=SUNUCU_AYARLARI["anahtar"],
+                        help="İstemcilerin X-Api-Anahtari başlığıyla göndereceği paylaşılan anahtar")
+    args = parser.parse_args()
+
+    db = veritabani_ac(args.motor)
+    try:
+        # İstemciler göç ve bakım işlerini yapmaz; hepsi burada bir kez çalışır
+        gocleri_uygula(db)
+        silinme_izlerini_temizle(db)
+        db.isit(db.havuz.boyut)
+        onbellek = YanitOnbellegi(SUNUCU_AYARLARI["onbellek_boyutu_mb"] << 20, SUNUCU_AYARLARI["onbellek_suresi"])
+        sunucu = Sunucu(db, args.anahtar, onbellek, bosta_kalma_suresi=SUNUCU_AYARLARI["bosta_kalma_suresi"])
+        asyncio.run(sunucu.calistir(args.host, args.port))
+        return 0
+    except KeyboardInterrupt:
+        return 0
+    except OSError as err:
+        print(f"Hata: {err}", file=sys.stderr)
+        return 2
+    except VeritabaniHatasi as err:
+        print(f"{err.baslik}: {err.mesaj}", file=sys.stderr)
+        return 2
+    finally:
+        db.kapat()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Randevu çakışma denetimi için testler (SQLite).
+
+    python -m pytest -q test_cakisma.py
+"""
+from datetime import datetime
+
+import pytest
+
+import sorgular
+from cakisma import CakismaDenetcisi
+from sema import gocleri_uygula
+from veritabani import veritabani_olustur
+
+SAAT_10 = datetime(2024, 3, 4, 10, 0)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = veritabani_olustur("sqlite", {"database": str(tmp_path / "klinik.db")})
+    gocleri_uygula(db)
+    yield db
+    db.kapat()
+
+
+@pytest.fixture
+def randevu(db):
+    """randevu(baslangic, veteriner=..., oda=...) aynı hayvana 30 dakikalık randevu ekler; id döndürür."""
+    _, sahip_id = db.yaz(sorgular.SAHIP_EKLE, ("Ali Veli", "5550000000", None))
+    _, hayvan_id = db.yaz(sorgular.HAYVAN_EKLE, ("Pamuk", "Kedi", "Tekir", None, None, sahip_id, None))
+
+    def ekle(baslangic, veteriner=None, oda=None):
+        _, randevu_id = db.yaz(sorgular.RANDEVU_EKLE, (hayvan_id, baslangic, None, "Planlandı", 30, veteriner, oda))
+        return randevu_id
+    return ekle
+
+
+def _idler(cakismalar):
+    return [cakisma.randevu_id for cakisma in cakismalar]
+
+
+def test_ayni_veteriner_cakisir_baskasi_cakismaz(db, randevu):
+    randevu_id = randevu(SAAT_10, veteriner="Ayşe")
+    denetci = CakismaDenetcisi(db)
+    assert _idler(denetci.cakismalar(SAAT_10, 15, veteriner="Ayşe")) == [randevu_id]
+    assert denetci.cakismalar(SAAT_10, 15, veteriner="Mehmet") == []
+
+
+def test_kaynaksiz_randevu_veterinerli_randevuyla_cakisir(db, randevu):
+    eski_id = randevu(SAAT_10)
+    denetci = CakismaDenetcisi(db)
+    assert _idler(denetci.cakismalar(SAAT_10, 15, veteriner="Ayşe")) == [eski_id]
+    assert _idler(denetci.cakismalar(SAAT_10, 15, oda="Oda 1")) == [eski_id]
+
+
+def test_kaynaksiz_yeni_randevu_tum_kaynaklarla_cakisir(db, randevu):
+    veterinerli_id = randevu(SAAT_10, veteriner="Ayşe")
+    odali_id = randevu(SAAT_10.replace(minute=15), oda="Oda 1")
+    denetci = CakismaDenetcisi(db)
+    assert _idler(denetci.cakismalar(SAAT_10, 30)) == [veterinerli_id, odali_id]
@@ -0,0 +1,74 @@
+"""
+Göçler ve sorgu planları için testler (SQLite).
+
+    python -m pytest -q test_sema.py
+"""
+import pytest
+
+import sorgular
+from sema import GOCLER, gocleri_uygula, plan_denetimi, uygulanmis_surumler
+from veritabani import veritabani_olustur
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = veritabani_olustur("sqlite", {"database": str(tmp_path / "klinik.db")})
+    gocleri_uygula(db)
+    yield db
+    db.kapat()
+
+
+def _sql_sabitleri():
+    """sorgular.py'deki tablo okuyan sabit sorgular: (ad, lehce, sorgu)."""
+    for ad, deger in vars(sorgular).items():
+        if not ad.isupper() or ad.startswith("_"):  # Alt çizgililer {sutunlar} şablonlarıdır
+            continue
+        if isinstance(deger, dict):
+            metinler = deger.items()
+        elif isinstance(deger, str):
+            metinler = (("mysql", deger), ("sqlite", deger))
+        else:
+            continue
+        for lehce, sorgu in metinler:
+            if not isinstance(sorgu, str):
+                continue
+            ilk_kelime = sorgu.split(None, 1)[0].upper() if sorgu.strip() else ""
+            # {kosul}'lu SayfaliListe şablonları _sayfa / _degisim ile denetlenir
+            if ilk_kelime in ("SELECT", "UPDATE", "DELETE") and "{kosul}" not in sorgu:
+                yield ad, lehce, sorgu
+
+
+def test_goclerin_hepsi_uygulanir(db):
+    with db.oturum() as oturum:
+        assert uygulanmis_surumler(oturum) == {surum for surum, _, _ in GOCLER}
+    assert gocleri_uygula(db) == []
+
+
+def test_elle_eklenmis_sutunlar_devralinir(tmp_path):
+    db = veritabani_olustur("sqlite", {"database": str(tmp_path / "elle.db")})
+    try:
+        gocleri_uygula(db, hedef=2)
+        with db.oturum() as oturum:
+            # 3. ve 6. göçlerin eklediği sütunlar elle kurulmuş şemada zaten var
+            oturum.calistir("ALTER TABLE sahipler ADD COLUMN guncellenme TIMESTAMP")
+            oturum.calistir("ALTER TABLE randevular ADD COLUMN veteriner TEXT")
+        assert gocleri_uygula(db) == [surum for surum, _, _ in GOCLER if surum > 2]
+    finally:
+        db.kapat()
+
+
+def test_sorgular_tam_tablo_taramasi_yapmaz(db):
+    assert plan_denetimi(db) == []
+
+
+def test_tum_sabit_sorgular_denetlenir():
+    denetlenenler = {(lehce, sorgular.lehceye_gore(sorgu, lehce))
+                     for _, sorgu, _ in sorgular.DENETLENECEK_SORGULAR for lehce in ("mysql", "sqlite")}
+    eksikler = [ad for ad, lehce, sorgu in _sql_sabitleri()
+                if ad != "DENETLENECEK_SORGULAR" and (lehce, sorgu) not in denetlenenler]
+    assert eksikler == []
+
+
+def test_bilerek_taranan_sorgular_denetimde_var():
+    adlar = {ad for ad, _, _ in sorgular.DENETLENECEK_SORGULAR}
+    assert {ad for ad, _ in sorgular.BILEREK_TARANANLAR} <= adlar
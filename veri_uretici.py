@@ -0,0 +1,234 @@
+"""
+Ölçümler için tekrarlanabilir örnek veri üretici.
+
+Aynı tohum ve `bugun` ile her çalıştırmada aynı sahip, hayvan, aşı, randevu ve
+muayene kayıtlarını üretir. Dağılımlar klinikteki gerçek veriye benzeyecek
+şekilde seçilmiştir: sahip başına çoğunlukla bir-iki hayvan, türe göre yıllık
+aşı programı, hafta içi ve cumartesi mesai saatlerinde çoğunlukla 15-30
+dakikalık, veteriner ve odası atanmış randevular, tamamlanan randevular için
+muayene kaydı. Yaklaşık 60.000 sahip, 100.000 hayvan ve 1.000.000 aşı kaydı
+üretir.
+
+Kayıtlar tablodaki en büyük id'nin devamından açık id'lerle, parti parti
+executemany ile ve her parti tek işlemde eklenir.
+
+Kullanım:
+    python veri_uretici.py --sahip-sayisi 60000 [--motor sqlite] [--tohum 42]
+"""
+import argparse
+import random
+from datetime import date, datetime, timedelta
+
+ISIMLER = ["Ahmet", "Mehmet", "Ayşe", "Fatma", "Mustafa", "Zeynep", "Ali", "Elif", "Hüseyin", "Emine",
+           "Hasan", "Hatice", "İbrahim", "Merve", "Murat", "Esra", "Ömer", "Büşra", "Emre", "Selin",
+           "Can", "Deniz", "Burak", "Ece", "Kemal", "Gül", "Serkan", "Derya", "Okan", "Sibel"]
+SOYISIMLER = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir",
+              "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek"]
+ILCELER = ["Kadıköy", "Üsküdar", "Beşiktaş", "Şişli", "Bakırköy", "Ataşehir", "Maltepe", "Sarıyer", "Beykoz", "Fatih"]
+HAYVAN_ISIMLERI = ["Pamuk", "Boncuk", "Karabaş", "Tarçın", "Zeytin", "Minnoş", "Duman", "Paşa", "Limon", "Fındık",
+                   "Max", "Luna", "Bella", "Çakıl", "Mia", "Oscar", "Şila", "Rocky", "Lokum", "Kömür"]
+
+# tür: (ağırlık, cinsler, yıllık aşı programı, ömür üst sınırı gün)
+TURLER = {
+    "Kedi": (45, ["Tekir", "Van Kedisi", "British Shorthair", "Scottish Fold", "Sarman", "Ankara Kedisi"],
+             ["Karma Aşı", "Kuduz", "Lösemi"], 6500),
+    "Köpek": (40, ["Golden Retriever", "Kangal", "Labrador", "Terrier", "Pug", "Melez"],
+              ["Karma Aşı", "Kuduz", "Bronşin", "Lyme"], 5500),
+    "Kuş": (8, ["Muhabbet Kuşu", "Kanarya", "Papağan"], ["Polyomavirüs"], 4000),
+    "Tavşan": (5, ["Hollanda Lop", "Aslan Baş", "Ankara Tavşanı"], ["Miksomatozis", "RHD"], 3000),
+    "Diğer": (2, ["Hamster", "Kaplumbağa", "Gelincik"], [], 2500),
+}
+GELIS_SEBEPLERI = {"Aşı": 35, "Kontrol": 30, "Yaralanma": 12, "Parazit": 13, "Diğer": 10}
+HAYVAN_SAYISI_AGIRLIKLARI = {1: 55, 2: 28, 3: 12, 4: 5}  # Sahip başına ortalama ~1,7 hayvan
+
+VETERINERLER = ["Dr. Ayşe Kaya", "Dr. Murat Demir", "Dr. Selin Aydın", "Dr. Okan Çetin"]
+ODALAR = ["Muayene 1", "Muayene 2", "Muayene 3", "Ameliyathane"]
+RANDEVU_SURELERI = {15: 60, 30: 30, 45: 6, 60: 4}
+RANDEVU_ACIKLAMALARI = ["Kontrol", "Aşı", "Pansuman", "Dikiş alma", "Kan tahlili", "Tırnak kesimi", "Diş kontrolü"]
+# (şikayet, bulgu, teşhis, tedavi planı)
+MUAYENE_SABLONLARI = [
+    ("İştahsızlık ve halsizlik", "Ateş {ates}°C, mukozalar soluk", "Gastroenterit",
+     "Serum tedavisi, {gun} gün diyet mama"),
+    ("Kaşıntı ve tüy dökülmesi", "Boyun ve sırt bölgesinde kızarıklık", "Dermatit",
+     "Antifungal şampuan, {gun} gün sonra kontrol"),
+    ("Topallama", "Sağ arka bacakta hassasiyet, şişlik yok", "Yumuşak doku zedelenmesi",
+     "{gun} gün ağrı kesici, hareket kısıtlaması"),
+    ("Kusma", "Karın palpasyonunda hassasiyet", "Yabancı cisim şüphesi",
+     "Röntgen çekildi, {gun} gün gözlem"),
+    ("Göz akıntısı", "Konjonktivada kızarıklık", "Konjonktivit", "Antibiyotikli göz damlası {gun} gün"),
+    ("Rutin kontrol", "Genel durum iyi, kilo {kilo} kg", "Sağlıklı", "Bir sonraki aşı takvimi hatırlatıldı"),
+    ("İç parazit", "Dışkı muayenesinde parazit yumurtası", "Endoparazit", "Antiparaziter, {gun} gün sonra tekrar"),
+]
+
+RANDEVU_BASLANGIC_SAATI = 9
+GUNLUK_RANDEVU_SAYISI = 36  # 09:00-18:00, 15 dakikada bir
+
+
+def _agirlikli(sozluk):
+    return list(sozluk), list(sozluk.values())
+
+
+def _randevu_zamani(rastgele, bugun, gun_araligi):
+    """bugun + [gun_araligi] içinde pazar dışı bir günün mesai saatindeki 15 dakikalık dilimi."""
+    gun = bugun + timedelta(days=rastgele.randint(*gun_araligi))
+    if gun.weekday() == 6:
+        gun += timedelta(days=1)
+    dilim = rastgele.randrange(GUNLUK_RANDEVU_SAYISI)
+    return datetime(gun.year, gun.month, gun.day, RANDEVU_BASLANGIC_SAATI) + timedelta(minutes=15 * dilim)
+
+
+class _Tamponlar:
+    """Tablo başına bekleyen satırlar; dolunca hepsi tek işlemde yazılır."""
+    SORGULAR = {
+        "sahipler": "INSERT INTO sahipler (id, isim, telefon, adres) VALUES (%s, %s, %s, %s)",
+        "hayvanlar": """INSERT INTO hayvanlar (id, isim, tur, cins, dogum_tarihi, gelis_sebebi, sahip_id, notlar)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
+        "asi_takip": """INSERT INTO asi_takip (id, hayvan_id, asi_adi, asi_tarihi, sonraki_asi_tarihi, notlar)
+                        VALUES (%s, %s, %s, %s, %s, %s)""",
+        "randevular": ("INSERT INTO randevular (id, hayvan_id, randevu_tarihi, aciklama, durum, sure_dakika, veteriner, oda) "
+                       "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"),
+        "muayeneler": """INSERT INTO muayeneler (id, hayvan_id, muayene_tarihi, sikayet, bulgular, teshis, tedavi_plani)
+                         VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+    }
+
+    def __init__(self, oturum, parti_boyutu):
+        self.oturum = oturum
+        self.parti_boyutu = parti_boyutu
+        self.satirlar = {tablo: [] for tablo in self.SORGULAR}  # Yabancı anahtar sırasıyla
+        self.sayilar = dict.fromkeys(self.SORGULAR, 0)
+
+    def sonraki_id(self, tablo):
+        return (self.oturum.calistir(f"SELECT MAX(id) FROM {tablo}", fetch_results=True)[0][0] or 0) + 1
+
+    def ekle(self, tablo, satir):
+        self.satirlar[tablo].append(satir)
+        if len(self.satirlar[tablo]) >= self.parti_boyutu:
+            self.yaz()
+
+    def yaz(self):
+        self.oturum.calistir("BEGIN")
+        try:
+            for tablo, satirlar in self.satirlar.items():
+                if satirlar:
+                    self.oturum.coklu_calistir(self.SORGULAR[tablo], satirlar)
+                    self.sayilar[tablo] += len(satirlar)
+                    satirlar.clear()
+            self.oturum.calistir("COMMIT")
+        except BaseException:
+            self.oturum.calistir("ROLLBACK")
+            raise
+
+
+def veri_uret(db, sahip_sayisi, tohum=42, bugun=None, parti_boyutu=5000, ilerleme=None):
+    """
+    Veritabanına sahip_sayisi kadar sahip ve onlara bağlı kayıtları ekler.
+    :param tohum: Aynı tohum ve bugun ile aynı veri üretilir.
+    :param bugun: Tarihlerin göreli alındığı gün (varsayılan: bugün); yaklaşan aşılar ve
+                  gelecekteki randevular bu güne göre dağıtılır.
+    :param parti_boyutu: Bir işlemde tablo başına eklenecek en fazla satır.
+    :param ilerleme: Verilirse her partiden sonra (eklenen_sahip, sahip_sayisi) ile çağrılır.
+    :return: Tablo -> eklenen satır sayısı.
+    """
+    rastgele = random.Random(tohum)
+    bugun = bugun or date.today()
+    turler, tur_agirliklari = _agirlikli({tur: bilgi[0] for tur, bilgi in TURLER.items()})
+    sebepler, sebep_agirliklari = _agirlikli(GELIS_SEBEPLERI)
+    hayvan_sayilari, hayvan_sayisi_agirliklari = _agirlikli(HAYVAN_SAYISI_AGIRLIKLARI)
+    sureler, sure_agirliklari = _agirlikli(RANDEVU_SURELERI)
+
+    with db.oturum() as oturum:
+        tampon = _Tamponlar(oturum, parti_boyutu)
+        idler = {tablo: tampon.sonraki_id(tablo) for tablo in tampon.SORGULAR}
+
+        def yeni_id(tablo):
+            kayit_id = idler[tablo]
+            idler[tablo] += 1
+            return kayit_id
+
+        for i in range(sahip_sayisi):
+            sahip_id = yeni_id("sahipler")
+            tampon.ekle("sahipler", (
+                sahip_id,
+                f"{rastgele.choice(ISIMLER)} {rastgele.choice(SOYISIMLER)}",
+                f"05{rastgele.randint(30, 55)}{rastgele.randint(0, 9999999):07d}",
+                f"{rastgele.choice(ILCELER)}, No: {rastgele.randint(1, 200)}" if rastgele.random() < 0.8 else None,
+            ))
+
+            for _ in range(rastgele.choices(hayvan_sayilari, hayvan_sayisi_agirliklari)[0]):
+                tur = rastgele.choices(turler, tur_agirliklari)[0]
+                _, cinsler, asilar, omur = TURLER[tur]
+                yas = int(rastgele.triangular(20, omur, omur // 8))
+                dogum_tarihi = bugun - timedelta(days=yas)
+                hayvan_id = yeni_id("hayvanlar")
+                tampon.ekle("hayvanlar", (
+                    hayvan_id, rastgele.choice(HAYVAN_ISIMLERI), tur, rastgele.choice(cinsler), dogum_tarihi,
+                    rastgele.choices(sebepler, sebep_agirliklari)[0], sahip_id,
+                    "Alerjisi var" if rastgele.random() < 0.05 else None,
+                ))
+
+                # Aşılar: ilk doz ~2 aylıkken, sonra yıllık (arada atlanan yıllar olur); son dozun sonraki tarihi gelecekte kalabilir
+                for asi_adi in asilar:
+                    if rastgele.random() < 0.15:
+                        continue  # Bu aşıyı hiç yaptırmamış
+                    asi_tarihi = dogum_tarihi + timedelta(days=60 + rastgele.randint(0, 30))
+                    while asi_tarihi <= bugun:
+                        sonraki = asi_tarihi + timedelta(days=365)
+                        tampon.ekle("asi_takip", (
+                            yeni_id("asi_takip"), hayvan_id, asi_adi, asi_tarihi, sonraki,
+                            "Hafif reaksiyon" if rastgele.random() < 0.02 else None,
+                        ))
+                        asi_tarihi = sonraki + timedelta(days=rastgele.randint(-10, 40))
+                        if rastgele.random() < 0.4:
+                            asi_tarihi += timedelta(days=365)  # Bir yılı atlamış
+
+                # Randevular ve tamamlananların muayeneleri
+                for _ in range(min(int(rastgele.expovariate(1 / 2.5)), 12)):
+                    zaman = _randevu_zamani(rastgele, bugun, (-730, 60))
+                    if zaman.date() > bugun:
+                        durum = "Planlandı"
+                    else:
+                        durum = rastgele.choices(("Tamamlandı", "İptal Edildi", "Gelmedi"), (80, 12, 8))[0]
+                    tampon.ekle("randevular", (
+                        yeni_id("randevular"), hayvan_id, zaman, rastgele.choice(RANDEVU_ACIKLAMALARI), durum,
+                        rastgele.choices(sureler, sure_agirliklari)[0], rastgele.choice(VETERINERLER),
+                        rastgele.choice(ODALAR),
+                    ))
+                    if durum == "Tamamlandı":
+                        sikayet, bulgu, teshis, tedavi = rastgele.choice(MUAYENE_SABLONLARI)
+                        degerler = {"ates": f"{rastgele.uniform(37.5, 40.5):.1f}", "gun": rastgele.randint(3, 14),
+                                    "kilo": f"{rastgele.uniform(0.1, 45):.1f}"}
+                        tampon.ekle("muayeneler", (
+                            yeni_id("muayeneler"), hayvan_id, zaman, sikayet,
+                            bulgu.format(**degerler), teshis, tedavi.format(**degerler),
+                        ))
+
+            if ilerleme and ((i + 1) % 1000 == 0 or i + 1 == sahip_sayisi):
+                ilerleme(i + 1, sahip_sayisi)
+
+        tampon.yaz()
+    return tampon.sayilar
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Veritabanına tekrarlanabilir örnek veri ekler (kalıcıdır!)")
+    parser.add_argument("--sahip-sayisi", type=int, default=60000, help="60000 sahip ≈ 100 bin hayvan, 1 milyon aşı")
+    parser.add_argument("--tohum", type=int, default=42)
+    parser.add_argument("--motor", choices=("mysql", "sqlite"), help="Ayarlardaki motor yerine bunu kullan")
+    args = parser.parse_args()
+
+    from ayarlar import veritabani_ac
+    from sema import gocleri_uygula
+    db = veritabani_ac(args.motor)
+    try:
+        gocleri_uygula(db)
+        sayilar = veri_uret(db, args.sahip_sayisi, args.tohum,
+                            ilerleme=lambda n, toplam: print(f"\r{n}/{toplam} sahip", end="", flush=True))
+        print()
+        for tablo, sayi in sayilar.items():
+            print(f"{tablo:<12} {sayi:>10}")
+    finally:
+        db.kapat()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,738 @@
+"""
+Veritabanı erişim katmanı.
+
+Veritabani sorguları bir bağlantı havuzu üzerinden çalıştırır; motora özgü
+kısımlar (bağlantı açma, parametre biçimi, tarih dönüşümleri, sunucu saati)
+alt sınıflardadır:
+
+    MySQLVeritabani    - mysql.connector ile MySQL/MariaDB sunucusu
+    SQLiteVeritabani   - Tek iş istasyonlu şubeler ve ölçümler için gömülü SQLite dosyası
+    IstemciVeritabani  - Sorguları sunucu.py'deki yerel API sunucusuna HTTP ile gönderir
+
+Sorgular her iki motor için de MySQL'in %s parametre biçimiyle yazılır;
+SQLiteVeritabani bunları ? biçimine çevirir.
+"""
+import json
+import re
+import select
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+
+from havuz import BaglantiHavuzu, HavuzHatasi
+
+
+class VeritabaniHatasi(Exception):
+    """Bağlantı veya sorgu hatası; başlık ve mesaj kullanıcıya gösterilmeye hazırdır."""
+    def __init__(self, baslik, mesaj, kod=None):
+        super().__init__(mesaj)
+        self.baslik = baslik
+        self.mesaj = mesaj
+        self.kod = kod  # Sürücünün hata numarası (ör. MySQL errno), varsa
+
+
+def _sorgu_hatasi(err, sorgu):
+    return VeritabaniHatasi("Veritabanı Hatası", f"Sorgu çalıştırılırken bir hata oluştu:\n{err}\nSorgu: {sorgu}",
+                            kod=getattr(err, "errno", None))
+
+
+_YAZMA_KALIBI = re.compile(r"^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def yazilan_tablo(sorgu):
+    """INSERT/UPDATE/DELETE sorgusunun hedef tablosunu, diğer sorgular için None döndürür."""
+    eslesme = _YAZMA_KALIBI.match(sorgu)
+    return eslesme.group(1).lower() if eslesme else None
+
+
+class Oturum:
+    """Aynı bağlantı üzerinde sırayla çalıştırılan ifadeler (oturum değişkenleri, kilitler, göçler)."""
+    def __init__(self, db, baglanti):
+        self.db = db
+        self.baglanti = baglanti
+        self.sutunlar = ()  # Son SELECT'in sütun adları
+        self.son_id = None  # Son INSERT'in ürettiği AUTO_INCREMENT id'si
+        self.etkilenen = 0  # Son INSERT/UPDATE/DELETE'in etkilediği satır sayısı
+
+    def calistir(self, sorgu, veri=None, fetch_results=False):
+        cursor = self.db._imlec(self.baglanti)
+        baslangic = time.perf_counter()
+        satir, hata = 0, True
+        try:
+            cursor.execute(self.db._hazirla(sorgu), veri or ())
+            self.sutunlar = tuple(aciklama[0] for aciklama in cursor.description or ())
+            self.son_id, self.etkilenen = cursor.lastrowid, cursor.rowcount
+            sonuc = cursor.fetchall() if fetch_results else True
+            satir, hata = len(sonuc) if fetch_results else cursor.rowcount, False
+            return sonuc
+        except self.db.hata_turleri as err:
+            raise _sorgu_hatasi(err, sorgu) from err
+        finally:
+            cursor.close()
+            self.db._olc(sorgu, baslangic, satir, hata)
+
+    def coklu_calistir(self, sorgu, satirlar):
+        """Aynı ifadeyi satirlar'daki her parametre demeti için çalıştırır (executemany)."""
+        cursor = self.db._imlec(self.baglanti)
+        baslangic = time.perf_counter()
+        satir, hata = 0, True
+        try:
+            cursor.executemany(self.db._hazirla(sorgu), satirlar)
+            satir, hata = cursor.rowcount, False
+            return satir
+        except self.db.hata_turleri as err:
+            raise _sorgu_hatasi(err, sorgu) from err
+        finally:
+            cursor.close()
+            self.db._olc(sorgu, baslangic, satir, hata)
+
+
+class Veritabani:
+    """Motordan bağımsız kısım; alt sınıflar _baglanti_ac, _imlec ve sunucu_zamani'nı sağlar."""
+    lehce = None        # Motora özgü SQL seçiminde kullanılır ("mysql" / "sqlite")
+    hata_turleri = ()   # Sürücünün hata sınıfları
+    uzak = False        # True ise göçler ve bakım işleri sunucuda yapılır (IstemciVeritabani)
+    hata_bildirici = None  # hata_goster'in çağırdığı fonksiyon(err); arayüz kendi mesaj kutusunu atar
+
+    def __init__(self, config, havuz_ayarlari=None, hazir_ifade_sayisi=32, olcumleyici=None):
+        """
+        :param config: Sürücünün connect() parametreleri.
+        :param havuz_ayarlari: BaglantiHavuzu parametreleri.
+        :param hazir_ifade_sayisi: Bağlantı başına saklanacak hazırlanmış ifade sayısı (0: kapalı).
+        :param olcumleyici: Verilirse sorgu ve bağlantı süreleri bu olcum.Olcumleyici'ye kaydedilir.
+        """
+        self.config = config
+        self.olcumleyici = olcumleyici
+        self.hazir_ifade_sayisi = hazir_ifade_sayisi
+        self.hazir_istatistik = {"hazirlanan": 0, "yeniden_kullanilan": 0, "atilan": 0}
+        self._hazirlanamayanlar = set()
+        self.havuz = BaglantiHavuzu(
+            self._olculu_baglanti_ac,
+            saglik_kontrolu=self._saglikli_mi,
+            hata_turleri=self.hata_turleri,
+            **(havuz_ayarlari or {})
+        )
+        self._yazma_dinleyicileri = []
+
+    # --- Motora özgü kısımlar ---
+    def _baglanti_ac(self):
+        raise NotImplementedError
+
+    @staticmethod
+    def _saglikli_mi(baglanti):
+        return True
+
+    @staticmethod
+    def _imlec(baglanti, tamponlu=True):
+        return baglanti.cursor()
+
+    @staticmethod
+    def _hazirla(sorgu):
+        """Sorguyu sürücünün parametre biçimine çevirir."""
+        return sorgu
+
+    def _hazir_imlec(self, hb, sorgu):
+        """
+        Bu bağlantıda sorgu için saklanan hazırlanmış imleci ve onunla çalıştırılacak SQL metnini
+        döndürür; motor sunucu tarafı hazırlanmış ifadeleri desteklemiyorsa None.
+        """
+        return None
+
+    @staticmethod
+    def _hazirlanamaz_mi(err):
+        """Hata, ifadenin hazırlanmış ifade olarak çalıştırılamadığını mı bildiriyor?"""
+        return False
+
+    @staticmethod
+    def _salt_okunur(baglanti, acik):
+        """acik ise bağlantıda yazmayı reddeden bir kip başlatır, değilse bitirir."""
+        raise NotImplementedError
+
+    def _baglanti_hatasi(self, err):
+        return VeritabaniHatasi("Veritabanı Bağlantı Hatası", f"Veritabanına bağlanılamadı:\n{err}")
+
+    def sunucu_zamani(self):
+        """Değişiklik takibinde kullanılan sunucu saatini döndürür (istemci saatinden bağımsız)."""
+        raise NotImplementedError
+
+    # --- Ortak kısım ---
+    def yazma_dinleyicisi_ekle(self, dinleyici):
+        """
+        sorgu()/sorgu_calistir() ile bir tabloya yazılıp commit edildikten sonra dinleyici(tablo) çağrılır.
+        Yazma arka plan iş parçacığından da yapılabileceği için dinleyici Tk'ye dokunmamalıdır.
+        """
+        self._yazma_dinleyicileri.append(dinleyici)
+
+    def yazma_bildir(self, tablo):
+        """oturum() içinde yazılıp commit edilen tablolar için dinleyicileri elle çağırır."""
+        for dinleyici in self._yazma_dinleyicileri:
+            dinleyici(tablo)
+
+    def _yazildi(self, sorgu):
+        tablo = yazilan_tablo(sorgu)
+        if tablo is not None:
+            self.yazma_bildir(tablo)
+
+    def _yurut(self, hb, sorgu, veri):
+        """
+        Sorguyu varsa hazırlanmış ifadeyle, yoksa metin olarak çalıştırır.
+        :return: (imleç, imleç önbellekte mi); önbellekteki imleç kapatılmamalıdır.
+        """
+        hazir = self._hazir_imlec(hb, sorgu)
+        if hazir is not None:
+            cursor, metin = hazir
+            try:
+                cursor.execute(metin, veri or ())
+                return cursor, True
+            except self.hata_turleri as err:
+                # Hata sonrası imlecin durumu belirsiz; bir sonraki çağrı yeniden hazırlar
+                hb.ek["hazir_ifadeler"].pop(sorgu, None)
+                cursor.close()
+                if not self._hazirlanamaz_mi(err):
+                    raise
+                self._hazirlanamayanlar.add(sorgu)
+
+        cursor = self._imlec(hb.baglanti)
+        try:
+            cursor.execute(self._hazirla(sorgu), veri or ())
+        except BaseException:
+            cursor.close()
+            raise
+        return cursor, False
+
+    def _olc(self, sorgu, baslangic, satir, hata):
+        if self.olcumleyici is not None:
+            self.olcumleyici.sorgu_kaydet(sorgu, time.perf_counter() - baslangic, satir, hata)
+
+    def _olculu_baglanti_ac(self):
+        if self.olcumleyici is None:
+            return self._baglanti_ac()
+        baslangic = time.perf_counter()
+        try:
+            return self._baglanti_ac()
+        finally:
+            self.olcumleyici.baglanti_kaydet("acma", time.perf_counter() - baslangic)
+
+    def _havuzdan_al(self):
+        baslangic = time.perf_counter()
+        try:
+            return self.havuz.al()
+        except self.hata_turleri + (HavuzHatasi,) as err:
+            raise self._baglanti_hatasi(err) from err
+        finally:
+            if self.olcumleyici is not None:
+                self.olcumleyici.baglanti_kaydet("bekleme", time.perf_counter() - baslangic)
+
+    def isit(self, baglanti_sayisi):
+        """Havuzda baglanti_sayisi bağlantıyı önceden açar; ilk pencereler bağlantı açılmasını beklemesin."""
+        alinanlar = []
+        try:
+            for _ in range(min(baglanti_sayisi, self.havuz.boyut)):
+                alinanlar.append(self._havuzdan_al())
+        finally:
+            for hb in alinanlar:
+                self.birak(hb)
+
+    def baglan(self):
+        """Havuzdan sağlıklı bir bağlantı alır; alınamazsa kullanıcıyı bilgilendirip None döndürür."""
+        try:
+            return self._havuzdan_al()
+        except VeritabaniHatasi as err:
+            self.hata_goster(err)
+            return None
+
+    def birak(self, havuz_baglantisi, bozuk=False):
+        """baglan() ile alınan bağlantıyı havuza geri verir."""
+        self.havuz.birak(havuz_baglantisi, bozuk)
+
+    def kapat(self):
+        """Havuzdaki tüm bağlantıları kapatır (uygulama kapanırken çağrılır)."""
+        self.havuz.kapat()
+
+    @contextmanager
+    def oturum(self):
+        """
+        Havuzdan bir bağlantıyı blok boyunca ayırır; birden çok ifadenin aynı oturumda
+        çalışması gerektiğinde (kilitler, göçler) kullanılır. Hata VeritabaniHatasi olarak yükselir.
+        """
+        hb = self._havuzdan_al()
+        bozuk = False
+        try:
+            yield Oturum(self, hb.baglanti)
+        except VeritabaniHatasi:
+            bozuk = not self._saglikli_mi(hb.baglanti)
+            raise
+        finally:
+            self.birak(hb, bozuk)
+
+    def hata_goster(self, err):
+        """
+        VeritabaniHatasi'nı hata_bildirici ile kullanıcıya gösterir (yalnızca ana iş parçacığından
+        çağrılmalı); bildirici atanmamışsa (arayüzsüz araçlar) standart hataya yazar.
+        """
+        if self.hata_bildirici is not None:
+            self.hata_bildirici(err)
+        else:
+            print(f"{err.baslik}: {err.mesaj}", file=sys.stderr)
+
+    def sorgu(self, sorgu, veri=None, commit=False, fetch_results=False, salt_okunur=False):
+        """
+        sorgu_calistir ile aynı işi yapar, ancak hata durumunda mesaj kutusu göstermek yerine
+        VeritabaniHatasi fırlatır. Tk'ye dokunmadığı için arka plan iş parçacıklarından çağrılabilir.
+        :param salt_okunur: True ise sorgu yazmayı reddeden bir bağlantıda çalışır (dışarıdan gelen SQL).
+        """
+        hb = self._havuzdan_al()
+        db = hb.baglanti
+        cursor = None
+        saklanan = False
+        bozuk = False
+        baslangic = time.perf_counter()
+        satir, hata = 0, True
+        try:
+            if salt_okunur:
+                self._salt_okunur(db, True)
+            cursor, saklanan = self._yurut(hb, sorgu, veri)
+
+            if commit:
+                db.commit()
+                satir, hata = cursor.rowcount, False
+                self._yazildi(sorgu)
+                return True
+
+            # Okunmamış satır kalırsa havuzdaki bağlantı bir sonraki sorguda kullanılamaz
+            results = cursor.fetchall() if cursor.description else []
+            satir, hata = len(results) if cursor.description else cursor.rowcount, False
+            if fetch_results:
+                return results
+            else:
+                return True
+
+        except self.hata_turleri as err:
+            bozuk = not self._saglikli_mi(db)
+            if commit and not bozuk:
+                db.rollback()
+            raise _sorgu_hatasi(err, sorgu) from err
+        finally:
+            self._olc(sorgu, baslangic, satir, hata)
+            if cursor and not saklanan:
+                cursor.close()
+            bozuk = self._salt_okunur_bitir(db, bozuk) if salt_okunur else bozuk
+            self.birak(hb, bozuk)
+
+    def _salt_okunur_bitir(self, baglanti, bozuk):
+        """Salt okunur kipi kapatır; kapatılamazsa bağlantı havuza geri konmaz. :return: bozuk"""
+        if bozuk:
+            return True
+        try:
+            self._salt_okunur(baglanti, False)
+            return False
+        except self.hata_turleri:
+            return True
+
+    def yaz(self, sorgu, veri=None):
+        """
+        INSERT/UPDATE/DELETE sorgusunu çalıştırır; (etkilenen satır sayısı, eklenen satırın id'si)
+        döndürür. id aynı bağlantıdan okunması gerektiği için sorgu bir oturumda çalışır.
+        Hata VeritabaniHatasi olarak yükselir.
+        """
+        with self.oturum() as oturum:
+            oturum.calistir(sorgu, veri)
+            sonuc = oturum.etkilenen, oturum.son_id
+        self._yazildi(sorgu)
+        return sonuc
+
+    def sorgu_akisi(self, sorgu, veri=None, parti_boyutu=500, salt_okunur=False):
+        """
+        SELECT sonuçlarını fetchmany ile parti parti (list of tuples) üreten üreteç.
+        Tamponsuz imleç kullanıldığından sonuç kümesi ne istemcide ne de bellekte birikir;
+        bağlantı üreteç tükenene veya kapatılana kadar havuza dönmez. salt_okunur sorgu() ile aynıdır.
+        """
+        hb = self._havuzdan_al()
+        db = hb.baglanti
+        cursor = None
+        bozuk = True # Sonuna kadar okunmazsa bağlantıda okunmamış satır kalır; havuza geri konmaz
+        sure, satir, hata = 0.0, 0, False  # Süreye tüketicinin partiler arasında harcadığı zaman katılmaz
+        try:
+            baslangic = time.perf_counter()
+            if salt_okunur:
+                self._salt_okunur(db, True)
+            cursor = self._imlec(db, tamponlu=False)
+            cursor.execute(self._hazirla(sorgu), veri or ())
+            while True:
+                parti = cursor.fetchmany(parti_boyutu)
+                sure += time.perf_counter() - baslangic
+                if not parti:
+                    break
+                satir += len(parti)
+                yield parti
+                baslangic = time.perf_counter()
+            bozuk = False
+        except self.hata_turleri as err:
+            sure += time.perf_counter() - baslangic
+            hata = True
+            raise _sorgu_hatasi(err, sorgu) from err
+        finally:
+            self._olc(sorgu, time.perf_counter() - sure, satir, hata)
+            if cursor and not bozuk:
+                cursor.close()
+            bozuk = self._salt_okunur_bitir(db, bozuk) if salt_okunur else bozuk
+            self.birak(hb, bozuk)
+
+    def sorgu_calistir(self, sorgu, veri=None, commit=False, fetch_results=False):
+        """
+        Veritabanı sorgusunu havuzdan alınan bir bağlantı üzerinde çalıştırır.
+        :param sorgu: Çalıştırılacak SQL sorgusu.
+        :param veri: Sorguya geçirilecek veriler (tuple).
+        :param commit: True ise değişiklikleri commit eder.
+        :param fetch_results: True ise tüm sonuçları (SELECT için) fetch eder ve döndürür.
+        :return: Sorgu sonuçları (list of tuples) SELECT için, aksi halde True/False başarılı/başarısız.
+        """
+        try:
+            return self.sorgu(sorgu, veri, commit=commit, fetch_results=fetch_results)
+        except VeritabaniHatasi as err:
+            self.hata_goster(err)
+            return None
+
+
+class MySQLVeritabani(Veritabani):
+    lehce = "mysql"
+
+    # Sunucunun ikili protokolde hazırlayamadığı ifade (ER_UNSUPPORTED_PS)
+    HAZIRLANAMAZ_HATASI = 1295
+
+    def __init__(self, config, havuz_ayarlari=None, **ayarlar):
+        import mysql.connector  # Yalnızca SQLite kullanan kurulumlar sürücüye ihtiyaç duymasın
+        self._surucu = mysql.connector
+        self.hata_turleri = (mysql.connector.Error,)
+        super().__init__(config, havuz_ayarlari, **ayarlar)
+
+    def _baglanti_ac(self):
+        # autocommit: havuzdaki bağlantılar SELECT'ten sonra açık bir işlem (REPEATABLE READ
+        # anlık görüntüsü) bırakırsa sonraki okumalar eski veriyi görür.
+        return self._surucu.connect(autocommit=True, **self.config)
+
+    @staticmethod
+    def _saglikli_mi(baglanti):
+        return baglanti.is_connected()
+
+    @staticmethod
+    def _imlec(baglanti, tamponlu=True):
+        return baglanti.cursor(buffered=tamponlu)
+
+    def _hazir_imlec(self, hb, sorgu):
+        if self.hazir_ifade_sayisi <= 0 or sorgu in self._hazirlanamayanlar:
+            return None
+        ifadeler = hb.ek.setdefault("hazir_ifadeler", OrderedDict())  # SQL -> (imleç, metin), LRU sırasıyla
+        hazir = ifadeler.get(sorgu)
+        if hazir is not None:
+            ifadeler.move_to_end(sorgu)
+            self.hazir_istatistik["yeniden_kullanilan"] += 1
+            return hazir
+
+        # İfade ilk execute'ta sunucuda hazırlanır. Sürücü, imleç aynı str nesnesiyle (eşit değil,
+        # aynı nesne) çalıştırıldığında yeniden hazırlamaz; bu yüzden ilk metin de saklanır.
+        hazir = ifadeler[sorgu] = (hb.baglanti.cursor(prepared=True), sorgu)
+        self.hazir_istatistik["hazirlanan"] += 1
+        if len(ifadeler) > self.hazir_ifade_sayisi:
+            _, (eski, _) = ifadeler.popitem(last=False)
+            eski.close()  # Sunucudaki ifadeyi de serbest bırakır
+            self.hazir_istatistik["atilan"] += 1
+        return hazir
+
+    def _hazirlanamaz_mi(self, err):
+        return getattr(err, "errno", None) == self.HAZIRLANAMAZ_HATASI
+
+    @staticmethod
+    def _salt_okunur(baglanti, acik):
+        # READ ONLY işlemde INSERT/UPDATE/DELETE (WITH ... DELETE dahil) hata verir
+        if acik:
+            baglanti.start_transaction(readonly=True)
+        else:
+            baglanti.commit()
+
+    def _baglanti_hatasi(self, err):
+        return VeritabaniHatasi(
+            "Veritabanı Bağlantı Hatası",
+            f"Veritabanına bağlanılamadı:\n{err}\\n\\n"
+            "Lütfen MySQL sunucunuzun çalıştığından, kullanıcı adı ve şifrenin doğru olduğundan "
+            "ve 'veteriner_klinik' veritabanının mevcut olduğundan emin olun."
+        )
+
+    def sunucu_zamani(self):
+        return self.sorgu("SELECT CURRENT_TIMESTAMP(6)", fetch_results=True)[0][0]
+
+
+# SQLite'ta zaman damgaları metin olarak tutulur; bu biçim sözlük sırasıyla zaman sırasını korur.
+SQLITE_SIMDI = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+def _tarih_coz(deger):
+    metin = deger.decode()
+    try:
+        return date.fromisoformat(metin)
+    except ValueError:
+        return datetime.strptime(metin, "%Y-%m-%d").date()  # "2024-1-5" gibi doldurulmamış girişler
+
+
+def _zaman_coz(deger):
+    return datetime.fromisoformat(deger.decode())
+
+
+# Sütunun tanımlı türüne göre (PARSE_DECLTYPES) MySQL sürücüsünün döndürdüğü türler elde edilir
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda zaman: zaman.isoformat(" "))
+sqlite3.register_converter("DATE", _tarih_coz)
+sqlite3.register_converter("DATETIME", _zaman_coz)
+sqlite3.register_converter("TIMESTAMP", _zaman_coz)
+
+
+class SQLiteVeritabani(Veritabani):
+    lehce = "sqlite"
+    hata_turleri = (sqlite3.Error,)
+
+    def _baglanti_ac(self):
+        # isolation_level=None: MySQL tarafındaki autocommit ile aynı davranış; işlemler açıkça BEGIN ile açılır.
+        # check_same_thread=False: havuz bağlantıyı sırayla farklı iş parçacıklarına verir.
+        # cached_statements: sqlite3 derlenmiş ifadeleri bağlantı başına SQL metnine göre LRU olarak
+        # kendisi saklar; ayrı bir hazırlanmış ifade önbelleğine gerek yoktur.
+        baglanti = sqlite3.connect(**self.config, detect_types=sqlite3.PARSE_DECLTYPES,
+                                   isolation_level=None, check_same_thread=False,
+                                   cached_statements=self.hazir_ifade_sayisi)
+        baglanti.execute("PRAGMA foreign_keys = ON")   # ON DELETE CASCADE / RESTRICT için
+        baglanti.execute("PRAGMA journal_mode = WAL")  # Okuyucular yazanı beklemesin
+        return baglanti
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _hazirla(sorgu):
+        return sorgu.replace("%%", "\0").replace("%s", "?").replace("\0", "%")
+
+    @staticmethod
+    def _salt_okunur(baglanti, acik):
+        baglanti.execute(f"PRAGMA query_only = {'ON' if acik else 'OFF'}")
+
+    def _baglanti_hatasi(self, err):
+        return VeritabaniHatasi(
+            "Veritabanı Bağlantı Hatası",
+            f"Veritabanı dosyası açılamadı:\n{err}\n\nDosya: {self.config.get('database')}"
+        )
+
+    def sunucu_zamani(self):
+        return datetime.fromisoformat(self.sorgu(f"SELECT {SQLITE_SIMDI}", fetch_results=True)[0][0])
+
+
+# --- API sunucusu istemcisi ---
+def _json_varsayilan(nesne):
+    # datetime, date'in alt sınıfıdır; önce denetlenmeli
+    if isinstance(nesne, datetime):
+        return {"$zaman": nesne.isoformat()}
+    if isinstance(nesne, date):
+        return {"$tarih": nesne.isoformat()}
+    if isinstance(nesne, Decimal):
+        return {"$ondalik": str(nesne)}
+    raise TypeError(f"JSON'a çevrilemeyen değer: {type(nesne).__name__}")
+
+
+def _json_nesnesi(sozluk):
+    if len(sozluk) == 1:
+        (anahtar, deger), = sozluk.items()
+        if anahtar == "$zaman":
+            return datetime.fromisoformat(deger)
+        if anahtar == "$tarih":
+            return date.fromisoformat(deger)
+        if anahtar == "$ondalik":
+            return Decimal(deger)
+    return sozluk
+
+
+def json_kodla(nesne):
+    """Sorgu parametrelerini ve satırlarını tarih/zaman/ondalık türleri korunarak JSON baytlarına çevirir."""
+    return json.dumps(nesne, default=_json_varsayilan, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_coz(veri):
+    return json.loads(veri, object_hook=_json_nesnesi)
+
+
+class IstemciVeritabani(Veritabani):
+    """
+    Sorguları doğrudan veritabanına değil sunucu.py'deki API sunucusuna gönderir; iş
+    istasyonları veritabanı bağlantısı açmaz, sunucunun tek havuzunu ve yanıt önbelleğini
+    paylaşır. Havuz burada sunucuya açık tutulan (keep-alive) HTTP bağlantılarını tutar.
+
+    Okumalar ve tek ifadelik yazmalar (sorgu, yaz, sorgu_akisi) desteklenir; oturum()
+    gerektiren işler (göçler, toplu içe aktarma) sunucunun bulunduğu makinede çalıştırılır.
+    """
+    uzak = True
+
+    def __init__(self, config, havuz_ayarlari=None, **ayarlar):
+        """:param config: host, port, anahtar (sunucudaki paylaşılan anahtar) ve zaman_asimi (saniye)."""
+        import http.client  # ~40 ms; yalnızca istemci modunda gerekir
+        self._http = http.client
+        self.hata_turleri = (OSError, http.client.HTTPException)
+        super().__init__(config, havuz_ayarlari, **ayarlar)
+        self._lehce = None
+
+    @property
+    def lehce(self):
+        # Sunucunun kullandığı motor; SQL seçimi ona göre yapılır
+        if self._lehce is None:
+            self._lehce = self._istek("GET", "/saglik")["lehce"]
+        return self._lehce
+
+    def _baglanti_ac(self):
+        baglanti = self._http.HTTPConnection(self.config.get("host", "localhost"), self.config.get("port", 8765),
+                                             timeout=self.config.get("zaman_asimi", 30))
+        baglanti.connect()  # Bağlantı hataları havuzun yeniden denemesine takılsın
+        return baglanti
+
+    @staticmethod
+    def _saglikli_mi(baglanti):
+        # Boştaki bağlantıda okunacak veri varsa sunucu bağlantıyı kapatmıştır
+        if baglanti.sock is None:
+            return False
+        try:
+            okunabilir, _, _ = select.select([baglanti.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not okunabilir
+
+    def _baglanti_hatasi(self, err):
+        return VeritabaniHatasi(
+            "Sunucu Bağlantı Hatası",
+            f"API sunucusuna bağlanılamadı:\n{err}\n\n"
+            f"Lütfen {self.config.get('host', 'localhost')}:{self.config.get('port', 8765)} adresinde "
+            "sunucu.py'nin çalıştığından emin olun."
+        )
+
+    def _gonder(self, yontem, yol, govde, tekrarlanabilir=True):
+        """
+        İsteği havuzdaki bir bağlantıyla gönderir; (havuz bağlantısı, yanıt) döndürür.
+        Sunucunun boşta kapattığı bağlantıya gönderilen istek işlenmemiştir; gönderirken kopan
+        istek bir kez yeni bağlantıyla denenir. Yanıt beklenirken kopan bağlantıda istek işlenmiş
+        olabilir; yalnızca tekrarlanabilir (okuma) istekler yeniden gönderilir.
+        """
+        basliklar = {"Content-Type": "application/json"}
+        if self.config.get("anahtar"):
+            basliklar["X-Api-Anahtari"] = self.config["anahtar"]
+        govde = None if govde is None else json_kodla(govde)
+        for deneme in range(2):
+            hb = self._havuzdan_al()
+            if not tekrarlanabilir and not self._saglikli_mi(hb.baglanti):
+                # Yazma yanıt beklerken kopunca yeniden gönderilemez; kapanmış bağlantı baştan elenir
+                self.birak(hb, bozuk=True)
+                hb = self._havuzdan_al()
+            gonderildi = False
+            try:
+                hb.baglanti.request(yontem, yol, body=govde, headers=basliklar)
+                gonderildi = True
+                return hb, hb.baglanti.getresponse()
+            except (BrokenPipeError, ConnectionResetError) as err:  # RemoteDisconnected dahil
+                self.birak(hb, bozuk=True)
+                if deneme or (gonderildi and not tekrarlanabilir):
+                    raise self._baglanti_hatasi(err) from err
+            except self.hata_turleri as err:
+                self.birak(hb, bozuk=True)
+                raise self._baglanti_hatasi(err) from err
+
+    @staticmethod
+    def _yanit_hatasi(yanit, icerik):
+        try:
+            hata = json_coz(icerik)["hata"]
+            return VeritabaniHatasi(hata["baslik"], hata["mesaj"], hata.get("kod"))
+        except (ValueError, KeyError, TypeError):
+            return VeritabaniHatasi("Sunucu Hatası", f"API sunucusu {yanit.status} {yanit.reason} döndürdü.")
+
+    def _istek(self, yontem, yol, govde=None, tekrarlanabilir=True):
+        """İsteği gönderir ve çözülmüş JSON yanıtı döndürür; hata VeritabaniHatasi olarak yükselir."""
+        hb, yanit = self._gonder(yontem, yol, govde, tekrarlanabilir)
+        bozuk = True
+        try:
+            icerik = yanit.read()
+            bozuk = yanit.will_close
+        except self.hata_turleri as err:
+            raise self._baglanti_hatasi(err) from err
+        finally:
+            self.birak(hb, bozuk)
+        if yanit.status != 200:
+            raise self._yanit_hatasi(yanit, icerik)
+        return json_coz(icerik)
+
+    def sunucu_zamani(self):
+        return self._istek("GET", "/zaman")["zaman"]
+
+    def isit(self, baglanti_sayisi):
+        super().isit(baglanti_sayisi)
+        self.lehce  # Sunucu yanıt vermiyorsa hata açılışta görünsün
+
+    def oturum(self):
+        raise VeritabaniHatasi("Sunucu Modu", "Bu işlem istemci modunda yapılamaz; "
+                                              "lütfen API sunucusunun çalıştığı bilgisayarda çalıştırın.")
+
+    # salt_okunur yok sayılır: sunucu /sorgu ve /akis isteklerini zaten salt okunur çalıştırır
+    def sorgu(self, sorgu, veri=None, commit=False, fetch_results=False, salt_okunur=False):
+        if commit:
+            self.yaz(sorgu, veri)
+            return True
+        baslangic = time.perf_counter()
+        satir, hata = 0, True
+        try:
+            satirlar = [tuple(satir) for satir in self._istek("POST", "/sorgu", {"sorgu": sorgu, "veri": veri})["satirlar"]]
+            satir, hata = len(satirlar), False
+        finally:
+            self._olc(sorgu, baslangic, satir, hata)
+        return satirlar if fetch_results else True
+
+    def yaz(self, sorgu, veri=None):
+        baslangic = time.perf_counter()
+        satir, hata = 0, True
+        try:
+            sonuc = self._istek("POST", "/yaz", {"sorgu": sorgu, "veri": veri}, tekrarlanabilir=False)
+            satir, hata = sonuc["etkilenen"], False
+        finally:
+            self._olc(sorgu, baslangic, satir, hata)
+        self._yazildi(sorgu)
+        return sonuc["etkilenen"], sonuc["son_id"]
+
+    def sorgu_akisi(self, sorgu, veri=None, parti_boyutu=500, salt_okunur=False):
+        """Partiler sunucudan satır satır JSON (chunked) olarak geldikçe üretilir."""
+        hb, yanit = self._gonder("POST", "/akis", {"sorgu": sorgu, "veri": veri, "parti_boyutu": parti_boyutu})
+        bozuk = True # Yanıt sonuna kadar okunmazsa bağlantı yeniden kullanılamaz
+        try:
+            if yanit.status != 200:
+                icerik = yanit.read()
+                bozuk = yanit.will_close
+                raise self._yanit_hatasi(yanit, icerik)
+            for satir in yanit:
+                mesaj = json_coz(satir)
+                if "hata" in mesaj:
+                    hata = mesaj["hata"]
+                    raise VeritabaniHatasi(hata["baslik"], hata["mesaj"], hata.get("kod"))
+                yield [tuple(kayit) for kayit in mesaj["parti"]]
+            bozuk = yanit.will_close
+        except self.hata_turleri as err:
+            raise self._baglanti_hatasi(err) from err
+        finally:
+            self.birak(hb, bozuk)
+
+
+MOTORLAR = {
+    "mysql": MySQLVeritabani,
+    "sqlite": SQLiteVeritabani,
+    "istemci": IstemciVeritabani,
+}
+
+
+def veritabani_olustur(motor, config, havuz_ayarlari=None, **ayarlar):
+    """Adı verilen motor ("mysql", "sqlite" veya "istemci") için bir Veritabani döndürür; ayarlar Veritabani'ya geçer."""
+    try:
+        sinif = MOTORLAR[motor]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen veritabanı motoru: {motor!r} (seçenekler: {', '.join(MOTORLAR)})") from None
+    return sinif(config, havuz_ayarlari, **ayarlar)